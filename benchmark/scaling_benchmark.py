@@ -0,0 +1,162 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""
+Benchmark how the cost of the PrimAITE simulation grows with the size of the network.
+
+Game configs of increasing size are generated with ``EnterpriseConfigGenerator``, and for each one the time taken to
+build and reset the game, the time taken by each step, and the memory held by the built game are measured. The results
+are written to JSON, and plotted against the number of nodes::
+
+    python scaling_benchmark.py --hosts 100 500 1000 5000 --hosts-per-subnet 50
+"""
+import argparse
+import copy
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Final, List, Optional
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+import primaite
+from primaite.config.generate import EnterpriseConfigGenerator
+from primaite.game.agent.interface import ProxyAgent
+from primaite.game.game import PrimaiteGame
+
+_BENCHMARK_ROOT: Final[Path] = Path(__file__).parent
+_RESULTS_ROOT: Final[Path] = _BENCHMARK_ROOT / "results" / "scaling"
+
+
+def _build_game(cfg: Dict) -> PrimaiteGame:
+    game = PrimaiteGame.from_config(copy.deepcopy(cfg))
+    game.setup_for_episode(episode=0)
+    return game
+
+
+def benchmark_size(generator: EnterpriseConfigGenerator, steps: int, repeats: int) -> Dict[str, float]:
+    """
+    Benchmark a game generated from a config generator.
+
+    :param generator: Generator of the game config.
+    :param steps: Number of steps to time the game for.
+    :param repeats: Number of times to build the game, of which the median build time is taken.
+    :return: Mapping from metric name to value.
+    """
+    cfg = generator.generate()
+
+    reset_timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        game = _build_game(cfg)
+        reset_timings.append(perf_counter() - start)
+
+    step_timings = []
+    for _ in range(steps):
+        for agent in game.agents.values():
+            if isinstance(agent, ProxyAgent):
+                agent.store_action(0)
+        start = perf_counter()
+        game.step()
+        step_timings.append(perf_counter() - start)
+    del game
+
+    # Memory is measured on a separate build, as tracing allocations slows the build down
+    gc.collect()
+    tracemalloc.start()
+    game = _build_game(cfg)
+    memory_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "hosts": generator.num_hosts,
+        "subnets": generator.num_subnets,
+        "nodes": len(game.simulation.network.nodes),
+        "agents": len(game.agents),
+        "reset_s": statistics.median(reset_timings),
+        "step_s": statistics.mean(step_timings),
+        "step_p95_s": sorted(step_timings)[math.ceil(0.95 * len(step_timings)) - 1],
+        "memory_mb": memory_bytes / 2**20,
+    }
+
+
+def plot(results: List[Dict[str, float]]) -> go.Figure:
+    """
+    Plot step time, reset time and memory against the number of nodes.
+
+    :param results: Results of :py:func:`run`.
+    :return: Figure with one subplot for each metric.
+    """
+    nodes = [result["nodes"] for result in results]
+    fig = make_subplots(rows=1, cols=3, subplot_titles=["Mean step time (s)", "Reset time (s)", "Memory (MB)"])
+    for col, metric in enumerate(["step_s", "reset_s", "memory_mb"], start=1):
+        fig.add_trace(
+            go.Scatter(x=nodes, y=[result[metric] for result in results], mode="lines+markers", showlegend=False),
+            row=1,
+            col=col,
+        )
+        fig.update_xaxes(title_text="Nodes", row=1, col=col)
+    fig.update_layout(template="plotly_white", width=1200, height=400, title="PrimAITE Simulation Scaling")
+    return fig
+
+
+def run(hosts: List[int], hosts_per_subnet: int, steps: int, repeats: int) -> Dict[str, Any]:
+    """
+    Run the scaling benchmark.
+
+    :param hosts: Approximate total numbers of hosts to benchmark. Each is rounded up to a whole number of subnets.
+    :param hosts_per_subnet: Number of hosts in each subnet.
+    :param steps: Number of steps to time each game for.
+    :param repeats: Number of times to build each game.
+    :return: The benchmark metadata and results.
+    """
+    results = []
+    for num_hosts in hosts:
+        generator = EnterpriseConfigGenerator(
+            num_subnets=math.ceil(num_hosts / hosts_per_subnet), hosts_per_subnet=hosts_per_subnet
+        )
+        print(f"Benchmarking {generator.num_hosts} hosts in {generator.num_subnets} subnets")
+        results.append(benchmark_size(generator, steps, repeats))
+    return {
+        "metadata": {
+            "primaite_version": primaite.__version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "hosts_per_subnet": hosts_per_subnet,
+            "steps": steps,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the scaling benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--hosts", type=int, nargs="+", default=[50, 100, 250, 500], help="Numbers of hosts.")
+    parser.add_argument("--hosts-per-subnet", type=int, default=25, help="Number of hosts in each subnet.")
+    parser.add_argument("--steps", type=int, default=20, help="Number of steps to time each game for.")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of times to build each game.")
+    parser.add_argument("--output", type=Path, help="Directory to write the results and plot to.")
+    args = parser.parse_args(argv)
+
+    results = run(hosts=args.hosts, hosts_per_subnet=args.hosts_per_subnet, steps=args.steps, repeats=args.repeats)
+
+    output = args.output or _RESULTS_ROOT / datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output.mkdir(parents=True, exist_ok=True)
+    with open(output / "scaling.json", "w") as file:
+        json.dump(results, file, indent=4)
+    plot(results["results"]).write_image(output / "scaling.png")
+    print(f"Saved results to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
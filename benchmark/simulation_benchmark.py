@@ -0,0 +1,334 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""
+Benchmark the throughput of the PrimAITE simulation on the CPU, without any RL training.
+
+Unlike ``primaite_benchmark.py``, which measures how long SB3 takes to train an agent, this benchmark only measures
+the cost of the simulation itself, so it has no GPU or RL library requirements and can be run on CI machines. For each
+bundled config it measures how long a game takes to build and reset, how many steps per second ``PrimaiteGame.step``
+manages with agents taking random actions, and how long describing the simulation state and building observations
+take. It also measures how many frames per second can be passed through a switch, a router and a firewall.
+
+Results are written to JSON, and can be compared against a stored baseline to flag regressions::
+
+    python simulation_benchmark.py --save-baseline
+    python simulation_benchmark.py --baseline results/simulation_baseline.json
+"""
+import argparse
+import copy
+import json
+import platform
+import random
+import statistics
+import sys
+from datetime import datetime
+from ipaddress import IPv4Address
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+
+import numpy as np
+from prettytable import PrettyTable
+
+import primaite
+from primaite import PRIMAITE_PATHS
+from primaite.config.load import load
+from primaite.game.agent.interface import ProxyAgent
+from primaite.game.game import PrimaiteGame
+from primaite.game.snapshot import GameSnapshot
+from primaite.simulator.network.container import Network
+from primaite.simulator.network.hardware.base import Node
+from primaite.simulator.network.hardware.nodes.host.computer import Computer
+from primaite.simulator.network.hardware.nodes.network.firewall import Firewall
+from primaite.simulator.network.hardware.nodes.network.router import ACLAction, Router
+from primaite.simulator.network.hardware.nodes.network.switch import Switch
+from primaite.utils.validation.ip_protocol import PROTOCOL_LOOKUP
+from primaite.utils.validation.port import PORT_LOOKUP
+
+_BENCHMARK_ROOT: Final[Path] = Path(__file__).parent
+_RESULTS_ROOT: Final[Path] = _BENCHMARK_ROOT / "results" / "simulation"
+_DEFAULT_BASELINE: Final[Path] = _BENCHMARK_ROOT / "results" / "simulation_baseline.json"
+
+_EXAMPLE_CONFIG: Final[Path] = PRIMAITE_PATHS.user_config_path / "example_config"
+CONFIGS: Final[Dict[str, Path]] = {
+    "data_manipulation": _EXAMPLE_CONFIG / "data_manipulation.yaml",
+    "uc7": _EXAMPLE_CONFIG / "uc7_config.yaml",
+    "multi_lan_internet": _EXAMPLE_CONFIG / "multi_lan_internet_network_example.yaml",
+}
+"""Bundled configs that the simulation is benchmarked with, by name."""
+
+
+def _median_time(func: Callable[[], Any], repeats: int) -> float:
+    """Call a function several times and return the median time it took, in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _build_game(cfg: Dict) -> PrimaiteGame:
+    game = PrimaiteGame.from_config(copy.deepcopy(cfg))
+    game.setup_for_episode(episode=0)
+    return game
+
+
+def _store_random_actions(game: PrimaiteGame, rng: np.random.Generator) -> None:
+    """Make each RL agent in the game take a random action on the next step."""
+    for agent in game.agents.values():
+        if isinstance(agent, ProxyAgent):
+            agent.store_action(int(rng.integers(len(agent.action_manager.action_map))))
+
+
+def benchmark_config(cfg: Dict, steps: int, repeats: int, seed: int) -> Dict[str, float]:
+    """
+    Benchmark a game built from a config.
+
+    :param cfg: Game config.
+    :param steps: Number of steps to time the game for.
+    :param repeats: Number of times to repeat the shorter measurements, of which the median is taken.
+    :param seed: Seed for the agents' random actions and the simulation's random number generators.
+    :return: Mapping from metric name to value. Metrics ending in ``_per_s`` are rates, and metrics ending in ``_s``
+        are durations in seconds.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    reset_s = _median_time(lambda: _build_game(cfg), repeats)
+    _, snapshot = GameSnapshot.build(cfg=cfg)
+    if snapshot is not None:
+        fast_reset_s = _median_time(lambda: snapshot.restore().setup_for_episode(episode=0), repeats)
+    else:
+        fast_reset_s = reset_s
+
+    game = _build_game(cfg)
+    rng = np.random.default_rng(seed)
+    _store_random_actions(game, rng)
+    game.step()
+
+    start = perf_counter()
+    for _ in range(steps):
+        _store_random_actions(game, rng)
+        game.step()
+    steps_per_s = steps / (perf_counter() - start)
+
+    describe_state_s = _median_time(game.get_sim_state, repeats)
+    state = game.get_sim_state()
+    observation_s = _median_time(
+        lambda: [agent.observation_manager.update(state) for agent in game.agents.values()], repeats
+    )
+
+    return {
+        "nodes": len(game.simulation.network.nodes),
+        "reset_s": reset_s,
+        "fast_reset_s": fast_reset_s,
+        "steps_per_s": steps_per_s,
+        "describe_state_s": describe_state_s,
+        "observation_s": observation_s,
+    }
+
+
+def _host(hostname: str, ip_address: str, default_gateway: str) -> Computer:
+    host = Computer.from_config(
+        config={
+            "type": "computer",
+            "hostname": hostname,
+            "ip_address": ip_address,
+            "subnet_mask": "255.255.255.0",
+            "default_gateway": default_gateway,
+            "start_up_duration": 0,
+        }
+    )
+    host.power_on()
+    return host
+
+
+def _switched_network() -> Tuple[Network, Node, str]:
+    """Two hosts connected by a switch."""
+    network = Network()
+    switch = Switch.from_config(config={"type": "switch", "hostname": "switch_1", "start_up_duration": 0})
+    switch.power_on()
+    client = _host("client_1", "192.168.1.10", "192.168.1.1")
+    server = _host("server_1", "192.168.1.11", "192.168.1.1")
+    network.connect(endpoint_a=client.network_interface[1], endpoint_b=switch.network_interface[1])
+    network.connect(endpoint_a=server.network_interface[1], endpoint_b=switch.network_interface[2])
+    return network, client, "192.168.1.11"
+
+
+def _routed_network() -> Tuple[Network, Node, str]:
+    """Two hosts in different subnets, connected through a router which permits ARP and ICMP."""
+    network = Network()
+    router = Router.from_config(
+        config={"type": "router", "hostname": "router_1", "num_ports": 2, "start_up_duration": 0}
+    )
+    router.power_on()
+    router.configure_port(port=1, ip_address="192.168.1.1", subnet_mask="255.255.255.0")
+    router.configure_port(port=2, ip_address="192.168.10.1", subnet_mask="255.255.255.0")
+    router.enable_port(1)
+    router.enable_port(2)
+    router.acl.add_rule(action=ACLAction.PERMIT, src_port=PORT_LOOKUP["ARP"], dst_port=PORT_LOOKUP["ARP"], position=22)
+    router.acl.add_rule(action=ACLAction.PERMIT, protocol=PROTOCOL_LOOKUP["ICMP"], position=23)
+    client = _host("client_1", "192.168.10.10", "192.168.10.1")
+    server = _host("server_1", "192.168.1.10", "192.168.1.1")
+    network.connect(endpoint_a=client.network_interface[1], endpoint_b=router.network_interface[2])
+    network.connect(endpoint_a=server.network_interface[1], endpoint_b=router.network_interface[1])
+    return network, client, "192.168.1.10"
+
+
+def _firewalled_network() -> Tuple[Network, Node, str]:
+    """An external host and an internal host, connected through a firewall which permits ARP and ICMP."""
+    network = Network()
+    firewall = Firewall.from_config(config={"type": "firewall", "hostname": "firewall_1", "start_up_duration": 0})
+    firewall.power_on()
+    firewall.configure_external_port(ip_address=IPv4Address("192.168.10.1"), subnet_mask="255.255.255.0")
+    firewall.configure_internal_port(ip_address=IPv4Address("192.168.0.1"), subnet_mask="255.255.255.0")
+    for acl in [
+        firewall.internal_inbound_acl,
+        firewall.internal_outbound_acl,
+        firewall.external_inbound_acl,
+        firewall.external_outbound_acl,
+    ]:
+        acl.add_rule(action=ACLAction.PERMIT, src_port=PORT_LOOKUP["ARP"], dst_port=PORT_LOOKUP["ARP"], position=22)
+        acl.add_rule(action=ACLAction.PERMIT, protocol=PROTOCOL_LOOKUP["ICMP"], position=23)
+    external = _host("external_node", "192.168.10.2", "192.168.10.1")
+    internal = _host("internal_node", "192.168.0.2", "192.168.0.1")
+    network.connect(endpoint_a=firewall.external_port, endpoint_b=external.network_interface[1])
+    network.connect(endpoint_a=firewall.internal_port, endpoint_b=internal.network_interface[1])
+    return network, external, "192.168.0.2"
+
+
+DEVICE_NETWORKS: Final[Dict[str, Callable[[], Tuple[Network, Node, str]]]] = {
+    "switch": _switched_network,
+    "router": _routed_network,
+    "firewall": _firewalled_network,
+}
+"""Networks that frames are passed through to benchmark each kind of network device, by device name."""
+
+
+def benchmark_device(build_network: Callable[[], Tuple[Network, Node, str]], pings: int) -> Dict[str, float]:
+    """
+    Benchmark how many frames per second can be passed through a network device.
+
+    Each ping passes two frames through the device, the echo request and the echo reply. The ARP exchange is done
+    before timing starts, so only these frames are counted.
+
+    :param build_network: Function which builds the network, and returns it with the host to ping from and the IP
+        address to ping.
+    :param pings: Number of pings to send.
+    :return: Mapping from metric name to value.
+    """
+    network, source, target_ip_address = build_network()
+    if not source.ping(target_ip_address, pings=1):
+        raise RuntimeError(f"{source.config.hostname} cannot ping {target_ip_address} to benchmark.")
+
+    replies = 0
+    start = perf_counter()
+    for _ in range(pings):
+        network.pre_timestep(0)
+        replies += source.ping(target_ip_address, pings=1)
+    elapsed = perf_counter() - start
+    return {"frames": 2 * replies, "frames_per_s": 2 * replies / elapsed}
+
+
+def run(
+    configs: Optional[List[str]] = None, steps: int = 200, repeats: int = 5, pings: int = 500, seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Run the simulation benchmark.
+
+    :param configs: Names of the bundled configs to benchmark. Defaults to all of them.
+    :param steps: Number of steps to time each game for.
+    :param repeats: Number of times to repeat the shorter measurements.
+    :param pings: Number of pings to send through each network device.
+    :param seed: Random seed.
+    :return: The benchmark metadata and results.
+    """
+    results = {}
+    for name in configs or list(CONFIGS):
+        print(f"Benchmarking {name}")
+        results[name] = benchmark_config(load(CONFIGS[name]), steps, repeats, seed)
+    for name, build_network in DEVICE_NETWORKS.items():
+        print(f"Benchmarking {name}")
+        results[name] = benchmark_device(build_network, pings)
+    return {
+        "metadata": {
+            "primaite_version": primaite.__version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "steps": steps,
+            "repeats": repeats,
+            "pings": pings,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare benchmark results against a baseline and print a table of the changes.
+
+    Rates (metrics ending in ``_per_s``) regress when they fall, and durations (metrics ending in ``_s``) regress when
+    they rise, by more than the tolerance. Other metrics, such as node and frame counts, are not compared.
+
+    :param results: Results of :py:func:`run`.
+    :param baseline: Results of an earlier run.
+    :param tolerance: Fractional change allowed before a metric counts as a regression.
+    :return: Descriptions of the metrics that regressed.
+    """
+    table = PrettyTable(["Benchmark", "Metric", "Baseline", "Current", "Change", "Status"])
+    table.align = "l"
+    regressions = []
+    for name, metrics in results["results"].items():
+        for metric, value in metrics.items():
+            if not metric.endswith("_s") or metric not in baseline["results"].get(name, {}):
+                continue
+            baseline_value = baseline["results"][name][metric]
+            change = (value - baseline_value) / baseline_value
+            worse = -change if metric.endswith("_per_s") else change
+            status = "REGRESSION" if worse > tolerance else "ok"
+            if status == "REGRESSION":
+                regressions.append(f"{name}.{metric}: {baseline_value:.6g} -> {value:.6g} ({change:+.1%})")
+            table.add_row([name, metric, f"{baseline_value:.6g}", f"{value:.6g}", f"{change:+.1%}", status])
+    print(table)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line, returning 1 if any metric regressed against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--configs", nargs="+", choices=list(CONFIGS), help="Bundled configs to benchmark.")
+    parser.add_argument("--steps", type=int, default=200, help="Number of steps to time each game for.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of times to repeat the shorter measurements.")
+    parser.add_argument("--pings", type=int, default=500, help="Number of pings to send through each device.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Path to write the results to.")
+    parser.add_argument("--baseline", type=Path, help="Results of an earlier run to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Save the results as the default baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Fractional slowdown counted as a regression.")
+    args = parser.parse_args(argv)
+
+    results = run(configs=args.configs, steps=args.steps, repeats=args.repeats, pings=args.pings, seed=args.seed)
+
+    output = args.output or _RESULTS_ROOT / f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    if args.save_baseline:
+        output = _DEFAULT_BASELINE
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(results, file, indent=4)
+    print(f"Saved results to {output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions:\n" + "\n".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
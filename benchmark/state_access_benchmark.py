@@ -0,0 +1,85 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""
+Benchmark accessing items in the simulation state, as observations and rewards do every step.
+
+Compares :py:class:`primaite.game.agent.utils.StateAccessor`, which is created once for each location in the state,
+with the recursive walk that ``access_from_nested_dict`` used to do, which copies the list of keys at every level. The
+locations accessed are every dictionary in the state of a bundled config's simulation, along with a missing key at the
+end of each one::
+
+    python state_access_benchmark.py --config uc7
+"""
+import argparse
+import copy
+import statistics
+import sys
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+from simulation_benchmark import _median_time, CONFIGS
+
+from primaite.config.load import load
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE, StateAccessor
+from primaite.game.game import PrimaiteGame
+
+
+def recursive_access(dictionary: Dict, keys: Optional[Sequence[Hashable]]) -> Any:
+    """The implementation of ``access_from_nested_dict`` before it was replaced by :py:class:`StateAccessor`."""
+    if keys is None:
+        return NOT_PRESENT_IN_STATE
+    key_list = [*keys]
+    if len(key_list) == 0:
+        return dictionary
+    k = key_list.pop(0)
+    if k not in dictionary:
+        return NOT_PRESENT_IN_STATE
+    return recursive_access(dictionary[k], key_list)
+
+
+def _locations(state: Dict, prefix: List[Hashable]) -> List[List[Hashable]]:
+    """Find the location of every dictionary nested in the state, and of a missing key in each of them."""
+    locations = [prefix, prefix + ["not-in-state"]]
+    for key, value in state.items():
+        if isinstance(value, dict):
+            locations.extend(_locations(value, prefix + [key]))
+    return locations
+
+
+def run(config: str, repeats: int) -> Dict[str, float]:
+    """
+    Time accessing every location in the state of a config's simulation with each implementation.
+
+    :param config: Name of the bundled config.
+    :param repeats: Number of times to access every location, of which the median time is taken.
+    :return: Mapping from metric name to value.
+    """
+    game = PrimaiteGame.from_config(copy.deepcopy(load(CONFIGS[config])))
+    state = game.get_sim_state()
+    locations = _locations(state, [])
+    accessors = [StateAccessor(location) for location in locations]
+    assert [recursive_access(state, location) for location in locations] == [accessor(state) for accessor in accessors]
+
+    recursive_s = _median_time(lambda: [recursive_access(state, location) for location in locations], repeats)
+    accessor_s = _median_time(lambda: [accessor(state) for accessor in accessors], repeats)
+    return {
+        "locations": len(locations),
+        "mean_depth": statistics.mean(len(location) for location in locations),
+        "recursive_s": recursive_s,
+        "accessor_s": accessor_s,
+        "speedup": recursive_s / accessor_s,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--config", choices=list(CONFIGS), default="data_manipulation", help="Bundled config to use.")
+    parser.add_argument("--repeats", type=int, default=50, help="Number of times to access every location.")
+    args = parser.parse_args(argv)
+
+    for metric, value in run(args.config, args.repeats).items():
+        print(f"{metric}: {value:.6g}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
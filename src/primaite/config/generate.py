@@ -0,0 +1,435 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Generate synthetic game configs of enterprise networks of any size, for testing how PrimAITE scales."""
+from ipaddress import IPv4Address
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from primaite import getLogger
+from primaite.simulator.network.creation import num_of_switches_required
+from primaite.simulator.network.transmission.network_layer import IPPacket
+
+_LOGGER = getLogger(__name__)
+
+_PERMITTED_PORTS = ["ARP", "DNS", "HTTP", "POSTGRES_SERVER"]
+"""Ports permitted through the core router and the firewall, in addition to ICMP."""
+
+_TRANSIT_SUBNET = "192.168.0"
+"""Subnet between the core router and the firewall."""
+
+_SERVER_SUBNET = "192.168.1"
+"""Subnet of the servers behind the firewall."""
+
+_FIRST_USER_SUBNET = 10
+"""Third octet of the first user subnet."""
+
+_DOMAIN_CONTROLLER_IP = f"{_SERVER_SUBNET}.10"
+_WEB_SERVER_IP = f"{_SERVER_SUBNET}.12"
+_DATABASE_SERVER_IP = f"{_SERVER_SUBNET}.14"
+
+
+class EnterpriseConfigGenerator(BaseModel):
+    """
+    Generates a game config for an enterprise network made up of a number of user subnets of the same size.
+
+    The user subnets are connected by a core router, which also connects them to a server subnet through a firewall.
+    Hosts in each user subnet are connected to edge switches with ``switch_ports`` ports, with one port of each edge
+    switch kept for its uplink. When a subnet needs more than one edge switch, the edge switches are connected to the
+    router through a core switch for the subnet, in the same way as ``OfficeLANAdder``.
+
+    The server subnet holds a domain controller running a DNS server, a web server and a database server. Every host
+    runs a DNS client, a web browser and a database client, and the first host of each subnet also has a data
+    manipulation bot. Green agents browse the web and query the database from hosts spread across the subnets, a red
+    agent attacks the database from the first host of a random subnet, and a blue agent observes the servers.
+
+    Example:
+    ```
+    cfg = EnterpriseConfigGenerator(num_subnets=10, hosts_per_subnet=50).generate()
+    game = PrimaiteGame.from_config(cfg)
+    ```
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    num_subnets: int = Field(default=2, ge=1, le=245 - _FIRST_USER_SUBNET)
+    """Number of user subnets."""
+    hosts_per_subnet: int = Field(default=10, ge=1)
+    """Number of hosts in each user subnet."""
+    switch_ports: int = Field(default=24, ge=2)
+    """Number of ports on each switch."""
+    green_agents_per_subnet: int = Field(default=1, ge=0)
+    """Number of green agents in each user subnet, each using a different host. Capped at ``hosts_per_subnet``."""
+    include_red_agent: bool = True
+    """Whether to include a red agent which attacks the database."""
+    max_episode_length: int = Field(default=128, ge=1)
+    """Number of steps in each episode."""
+
+    @model_validator(mode="after")
+    def check_subnet_size(self) -> "EnterpriseConfigGenerator":
+        """
+        Make sure each user subnet can be built and its hosts can reach the router.
+
+        A core switch must have enough ports to connect all the edge switches of a subnet. A broadcast frame is shared
+        by every interface it is flooded to, and each of them decrements its TTL, so the hosts, switches and router
+        port of a subnet must not outnumber the default TTL or ARP requests will not reach every interface.
+        """
+        num_edge_switches = num_of_switches_required(self.hosts_per_subnet, self.switch_ports)
+        if num_edge_switches > self.switch_ports - 1:
+            raise ValueError(
+                f"Cannot connect {self.hosts_per_subnet} hosts with {self.switch_ports} port switches, because "
+                f"{num_edge_switches} edge switches are needed but a core switch only has room for "
+                f"{self.switch_ports - 1}."
+            )
+        num_switches = num_edge_switches + (1 if num_edge_switches > 1 else 0)
+        broadcast_domain_size = self.hosts_per_subnet + num_switches + 1
+        max_broadcast_domain_size = IPPacket.model_fields["ttl"].default
+        if broadcast_domain_size > max_broadcast_domain_size:
+            raise ValueError(
+                f"Cannot put {self.hosts_per_subnet} hosts in one subnet, because with its {num_switches} switches and "
+                f"router port the subnet has {broadcast_domain_size} interfaces that broadcasts are flooded to, more "
+                f"than the default TTL of {max_broadcast_domain_size}. Use more, smaller subnets instead."
+            )
+        return self
+
+    @property
+    def num_hosts(self) -> int:
+        """Total number of hosts across the user subnets."""
+        return self.num_subnets * self.hosts_per_subnet
+
+    @staticmethod
+    def host_name(subnet: int, host: int) -> str:
+        """Get the hostname of a host in a user subnet, where both are numbered from 1."""
+        return f"pc_{subnet}_{host}"
+
+    def generate(self) -> Dict:
+        """
+        Generate the game config.
+
+        :return: Game config, in the same form as a loaded YAML config.
+        :rtype: Dict
+        """
+        nodes, links = self._server_side()
+        for subnet in range(1, self.num_subnets + 1):
+            subnet_nodes, subnet_links = self._user_subnet(subnet)
+            nodes.extend(subnet_nodes)
+            links.extend(subnet_links)
+
+        return {
+            "metadata": {"version": 3.0},
+            "io_settings": {
+                "save_agent_actions": False,
+                "save_step_metadata": False,
+                "save_pcap_logs": False,
+                "save_sys_logs": False,
+            },
+            "game": {
+                "max_episode_length": self.max_episode_length,
+                "ports": ["HTTP", "POSTGRES_SERVER", "DNS"],
+                "protocols": ["ICMP", "TCP", "UDP"],
+            },
+            "agents": self._agents(),
+            "simulation": {"network": {"nodes": nodes, "links": links}},
+        }
+
+    def save(self, file_path: Union[str, Path]) -> Path:
+        """
+        Generate the game config and write it to a YAML file.
+
+        :param file_path: Path to write the config to.
+        :type file_path: Union[str, Path]
+        :return: Path the config was written to.
+        :rtype: Path
+        """
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w") as file:
+            yaml.safe_dump(self.generate(), file, sort_keys=False)
+        _LOGGER.info(f"Saved {self.num_hosts} host config to {file_path}")
+        return file_path
+
+    @staticmethod
+    def _acl() -> Dict[int, Dict[str, str]]:
+        acl = {
+            position: {"action": "PERMIT", "src_port": port, "dst_port": port}
+            for position, port in enumerate(_PERMITTED_PORTS, start=19)
+        }
+        acl[23] = {"action": "PERMIT", "protocol": "ICMP"}
+        return acl
+
+    @staticmethod
+    def _link(hostname_a: str, port_a: int, hostname_b: str, port_b: int) -> Dict[str, Any]:
+        return {
+            "endpoint_a_hostname": hostname_a,
+            "endpoint_a_port": port_a,
+            "endpoint_b_hostname": hostname_b,
+            "endpoint_b_port": port_b,
+        }
+
+    def _server_side(self) -> Tuple[List[Dict], List[Dict]]:
+        """Nodes and links of the core router, the firewall and the server subnet."""
+        router_ports = {
+            1: {"ip_address": f"{_TRANSIT_SUBNET}.1", "subnet_mask": "255.255.255.0"},
+        }
+        for subnet in range(1, self.num_subnets + 1):
+            router_ports[subnet + 1] = {
+                "ip_address": f"192.168.{_FIRST_USER_SUBNET + subnet - 1}.1",
+                "subnet_mask": "255.255.255.0",
+            }
+        server_defaults = {
+            "type": "server",
+            "subnet_mask": "255.255.255.0",
+            "default_gateway": f"{_SERVER_SUBNET}.1",
+            "dns_server": _DOMAIN_CONTROLLER_IP,
+        }
+        nodes = [
+            {
+                "hostname": "router_core",
+                "type": "router",
+                "num_ports": self.num_subnets + 1,
+                "ports": router_ports,
+                "acl": self._acl(),
+                "routes": [
+                    {
+                        "address": f"{_SERVER_SUBNET}.0",
+                        "subnet_mask": "255.255.255.0",
+                        "next_hop_ip_address": f"{_TRANSIT_SUBNET}.2",
+                    }
+                ],
+            },
+            {
+                "hostname": "firewall",
+                "type": "firewall",
+                "ports": {
+                    "external_port": {"ip_address": f"{_TRANSIT_SUBNET}.2", "subnet_mask": "255.255.255.0"},
+                    "internal_port": {"ip_address": f"{_SERVER_SUBNET}.1", "subnet_mask": "255.255.255.0"},
+                },
+                "acl": {
+                    "internal_inbound_acl": self._acl(),
+                    "internal_outbound_acl": self._acl(),
+                    "dmz_inbound_acl": {},
+                    "dmz_outbound_acl": {},
+                    "external_inbound_acl": self._acl(),
+                    "external_outbound_acl": self._acl(),
+                },
+                "default_route": {"next_hop_ip_address": f"{_TRANSIT_SUBNET}.1"},
+            },
+            {"hostname": "switch_servers", "type": "switch", "num_ports": self.switch_ports},
+            {
+                **server_defaults,
+                "hostname": "domain_controller",
+                "ip_address": _DOMAIN_CONTROLLER_IP,
+                "services": [{"type": "dns-server", "options": {"domain_mapping": {"arcd.com": _WEB_SERVER_IP}}}],
+            },
+            {
+                **server_defaults,
+                "hostname": "web_server",
+                "ip_address": _WEB_SERVER_IP,
+                "services": [{"type": "web-server"}],
+                "applications": [{"type": "database-client", "options": {"db_server_ip": _DATABASE_SERVER_IP}}],
+            },
+            {
+                **server_defaults,
+                "hostname": "database_server",
+                "ip_address": _DATABASE_SERVER_IP,
+                "services": [{"type": "database-service"}],
+            },
+        ]
+        links = [
+            self._link("router_core", 1, "firewall", 1),
+            self._link("firewall", 2, "switch_servers", self.switch_ports),
+            self._link("switch_servers", 1, "domain_controller", 1),
+            self._link("switch_servers", 2, "web_server", 1),
+            self._link("switch_servers", 3, "database_server", 1),
+        ]
+        return nodes, links
+
+    def _user_subnet(self, subnet: int) -> Tuple[List[Dict], List[Dict]]:
+        """Nodes and links of a user subnet, where subnets are numbered from 1."""
+        third_octet = _FIRST_USER_SUBNET + subnet - 1
+        num_edge_switches = num_of_switches_required(self.hosts_per_subnet, self.switch_ports)
+        hosts_per_switch = self.switch_ports - 1
+        uplink = self.switch_ports
+
+        nodes = []
+        links = []
+        if num_edge_switches > 1:
+            core_switch = f"switch_core_{subnet}"
+            nodes.append({"hostname": core_switch, "type": "switch", "num_ports": self.switch_ports})
+            links.append(self._link("router_core", subnet + 1, core_switch, uplink))
+        for switch_n in range(1, num_edge_switches + 1):
+            edge_switch = f"switch_edge_{subnet}_{switch_n}"
+            nodes.append({"hostname": edge_switch, "type": "switch", "num_ports": self.switch_ports})
+            if num_edge_switches > 1:
+                links.append(self._link(core_switch, switch_n, edge_switch, uplink))
+            else:
+                links.append(self._link("router_core", subnet + 1, edge_switch, uplink))
+
+        for host in range(1, self.hosts_per_subnet + 1):
+            hostname = self.host_name(subnet, host)
+            applications = [
+                {"type": "web-browser", "options": {"target_url": "http://arcd.com/users/"}},
+                {"type": "database-client", "options": {"db_server_ip": _DATABASE_SERVER_IP}},
+            ]
+            if host == 1:
+                applications.append(
+                    {
+                        "type": "data-manipulation-bot",
+                        "options": {
+                            "port_scan_p_of_success": 0.8,
+                            "data_manipulation_p_of_success": 0.8,
+                            "payload": "DELETE",
+                            "server_ip": _DATABASE_SERVER_IP,
+                        },
+                    }
+                )
+            # Addresses .2 to .9 are left free, as in the bundled configs
+            nodes.append(
+                {
+                    "hostname": hostname,
+                    "type": "computer",
+                    "ip_address": str(IPv4Address(f"192.168.{third_octet}.{9 + host}")),
+                    "subnet_mask": "255.255.255.0",
+                    "default_gateway": f"192.168.{third_octet}.1",
+                    "dns_server": _DOMAIN_CONTROLLER_IP,
+                    "applications": applications,
+                    "services": [{"type": "dns-client"}],
+                }
+            )
+            switch_n, switch_port = divmod(host - 1, hosts_per_switch)
+            links.append(self._link(f"switch_edge_{subnet}_{switch_n + 1}", switch_port + 1, hostname, 1))
+        return nodes, links
+
+    def _agents(self) -> List[Dict[str, Any]]:
+        agents = []
+        green_hosts = [
+            self.host_name(subnet, host)
+            for subnet in range(1, self.num_subnets + 1)
+            for host in range(1, min(self.green_agents_per_subnet, self.hosts_per_subnet) + 1)
+        ]
+        for hostname in green_hosts:
+            agents.append(
+                {
+                    "ref": f"{hostname}_green_user",
+                    "team": "GREEN",
+                    "type": "probabilistic-agent",
+                    "agent_settings": {"action_probabilities": {0: 0.3, 1: 0.6, 2: 0.1}},
+                    "action_space": {
+                        "action_map": {
+                            0: {"action": "do-nothing", "options": {}},
+                            1: {
+                                "action": "node-application-execute",
+                                "options": {"node_name": hostname, "application_name": "web-browser"},
+                            },
+                            2: {
+                                "action": "node-application-execute",
+                                "options": {"node_name": hostname, "application_name": "database-client"},
+                            },
+                        }
+                    },
+                    "reward_function": {
+                        "reward_components": [
+                            {
+                                "type": "webpage-unavailable-penalty",
+                                "weight": 0.25,
+                                "options": {"node_hostname": hostname},
+                            },
+                            {
+                                "type": "green-admin-database-unreachable-penalty",
+                                "weight": 0.05,
+                                "options": {"node_hostname": hostname},
+                            },
+                        ]
+                    },
+                }
+            )
+
+        if self.include_red_agent:
+            agents.append(
+                {
+                    "ref": "data_manipulation_attacker",
+                    "team": "RED",
+                    "type": "red-database-corrupting-agent",
+                    "agent_settings": {
+                        "possible_start_nodes": [
+                            self.host_name(subnet, 1) for subnet in range(1, self.num_subnets + 1)
+                        ],
+                        "target_application": "data-manipulation-bot",
+                        "start_step": 25,
+                        "frequency": 20,
+                        "variance": 5,
+                    },
+                }
+            )
+
+        server_actions = []
+        for hostname in ["domain_controller", "web_server", "database_server"]:
+            for action in ["node-os-scan", "node-shutdown", "node-startup", "node-reset"]:
+                server_actions.append({"action": action, "options": {"node_name": hostname}})
+        agents.append(
+            {
+                "ref": "defender",
+                "team": "BLUE",
+                "type": "proxy-agent",
+                "observation_space": {
+                    "type": "custom",
+                    "options": {
+                        "components": [
+                            {
+                                "type": "nodes",
+                                "label": "NODES",
+                                "options": {
+                                    "hosts": [
+                                        {"hostname": "domain_controller"},
+                                        {"hostname": "web_server", "services": [{"service_name": "web-server"}]},
+                                        {
+                                            "hostname": "database_server",
+                                            "folders": [
+                                                {"folder_name": "database", "files": [{"file_name": "database.db"}]}
+                                            ],
+                                        },
+                                    ],
+                                    "routers": [{"hostname": "router_core"}],
+                                    "firewalls": [{"hostname": "firewall"}],
+                                    "num_services": 1,
+                                    "num_applications": 0,
+                                    "num_folders": 1,
+                                    "num_files": 1,
+                                    "num_nics": 1,
+                                    "include_num_access": False,
+                                    "include_nmne": False,
+                                    "num_ports": 0,
+                                    "ip_list": [_WEB_SERVER_IP, _DATABASE_SERVER_IP],
+                                    "wildcard_list": ["0.0.0.1"],
+                                    "port_list": ["HTTP", "POSTGRES_SERVER"],
+                                    "protocol_list": ["ICMP", "TCP", "UDP"],
+                                    "num_rules": 10,
+                                },
+                            }
+                        ]
+                    },
+                },
+                "action_space": {
+                    "action_map": {
+                        0: {"action": "do-nothing", "options": {}},
+                        **{index: action for index, action in enumerate(server_actions, start=1)},
+                    }
+                },
+                "reward_function": {
+                    "reward_components": [
+                        {
+                            "type": "database-file-integrity",
+                            "weight": 0.4,
+                            "options": {
+                                "node_hostname": "database_server",
+                                "folder_name": "database",
+                                "file_name": "database.db",
+                            },
+                        }
+                    ]
+                },
+                "agent_settings": {"flatten_obs": True, "action_masking": True},
+            }
+        )
+        return agents
@@ -3,15 +3,17 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from gymnasium import spaces
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, PrivateAttr
 
 from primaite.game.agent.actions.abstract import AbstractAction
 from primaite.interface.request import RequestFormat
+from primaite.simulator.core import RequestManager, RequestPermissionValidator, SimComponent
 
-__all__ = ("DoNothingAction", "ActionManager")
+__all__ = ("DoNothingAction", "ActionManager", "ActionMaskEngine")
 
 
 class DoNothingAction(AbstractAction, discriminator="do-nothing"):
@@ -56,6 +58,9 @@ class ActionManager(BaseModel):
     action_map: Dict[int, Tuple[str, Dict]] = {}
     """Init as empty, populate after model validation."""
 
+    _requests: Dict[int, RequestFormat] = PrivateAttr(default_factory=dict)
+    """Requests formed from the action map, by action number."""
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.action_map = {n: (v.action, v.options) for n, v in self.config.action_map.items()}
@@ -76,6 +81,21 @@ class ActionManager(BaseModel):
         config = act_class.ConfigSchema(**action_options)
         return act_class.form_request(config=config)
 
+    def get_request(self, action: int) -> RequestFormat:
+        """
+        Get the request for an action in the action map.
+
+        The request is formed the first time it is needed and reused afterwards, as it only depends on the action map.
+
+        :param action: The action number.
+        :type action: int
+        :return: The action formatted as a request.
+        :rtype: RequestFormat
+        """
+        if action not in self._requests:
+            self._requests[action] = self.form_request(*self.action_map[action])
+        return self._requests[action]
+
     @property
     def space(self) -> spaces.Space:
         """Return the gymnasium action space for this agent."""
@@ -96,3 +116,76 @@ class ActionManager(BaseModel):
         :rtype: ActionManager
         """
         return cls(**cfg.get("options", {}), act_map=cfg.get("action_map"))
+
+
+class _MaskEntry:
+    """The compiled validity check for one action of an :py:class:`ActionMaskEngine`."""
+
+    __slots__ = ("validator", "options", "dependencies", "change_counts")
+
+    def __init__(
+        self,
+        validator: RequestPermissionValidator,
+        options: RequestFormat,
+        dependencies: Optional[List[SimComponent]],
+    ):
+        self.validator: RequestPermissionValidator = validator
+        self.options: RequestFormat = options
+        self.dependencies: Optional[List[SimComponent]] = dependencies
+        self.change_counts: Optional[List[int]] = None
+
+
+class ActionMaskEngine:
+    """
+    Calculates the action mask of an agent, re-evaluating only the actions whose validity may have changed.
+
+    Each action's request is resolved to the request type that would handle it once, so the request manager tree is not
+    walked again until a request is added or removed anywhere in the simulation. An action is only re-checked if one of
+    the components its validator depends on, or one of their children, has changed since the action was last checked.
+
+    :param action_manager: The action manager of the agent.
+    :type action_manager: ActionManager
+    :param request_manager: The request manager of the simulation.
+    :type request_manager: RequestManager
+    """
+
+    def __init__(self, action_manager: ActionManager, request_manager: RequestManager) -> None:
+        self.action_manager: ActionManager = action_manager
+        self.request_manager: RequestManager = request_manager
+        self._mask: np.ndarray = np.zeros(len(action_manager.action_map), dtype=np.int8)
+        self._entries: List[Optional[_MaskEntry]] = []
+        self._structure_version: Optional[int] = None
+
+    def _compile(self) -> None:
+        """Resolve the request of every action to the validator which decides whether it is valid."""
+        self._entries = []
+        for action in range(len(self.action_manager.action_map)):
+            resolved = self.request_manager.resolve(self.action_manager.get_request(action))
+            if resolved is None:
+                self._entries.append(None)
+                self._mask[action] = 0
+                continue
+            request_type, options = resolved
+            validator = request_type.validator
+            self._entries.append(_MaskEntry(validator=validator, options=options, dependencies=validator.dependencies))
+        self._structure_version = RequestManager.structure_version
+
+    def mask(self) -> np.ndarray:
+        """
+        Return the action mask for the agent.
+
+        :return: An array with an entry for each action, which is 1 if the action is valid and 0 otherwise.
+        :rtype: np.ndarray
+        """
+        if self._structure_version != RequestManager.structure_version:
+            self._compile()
+        for action, entry in enumerate(self._entries):
+            if entry is None:
+                continue
+            if entry.dependencies is not None:
+                change_counts = [component.change_count for component in entry.dependencies]
+                if change_counts == entry.change_counts:
+                    continue
+                entry.change_counts = change_counts
+            self._mask[action] = entry.validator(entry.options, {})
+        return self._mask.copy()
@@ -2,7 +2,7 @@
 """Optional logger for internal agent decisions and debugging."""
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 from prettytable import MARKDOWN, PrettyTable
 
@@ -26,6 +26,9 @@ class AgentLog:
 
     Each log message is written to a file located at:
     <simulation output directory>/agent_name/agent_name.log
+
+    As with ``SysLog``, messages can be given as a %-style format string and values which are only formatted if the
+    message is output.
     """
 
     def __init__(self, agent_name: Optional[str]):
@@ -97,79 +100,74 @@ class AgentLog:
         if to_terminal or SIM_OUTPUT.write_agent_log_to_terminal:
             print(f"{self.agent_name}: ({self.timestep}) ({level}) {msg}")
 
-    def debug(self, msg: str, to_terminal: bool = False):
+    def _log(self, level: LogLevel, msg: str, args: Tuple[Any, ...], to_terminal: bool) -> None:
+        if SIM_OUTPUT.agent_log_level > level:
+            return
+        if args:
+            msg = msg % args
+        if SIM_OUTPUT.save_agent_logs:
+            self.logger.log(level, msg, extra={"timestep": self.timestep})
+        self._write_to_terminal(msg, level.name, to_terminal)
+
+    def debug(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the DEBUG level.
 
-        :param msg: The message to be logged.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.agent_log_level > LogLevel.DEBUG:
+        if SIM_OUTPUT.agent_log_threshold > LogLevel.DEBUG and not to_terminal:
             return
+        self._log(LogLevel.DEBUG, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_agent_logs:
-            self.logger.debug(msg, extra={"timestep": self.timestep})
-        self._write_to_terminal(msg, "DEBUG", to_terminal)
-
-    def info(self, msg: str, to_terminal: bool = False):
+    def info(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the INFO level.
 
-        :param msg: The message to be logged.
-        :param timestep: The current timestep.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.agent_log_level > LogLevel.INFO:
+        if SIM_OUTPUT.agent_log_threshold > LogLevel.INFO and not to_terminal:
             return
+        self._log(LogLevel.INFO, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_agent_logs:
-            self.logger.info(msg, extra={"timestep": self.timestep})
-        self._write_to_terminal(msg, "INFO", to_terminal)
-
-    def warning(self, msg: str, to_terminal: bool = False):
+    def warning(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the WARNING level.
 
-        :param msg: The message to be logged.
-        :param timestep: The current timestep.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.agent_log_level > LogLevel.WARNING:
+        if SIM_OUTPUT.agent_log_threshold > LogLevel.WARNING and not to_terminal:
             return
+        self._log(LogLevel.WARNING, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_agent_logs:
-            self.logger.warning(msg, extra={"timestep": self.timestep})
-        self._write_to_terminal(msg, "WARNING", to_terminal)
-
-    def error(self, msg: str, to_terminal: bool = False):
+    def error(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the ERROR level.
 
-        :param msg: The message to be logged.
-        :param timestep: The current timestep.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.agent_log_level > LogLevel.ERROR:
+        if SIM_OUTPUT.agent_log_threshold > LogLevel.ERROR and not to_terminal:
             return
+        self._log(LogLevel.ERROR, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_agent_logs:
-            self.logger.error(msg, extra={"timestep": self.timestep})
-        self._write_to_terminal(msg, "ERROR", to_terminal)
-
-    def critical(self, msg: str, to_terminal: bool = False):
+    def critical(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the CRITICAL level.
 
-        :param msg: The message to be logged.
-        :param timestep: The current timestep.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if LogLevel.CRITICAL < SIM_OUTPUT.agent_log_level:
+        if SIM_OUTPUT.agent_log_threshold > LogLevel.CRITICAL and not to_terminal:
             return
-
-        if SIM_OUTPUT.save_agent_logs:
-            self.logger.critical(msg, extra={"timestep": self.timestep})
-        self._write_to_terminal(msg, "CRITICAL", to_terminal)
+        self._log(LogLevel.CRITICAL, msg, args, to_terminal)
 
     def show(self, last_n: int = 10, markdown: bool = False):
         """
@@ -2,8 +2,24 @@
 """Interface for agents."""
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple, Type, TYPE_CHECKING
+from array import array
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 from gymnasium.core import ActType, ObsType
 from prettytable import PrettyTable
@@ -18,7 +34,7 @@ from primaite.interface.request import RequestFormat, RequestResponse
 if TYPE_CHECKING:
     pass
 
-__all__ = ("AgentHistoryItem", "AbstractAgent", "AbstractScriptedAgent", "ProxyAgent")
+__all__ = ("AgentHistoryItem", "AgentHistory", "AbstractAgent", "AbstractScriptedAgent", "ProxyAgent")
 
 
 class AgentHistoryItem(BaseModel):
@@ -47,6 +63,141 @@ class AgentHistoryItem(BaseModel):
     """The observation space data for this step."""
 
 
+_RESPONSE_STATUSES: Final[Tuple[str, ...]] = ("pending", "success", "failure", "unreachable")
+"""Statuses of request responses, indexed by the status ids stored by :py:class:`AgentHistory`."""
+
+
+class AgentHistory(Sequence[AgentHistoryItem]):
+    """
+    An agent's action log, which can be configured to keep only the details of the most recent steps.
+
+    The history is a sequence of :py:class:`AgentHistoryItem`, one for each step in the order they were recorded. The
+    timestep, action, reward and response of every step are stored in columns, as scripted agents such as TAPs look
+    back at the responses to earlier steps. Full items, holding the parameters, request and observation of their step,
+    are kept for every step, the most recent ``length`` steps, or only the most recent step, depending on the
+    ``retention``. Accessing an older step returns an item rebuilt from the columns, which has empty parameters,
+    request and reward info and no observation.
+
+    :param config: Which steps to keep full items for, and whether to keep observations.
+    :type config: Optional[AgentHistory.ConfigSchema]
+    """
+
+    class ConfigSchema(BaseModel):
+        """Configuration schema for the 'history' key of an agent's config."""
+
+        model_config = ConfigDict(extra="forbid")
+
+        retention: Literal["full", "last-n", "none"] = "full"
+        """
+        Which steps to keep full items for: every step, the most recent ``length`` steps, or only the most recent step,
+        which the reward function and environments need.
+        """
+        length: int = Field(default=100, ge=1)
+        """Number of steps to keep full items for when ``retention`` is ``last-n``."""
+        save_observations: bool = True
+        """Whether to keep the observation of each step in its item."""
+
+    def __init__(self, config: Optional[ConfigSchema] = None) -> None:
+        self.config: AgentHistory.ConfigSchema = config or AgentHistory.ConfigSchema()
+        self._max_items: Optional[int] = {"full": None, "last-n": self.config.length, "none": 1}[self.config.retention]
+        self._items: List[AgentHistoryItem] = []
+        """Full items of the most recent steps."""
+        self._timesteps: array = array("l")
+        self._action_ids: array = array("L")
+        self._rewards: array = array("d")
+        """Reward of each step, NaN if it has not been given one."""
+        self._status_ids: array = array("B")
+        self._response_data: List[Dict] = []
+        self._action_names: List[str] = []
+        self._action_name_ids: Dict[str, int] = {}
+
+    def append(self, item: AgentHistoryItem) -> None:
+        """
+        Record the item of the latest step.
+
+        :param item: What the agent did, and how the simulation responded.
+        :type item: AgentHistoryItem
+        """
+        if not self.config.save_observations:
+            item.observation = None
+        action_id = self._action_name_ids.get(item.action)
+        if action_id is None:
+            action_id = self._action_name_ids[item.action] = len(self._action_names)
+            self._action_names.append(item.action)
+        self._timesteps.append(item.timestep)
+        self._action_ids.append(action_id)
+        self._rewards.append(math.nan)
+        self._status_ids.append(0)
+        self._response_data.append(item.response.data)
+        self._items.append(item)
+        if self._max_items is not None and len(self._items) > self._max_items:
+            self._store_columns(len(self) - len(self._items), self._items.pop(0))
+
+    def _store_columns(self, index: int, item: AgentHistoryItem) -> None:
+        """Copy the reward and response of a step's item to the columns, as they can change after recording."""
+        self._rewards[index] = math.nan if item.reward is None else item.reward
+        self._status_ids[index] = _RESPONSE_STATUSES.index(item.response.status)
+        self._response_data[index] = item.response.data
+
+    def _sync_columns(self) -> None:
+        first_kept = len(self) - len(self._items)
+        for offset, item in enumerate(self._items):
+            self._store_columns(first_kept + offset, item)
+
+    def __len__(self) -> int:
+        return len(self._timesteps)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[AgentHistoryItem, List[AgentHistoryItem]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("agent history index out of range")
+        offset = index - (len(self) - len(self._items))
+        if offset >= 0:
+            return self._items[offset]
+        reward = self._rewards[index]
+        return AgentHistoryItem(
+            timestep=self._timesteps[index],
+            action=self._action_names[self._action_ids[index]],
+            parameters={},
+            request=[],
+            response=RequestResponse(
+                status=_RESPONSE_STATUSES[self._status_ids[index]], data=self._response_data[index]
+            ),
+            reward=None if math.isnan(reward) else reward,
+        )
+
+    def __iter__(self) -> Iterator[AgentHistoryItem]:
+        first_kept = len(self) - len(self._items)
+        for index in range(first_kept):
+            yield self[index]
+        yield from list(self._items)
+
+    @property
+    def timesteps(self) -> List[int]:
+        """Timestep of each step."""
+        return self._timesteps.tolist()
+
+    @property
+    def actions(self) -> List[str]:
+        """CAOS action name of each step."""
+        return [self._action_names[action_id] for action_id in self._action_ids]
+
+    @property
+    def rewards(self) -> List[Optional[float]]:
+        """Reward of each step, or None if it has not been given one."""
+        self._sync_columns()
+        return [None if math.isnan(reward) else reward for reward in self._rewards]
+
+    @property
+    def response_statuses(self) -> List[str]:
+        """Status of the simulation's response to each step's request."""
+        self._sync_columns()
+        return [_RESPONSE_STATUSES[status_id] for status_id in self._status_ids]
+
+
 class AbstractAgent(BaseModel, ABC):
     """Base class for scripted and RL agents."""
 
@@ -71,6 +222,8 @@ class AbstractAgent(BaseModel, ABC):
             default_factory=lambda: ObservationManager.ConfigSchema()
         )
         reward_function: RewardFunction.ConfigSchema = Field(default_factory=lambda: RewardFunction.ConfigSchema())
+        history: AgentHistory.ConfigSchema = Field(default_factory=lambda: AgentHistory.ConfigSchema())
+        """Which steps of the agent's action log to keep in full."""
         thresholds: Optional[Dict] = {}
         # TODO: this is only relevant to some observations, need to refactor the way thresholds are dealt with (#3085)
         """A dict containing the observation thresholds."""
@@ -78,7 +231,7 @@ class AbstractAgent(BaseModel, ABC):
     config: ConfigSchema = Field(default_factory=lambda: AbstractAgent.ConfigSchema())
 
     logger: AgentLog = None
-    history: List[AgentHistoryItem] = []
+    history: AgentHistory = Field(default_factory=lambda: AgentHistory())
 
     action_manager: ActionManager = Field(default_factory=lambda: ActionManager())
     observation_manager: ObservationManager = Field(default_factory=lambda: ObservationManager())
@@ -105,6 +258,7 @@ class AbstractAgent(BaseModel, ABC):
         self.config.observation_space.options.thresholds = self.config.thresholds
         self.observation_manager = ObservationManager(config=self.config.observation_space)
         self.reward_function = RewardFunction(config=self.config.reward_function)
+        self.history = AgentHistory(config=self.config.history)
         return super().model_post_init(__context)
 
     def show_history(self, ignored_actions: Optional[list] = None):
@@ -200,6 +354,16 @@ class AbstractAgent(BaseModel, ABC):
         """Update the most recent history item with the reward value."""
         self.history[-1].reward = self.reward_function.current_reward
 
+    def reset_for_episode(self) -> None:
+        """
+        Redraw the random choices that the agent makes when it is built, such as its schedule or starting node.
+
+        Games restored from a snapshot reuse agents that were built for an earlier episode, so this is called on each
+        of them to vary their behaviour between episodes as a freshly built agent would. Agents which make no random
+        choices when they are built do not need to override this.
+        """
+        pass
+
     @classmethod
     def from_config(cls, config: Dict) -> AbstractAgent:
         """Grab the relevant agent class and construct an instance from a config dict."""
@@ -9,7 +9,7 @@ from gymnasium.core import ObsType
 
 from primaite import getLogger
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 from primaite.utils.validation.ip_protocol import IPProtocol
 from primaite.utils.validation.ipv4_address import StrIP
 from primaite.utils.validation.port import Port
@@ -89,7 +89,7 @@ class ACLObservation(AbstractObservation, discriminator="acl"):
         :return: Observation containing ACL rules.
         :rtype: ObsType
         """
-        acl_state: Dict = access_from_nested_dict(state, self.where)
+        acl_state: Dict = self._state_accessor(state)
         if acl_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
         obs = {}
@@ -8,7 +8,7 @@ from gymnasium.core import ObsType
 
 from primaite import getLogger
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 
 _LOGGER = getLogger(__name__)
 
@@ -109,7 +109,7 @@ class FileObservation(AbstractObservation, discriminator="file"):
         :return: Observation containing the health status of the file and optionally the number of accesses.
         :rtype: ObsType
         """
-        file_state = access_from_nested_dict(state, self.where)
+        file_state = self._state_accessor(state)
         if file_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
         if self.file_system_requires_scan:
@@ -236,7 +236,7 @@ class FolderObservation(AbstractObservation, discriminator="folder"):
         :return: Observation containing the health status of the folder and status of files within the folder.
         :rtype: ObsType
         """
-        folder_state = access_from_nested_dict(state, self.where)
+        folder_state = self._state_accessor(state)
         if folder_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
 
@@ -10,7 +10,7 @@ from primaite import getLogger
 from primaite.game.agent.observations.acl_observation import ACLObservation
 from primaite.game.agent.observations.nic_observations import PortObservation
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 from primaite.utils.validation.ip_protocol import IPProtocol
 from primaite.utils.validation.ipv4_address import StrIP
 from primaite.utils.validation.port import Port
@@ -154,7 +154,7 @@ class FirewallObservation(AbstractObservation, discriminator="firewall"):
         :return: Observation containing the status of ports and ACLs for internal, DMZ, and external traffic.
         :rtype: ObsType
         """
-        firewall_state = access_from_nested_dict(state, self.where)
+        firewall_state = self._state_accessor(state)
         if firewall_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
 
@@ -11,7 +11,7 @@ from primaite.game.agent.observations.file_system_observations import FolderObse
 from primaite.game.agent.observations.nic_observations import NICObservation
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
 from primaite.game.agent.observations.software_observation import ApplicationObservation, ServiceObservation
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 from primaite.utils.validation.ip_protocol import IPProtocol
 from primaite.utils.validation.port import Port
 
@@ -211,7 +211,7 @@ class HostObservation(AbstractObservation, discriminator="host"):
         :return: Observation containing the status information about the host.
         :rtype: ObsType
         """
-        node_state = access_from_nested_dict(state, self.where)
+        node_state = self._state_accessor(state)
         if node_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
 
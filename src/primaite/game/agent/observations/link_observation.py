@@ -8,7 +8,7 @@ from gymnasium.core import ObsType
 
 from primaite import getLogger
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 
 _LOGGER = getLogger(__name__)
 
@@ -42,10 +42,11 @@ class LinkObservation(AbstractObservation, discriminator="link"):
         :return: Observation containing information about the link.
         :rtype: Any
         """
-        link_state = access_from_nested_dict(state, self.where)
+        link_state = self._state_accessor(state)
         if link_state is NOT_PRESENT_IN_STATE:
-            self.where[-1] = "<->".join(self.where[-1].split("<->")[::-1])  # try swapping endpoint A and B
-            link_state = access_from_nested_dict(state, self.where)
+            # try swapping endpoint A and B
+            self.where = [*self.where[:-1], "<->".join(self.where[-1].split("<->")[::-1])]
+            link_state = self._state_accessor(state)
             if link_state is NOT_PRESENT_IN_STATE:
                 return self.default_observation
 
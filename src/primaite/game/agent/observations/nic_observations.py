@@ -7,7 +7,7 @@ from gymnasium import spaces
 from gymnasium.core import ObsType
 
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 from primaite.simulator.network.nmne import NMNEConfig
 from primaite.utils.validation.ip_protocol import IPProtocol
 from primaite.utils.validation.port import Port
@@ -146,7 +146,7 @@ class NICObservation(AbstractObservation, discriminator="network-interface"):
         :return: Observation containing the status of the network interface and optionally NMNE information.
         :rtype: ObsType
         """
-        nic_state = access_from_nested_dict(state, self.where)
+        nic_state = self._state_accessor(state)
 
         if nic_state is NOT_PRESENT_IN_STATE or self.where is None:
             return self.default_observation
@@ -289,7 +289,7 @@ class PortObservation(AbstractObservation, discriminator="port"):
         :return: Observation containing the operating status of the port.
         :rtype: ObsType
         """
-        port_state = access_from_nested_dict(state, self.where)
+        port_state = self._state_accessor(state)
         if port_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
         return {"operating_status": 1 if port_state["enabled"] else 2}
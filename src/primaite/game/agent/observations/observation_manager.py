@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from gymnasium import spaces
 from gymnasium.core import ObsType
-from pydantic import BaseModel, computed_field, ConfigDict, Field, model_validator, ValidationError
+from pydantic import BaseModel, computed_field, ConfigDict, Field, model_validator, PrivateAttr, ValidationError
 
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
 
@@ -143,6 +144,127 @@ class NullObservation(AbstractObservation, discriminator="none"):
         return cls()
 
 
+class FlatObservationEncoder:
+    """
+    Flattens observations of a fixed observation space into a 1D array, equivalent to ``gymnasium.spaces.flatten``.
+
+    ``gymnasium.spaces.flatten`` recursively walks the space and concatenates a new array for every leaf of the
+    observation on every call. The encoder instead walks the space once, when it is created, to lay out where each leaf
+    of the observation is written in the flattened array. Encoding an observation then writes each leaf directly into
+    a preallocated buffer.
+
+    :param space: The observation space to flatten observations of.
+    :type space: spaces.Space
+    """
+
+    def __init__(self, space: spaces.Space) -> None:
+        self.space: spaces.Space = space
+        self.flat_space: spaces.Box = spaces.flatten_space(space)
+        self._writers: List[Callable[[Any], None]] = []
+        self._buffer: np.ndarray = np.zeros(self.flat_space.shape, dtype=self.flat_space.dtype)
+        size = self._compile(space, (), 0)
+        if size != self._buffer.size:
+            raise ValueError(f"Flattened observation layout has size {size}, expected {self._buffer.size}.")
+
+    def _compile(self, space: spaces.Space, path: Tuple, offset: int) -> int:
+        """
+        Add writers for each leaf of a space to the layout.
+
+        :param space: The space, or part of the space, to lay out.
+        :param path: The keys or indices used to find this part of the observation in the whole observation.
+        :param offset: The index in the flattened array at which this part of the observation starts.
+        :return: The index in the flattened array at which this part of the observation ends.
+        """
+        if isinstance(space, spaces.Dict):
+            for key, subspace in space.spaces.items():
+                offset = self._compile(subspace, path + (key,), offset)
+            return offset
+        if isinstance(space, spaces.Tuple):
+            for index, subspace in enumerate(space.spaces):
+                offset = self._compile(subspace, path + (index,), offset)
+            return offset
+
+        buffer = self._buffer
+        if isinstance(space, spaces.Discrete):
+            index = offset - int(space.start)
+
+            def write(obs: Any) -> None:
+                buffer[index + obs] = 1
+
+            size = int(space.n)
+        elif isinstance(space, spaces.MultiDiscrete):
+            starts = offset + np.concatenate(([0], np.cumsum(space.nvec.flatten())[:-1]))
+            if hasattr(space, "start"):  # MultiDiscrete start values were added in gymnasium 1.0
+                starts = starts - space.start.flatten()
+
+            def write(obs: Any) -> None:
+                buffer[starts + np.asarray(obs).flatten()] = 1
+
+            size = int(np.sum(space.nvec))
+        elif isinstance(space, (spaces.Box, spaces.MultiBinary)):
+            size = int(np.prod(space.shape))
+            end = offset + size
+
+            def write(obs: Any) -> None:
+                buffer[offset:end] = np.asarray(obs).flatten()
+
+        else:
+            size = spaces.flatdim(space)
+            end = offset + size
+
+            def write(obs: Any) -> None:
+                buffer[offset:end] = spaces.flatten(space, obs)
+
+        self._writers.append(self._at_path(write, path))
+        return offset + size
+
+    @staticmethod
+    def _at_path(write: Callable[[Any], None], path: Tuple) -> Callable[[Any], None]:
+        """
+        Wrap a leaf writer so that it is given the whole observation and looks up its own leaf.
+
+        :param write: Writer that writes a leaf of the observation into the buffer.
+        :param path: The keys or indices used to find the leaf in the whole observation.
+        :return: Writer that writes the leaf of a whole observation into the buffer.
+        """
+        if not path:
+            return write
+        if len(path) == 1:
+            (key,) = path
+
+            def write_at_path(obs: Any) -> None:
+                write(obs[key])
+
+            return write_at_path
+
+        def write_at_path(obs: Any) -> None:
+            for key in path:
+                obs = obs[key]
+            write(obs)
+
+        return write_at_path
+
+    def encode(self, obs: ObsType, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Flatten an observation.
+
+        :param obs: An observation in the observation space.
+        :type obs: ObsType
+        :param out: Array to copy the flattened observation into, such as a row of a shared buffer. If not given, a new
+            array is returned.
+        :type out: Optional[np.ndarray]
+        :return: The flattened observation. This is a copy, so it is not changed when the next observation is encoded.
+        :rtype: np.ndarray
+        """
+        self._buffer.fill(0)
+        for write in self._writers:
+            write(obs)
+        if out is None:
+            return self._buffer.copy()
+        np.copyto(out, self._buffer)
+        return out
+
+
 class ObservationManager(BaseModel):
     """
     Manage the observations of an Agent.
@@ -206,6 +328,8 @@ class ObservationManager(BaseModel):
 
     current_observation: ObsType = 0
 
+    _flat_encoder: Optional[FlatObservationEncoder] = PrivateAttr(default=None)
+
     @computed_field
     @cached_property
     def obs(self) -> AbstractObservation:
@@ -229,6 +353,23 @@ class ObservationManager(BaseModel):
         """Gymnasium space object describing the observation space shape."""
         return self.obs.space
 
+    @property
+    def flat_encoder(self) -> FlatObservationEncoder:
+        """Encoder that flattens observations, created from the observation space the first time it is needed."""
+        if self._flat_encoder is None:
+            self._flat_encoder = FlatObservationEncoder(self.space)
+        return self._flat_encoder
+
+    @property
+    def flat_space(self) -> spaces.Box:
+        """Gymnasium space object describing the shape of the flattened observation space."""
+        return self.flat_encoder.flat_space
+
+    @property
+    def flat_observation(self) -> np.ndarray:
+        """The current observation flattened into a 1D array, equivalent to ``gymnasium.spaces.flatten``."""
+        return self.flat_encoder.encode(self.current_observation)
+
     @classmethod
     def from_config(cls, config: Optional[Dict], thresholds: Optional[Dict] = {}) -> "ObservationManager":
         """
@@ -8,6 +8,7 @@ from gymnasium.core import ObsType
 from pydantic import BaseModel, ConfigDict
 
 from primaite import getLogger
+from primaite.game.agent.utils import StateAccessor
 
 _LOGGER = getLogger(__name__)
 WhereType = Optional[Iterable[Union[str, int]]]
@@ -49,6 +50,21 @@ class AbstractObservation(ABC):
             raise ValueError(f"Duplicate observation component type {discriminator}")
         cls._registry[discriminator] = cls
 
+    @property
+    def where(self) -> WhereType:
+        """
+        Where in the simulation state dictionary to find the relevant information for this observation.
+
+        An accessor for the location is created whenever this is set, so assign a new value rather than modifying it in
+        place.
+        """
+        return self._where
+
+    @where.setter
+    def where(self, where: WhereType) -> None:
+        self._where: WhereType = where
+        self._state_accessor: StateAccessor = StateAccessor(where)
+
     @abstractmethod
     def observe(self, state: Dict) -> Any:
         """
@@ -7,7 +7,7 @@ from gymnasium import spaces
 from gymnasium.core import ObsType
 
 from primaite.game.agent.observations.observations import AbstractObservation, WhereType
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE
 
 
 class ServiceObservation(AbstractObservation, discriminator="service"):
@@ -43,7 +43,7 @@ class ServiceObservation(AbstractObservation, discriminator="service"):
         :return: Observation containing the operating status and health status of the service.
         :rtype: ObsType
         """
-        service_state = access_from_nested_dict(state, self.where)
+        service_state = self._state_accessor(state)
         if service_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
         return {
@@ -163,7 +163,7 @@ class ApplicationObservation(AbstractObservation, discriminator="application"):
         :return: Obs containing the operating status, health status, and number of executions of the application.
         :rtype: ObsType
         """
-        application_state = access_from_nested_dict(state, self.where)
+        application_state = self._state_accessor(state)
         if application_state is NOT_PRESENT_IN_STATE:
             return self.default_observation
         return {
@@ -30,11 +30,11 @@ the structure:
 from abc import ABC, abstractmethod
 from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING, Union
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator, PrivateAttr
 from typing_extensions import Never
 
 from primaite import getLogger
-from primaite.game.agent.utils import access_from_nested_dict, NOT_PRESENT_IN_STATE
+from primaite.game.agent.utils import NOT_PRESENT_IN_STATE, StateAccessor
 
 if TYPE_CHECKING:
     from primaite.game.agent.interface import AgentHistoryItem
@@ -114,6 +114,7 @@ class DatabaseFileIntegrity(AbstractReward, discriminator="database-file-integri
     config: "DatabaseFileIntegrity.ConfigSchema"
     location_in_state: List[str] = [""]
     reward: float = 0.0
+    _state_accessor: StateAccessor = PrivateAttr()
 
     class ConfigSchema(AbstractReward.ConfigSchema):
         """ConfigSchema for DatabaseFileIntegrity."""
@@ -123,16 +124,8 @@ class DatabaseFileIntegrity(AbstractReward, discriminator="database-file-integri
         folder_name: str
         file_name: str
 
-    def calculate(self, state: Dict, last_action_response: "AgentHistoryItem") -> float:
-        """Calculate the reward for the current state.
-
-        :param state: Current simulation state
-        :type state: Dict
-        :param last_action_response: Current agent history state
-        :type last_action_response: AgentHistoryItem state
-        :return: Reward value
-        :rtype: float
-        """
+    def model_post_init(self, __context: Any) -> None:
+        """Find the location of the database file in the simulation state."""
         self.location_in_state = [
             "network",
             "nodes",
@@ -143,8 +136,20 @@ class DatabaseFileIntegrity(AbstractReward, discriminator="database-file-integri
             "files",
             self.config.file_name,
         ]
+        self._state_accessor = StateAccessor(self.location_in_state)
+        return super().model_post_init(__context)
+
+    def calculate(self, state: Dict, last_action_response: "AgentHistoryItem") -> float:
+        """Calculate the reward for the current state.
 
-        database_file_state = access_from_nested_dict(state, self.location_in_state)
+        :param state: Current simulation state
+        :type state: Dict
+        :param last_action_response: Current agent history state
+        :type last_action_response: AgentHistoryItem state
+        :return: Reward value
+        :rtype: float
+        """
+        database_file_state = self._state_accessor(state)
         if database_file_state is NOT_PRESENT_IN_STATE:
             _LOGGER.debug(
                 f"Could not calculate {self.__class__} reward because "
@@ -167,6 +172,7 @@ class WebServer404Penalty(AbstractReward, discriminator="web-server-404-penalty"
     config: "WebServer404Penalty.ConfigSchema"
     location_in_state: List[str] = [""]
     reward: float = 0.0
+    _state_accessor: StateAccessor = PrivateAttr()
 
     class ConfigSchema(AbstractReward.ConfigSchema):
         """ConfigSchema for WebServer404Penalty."""
@@ -176,6 +182,18 @@ class WebServer404Penalty(AbstractReward, discriminator="web-server-404-penalty"
         service_name: str
         sticky: bool = True
 
+    def model_post_init(self, __context: Any) -> None:
+        """Find the location of the web server in the simulation state."""
+        self.location_in_state = [
+            "network",
+            "nodes",
+            self.config.node_hostname,
+            "services",
+            self.config.service_name,
+        ]
+        self._state_accessor = StateAccessor(self.location_in_state)
+        return super().model_post_init(__context)
+
     def calculate(self, state: Dict, last_action_response: "AgentHistoryItem") -> float:
         """Calculate the reward for the current state.
 
@@ -186,14 +204,7 @@ class WebServer404Penalty(AbstractReward, discriminator="web-server-404-penalty"
         :return: Reward value
         :rtype: float
         """
-        self.location_in_state = [
-            "network",
-            "nodes",
-            self.config.node_hostname,
-            "services",
-            self.config.service_name,
-        ]
-        web_service_state = access_from_nested_dict(state, self.location_in_state)
+        web_service_state = self._state_accessor(state)
 
         # if webserver is no longer installed on the node, return 0
         if web_service_state is NOT_PRESENT_IN_STATE:
@@ -220,7 +231,8 @@ class WebpageUnavailablePenalty(AbstractReward, discriminator="webpage-unavailab
 
     config: "WebpageUnavailablePenalty.ConfigSchema"
     reward: float = 0.0
-    location_in_state: List[str] = [""]  # Calculate in __init__()?
+    location_in_state: List[str] = [""]
+    _state_accessor: StateAccessor = PrivateAttr()
 
     class ConfigSchema(AbstractReward.ConfigSchema):
         """ConfigSchema for WebpageUnavailablePenalty."""
@@ -229,6 +241,18 @@ class WebpageUnavailablePenalty(AbstractReward, discriminator="webpage-unavailab
         node_hostname: str = ""
         sticky: bool = True
 
+    def model_post_init(self, __context: Any) -> None:
+        """Find the location of the web browser in the simulation state."""
+        self.location_in_state = [
+            "network",
+            "nodes",
+            self.config.node_hostname,
+            "applications",
+            "web-browser",
+        ]
+        self._state_accessor = StateAccessor(self.location_in_state)
+        return super().model_post_init(__context)
+
     def calculate(self, state: Dict, last_action_response: "AgentHistoryItem") -> float:
         """
         Calculate the reward based on current simulation state, and the recent agent action.
@@ -243,14 +267,7 @@ class WebpageUnavailablePenalty(AbstractReward, discriminator="webpage-unavailab
         :return: Reward value
         :rtype: float
         """
-        self.location_in_state = [
-            "network",
-            "nodes",
-            self.config.node_hostname,
-            "applications",
-            "web-browser",
-        ]
-        web_browser_state = access_from_nested_dict(state, self.location_in_state)
+        web_browser_state = self._state_accessor(state)
 
         if web_browser_state is NOT_PRESENT_IN_STATE:
             self.reward = 0.0
@@ -463,7 +480,7 @@ class RewardFunction(BaseModel):
 
         model_config = ConfigDict(extra="forbid")
 
-        reward_components: Iterable[_SingleComponentConfig] = []
+        reward_components: List[_SingleComponentConfig] = []
 
     config: ConfigSchema = Field(default_factory=lambda: RewardFunction.ConfigSchema())
 
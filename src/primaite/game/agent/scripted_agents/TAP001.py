@@ -263,6 +263,10 @@ class TAP001(AbstractTAP, discriminator="tap-001"):
             "continue_on_failed_exfil": self.config.agent_settings.kill_chain.PAYLOAD.continue_on_failed_exfil,
         }
 
+    def reset_for_episode(self) -> None:
+        """Redraw the starting node, target and first execution timestep by setting the agent up again."""
+        self.setup_agent()
+
     def get_action(self, obs: ObsType, timestep: int) -> Tuple[str, Dict]:
         """Follows the TAP001's Mobile Malware Kill Chain.
 
@@ -160,6 +160,10 @@ class TAP003(AbstractTAP, discriminator="tap-003"):
         self._set_next_execution_timestep(self.config.agent_settings.start_step)
         self.current_host = self.starting_node
 
+    def reset_for_episode(self) -> None:
+        """Redraw the starting node and first execution timestep by setting the agent up again."""
+        self.setup_agent()
+
     def get_action(self, obs: ObsType, timestep: int) -> Tuple[str, Dict]:
         """Follows the TAP003 Backdoor Vulnerability Kill Chain.
 
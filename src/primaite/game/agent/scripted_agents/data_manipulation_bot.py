@@ -29,6 +29,11 @@ class DataManipulationAgent(PeriodicAgent, discriminator="red-database-corruptin
         super().__init__(**kwargs)
         self._set_next_execution_timestep(timestep=self.config.agent_settings.start_step, variance=0)
 
+    def reset_for_episode(self) -> None:
+        """Redraw the start node, and reset the first execution timestep to the configured start step."""
+        super().reset_for_episode()
+        self._set_next_execution_timestep(timestep=self.config.agent_settings.start_step, variance=0)
+
     def get_action(self, obs: ObsType, timestep: int) -> Tuple[str, Dict]:
         """Waits until a specific timestep, then attempts to execute its data manipulation application.
 
@@ -74,3 +74,7 @@ class ProbabilisticAgent(AbstractScriptedAgent, discriminator="probabilistic-age
         choice = self.rng.choice(len(self.action_manager.action_map), p=self.probabilities)
         self.logger.info(f"Performing Action: {choice}")
         return self.action_manager.get_action(choice)
+
+    def reset_for_episode(self) -> None:
+        """Draw a new random number generator from the global numpy generator."""
+        self.rng = np.random.default_rng(np.random.randint(0, 65535))
@@ -106,6 +106,13 @@ class PeriodicAgent(AbstractScriptedAgent, discriminator="periodic-agent"):
         random_increment = random.randint(-variance, variance)
         self.next_execution_timestep = timestep + random_increment
 
+    def reset_for_episode(self) -> None:
+        """Redraw the first execution timestep, and forget the start node so that it is selected again."""
+        self.__dict__.pop("start_node", None)
+        self._set_next_execution_timestep(
+            timestep=self.config.agent_settings.start_step, variance=self.config.agent_settings.start_variance
+        )
+
     def get_action(self, obs: ObsType, timestep: int) -> Tuple[str, Dict]:
         """Do nothing, unless the current timestep is the next execution timestep, in which case do the action."""
         if timestep == self.next_execution_timestep and self.num_executions < self.config.agent_settings.max_executions:
@@ -1,6 +1,6 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 """Utility functions used in the PrimAITE game layer."""
-from typing import Any, Dict, Hashable, Optional, Sequence
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
 
 NOT_PRESENT_IN_STATE = object()
 """
@@ -9,12 +9,53 @@ the thing requested in the state could equal None. This NOT_PRESENT_IN_STATE is
 """
 
 
+class StateAccessor:
+    """
+    Accessor for an item at a fixed location in deeply nested dictionaries, such as the simulation state.
+
+    The keys are stored as a tuple when the accessor is created, so each access walks down the dictionary in a simple
+    loop rather than copying the list of keys at every level. Create one accessor for each location which is accessed
+    repeatedly, such as where an observation finds its state, and call it with each new dictionary. For example,
+    ``StateAccessor([2, 3])({1: 'a', 2: {3: {4: 'b'}}})`` returns ``{4: 'b'}``.
+
+    :param keys: Dict keys used to traverse the nested dict. Each item corresponds to one level of depth. If None,
+        the accessor always returns NOT_PRESENT_IN_STATE.
+    :type keys: Optional[Sequence[Hashable]]
+    """
+
+    __slots__ = ("keys",)
+
+    def __init__(self, keys: Optional[Sequence[Hashable]]) -> None:
+        self.keys: Optional[Tuple[Hashable, ...]] = None if keys is None else tuple(keys)
+
+    def __call__(self, dictionary: Dict) -> Any:
+        """
+        Access the item from a nested dictionary.
+
+        :param dictionary: Deeply nested dictionary
+        :type dictionary: Dict
+        :return: The value in the dictionary, or NOT_PRESENT_IN_STATE if a key does not exist at any level of nesting.
+        :rtype: Any
+        """
+        if self.keys is None:
+            return NOT_PRESENT_IN_STATE
+        for key in self.keys:
+            if key not in dictionary:
+                return NOT_PRESENT_IN_STATE
+            dictionary = dictionary[key]
+        return dictionary
+
+    def __repr__(self) -> str:
+        return f"StateAccessor({None if self.keys is None else list(self.keys)})"
+
+
 def access_from_nested_dict(dictionary: Dict, keys: Optional[Sequence[Hashable]]) -> Any:
     """
     Access an item from a deeply dictionary with a list of keys.
 
     For example, if the dictionary is {1: 'a', 2: {3: {4: 'b'}}}, then the key [2, 3, 4] would return 'b', and the key
-    [2, 3] would return {4: 'b'}. Raises a KeyError if specified key does not exist at any level of nesting.
+    [2, 3] would return {4: 'b'}. Returns NOT_PRESENT_IN_STATE if specified key does not exist at any level of nesting.
+    Use a :py:class:`StateAccessor` instead when accessing the same location repeatedly.
 
     :param dictionary: Deeply nested dictionary
     :type dictionary: Dict
@@ -23,12 +64,4 @@ def access_from_nested_dict(dictionary: Dict, keys: Optional[Sequence[Hashable]]
     :return: The value in the dictionary
     :rtype: Any
     """
-    if keys is None:
-        return NOT_PRESENT_IN_STATE
-    key_list = [*keys]  # copy keys to a new list to prevent editing original list
-    if len(key_list) == 0:
-        return dictionary
-    k = key_list.pop(0)
-    if k not in dictionary:
-        return NOT_PRESENT_IN_STATE
-    return access_from_nested_dict(dictionary[k], key_list)
+    return StateAccessor(keys)(dictionary)
@@ -6,18 +6,21 @@ import numpy as np
 from pydantic import BaseModel, ConfigDict
 
 from primaite import DEFAULT_BANDWIDTH, getLogger
+from primaite.game.agent.actions.manager import ActionMaskEngine
 from primaite.game.agent.interface import AbstractAgent, ProxyAgent
 from primaite.game.agent.observations import NICObservation
 from primaite.game.agent.rewards import SharedReward
 from primaite.game.science import graph_has_cycle, topological_sort
 from primaite.simulator import SIM_OUTPUT
 from primaite.simulator.network.creation import NetworkNodeAdder
+from primaite.simulator.network.frame_queue import FrameDeliveryQueue
 from primaite.simulator.network.hardware.base import NetworkInterface, Node, NodeOperatingState, UserManager
 from primaite.simulator.network.hardware.nodes.host.host_node import NIC
 from primaite.simulator.network.hardware.nodes.network.firewall import Firewall  # noqa: F401
 from primaite.simulator.network.hardware.nodes.network.switch import Switch
 from primaite.simulator.network.hardware.nodes.network.wireless_router import WirelessRouter
 from primaite.simulator.network.nmne import NMNEConfig
+from primaite.simulator.network.transmission.data_link_layer import Frame
 from primaite.simulator.sim_container import Simulation
 from primaite.simulator.system.applications.application import Application
 from primaite.simulator.system.applications.database_client import DatabaseClient  # noqa: F401
@@ -29,6 +32,7 @@ from primaite.simulator.system.applications.red_applications.data_manipulation_b
 from primaite.simulator.system.applications.red_applications.dos_bot import DoSBot  # noqa: F401
 from primaite.simulator.system.applications.red_applications.ransomware_script import RansomwareScript  # noqa: F401
 from primaite.simulator.system.applications.web_browser import WebBrowser  # noqa: F401
+from primaite.simulator.system.core.session_manager import SessionManager
 from primaite.simulator.system.services.database.database_service import DatabaseService
 from primaite.simulator.system.services.dns.dns_client import DNSClient
 from primaite.simulator.system.services.dns.dns_server import DNSServer
@@ -40,6 +44,7 @@ from primaite.simulator.system.services.service import Service
 from primaite.simulator.system.services.terminal.terminal import Terminal
 from primaite.simulator.system.services.web_server.web_server import WebServer
 from primaite.simulator.system.software import Software
+from primaite.utils.profiling import StepProfiler
 from primaite.utils.validation.ip_protocol import IPProtocol
 from primaite.utils.validation.port import Port, PORT_LOOKUP
 
@@ -80,6 +85,10 @@ class PrimaiteGameOptions(BaseModel):
     """A whitelist of available protocols in the simulation."""
     thresholds: Optional[Dict] = {}
     """A dict containing the thresholds used for determining what is acceptable during observations."""
+    fast_reset: bool = False
+    """Whether environments should restore a snapshot of the game on reset instead of rebuilding it from config."""
+    prefetch_games: bool = False
+    """Whether environments should build the game of the next episode in a worker process during each episode."""
 
 
 class PrimaiteGame:
@@ -112,6 +121,21 @@ class PrimaiteGame:
         self._reward_calculation_order: List[str] = [name for name in self.agents]
         """Agent order for reward evaluation, as some rewards can be dependent on other agents' rewards."""
 
+        self._action_mask_engines: Dict[str, ActionMaskEngine] = {}
+        """Action mask engines of the agents, by agent name. Created the first time an agent's mask is requested."""
+
+        self._profiler: StepProfiler = StepProfiler()
+
+    @property
+    def profiler(self) -> StepProfiler:
+        """Profiler which times the phases of each step. It is disabled unless an enabled profiler is assigned."""
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: StepProfiler) -> None:
+        self._profiler = profiler
+        self.simulation.network._profiler = profiler
+
     def step(self):
         """
         Perform one step of the simulation/agent loop.
@@ -150,48 +174,57 @@ class PrimaiteGame:
         # Update agents' observations and rewards based on the current state, and the response from the last action
         self.update_agents(state=sim_state)
 
+        self.profiler.end_step()
+
     def get_sim_state(self) -> Dict:
         """Get the current state of the simulation."""
-        return self.simulation.describe_state()
+        with self.profiler.phase("get_sim_state"):
+            return self.simulation.describe_state()
 
     def update_agents(self, state: Dict) -> None:
         """Update agents' observations and rewards based on the current state."""
         for agent_name in self._reward_calculation_order:
             agent = self.agents[agent_name]
             if self.step_counter > 0:  # can't get reward before first action
-                agent.update_reward(state=state)
+                with self.profiler.phase(f"update_reward.{agent_name}"):
+                    agent.update_reward(state=state)
                 agent.save_reward_to_history()
-            agent.update_observation(state=state)  # order of this doesn't matter so just use reward order
+            with self.profiler.phase(f"update_observation.{agent_name}"):
+                agent.update_observation(state=state)  # order of this doesn't matter so just use reward order
             agent.reward_function.total_reward += agent.reward_function.current_reward
 
     def apply_agent_actions(self) -> None:
         """Apply all actions to simulation as requests."""
-        for _, agent in self.agents.items():
-            obs = agent.observation_manager.current_observation
-            action_choice, parameters = agent.get_action(obs, timestep=self.step_counter)
-            if SIM_OUTPUT.save_agent_logs:
-                agent.logger.debug(f"Chosen Action: {action_choice}")
-            request = agent.format_request(action_choice, parameters)
-            response = self.simulation.apply_request(request)
-            agent.process_action_response(
-                timestep=self.step_counter,
-                action=action_choice,
-                parameters=parameters,
-                request=request,
-                response=response,
-                observation=obs,
-            )
+        for agent_name, agent in self.agents.items():
+            with self.profiler.phase(f"apply_agent_actions.{agent_name}"):
+                obs = agent.observation_manager.current_observation
+                action_choice, parameters = agent.get_action(obs, timestep=self.step_counter)
+                if SIM_OUTPUT.save_agent_logs:
+                    agent.logger.debug(f"Chosen Action: {action_choice}")
+                request = agent.format_request(action_choice, parameters)
+                response = self.simulation.apply_request(request)
+                agent.process_action_response(
+                    timestep=self.step_counter,
+                    action=action_choice,
+                    parameters=parameters,
+                    request=request,
+                    response=response,
+                    observation=obs,
+                )
 
     def pre_timestep(self) -> None:
         """Apply any pre-timestep logic that helps make sure we have the correct observations."""
-        self.simulation.pre_timestep(self.step_counter)
+        with self.profiler.phase("pre_timestep"):
+            self.simulation.pre_timestep(self.step_counter)
 
     def advance_timestep(self) -> None:
         """Advance timestep."""
         self.step_counter += 1
         _LOGGER.debug(f"Advancing timestep to {self.step_counter} ")
-        self.update_agent_loggers()
-        self.simulation.apply_timestep(self.step_counter)
+        with self.profiler.phase("update_agent_loggers"):
+            self.update_agent_loggers()
+        with self.profiler.phase("advance_timestep"):
+            self.simulation.apply_timestep(self.step_counter)
 
     def update_agent_loggers(self) -> None:
         """Updates Agent Loggers with new timestep."""
@@ -216,12 +249,12 @@ class PrimaiteGame:
         :return: Action mask
         :rtype: List[bool]
         """
-        agent = self.agents[agent_name]
-        mask = [True] * len(agent.action_manager.action_map)
-        for i, action in agent.action_manager.action_map.items():
-            request = agent.action_manager.form_request(action_identifier=action[0], action_options=action[1])
-            mask[i] = self.simulation._request_manager.check_valid(request, {})
-        return np.asarray(mask, dtype=np.int8)
+        if agent_name not in self._action_mask_engines:
+            self._action_mask_engines[agent_name] = ActionMaskEngine(
+                action_manager=self.agents[agent_name].action_manager,
+                request_manager=self.simulation._request_manager,
+            )
+        return self._action_mask_engines[agent_name].mask()
 
     def close(self) -> None:
         """Close the game, this will close the simulation."""
@@ -231,6 +264,26 @@ class PrimaiteGame:
         """Perform any final configuration of components to make them ready for the game to start."""
         self.simulation.setup_for_episode(episode=episode)
 
+    @staticmethod
+    def apply_network_settings(cfg: Dict) -> None:
+        """
+        Apply the network settings of a game config which are shared by every component of their class.
+
+        These are set when a game is built from config. A game which was not built in this process, such as one
+        restored from a snapshot, must have them applied before it is stepped.
+
+        :param cfg: The game config.
+        :type cfg: dict
+        """
+        network_config = cfg.get("simulation", {}).get("network", {})
+        # Set the NMNE capture config
+        NetworkInterface.nmne_config = NMNEConfig(**network_config.get("nmne_config", {}))
+        NICObservation.capture_nmne = NMNEConfig(**network_config.get("nmne_config", {})).capture_nmne
+        # Set the Frame size model
+        Frame.analytical_size = network_config.get("analytical_frame_size", False)
+        SessionManager.compact_frames = network_config.get("compact_frames", False)
+        NetworkInterface.frame_queue = FrameDeliveryQueue() if network_config.get("frame_delivery_queue") else None
+
     @classmethod
     def from_config(cls, cfg: Dict) -> "PrimaiteGame":
         """Create a PrimaiteGame object from a config dictionary.
@@ -266,9 +319,7 @@ class PrimaiteGame:
         nodes_cfg = network_config.get("nodes", [])
         links_cfg = network_config.get("links", [])
         node_sets_cfg = network_config.get("node_sets", [])
-        # Set the NMNE capture config
-        NetworkInterface.nmne_config = NMNEConfig(**network_config.get("nmne_config", {}))
-        NICObservation.capture_nmne = NMNEConfig(**network_config.get("nmne_config", {})).capture_nmne
+        cls.apply_network_settings(cfg)
 
         for node_cfg in nodes_cfg:
             n_type = node_cfg["type"]
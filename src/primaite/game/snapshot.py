@@ -0,0 +1,198 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Capture and restore freshly built games so that environments can reset without rebuilding from config."""
+import copy
+import io
+import marshal
+import pickle
+import sys
+import types
+from typing import Any, Dict, Optional, Tuple
+
+from primaite import getLogger
+from primaite.game.game import PrimaiteGame
+
+_LOGGER = getLogger(__name__)
+
+
+def _is_importable(func: types.FunctionType) -> bool:
+    """
+    Check whether a function can be pickled by reference, i.e. looked up again through its module and qualname.
+
+    :param func: The function to check.
+    :return: True if the qualified name resolves back to the same function object, otherwise False.
+    """
+    obj = sys.modules.get(func.__module__)
+    for part in func.__qualname__.split("."):
+        obj = getattr(obj, part, None)
+    return obj is func
+
+
+class _EmptyCell:
+    """Marker for a closure cell which had not been assigned a value when its function was pickled."""
+
+
+def _make_function(code: bytes, module: str, name: str, qualname: str, num_cells: int) -> types.FunctionType:
+    """
+    Recreate a function that was pickled by value by :class:`_SnapshotPickler`, with empty closure cells.
+
+    The closure cells, defaults and keyword defaults are filled in afterwards by :func:`_set_function_state`. This lets
+    pickle memoise the function before its closure is restored, so functions which refer to themselves can be restored.
+    """
+    closure = tuple(types.CellType() for _ in range(num_cells)) if num_cells else None
+    func = types.FunctionType(marshal.loads(code), sys.modules[module].__dict__, name, None, closure)
+    func.__qualname__ = qualname
+    return func
+
+
+def _set_function_state(func: types.FunctionType, state: Tuple[Optional[Tuple], Optional[Dict], Tuple]) -> None:
+    """Restore the defaults and closure cell contents of a function created by :func:`_make_function`."""
+    defaults, kwdefaults, closure_values = state
+    func.__defaults__ = defaults
+    func.__kwdefaults__ = kwdefaults
+    for cell, value in zip(func.__closure__ or (), closure_values):
+        if value is not _EmptyCell:
+            cell.cell_contents = value
+
+
+def _cell_value(cell: types.CellType) -> Any:
+    """Get the contents of a closure cell, or :class:`_EmptyCell` if it has not been assigned."""
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _EmptyCell
+
+
+def _reset_agents(game: PrimaiteGame) -> None:
+    """
+    Make every agent redraw the random choices it made when it was built, such as its schedule and generator.
+
+    Agents draw these from the global generators when they are built. A restored game would otherwise replay the
+    choices that were captured in the snapshot, so every episode would repeat the same schedules and actions.
+    Resetting in agent order makes restored games draw the same sequence as games rebuilt from config.
+    """
+    for agent in game.agents.values():
+        agent.reset_for_episode()
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickler which also handles the lambdas and closures held by request managers.
+
+    Request managers bind lambdas which close over the component that owns them. The standard pickler refuses to
+    serialise these, and ``copy.deepcopy`` would share them, leaving restored requests acting on the original objects.
+    Here they are serialised by value so that their closures point at the restored components instead.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Serialise local functions by value, defer everything else to the default behaviour."""
+        if isinstance(obj, property):
+            return property, (obj.fget, obj.fset, obj.fdel, obj.__doc__)
+        if isinstance(obj, types.FunctionType) and not _is_importable(obj):
+            closure = obj.__closure__ or ()
+            return (
+                _make_function,
+                (marshal.dumps(obj.__code__), obj.__module__, obj.__name__, obj.__qualname__, len(closure)),
+                (obj.__defaults__, obj.__kwdefaults__, tuple(_cell_value(cell) for cell in closure)),
+                None,
+                None,
+                _set_function_state,
+            )
+        return NotImplemented
+
+
+class GameSnapshot:
+    """
+    A serialised copy of a freshly built game, along with the config it was built from.
+
+    The snapshot is taken straight after ``PrimaiteGame.from_config`` so that it contains no episode specific state.
+    Restoring it is much cheaper than rebuilding the game, because no config has to be re-validated and no component
+    has to be re-instantiated. The caller is still responsible for calling ``setup_for_episode`` on the restored game.
+    """
+
+    def __init__(self, cfg: Dict, game: PrimaiteGame):
+        """
+        Capture a snapshot of the given game.
+
+        :param cfg: The config that the game was built from.
+        :type cfg: Dict
+        :param game: The game to capture. This must not have been stepped yet.
+        :type game: PrimaiteGame
+        """
+        self.cfg: Dict = copy.deepcopy(cfg)
+        """Copy of the config used to build the captured game."""
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(game)
+        self.blob: bytes = buffer.getvalue()
+        """Serialised game."""
+        self._preloaded: Optional[PrimaiteGame] = None
+        """Game deserialised ahead of time by :py:meth:`preload`, to be returned by the next restore."""
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"cfg": self.cfg, "blob": self.blob, "_preloaded": None}
+
+    def matches(self, cfg: Dict) -> bool:
+        """
+        Check whether this snapshot was built from the given config.
+
+        :param cfg: Config to compare against.
+        :type cfg: Dict
+        :return: True if the snapshot can be used in place of building a game from ``cfg``.
+        """
+        return cfg == self.cfg
+
+    def restore(self) -> PrimaiteGame:
+        """
+        Create a new game from the snapshot.
+
+        Agents redraw their random choices, such as schedules and generators, from the global generators as they would
+        if the game were rebuilt from config. The config's network settings are applied, as the game may have been
+        captured in another process.
+
+        :return: A new game, in the same state as the captured game was when the snapshot was taken.
+        :rtype: PrimaiteGame
+        """
+        game, self._preloaded = self._preloaded, None
+        if game is None:
+            game = pickle.loads(self.blob)
+        _reset_agents(game)
+        PrimaiteGame.apply_network_settings(self.cfg)
+        return game
+
+    def preload(self) -> None:
+        """
+        Deserialise a game from the snapshot ahead of time, so that the next :py:meth:`restore` is quicker.
+
+        Deserialising does not touch any global or class-level state, so this can be called from a background thread
+        while another game is running. The game is not returned until it is restored.
+        """
+        self._preloaded = pickle.loads(self.blob)
+
+    @classmethod
+    def build(
+        cls, cfg: Dict, snapshot: Optional["GameSnapshot"] = None
+    ) -> Tuple[PrimaiteGame, Optional["GameSnapshot"]]:
+        """
+        Get a game for the given config, restoring it from a snapshot if possible.
+
+        If the snapshot was built from the same config, the game is restored from it. Otherwise, the game is built from
+        config and a new snapshot is captured. If the game cannot be serialised (for instance because a plugin holds an
+        open file handle), a warning is logged and no snapshot is returned, so the next call rebuilds from config.
+
+        :param cfg: Game config.
+        :type cfg: Dict
+        :param snapshot: Snapshot from a previous call, if any.
+        :type snapshot: Optional[GameSnapshot]
+        :return: The game, and the snapshot to pass in on the next call.
+        :rtype: Tuple[PrimaiteGame, Optional[GameSnapshot]]
+        """
+        if snapshot is not None and snapshot.matches(cfg):
+            return snapshot.restore(), snapshot
+
+        _LOGGER.debug("Building game from config and capturing a new snapshot.")
+        game = PrimaiteGame.from_config(cfg=copy.deepcopy(cfg))
+        try:
+            snapshot = cls(cfg=cfg, game=game)
+        except (pickle.PicklingError, TypeError, AttributeError, ValueError, RecursionError) as e:
+            _LOGGER.warning(f"Could not capture a snapshot of the game, rebuilding from config instead. Reason: {e}")
+            return game, None
+        return game, snapshot
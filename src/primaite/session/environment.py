@@ -1,6 +1,5 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 """Main Gymnasium entrypoint for RL agents into PrimAITE."""
-import json
 import random
 import sys
 from os import PathLike
@@ -11,12 +10,17 @@ import numpy as np
 from gymnasium.core import ActType, ObsType
 
 from primaite import getLogger
-from primaite.game.agent.interface import ProxyAgent
+from primaite.game.agent.interface import AgentHistoryItem, ProxyAgent
 from primaite.game.game import PrimaiteGame
+from primaite.game.snapshot import GameSnapshot
 from primaite.session.episode_schedule import build_scheduler, EpisodeScheduler
 from primaite.session.io import PrimaiteIO
+from primaite.session.prefetch import GamePrefetcher, start_prefetcher
 from primaite.simulator import SIM_OUTPUT
 from primaite.simulator.system.core.packet_capture import PacketCapture
+from primaite.utils.agent_actions import AgentActionLogWriter
+from primaite.utils.profiling import StepProfiler
+from primaite.utils.step_metadata import STEP_METADATA_FILENAME, StepMetadataWriter
 
 _LOGGER = getLogger(__name__)
 
@@ -83,14 +87,28 @@ class PrimaiteGymEnv(gymnasium.Env):
         super().__init__()
         self.episode_scheduler: EpisodeScheduler = build_scheduler(env_config)
         """Object that returns a config corresponding to the current episode."""
-        self.seed = self.episode_scheduler(0).get("game", {}).get("seed")
+        first_cfg = self.episode_scheduler(0)
+        self.seed = first_cfg.get("game", {}).get("seed")
         """Get RNG seed from config file. NB: Must be before game instantiation."""
-        self.generate_seed_value = self.episode_scheduler(0).get("game", {}).get("generate_seed_value")
+        self.generate_seed_value = first_cfg.get("game", {}).get("generate_seed_value")
         self.seed = set_random_seed(self.seed, self.generate_seed_value)
-        self.io = PrimaiteIO.from_config(self.episode_scheduler(0).get("io_settings", {}))
+        self.io = PrimaiteIO.from_config(first_cfg.get("io_settings", {}))
         """Handles IO for the environment. This produces sys logs, agent logs, etc."""
-        self.game: PrimaiteGame = PrimaiteGame.from_config(self.episode_scheduler(0))
+        self.fast_reset: bool = first_cfg.get("game", {}).get("fast_reset", False)
+        """Whether to restore a snapshot of the game on reset instead of rebuilding it from config."""
+        self._snapshot: Optional[GameSnapshot] = None
+        """Snapshot of the most recently built game, used when fast reset is enabled."""
+        self._prefetcher: Optional[GamePrefetcher] = start_prefetcher(first_cfg)
+        """Worker which builds the next episode's game during each episode, used when prefetching games is enabled."""
+        self.profiler: StepProfiler = StepProfiler(enabled=self.io.settings.save_step_timings)
+        """Profiler which times the phases of each step. It is shared by the game of every episode."""
+        self._step_metadata: Optional[StepMetadataWriter] = None
+        """Writer of the current episode's step metadata, created at its first step when step metadata is saved."""
+        self._agent_actions: Optional[AgentActionLogWriter] = None
+        """Writer of the current episode's agent action log, created at its first step when agent actions are saved."""
+        self.game: PrimaiteGame = self._build_game(self.episode_scheduler(0))
         """Current game."""
+        self._prefetch(1)
         self._agent_name = next(iter(self.game.rl_agents))
         """Name of the RL agent. Since there should only be one RL agent we can just pull the first and only key."""
         self.episode_counter: int = 0
@@ -134,7 +152,8 @@ class PrimaiteGymEnv(gymnasium.Env):
         state = self.game.get_sim_state()
         self.game.update_agents(state)
 
-        next_obs = self._get_obs()  # this doesn't update observation, just gets the current observation
+        with self.profiler.phase("get_obs"):
+            next_obs = self._get_obs()  # this doesn't update observation, just gets the current observation
         reward = self.agent.reward_function.current_reward
         _LOGGER.debug(f"step: {self.game.step_counter}, Blue reward: {reward}")
         terminated = False
@@ -142,25 +161,35 @@ class PrimaiteGymEnv(gymnasium.Env):
         info = {
             "agent_actions": {name: agent.history[-1] for name, agent in self.game.agents.items()}
         }  # tell us what all the agents did for convenience.
+        if self.io.settings.save_agent_actions:
+            with self.profiler.phase("save_agent_actions"):
+                self._write_agent_actions(step, info["agent_actions"])
         if self.game.save_step_metadata:
-            self._write_step_metadata_json(step, action, state, reward)
+            with self.profiler.phase("save_step_metadata"):
+                self._write_step_metadata(step, action, state, reward)
+        self.profiler.end_step()
         return next_obs, reward, terminated, truncated, info
 
-    def _write_step_metadata_json(self, step: int, action: int, state: Dict, reward: int):
-        output_dir = SIM_OUTPUT.path / f"episode_{self.episode_counter}" / "step_metadata"
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-        path = output_dir / f"step_{step}.json"
+    def _write_step_metadata(self, step: int, action: int, state: Dict, reward: int):
+        if self._step_metadata is None:
+            self._step_metadata = StepMetadataWriter(
+                SIM_OUTPUT.path / f"episode_{self.episode_counter}" / STEP_METADATA_FILENAME
+            )
+        self._step_metadata.write(
+            step,
+            {
+                "episode": self.episode_counter,
+                "step": step,
+                "action": int(action),
+                "reward": int(reward),
+                "state": state,
+            },
+        )
 
-        data = {
-            "episode": self.episode_counter,
-            "step": step,
-            "action": int(action),
-            "reward": int(reward),
-            "state": state,
-        }
-        with open(path, "w") as file:
-            json.dump(data, file)
+    def _write_agent_actions(self, step: int, agent_actions: Dict[str, AgentHistoryItem]):
+        if self._agent_actions is None:
+            self._agent_actions = self.io.open_agent_log(episode=self.episode_counter)
+        self._agent_actions.write(step, agent_actions)
 
     def reset(self, seed: Optional[int] = None, options: Optional[Dict] = None) -> Tuple[ObsType, Dict[str, Any]]:
         """Reset the environment."""
@@ -170,21 +199,67 @@ class PrimaiteGymEnv(gymnasium.Env):
         )
         if seed is not None:
             set_random_seed(seed, self.generate_seed_value)
+            if self._prefetcher is not None:
+                # The prefetched game was built before reseeding, so build this episode's game from the new seed
+                self._prefetcher.discard()
         self.total_reward_per_episode[self.episode_counter] = self.agent.reward_function.total_reward
 
-        if self.io.settings.save_agent_actions:
-            all_agent_actions = {name: agent.history for name, agent in self.game.agents.items()}
-            self.io.write_agent_log(agent_actions=all_agent_actions, episode=self.episode_counter)
+        self._close_agent_actions()
+        if self.io.settings.save_step_timings:
+            self.io.write_step_timings(profiler=self.profiler, episode=self.episode_counter)
+        self._close_step_metadata()
         self.episode_counter += 1
         PacketCapture.clear()
-        self.game: PrimaiteGame = PrimaiteGame.from_config(cfg=self.episode_scheduler(self.episode_counter))
+        self.game: PrimaiteGame = self._build_game(self.episode_scheduler(self.episode_counter))
         self.game.setup_for_episode(episode=self.episode_counter)
+        self._prefetch(self.episode_counter + 1)
         state = self.game.get_sim_state()
         self.game.update_agents(state=state)
         next_obs = self._get_obs()
+        self.profiler.end_episode()
         info = {}
         return next_obs, info
 
+    def _build_game(self, cfg: Dict) -> PrimaiteGame:
+        """
+        Create the game for an episode.
+
+        When prefetching games is enabled, the game built by the prefetch worker is restored if it was built from the
+        same config. Otherwise, when fast reset is enabled, the game is restored from a snapshot unless the episode
+        scheduler has returned a different config to the one the snapshot was built from.
+
+        :param cfg: Config for the episode.
+        :type cfg: Dict
+        :return: Game for the episode, not yet set up.
+        :rtype: PrimaiteGame
+        """
+        snapshot = self._prefetcher.take(cfg) if self._prefetcher is not None else None
+        if snapshot is not None:
+            game = snapshot.restore()
+            if self.fast_reset:
+                self._snapshot = snapshot
+        elif not self.fast_reset:
+            game = PrimaiteGame.from_config(cfg=cfg)
+        else:
+            game, self._snapshot = GameSnapshot.build(cfg=cfg, snapshot=self._snapshot)
+        game.profiler = self.profiler
+        return game
+
+    def _prefetch(self, episode: int) -> None:
+        """
+        Start preparing an upcoming episode.
+
+        When prefetching games is enabled, the episode's game is built by the prefetch worker. Otherwise, the episode
+        scheduler is asked to prepare the episode's config.
+
+        :param episode: Number of the episode.
+        :type episode: int
+        """
+        if self._prefetcher is None:
+            self.episode_scheduler.prefetch(episode)
+        else:
+            self._prefetcher.request(self.episode_scheduler(episode))
+
     @property
     def action_space(self) -> gymnasium.Space:
         """Return the action space of the environment."""
@@ -194,21 +269,34 @@ class PrimaiteGymEnv(gymnasium.Env):
     def observation_space(self) -> gymnasium.Space:
         """Return the observation space of the environment."""
         if self.agent.flatten_obs:
-            return gymnasium.spaces.flatten_space(self.agent.observation_manager.space)
+            return self.agent.observation_manager.flat_space
         else:
             return self.agent.observation_manager.space
 
+    def _close_step_metadata(self) -> None:
+        """Finish writing the current episode's step metadata."""
+        if self._step_metadata is not None:
+            self._step_metadata.close()
+            self._step_metadata = None
+
+    def _close_agent_actions(self) -> None:
+        """Finish writing the current episode's agent action log."""
+        if self._agent_actions is not None:
+            self._agent_actions.close()
+            self._agent_actions = None
+
     def _get_obs(self) -> ObsType:
         """Return the current observation."""
         if self.agent.flatten_obs:
-            unflat_space = self.agent.observation_manager.space
-            unflat_obs = self.agent.observation_manager.current_observation
-            return gymnasium.spaces.flatten(unflat_space, unflat_obs)
+            return self.agent.observation_manager.flat_observation
         else:
             return self.agent.observation_manager.current_observation
 
     def close(self):
         """Close the simulation."""
-        if self.io.settings.save_agent_actions:
-            all_agent_actions = {name: agent.history for name, agent in self.game.agents.items()}
-            self.io.write_agent_log(agent_actions=all_agent_actions, episode=self.episode_counter)
+        self._close_agent_actions()
+        if self.io.settings.save_step_timings:
+            self.io.write_step_timings(profiler=self.profiler, episode=self.episode_counter)
+        self._close_step_metadata()
+        if self._prefetcher is not None:
+            self._prefetcher.close()
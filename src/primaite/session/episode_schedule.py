@@ -1,10 +1,12 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 """Strategies for selecting the game configuration between different episodes of a session."""
 import copy
+import pickle
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Mapping, Sequence, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 import pydantic
 import yaml
@@ -13,12 +15,49 @@ from primaite import getLogger
 
 _LOGGER = getLogger(__name__)
 
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+"""Executor which prepares episode configs in the background, created when a config is first prefetched."""
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="episode-config-prefetch")
+    return _prefetch_executor
+
+
+def freeze_config(config: Dict) -> Optional[bytes]:
+    """
+    Freeze a config into an immutable representation, from which independent copies can be made cheaply.
+
+    :param config: The config to freeze.
+    :return: The frozen config, or None if the config contains objects which cannot be pickled.
+    """
+    try:
+        return pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def thaw_config(frozen: bytes) -> Dict:
+    """
+    Make a new, independent copy of a config frozen by :py:func:`freeze_config`.
+
+    This is several times quicker than ``copy.deepcopy`` of the original config.
+
+    :param frozen: The frozen config.
+    :return: A copy of the config, which can be modified freely.
+    """
+    return pickle.loads(frozen)
+
 
 class EpisodeScheduler(pydantic.BaseModel, ABC):
     """
     Episode schedulers provide functionality to select different scenarios and game setups for each episode.
 
     This is useful when implementing advanced RL concepts like curriculum learning and domain randomisation.
+
+    Every call returns a new copy of the config, which the caller is free to modify.
     """
 
     @abstractmethod
@@ -26,19 +65,46 @@ class EpisodeScheduler(pydantic.BaseModel, ABC):
         """Return the config that should be used during this episode."""
         ...
 
+    def prefetch(self, episode_num: int) -> None:
+        """
+        Start preparing the config of an episode in the background, so it is ready when that episode is requested.
+
+        Schedulers whose configs are always ready do nothing.
+
+        :param episode_num: The episode whose config will be requested next.
+        """
+
 
 class ConstantEpisodeScheduler(EpisodeScheduler):
-    """The constant episode schedule simply provides the same game setup every time."""
+    """
+    The constant episode schedule simply provides the same game setup every time.
+
+    The config is frozen the first time it is requested, so changes made to the contents of ``config`` after that are
+    not seen. Assigning a new config is.
+    """
 
     config: Dict
 
+    _frozen_source: Optional[Dict] = pydantic.PrivateAttr(default=None)
+    _frozen_config: Optional[bytes] = pydantic.PrivateAttr(default=None)
+
     def __call__(self, episode_num: int) -> Dict:
         """Return the same config every time."""
-        return copy.deepcopy(self.config)
+        if self._frozen_source is not self.config:
+            self._frozen_source = self.config
+            self._frozen_config = freeze_config(self.config)
+        if self._frozen_config is None:
+            return copy.deepcopy(self.config)
+        return thaw_config(self._frozen_config)
 
 
 class EpisodeListScheduler(EpisodeScheduler):
-    """Cycle through a list of different game setups for each episode."""
+    """
+    Cycle through a list of different game setups for each episode.
+
+    The YAML of each distinct game setup is only parsed the first time it is needed, or in the background when it is
+    prefetched, and each parsed config is kept frozen to be copied for later episodes.
+    """
 
     schedule: Mapping[int, List[str]]
     """Mapping from episode number to list of filenames"""
@@ -54,22 +120,49 @@ class EpisodeListScheduler(EpisodeScheduler):
     When this happens, we loop back to the beginning, but a warning is raised.
     """
 
+    _parsed_configs: Dict[str, bytes] = pydantic.PrivateAttr(default_factory=dict)
+    """Mapping from the joined YAML of a game setup to its frozen parsed config."""
+    _pending_configs: Dict[str, Future] = pydantic.PrivateAttr(default_factory=dict)
+    """Mapping from the joined YAML of a game setup to the future of its config being parsed in the background."""
+
     def __call__(self, episode_num: int) -> Dict:
         """Return the config for the given episode number."""
-        if episode_num >= len(self.schedule):
-            if not self._exceeded_episode_list:
-                self._exceeded_episode_list = True
-                _LOGGER.warning(
-                    f"Running episode {episode_num} but the schedule only defines "
-                    f"{len(self.schedule)} episodes. Looping back to the beginning"
-                )
-                # not sure if we should be using a traditional warning, or a _LOGGER.warning
-            episode_num = episode_num % len(self.schedule)
-
-        filenames_to_join = self.schedule[episode_num]
+        if episode_num >= len(self.schedule) and not self._exceeded_episode_list:
+            self._exceeded_episode_list = True
+            _LOGGER.warning(
+                f"Running episode {episode_num} but the schedule only defines "
+                f"{len(self.schedule)} episodes. Looping back to the beginning"
+            )
+            # not sure if we should be using a traditional warning, or a _LOGGER.warning
+        joined_yaml = self._joined_yaml(episode_num)
+
+        frozen = self._parsed_configs.get(joined_yaml)
+        if frozen is None:
+            pending = self._pending_configs.pop(joined_yaml, None)
+            frozen = pending.result() if pending else self._parse(joined_yaml)
+            self._parsed_configs[joined_yaml] = frozen
+        return thaw_config(frozen)
+
+    def prefetch(self, episode_num: int) -> None:
+        """
+        Start parsing the config of an episode in a background thread, if it has not been parsed already.
+
+        :param episode_num: The episode whose config will be requested next.
+        """
+        joined_yaml = self._joined_yaml(episode_num)
+        if joined_yaml not in self._parsed_configs and joined_yaml not in self._pending_configs:
+            self._pending_configs[joined_yaml] = _get_prefetch_executor().submit(self._parse, joined_yaml)
+
+    def _joined_yaml(self, episode_num: int) -> str:
+        """Join the YAML of the files which make up the game setup of an episode."""
+        filenames_to_join = self.schedule[episode_num % len(self.schedule)]
         yaml_data_to_join = [self.episode_data[fn] for fn in filenames_to_join] + [self.base_scenario]
-        joined_yaml = "\n".join(yaml_data_to_join)
-        parsed_cfg = yaml.safe_load(joined_yaml)
+        return "\n".join(yaml_data_to_join)
+
+    @staticmethod
+    def _parse(joined_yaml: str) -> bytes:
+        """Parse the joined YAML of a game setup into a frozen config."""
+        parsed_cfg: Dict[str, Any] = yaml.safe_load(joined_yaml)
 
         # Unfortunately, using placeholders like this is slightly hacky, so we have to flatten the list of agents
         flat_agents_list = []
@@ -80,7 +173,7 @@ class EpisodeListScheduler(EpisodeScheduler):
                 flat_agents_list.append(a)
         parsed_cfg["agents"] = flat_agents_list
 
-        return parsed_cfg
+        return freeze_config(parsed_cfg)
 
 
 def build_scheduler(config: Union[str, Path, Dict]) -> EpisodeScheduler:
@@ -1,15 +1,19 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 """Utilities for reading settings and writing of log files."""
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Literal, Optional, Sequence, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict
 
 from primaite import _PRIMAITE_ROOT, getLogger, PRIMAITE_CONFIG, PRIMAITE_PATHS
 from primaite.simulator import LogLevel, SIM_OUTPUT
+from primaite.utils.agent_actions import AgentActionLogWriter
 from primaite.utils.cli.primaite_config_utils import is_dev_mode
+from primaite.utils.profiling import StepProfiler
+
+if TYPE_CHECKING:
+    from primaite.game.agent.interface import AgentHistoryItem
 
 _LOGGER = getLogger(__name__)
 
@@ -32,8 +36,12 @@ class PrimaiteIO:
         """Whether to save a log of all agents' actions every step."""
         save_step_metadata: bool = False
         """Whether to save the RL agents' action, environment state, and other data at every single step."""
+        save_step_timings: bool = False
+        """Whether to time the phases of every step and save the timings at the end of each episode."""
         save_pcap_logs: bool = True
         """Whether to save PCAP logs."""
+        pcap_format: Literal["json", "binary"] = "json"
+        """The format to save PCAP logs in, either JSON lines or compact binary records."""
         save_sys_logs: bool = True
         """Whether to save system logs."""
         save_agent_logs: bool = True
@@ -60,6 +68,7 @@ class PrimaiteIO:
         SIM_OUTPUT.path = self.session_path / "simulation_output"
         SIM_OUTPUT.agent_behaviour_path = self.session_path / "agent_behaviour"
         SIM_OUTPUT.save_pcap_logs = self.settings.save_pcap_logs
+        SIM_OUTPUT.pcap_format = self.settings.pcap_format
         SIM_OUTPUT.save_sys_logs = self.settings.save_sys_logs
         SIM_OUTPUT.save_agent_logs = self.settings.save_agent_logs
         SIM_OUTPUT.write_agent_log_to_terminal = self.settings.write_agent_log_to_terminal
@@ -97,26 +106,43 @@ class PrimaiteIO:
 
     def generate_agent_actions_save_path(self, episode: int) -> Path:
         """Return the path where agent actions will be saved."""
-        return self.session_path / "agent_actions" / f"episode_{episode}.json"
+        return self.session_path / "agent_actions" / f"episode_{episode}.jsonl"
+
+    def write_agent_log(self, agent_actions: Dict[str, Sequence["AgentHistoryItem"]], episode: int) -> None:
+        """Write the whole history of each agent in an episode to the episode's agent action log.
 
-    def write_agent_log(self, agent_actions: Dict[str, List], episode: int) -> None:
-        """Take the contents of the agent action log and write it to a file.
+        The environments write the log a step at a time as the episode runs, with :py:meth:`open_agent_log`.
 
+        :param agent_actions: History of each agent, by agent name.
+        :type agent_actions: Dict[str, Sequence[AgentHistoryItem]]
         :param episode: Episode number
         :type episode: int
         """
-        data = {}
-        longest_history = max([len(hist) for hist in agent_actions.values()])
+        writer = self.open_agent_log(episode=episode)
+        longest_history = max([len(hist) for hist in agent_actions.values()], default=0)
         for i in range(longest_history):
-            data[i] = {"timestep": i, "episode": episode}
-            data[i].update({name: acts[i] for name, acts in agent_actions.items() if len(acts) > i})
-
-        path = self.generate_agent_actions_save_path(episode=episode)
-        path.parent.mkdir(exist_ok=True, parents=True)
-        path.touch()
-        _LOGGER.info(f"Saving agent action log to {path}")
-        with open(path, "w") as file:
-            json.dump(data, fp=file, indent=1, default=lambda x: x.model_dump())
+            writer.write(i, {name: acts[i] for name, acts in agent_actions.items() if len(acts) > i})
+        writer.close()
+
+    def open_agent_log(self, episode: int) -> AgentActionLogWriter:
+        """Create a writer for the agent action log of an episode.
+
+        :param episode: Episode number
+        :type episode: int
+        :return: Writer of the episode's agent action log, which creates the file when the first step is written.
+        :rtype: AgentActionLogWriter
+        """
+        return AgentActionLogWriter(self.generate_agent_actions_save_path(episode=episode), episode=episode)
+
+    def write_step_timings(self, profiler: StepProfiler, episode: int) -> None:
+        """Write the step timings of an episode to the episode's simulation output directory.
+
+        :param profiler: Profiler which recorded the timings of the episode.
+        :type profiler: StepProfiler
+        :param episode: Episode number
+        :type episode: int
+        """
+        profiler.write_episode(SIM_OUTPUT.path / f"episode_{episode}")
 
     @classmethod
     def from_config(cls, config: Dict) -> "PrimaiteIO":
@@ -0,0 +1,189 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Build the games of upcoming episodes in a worker process while the current episode runs."""
+import copy
+import multiprocessing as mp
+import random
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Dict, Optional
+
+import numpy as np
+
+from primaite import getLogger
+from primaite.game.game import PrimaiteGame
+from primaite.game.snapshot import GameSnapshot
+from primaite.simulator import SIM_OUTPUT
+
+_LOGGER = getLogger(__name__)
+
+
+def _draw_seed() -> int:
+    """Draw a seed from the global numpy generator without advancing it, so the running episode is unaffected."""
+    generator = np.random.RandomState()
+    generator.set_state(np.random.get_state())
+    return int(generator.randint(0, 2**32 - 1))
+
+
+def _worker(remote: Connection, parent_remote: Connection, date_str: str, time_str: str) -> None:
+    """Build a game from each config and seed sent by the prefetcher, and send back a snapshot of it."""
+    parent_remote.close()
+    SIM_OUTPUT.date_str = date_str
+    SIM_OUTPUT.time_str = time_str
+    try:
+        while (request := remote.recv()) is not None:
+            cfg, seed = request
+            try:
+                random.seed(seed)
+                np.random.seed(seed)
+                game = PrimaiteGame.from_config(cfg=copy.deepcopy(cfg))
+                remote.send((True, GameSnapshot(cfg=cfg, game=game)))
+            except Exception:
+                remote.send((False, traceback.format_exc()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        remote.close()
+
+
+def start_prefetcher(cfg: Dict) -> Optional["GamePrefetcher"]:
+    """
+    Start a game prefetcher if the config enables prefetching games.
+
+    Daemonic processes, such as the workers of :py:class:`primaite.session.vec_env.PrimaiteVecEnv`, are not allowed to
+    start child processes. In these, a warning is logged and games are built at reset instead.
+
+    :param cfg: The environment's first game config.
+    :type cfg: Dict
+    :return: The prefetcher, or None if games are not prefetched.
+    :rtype: Optional[GamePrefetcher]
+    """
+    if not cfg.get("game", {}).get("prefetch_games", False):
+        return None
+    if mp.current_process().daemon:
+        _LOGGER.warning(
+            "Games cannot be prefetched in a daemonic process, such as a vectorised environment worker. Games will be "
+            "built at reset instead."
+        )
+        return None
+    return GamePrefetcher()
+
+
+class GamePrefetcher:
+    """
+    Builds the game of the next episode in the background, so that resetting an environment does not wait for it.
+
+    Each requested game is built from config in a worker process, which sends back a :py:class:`GameSnapshot` of it. A
+    thread in the environment's process receives the snapshot and deserialises the game, so that all that is left to
+    do at reset is reset its agents and apply its network settings. Building in a separate process rather than a
+    thread keeps the class-level network settings and the global random number generators of the running game
+    untouched. The worker seeds its own generators with a seed drawn from the environment's global numpy generator
+    when the game is requested, and the agents redraw their random choices from the environment's generators when the
+    game is restored, so episodes play out as they would if their game were built from config at reset. The worker is
+    started when the prefetcher is created, so plugins and components registered after that are not available to it
+    when using the ``"fork"`` start method.
+
+    Only one game is prefetched at a time. If a game cannot be prefetched, a warning is logged and :py:meth:`take`
+    returns None, so that the caller can build the game itself.
+
+    :param start_method: Multiprocessing start method, such as ``"fork"``, ``"spawn"`` or ``"forkserver"``. Defaults to
+        the platform's default start method.
+    :type start_method: Optional[str]
+    """
+
+    def __init__(self, start_method: Optional[str] = None) -> None:
+        context = mp.get_context(start_method)
+        self._remote, work_remote = context.Pipe()
+        self._process = context.Process(
+            target=_worker,
+            args=(work_remote, self._remote, SIM_OUTPUT.date_str, SIM_OUTPUT.time_str),
+            name="game-prefetcher",
+            daemon=True,
+        )
+        self._process.start()
+        work_remote.close()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-prefetcher")
+        self._pending: Optional[Future] = None
+        """Snapshot of the game which has been requested and not yet taken."""
+        self.closed: bool = False
+        """Whether the prefetcher has been closed."""
+
+    def request(self, cfg: Dict) -> None:
+        """
+        Start building the game for a config. A game which was requested earlier and not taken is discarded.
+
+        :param cfg: Config of the game to build.
+        :type cfg: Dict
+        """
+        if self.closed:
+            return
+        self.discard()
+        try:
+            self._remote.send((cfg, _draw_seed()))
+        except Exception as e:
+            _LOGGER.warning(f"Could not prefetch the next game, it will be built at reset instead. Reason: {e}")
+            return
+        self._pending = self._executor.submit(self._receive)
+
+    def discard(self) -> None:
+        """Discard the requested game, for instance because the random number generators have been reseeded."""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def take(self, cfg: Dict) -> Optional[GameSnapshot]:
+        """
+        Wait for the requested game, and get its snapshot if it was built from the given config.
+
+        The game has already been deserialised, so restoring the snapshot is quick.
+
+        :param cfg: Config of the game that is needed.
+        :type cfg: Dict
+        :return: Snapshot of the prefetched game, or None if no game was requested for the config or it could not be
+            built.
+        :rtype: Optional[GameSnapshot]
+        """
+        if self._pending is None:
+            return None
+        snapshot, self._pending = self._pending.result(), None
+        if snapshot is None or not snapshot.matches(cfg):
+            return None
+        return snapshot
+
+    def _receive(self) -> Optional[GameSnapshot]:
+        try:
+            success, result = self._remote.recv()
+            if success:
+                result.preload()
+        except (EOFError, OSError):
+            success, result = False, "The prefetch worker process exited unexpectedly."
+        except Exception:
+            success, result = False, traceback.format_exc()
+        if not success:
+            if not self.closed:
+                _LOGGER.warning(
+                    f"Could not prefetch the next game, it will be built at reset instead. Reason:\n{result}"
+                )
+            return None
+        return result
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._pending is not None and not self._pending.done():
+            # There is no point waiting for the game being built to be sent back
+            self._process.terminate()
+        else:
+            try:
+                self._remote.send(None)
+            except OSError:
+                pass
+        self._process.join(timeout=30)
+        if self._process.is_alive():
+            _LOGGER.warning(f"Game prefetch worker {self._process.pid} did not stop, terminating it.")
+            self._process.terminate()
+        self._executor.shutdown(wait=True)
+        self._pending = None
+        self._remote.close()
@@ -1,7 +1,6 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 """Entrypoint for Ray RLLib single- and multi-agent environments."""
-import json
-from typing import Dict, SupportsFloat, Tuple
+from typing import Dict, Optional, SupportsFloat, Tuple
 
 import gymnasium
 from gymnasium import spaces
@@ -10,11 +9,16 @@ from ray.rllib.env.multi_agent_env import MultiAgentEnv
 
 from primaite.game.agent.interface import ProxyAgent
 from primaite.game.game import PrimaiteGame
+from primaite.game.snapshot import GameSnapshot
 from primaite.session.environment import _LOGGER, PrimaiteGymEnv
 from primaite.session.episode_schedule import build_scheduler, EpisodeScheduler
 from primaite.session.io import PrimaiteIO
+from primaite.session.prefetch import GamePrefetcher, start_prefetcher
 from primaite.simulator import SIM_OUTPUT
 from primaite.simulator.system.core.packet_capture import PacketCapture
+from primaite.utils.agent_actions import AgentActionLogWriter
+from primaite.utils.profiling import StepProfiler
+from primaite.utils.step_metadata import STEP_METADATA_FILENAME, StepMetadataWriter
 
 
 class PrimaiteRayMARLEnv(MultiAgentEnv):
@@ -31,17 +35,31 @@ class PrimaiteRayMARLEnv(MultiAgentEnv):
         """Current episode number."""
         self.episode_scheduler: EpisodeScheduler = build_scheduler(env_config)
         """Object that returns a config corresponding to the current episode."""
-        self.io = PrimaiteIO.from_config(self.episode_scheduler(0).get("io_settings", {}))
+        first_cfg = self.episode_scheduler(0)
+        self.io = PrimaiteIO.from_config(first_cfg.get("io_settings", {}))
         """Handles IO for the environment. This produces sys logs, agent logs, etc."""
-        self.game: PrimaiteGame = PrimaiteGame.from_config(self.episode_scheduler(self.episode_counter))
+        self.fast_reset: bool = first_cfg.get("game", {}).get("fast_reset", False)
+        """Whether to restore a snapshot of the game on reset instead of rebuilding it from config."""
+        self._snapshot: Optional[GameSnapshot] = None
+        """Snapshot of the most recently built game, used when fast reset is enabled."""
+        self._prefetcher: Optional[GamePrefetcher] = start_prefetcher(first_cfg)
+        """Worker which builds the next episode's game during each episode, used when prefetching games is enabled."""
+        self.profiler: StepProfiler = StepProfiler(enabled=self.io.settings.save_step_timings)
+        """Profiler which times the phases of each step. It is shared by the game of every episode."""
+        self._step_metadata: Optional[StepMetadataWriter] = None
+        """Writer of the current episode's step metadata, created at its first step when step metadata is saved."""
+        self._agent_actions: Optional[AgentActionLogWriter] = None
+        """Writer of the current episode's agent action log, created at its first step when agent actions are saved."""
+        self.game: PrimaiteGame = self._build_game(self.episode_scheduler(self.episode_counter))
         """Reference to the primaite game"""
+        self._prefetch(self.episode_counter + 1)
         self._agent_ids = list(self.game.rl_agents.keys())
         """Agent ids. This is a list of strings of agent names."""
 
         self.terminateds = set()
         self.truncateds = set()
         self.observation_space = spaces.Dict(
-            {name: spaces.flatten_space(agent.observation_manager.space) for name, agent in self.agents.items()}
+            {name: agent.observation_manager.flat_space for name, agent in self.agents.items()}
         )
         for agent_name in self._agent_ids:
             agent = self.game.rl_agents[agent_name]
@@ -68,20 +86,62 @@ class PrimaiteRayMARLEnv(MultiAgentEnv):
         rewards = {name: agent.reward_function.total_reward for name, agent in self.agents.items()}
         _LOGGER.info(f"Resetting environment, episode {self.episode_counter}, " f"avg. reward: {rewards}")
 
-        if self.io.settings.save_agent_actions:
-            all_agent_actions = {name: agent.history for name, agent in self.game.agents.items()}
-            self.io.write_agent_log(agent_actions=all_agent_actions, episode=self.episode_counter)
+        self._close_agent_actions()
+        if self.io.settings.save_step_timings:
+            self.io.write_step_timings(profiler=self.profiler, episode=self.episode_counter)
+        self._close_step_metadata()
 
         self.episode_counter += 1
         PacketCapture.clear()
-        self.game: PrimaiteGame = PrimaiteGame.from_config(self.episode_scheduler(self.episode_counter))
+        self.game: PrimaiteGame = self._build_game(self.episode_scheduler(self.episode_counter))
         self.game.setup_for_episode(episode=self.episode_counter)
+        self._prefetch(self.episode_counter + 1)
         state = self.game.get_sim_state()
         self.game.update_agents(state)
         next_obs = self._get_obs()
+        self.profiler.end_episode()
         info = {}
         return next_obs, info
 
+    def _build_game(self, cfg: Dict) -> PrimaiteGame:
+        """
+        Create the game for an episode, restoring it from a snapshot if fast reset is enabled and the config matches.
+
+        When prefetching games is enabled, the game built by the prefetch worker is used if it was built from the same
+        config.
+
+        :param cfg: Config for the episode.
+        :type cfg: Dict
+        :return: Game for the episode, not yet set up.
+        :rtype: PrimaiteGame
+        """
+        snapshot = self._prefetcher.take(cfg) if self._prefetcher is not None else None
+        if snapshot is not None:
+            game = snapshot.restore()
+            if self.fast_reset:
+                self._snapshot = snapshot
+        elif not self.fast_reset:
+            game = PrimaiteGame.from_config(cfg)
+        else:
+            game, self._snapshot = GameSnapshot.build(cfg=cfg, snapshot=self._snapshot)
+        game.profiler = self.profiler
+        return game
+
+    def _prefetch(self, episode: int) -> None:
+        """
+        Start preparing an upcoming episode.
+
+        When prefetching games is enabled, the episode's game is built by the prefetch worker. Otherwise, the episode
+        scheduler is asked to prepare the episode's config.
+
+        :param episode: Number of the episode.
+        :type episode: int
+        """
+        if self._prefetcher is None:
+            self.episode_scheduler.prefetch(episode)
+        else:
+            self._prefetcher.request(self.episode_scheduler(episode))
+
     def step(
         self, actions: Dict[str, ActType]
     ) -> Tuple[Dict[str, ObsType], Dict[str, SupportsFloat], Dict[str, bool], Dict[str, bool], Dict]:
@@ -106,7 +166,8 @@ class PrimaiteRayMARLEnv(MultiAgentEnv):
         # 3. Get next observations
         state = self.game.get_sim_state()
         self.game.update_agents(state)
-        next_obs = self._get_obs()
+        with self.profiler.phase("get_obs"):
+            next_obs = self._get_obs()
 
         # 4. Get rewards
         rewards = {name: agent.reward_function.current_reward for name, agent in self.agents.items()}
@@ -116,34 +177,54 @@ class PrimaiteRayMARLEnv(MultiAgentEnv):
         infos = {name: {} for name, _ in self.agents.items()}
         terminateds["__all__"] = len(self.terminateds) == len(self.agents)
         truncateds["__all__"] = self.game.calculate_truncated()
+        if self.io.settings.save_agent_actions:
+            with self.profiler.phase("save_agent_actions"):
+                self._write_agent_actions(step)
         if self.game.save_step_metadata:
-            self._write_step_metadata_json(step, actions, state, rewards)
+            with self.profiler.phase("save_step_metadata"):
+                self._write_step_metadata(step, actions, state, rewards)
+        self.profiler.end_step()
         return next_obs, rewards, terminateds, truncateds, infos
 
-    def _write_step_metadata_json(self, step: int, actions: Dict, state: Dict, rewards: Dict):
-        output_dir = SIM_OUTPUT.path / f"episode_{self.episode_counter}" / "step_metadata"
+    def _write_agent_actions(self, step: int):
+        if self._agent_actions is None:
+            self._agent_actions = self.io.open_agent_log(episode=self.episode_counter)
+        self._agent_actions.write(step, {name: agent.history[-1] for name, agent in self.game.agents.items()})
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        path = output_dir / f"step_{step}.json"
+    def _close_agent_actions(self) -> None:
+        """Finish writing the current episode's agent action log."""
+        if self._agent_actions is not None:
+            self._agent_actions.close()
+            self._agent_actions = None
 
-        data = {
-            "episode": self.episode_counter,
-            "step": step,
-            "actions": {agent_name: int(action) for agent_name, action in actions.items()},
-            "reward": rewards,
-            "state": state,
-        }
-        with open(path, "w") as file:
-            json.dump(data, file)
+    def _write_step_metadata(self, step: int, actions: Dict, state: Dict, rewards: Dict):
+        if self._step_metadata is None:
+            self._step_metadata = StepMetadataWriter(
+                SIM_OUTPUT.path / f"episode_{self.episode_counter}" / STEP_METADATA_FILENAME
+            )
+        self._step_metadata.write(
+            step,
+            {
+                "episode": self.episode_counter,
+                "step": step,
+                "actions": {agent_name: int(action) for agent_name, action in actions.items()},
+                "reward": rewards,
+                "state": state,
+            },
+        )
+
+    def _close_step_metadata(self) -> None:
+        """Finish writing the current episode's step metadata."""
+        if self._step_metadata is not None:
+            self._step_metadata.close()
+            self._step_metadata = None
 
     def _get_obs(self) -> Dict[str, ObsType]:
         """Return the current observation."""
         all_obs = {}
         for agent_name in self._agent_ids:
             agent = self.game.rl_agents[agent_name]
-            unflat_space = agent.observation_manager.space
-            unflat_obs = agent.observation_manager.current_observation
-            obs = gymnasium.spaces.flatten(unflat_space, unflat_obs)
+            obs = agent.observation_manager.flat_observation
             if agent.config.agent_settings.action_masking:
                 all_obs[agent_name] = {"action_mask": self.game.action_mask(agent_name), "observations": obs}
             else:
@@ -152,9 +233,12 @@ class PrimaiteRayMARLEnv(MultiAgentEnv):
 
     def close(self):
         """Close the simulation."""
-        if self.io.settings.save_agent_actions:
-            all_agent_actions = {name: agent.history for name, agent in self.game.agents.items()}
-            self.io.write_agent_log(agent_actions=all_agent_actions, episode=self.episode_counter)
+        self._close_agent_actions()
+        if self.io.settings.save_step_timings:
+            self.io.write_step_timings(profiler=self.profiler, episode=self.episode_counter)
+        self._close_step_metadata()
+        if self._prefetcher is not None:
+            self._prefetcher.close()
 
 
 class PrimaiteRayEnv(gymnasium.Env):
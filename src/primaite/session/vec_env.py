@@ -0,0 +1,352 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Vectorised environment which runs several PrimAITE gym environments in worker processes."""
+import multiprocessing as mp
+import traceback
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from os import PathLike
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import gymnasium
+import numpy as np
+
+from primaite import getLogger
+from primaite.exceptions import PrimaiteError
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.simulator import SIM_OUTPUT
+
+_LOGGER = getLogger(__name__)
+
+_ArraySpec = Tuple[str, Tuple[int, ...], str]
+"""Name of the shared memory block, shape and dtype of a shared array."""
+
+
+class _SharedArray:
+    """A NumPy array backed by a block of shared memory, which can be attached to by other processes."""
+
+    def __init__(self, shm: SharedMemory, shape: Tuple[int, ...], dtype: np.dtype) -> None:
+        self.shm: SharedMemory = shm
+        self.array: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, shape: Tuple[int, ...], dtype: np.dtype) -> "_SharedArray":
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shared = cls(SharedMemory(create=True, size=size), shape, dtype)
+        shared.array.fill(0)
+        return shared
+
+    @classmethod
+    def attach(cls, spec: _ArraySpec) -> "_SharedArray":
+        name, shape, dtype = spec
+        return cls(SharedMemory(name=name), shape, np.dtype(dtype))
+
+    @property
+    def spec(self) -> _ArraySpec:
+        return self.shm.name, self.array.shape, self.array.dtype.str
+
+    def close(self) -> None:
+        del self.array
+        self.shm.close()
+
+
+class _VecEnvBuffers:
+    """The shared arrays which workers write their step results into, with one row per environment."""
+
+    def __init__(self, arrays: Dict[str, _SharedArray]) -> None:
+        self.arrays: Dict[str, _SharedArray] = arrays
+
+    @classmethod
+    def create(cls, num_envs: int, observation_space: gymnasium.spaces.Box, num_actions: int) -> "_VecEnvBuffers":
+        return cls(
+            {
+                "observations": _SharedArray.create((num_envs,) + observation_space.shape, observation_space.dtype),
+                "rewards": _SharedArray.create((num_envs,), np.float64),
+                "terminated": _SharedArray.create((num_envs,), np.bool_),
+                "truncated": _SharedArray.create((num_envs,), np.bool_),
+                "action_masks": _SharedArray.create((num_envs, num_actions), np.bool_),
+            }
+        )
+
+    @classmethod
+    def attach(cls, specs: Dict[str, _ArraySpec]) -> "_VecEnvBuffers":
+        return cls({name: _SharedArray.attach(spec) for name, spec in specs.items()})
+
+    @property
+    def specs(self) -> Dict[str, _ArraySpec]:
+        return {name: shared.spec for name, shared in self.arrays.items()}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name].array
+
+    def close(self) -> None:
+        for shared in self.arrays.values():
+            shared.close()
+
+    def unlink(self) -> None:
+        for shared in self.arrays.values():
+            shared.shm.unlink()
+
+
+def _write_observation(env: PrimaiteGymEnv, buffers: _VecEnvBuffers, index: int) -> None:
+    """Write the current flattened observation and action mask of an environment into its row of the buffers."""
+    observation_manager = env.agent.observation_manager
+    observation_manager.flat_encoder.encode(observation_manager.current_observation, out=buffers["observations"][index])
+    if env.agent.config.agent_settings.action_masking:
+        buffers["action_masks"][index] = env.action_masks()
+    else:
+        buffers["action_masks"][index] = True
+
+
+def _slim_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the history item of each agent in a step's info dict with its action, parameters and response status."""
+    info["agent_actions"] = {
+        name: {"action": item.action, "parameters": item.parameters, "response_status": item.response.status}
+        for name, item in info["agent_actions"].items()
+    }
+    return info
+
+
+def _worker(
+    remote: Connection,
+    parent_remote: Connection,
+    env_config: Union[Dict, str, PathLike],
+    index: int,
+    date_str: str,
+    time_str: str,
+    full_info: bool,
+) -> None:
+    """
+    Run a PrimaiteGymEnv in a worker process, following commands sent by the vectorised environment.
+
+    Each worker saves its output to its own subdirectory of the vectorised environment's session directory.
+    """
+    parent_remote.close()
+    SIM_OUTPUT.date_str = date_str
+    SIM_OUTPUT.time_str = f"{time_str}/worker_{index}"
+    buffers: Optional[_VecEnvBuffers] = None
+    try:
+        env = PrimaiteGymEnv(env_config=env_config)
+        remote.send((True, (env.agent.observation_manager.flat_space, env.action_space)))
+        while True:
+            command, data = remote.recv()
+            if command == "attach":
+                buffers = _VecEnvBuffers.attach(data)
+                result = None
+            elif command == "reset":
+                _, result = env.reset(seed=data)
+                _write_observation(env, buffers, index)
+                buffers["terminated"][index] = False
+                buffers["truncated"][index] = False
+            elif command == "step":
+                _, reward, terminated, truncated, result = env.step(data)
+                if not full_info:
+                    result = _slim_info(result)
+                if terminated or truncated:
+                    observation_manager = env.agent.observation_manager
+                    result["terminal_observation"] = observation_manager.flat_observation
+                    env.reset()
+                _write_observation(env, buffers, index)
+                buffers["rewards"][index] = reward
+                buffers["terminated"][index] = terminated
+                buffers["truncated"][index] = truncated
+            elif command == "close":
+                env.close()
+                remote.send((True, None))
+                break
+            else:
+                raise ValueError(f"Unknown command {command} sent to environment worker {index}.")
+            remote.send((True, result))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    except Exception:
+        remote.send((False, traceback.format_exc()))
+    finally:
+        if buffers is not None:
+            buffers.close()
+        remote.close()
+
+
+class PrimaiteVecEnv:
+    """
+    Vectorised environment which steps several copies of a PrimaiteGymEnv in parallel worker processes.
+
+    Each worker writes its flattened observation, reward, termination flags and action mask directly into shared
+    memory arrays with one row per environment, so only actions, commands and info dicts are sent between processes.
+    By default, the ``agent_actions`` of each step's info dict only give the action, parameters and response status of
+    each agent, as sending their full history items, observations included, every step is slow.
+    When an environment's episode ends, its worker resets it straight away. The final observation of the finished
+    episode is put in the step's info dict under ``terminal_observation``, and the returned observation is the first
+    observation of the next episode.
+
+    Observations are always flattened, so ``observation_space`` is the flattened observation space of a single
+    environment regardless of the agent's ``flatten_obs`` setting.
+
+    :param env_config: Config for the environments, as accepted by :py:class:`PrimaiteGymEnv`. Each environment is
+        built from the same config.
+    :type env_config: Union[Dict, str, PathLike]
+    :param num_envs: Number of environments, each run in its own process.
+    :type num_envs: int
+    :param start_method: Multiprocessing start method, such as ``"fork"``, ``"spawn"`` or ``"forkserver"``. Defaults to
+        the platform's default start method.
+    :type start_method: Optional[str]
+    :param full_info: Whether to send the full :py:class:`AgentHistoryItem` of each agent in the ``agent_actions`` of
+        each step's info dict, as :py:class:`PrimaiteGymEnv` returns them.
+    :type full_info: bool
+    """
+
+    def __init__(
+        self,
+        env_config: Union[Dict, str, PathLike],
+        num_envs: int,
+        start_method: Optional[str] = None,
+        full_info: bool = False,
+    ) -> None:
+        if num_envs < 1:
+            raise ValueError(f"A vectorised environment needs at least one environment, got num_envs={num_envs}.")
+        self.num_envs: int = num_envs
+        """Number of environments."""
+        self.closed: bool = False
+        """Whether the environment has been closed."""
+        self._waiting: bool = False
+        """Whether a step has been started with :py:meth:`step_async` and not yet collected."""
+
+        # Start the resource tracker before the workers, so they share it instead of each starting their own which
+        # would report the shared memory they attach to as leaked when they exit.
+        resource_tracker.ensure_running()
+        context = mp.get_context(start_method)
+        pipes = [context.Pipe() for _ in range(num_envs)]
+        self._remotes: List[Connection] = [remote for remote, _ in pipes]
+        self._processes: List[mp.Process] = []
+        for index, (remote, work_remote) in enumerate(pipes):
+            process = context.Process(
+                target=_worker,
+                args=(work_remote, remote, env_config, index, SIM_OUTPUT.date_str, SIM_OUTPUT.time_str, full_info),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+            work_remote.close()
+
+        self.observation_space: gymnasium.spaces.Box
+        """Flattened observation space of a single environment."""
+        self.action_space: gymnasium.spaces.Discrete
+        """Action space of a single environment."""
+        self.observation_space, self.action_space = self._receive_all()[0]
+
+        self._buffers: _VecEnvBuffers = _VecEnvBuffers.create(num_envs, self.observation_space, self.action_space.n)
+        self._send_all("attach", [self._buffers.specs] * num_envs)
+        self._receive_all()
+
+    def _send_all(self, command: str, data: Sequence[Any]) -> None:
+        for remote, item in zip(self._remotes, data):
+            remote.send((command, item))
+
+    def _receive_all(self) -> List[Any]:
+        """Receive a reply from every worker, raising the first error only once every reply has been received."""
+        results = []
+        errors = []
+        for index, remote in enumerate(self._remotes):
+            try:
+                success, result = remote.recv()
+            except (EOFError, OSError):
+                success, result = False, "The worker process exited unexpectedly."
+            if not success:
+                errors.append(f"Environment worker {index} failed:\n{result}")
+            results.append(result)
+        if errors:
+            raise PrimaiteError(errors[0])
+        return results
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        Reset every environment.
+
+        :param seed: If given, environment ``i`` is reset with seed ``seed + i``.
+        :type seed: Optional[int]
+        :return: The first observation of each environment, with shape ``(num_envs, *observation_space.shape)``, and
+            the info dict of each environment.
+        :rtype: Tuple[np.ndarray, List[Dict[str, Any]]]
+        """
+        seeds = [None if seed is None else seed + index for index in range(self.num_envs)]
+        self._send_all("reset", seeds)
+        infos = self._receive_all()
+        return self._buffers["observations"].copy(), infos
+
+    def step_async(self, actions: Sequence[Any]) -> None:
+        """
+        Send an action to each environment without waiting for the environments to step.
+
+        :param actions: One action for each environment.
+        :type actions: Sequence[Any]
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}.")
+        self._send_all("step", actions)
+        self._waiting = True
+
+    def step_wait(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """
+        Wait for the environments to finish the step started by :py:meth:`step_async`.
+
+        :return: Observations, rewards, terminated flags, truncated flags and info dicts, with one entry per
+            environment.
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]
+        """
+        self._waiting = False
+        infos = self._receive_all()
+        return (
+            self._buffers["observations"].copy(),
+            self._buffers["rewards"].copy(),
+            self._buffers["terminated"].copy(),
+            self._buffers["truncated"].copy(),
+            infos,
+        )
+
+    def step(
+        self, actions: Sequence[Any]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """
+        Step every environment, resetting any environment whose episode ends.
+
+        :param actions: One action for each environment.
+        :type actions: Sequence[Any]
+        :return: Observations, rewards, terminated flags, truncated flags and info dicts, with one entry per
+            environment.
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def action_masks(self) -> np.ndarray:
+        """
+        Return the current action mask of each environment.
+
+        :return: Boolean array with shape ``(num_envs, action_space.n)``. Environments whose agent does not use action
+            masking allow every action.
+        :rtype: np.ndarray
+        """
+        return self._buffers["action_masks"].copy()
+
+    def close(self) -> None:
+        """Close every environment, stop the worker processes and free the shared memory."""
+        if self.closed:
+            return
+        if self._waiting:
+            self._receive_all()
+        for remote in self._remotes:
+            try:
+                remote.send(("close", None))
+                remote.recv()
+            except (EOFError, OSError):
+                pass
+            remote.close()
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                _LOGGER.warning(f"Environment worker {process.pid} did not stop, terminating it.")
+                process.terminate()
+        self._buffers.close()
+        self._buffers.unlink()
+        self.closed = True
@@ -3,6 +3,7 @@
 from datetime import datetime
 from enum import IntEnum
 from pathlib import Path
+from typing import Literal
 
 from primaite import _PRIMAITE_ROOT, PRIMAITE_CONFIG, PRIMAITE_PATHS
 
@@ -26,6 +27,10 @@ class LogLevel(IntEnum):
     """Critical errors will be output to terminal or log file."""
 
 
+_LOGGING_DISABLED: int = LogLevel.CRITICAL + 1
+"""Log threshold used while a log has no output, which no message reaches."""
+
+
 class _SimOutput:
     def __init__(self):
         self.date_str = datetime.now().strftime("%Y-%m-%d")
@@ -42,6 +47,42 @@ class _SimOutput:
         self._write_agent_log_to_terminal: bool = False
         self._sys_log_level: LogLevel = LogLevel.WARNING  # default log level is at WARNING
         self._agent_log_level: LogLevel = LogLevel.WARNING
+        self.pcap_format: Literal["json", "binary"] = "json"
+        """The format PCAP logs are saved in, either JSON lines or compact binary records."""
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Resolve the output settings against the developer mode config, and cache the results.
+
+        The settings are read on every log call, so they are resolved here rather than each time they are read. This is
+        called whenever a setting is changed through ``SIM_OUTPUT``, and must be called after changing the developer
+        mode config in ``PRIMAITE_CONFIG`` directly for the change to take effect.
+        """
+        if is_dev_mode():
+            dev_config = PRIMAITE_CONFIG["developer_mode"]
+            self._resolved_save_pcap_logs = dev_config.get("output_pcap_logs")
+            self._resolved_save_sys_logs = dev_config.get("output_sys_logs")
+            self._resolved_save_agent_logs = dev_config.get("output_agent_logs")
+            self._resolved_write_sys_log_to_terminal = dev_config.get("output_to_terminal")
+            self._resolved_write_agent_log_to_terminal = dev_config.get("output_to_terminal")
+            self._resolved_sys_log_level = LogLevel[dev_config.get("sys_log_level")]
+            self._resolved_agent_log_level = LogLevel[dev_config.get("agent_log_level")]
+        else:
+            self._resolved_save_pcap_logs = self._save_pcap_logs
+            self._resolved_save_sys_logs = self._save_sys_logs
+            self._resolved_save_agent_logs = self._save_agent_logs
+            self._resolved_write_sys_log_to_terminal = self._write_sys_log_to_terminal
+            self._resolved_write_agent_log_to_terminal = self._write_agent_log_to_terminal
+            self._resolved_sys_log_level = self._sys_log_level
+            self._resolved_agent_log_level = self._agent_log_level
+
+        sys_log_enabled = self._resolved_save_sys_logs or self._resolved_write_sys_log_to_terminal
+        self.sys_log_threshold: int = self._resolved_sys_log_level if sys_log_enabled else _LOGGING_DISABLED
+        """Lowest level of sys log message that is output, or above every level while sys logs have no output."""
+        agent_log_enabled = self._resolved_save_agent_logs or self._resolved_write_agent_log_to_terminal
+        self.agent_log_threshold: int = self._resolved_agent_log_level if agent_log_enabled else _LOGGING_DISABLED
+        """Lowest level of agent log message that is output, or above every level while agent logs have no output."""
 
     @property
     def path(self) -> Path:
@@ -89,74 +130,67 @@ class _SimOutput:
 
     @property
     def save_pcap_logs(self) -> bool:
-        if is_dev_mode():
-            return PRIMAITE_CONFIG.get("developer_mode").get("output_pcap_logs")
-        return self._save_pcap_logs
+        return self._resolved_save_pcap_logs
 
     @save_pcap_logs.setter
     def save_pcap_logs(self, save_pcap_logs: bool) -> None:
         self._save_pcap_logs = save_pcap_logs
+        self.refresh()
 
     @property
     def save_sys_logs(self) -> bool:
-        if is_dev_mode():
-            return PRIMAITE_CONFIG.get("developer_mode").get("output_sys_logs")
-        return self._save_sys_logs
+        return self._resolved_save_sys_logs
 
     @save_sys_logs.setter
     def save_sys_logs(self, save_sys_logs: bool) -> None:
         self._save_sys_logs = save_sys_logs
+        self.refresh()
 
     @property
     def save_agent_logs(self) -> bool:
-        if is_dev_mode():
-            return PRIMAITE_CONFIG.get("developer_mode").get("output_agent_logs")
-        return self._save_agent_logs
+        return self._resolved_save_agent_logs
 
     @save_agent_logs.setter
     def save_agent_logs(self, save_agent_logs: bool) -> None:
         self._save_agent_logs = save_agent_logs
+        self.refresh()
 
     @property
     def write_sys_log_to_terminal(self) -> bool:
-        if is_dev_mode():
-            return PRIMAITE_CONFIG.get("developer_mode").get("output_to_terminal")
-        return self._write_sys_log_to_terminal
+        return self._resolved_write_sys_log_to_terminal
 
     @write_sys_log_to_terminal.setter
     def write_sys_log_to_terminal(self, write_sys_log_to_terminal: bool) -> None:
         self._write_sys_log_to_terminal = write_sys_log_to_terminal
+        self.refresh()
 
     # Should this be separate from sys_log?
     @property
     def write_agent_log_to_terminal(self) -> bool:
-        if is_dev_mode():
-            return PRIMAITE_CONFIG.get("developer_mode").get("output_to_terminal")
-        return self._write_agent_log_to_terminal
+        return self._resolved_write_agent_log_to_terminal
 
     @write_agent_log_to_terminal.setter
     def write_agent_log_to_terminal(self, write_agent_log_to_terminal: bool) -> None:
         self._write_agent_log_to_terminal = write_agent_log_to_terminal
+        self.refresh()
 
     @property
     def sys_log_level(self) -> LogLevel:
-        if is_dev_mode():
-            return LogLevel[PRIMAITE_CONFIG.get("developer_mode").get("sys_log_level")]
-        return self._sys_log_level
+        return self._resolved_sys_log_level
 
     @sys_log_level.setter
     def sys_log_level(self, sys_log_level: LogLevel) -> None:
         self._sys_log_level = sys_log_level
+        self.refresh()
 
     @property
     def agent_log_level(self) -> LogLevel:
-        if is_dev_mode():
-            return LogLevel[PRIMAITE_CONFIG.get("developer_mode").get("agent_log_level")]
-        return self._agent_log_level
+        return self._resolved_agent_log_level
 
     @agent_log_level.setter
     def agent_log_level(self, agent_log_level: LogLevel) -> None:
         self._agent_log_level = agent_log_level
+        self.refresh()
 
 
 SIM_OUTPUT = _SimOutput()
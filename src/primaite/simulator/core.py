@@ -3,7 +3,7 @@
 """Base classes for the PrimAITE Simulator."""
 import warnings
 from abc import abstractmethod
-from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Literal, Optional, Tuple, Union
 from uuid import uuid4
 
 from prettytable import PrettyTable
@@ -35,6 +35,19 @@ class RequestPermissionValidator(BaseModel):
         """Message that is reported when a request is rejected by this validator."""
         return "request rejected"
 
+    @property
+    def dependencies(self) -> Optional[List["SimComponent"]]:
+        """
+        The simulation components whose state this validator reads, or None if it is not known.
+
+        This is used to reuse the result of the validator while none of these components, or their children, have
+        changed. By default, these are the components held in the fields of the validator, or None if it has no such
+        fields. Validators which read state from anywhere else must override this to return None, so that they are always
+        re-evaluated.
+        """
+        dependencies = [value for value in self.__dict__.values() if isinstance(value, SimComponent)]
+        return dependencies or None
+
     def __add__(self, other: "RequestPermissionValidator") -> "_CombinedValidator":
         return _CombinedValidator(validators=[self, other])
 
@@ -45,6 +58,15 @@ class _CombinedValidator(RequestPermissionValidator):
     def __call__(self, request, context) -> bool:
         return all(x(request, context) for x in self.validators)
 
+    @property
+    def dependencies(self) -> Optional[List["SimComponent"]]:
+        dependencies = []
+        for validator in self.validators:
+            if validator.dependencies is None:
+                return None
+            dependencies.extend(validator.dependencies)
+        return dependencies
+
     @property
     def fail_message(self):
         return f"One of the following conditions are not met: {[v.fail_message for v in self.validators]}"
@@ -57,6 +79,11 @@ class AllowAllValidator(RequestPermissionValidator):
         """Always allow the request."""
         return True
 
+    @property
+    def dependencies(self) -> List["SimComponent"]:
+        """This validator does not read any state, so its result never changes."""
+        return []
+
     @property
     def fail_message(self) -> str:
         """
@@ -105,6 +132,9 @@ class RequestManager(BaseModel):
     request_types: Dict[str, RequestType] = {}
     """maps request name to an RequestType object."""
 
+    structure_version: ClassVar[int] = 0
+    """Incremented whenever a request is added to or removed from any request manager."""
+
     def __call__(self, request: RequestFormat, context: Dict) -> RequestResponse:
         """
         Process an request request.
@@ -150,6 +180,7 @@ class RequestManager(BaseModel):
             _LOGGER.debug(msg)
 
         self.request_types[name] = request_type
+        RequestManager.structure_version += 1
 
     def remove_request(self, name: str) -> None:
         """
@@ -164,6 +195,7 @@ class RequestManager(BaseModel):
             raise RuntimeError(msg)
 
         self.request_types.pop(name)
+        RequestManager.structure_version += 1
 
     def get_request_types_recursively(self) -> List[RequestFormat]:
         """
@@ -193,21 +225,42 @@ class RequestManager(BaseModel):
         table.add_rows([[x] for x in self.get_request_types_recursively()])
         print(table)
 
-    def check_valid(self, request: RequestFormat, context: Dict) -> bool:
-        """Check if this request would be valid in the current state of the simulation without invoking it."""
+    def resolve(self, request: RequestFormat) -> Optional[Tuple[RequestType, RequestFormat]]:
+        """
+        Find the request type which would handle a request, without checking whether the request is permitted.
 
-        request_key = request[0]
-        request_options = request[1:]
+        The result stays correct until a request is added to or removed from a request manager, which is tracked by
+        :py:attr:`structure_version`.
 
-        if request_key not in self.request_types:
-            return False
+        :param request: The request to resolve.
+        :type request: RequestFormat
+        :return: The leaf request type and the options which would be passed to it, or None if the request does not
+            match any request type.
+        :rtype: Optional[Tuple[RequestType, RequestFormat]]
+        """
+        request_manager = self
+        while request:
+            request_key = request[0]
+            request_options = request[1:]
 
-        request_type = self.request_types[request_key]
+            if request_key not in request_manager.request_types:
+                return None
+
+            request_type = request_manager.request_types[request_key]
 
-        # recurse if we are not at a leaf node
-        if isinstance(request_type.func, RequestManager):
-            return request_type.func.check_valid(request_options, context)
+            # descend if we are not at a leaf node
+            if not isinstance(request_type.func, RequestManager):
+                return request_type, request_options
+            request_manager = request_type.func
+            request = request_options
+        return None
 
+    def check_valid(self, request: RequestFormat, context: Dict) -> bool:
+        """Check if this request would be valid in the current state of the simulation without invoking it."""
+        resolved = self.resolve(request)
+        if resolved is None:
+            return False
+        request_type, request_options = resolved
         return request_type.validator(request_options, context)
 
 
@@ -220,10 +273,70 @@ class SimComponent(BaseModel):
     uuid: str = Field(default_factory=lambda: str(uuid4()))
     """The component UUID."""
 
+    state_caching: ClassVar[bool] = False
+    """
+    Whether :py:meth:`describe_state_cached` may reuse the state of this component between calls.
+
+    The cached state is discarded whenever an attribute of the component is set, and the invalidation is passed on to
+    the component's parent. Components which opt in must call :py:meth:`invalidate_state` whenever they mutate any part
+    of their state in place, for instance by appending to a list which is included in the output of
+    :py:meth:`describe_state`. A component which contains other components may only opt in if all of the children in
+    its state opt in too, have it set as their parent, and are described with :py:meth:`describe_state_cached`.
+    """
+
+    _change_epoch: ClassVar[object] = object()
+    """
+    Token which is replaced whenever a change count is read.
+
+    A change is only passed on to the ancestors of a component which have not already changed since a change count was
+    last read. A new object is used for each epoch, rather than a number, so that components restored from a snapshot
+    never appear to have changed in the current epoch.
+    """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._request_manager: RequestManager = self._init_request_manager()
         self._parent: Optional["SimComponent"] = None
+        self._state_cache: Optional[Dict] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_state_cache":
+            if name == "_parent":
+                # The new ancestors have not been counted as changed yet
+                self.__dict__.pop("_changed_in_epoch", None)
+            self._record_change()
+            if self.state_caching:
+                self._discard_state_cache()
+
+    @property
+    def change_count(self) -> int:
+        """
+        The number of times this component, or any of its children, have changed.
+
+        Setting an attribute of a component counts as a change, as does calling :py:meth:`invalidate_state`. The count
+        is only meaningful when compared with an earlier count of the same component. Several changes between two reads
+        of any change count may only be counted once.
+        """
+        SimComponent._change_epoch = object()
+        return self.__dict__.get("_change_count", 0)
+
+    def _record_change(self) -> None:
+        """
+        Increment the change count of this component and its ancestors.
+
+        A component which has already changed since a change count was last read already has a count that differs from
+        any count read before, and so do all of its ancestors, so the change is not passed on any further.
+        """
+        epoch = SimComponent._change_epoch
+        component = self
+        while component is not None:
+            component_dict = component.__dict__
+            if component_dict.get("_changed_in_epoch") is epoch:
+                return
+            component_dict["_changed_in_epoch"] = epoch
+            component_dict["_change_count"] = component_dict.get("_change_count", 0) + 1
+            component = component_dict.get("_parent")
 
     def setup_for_episode(self, episode: int):
         """
@@ -269,6 +382,43 @@ class SimComponent(BaseModel):
         }
         return state
 
+    def describe_state_cached(self) -> Dict:
+        """
+        Return the state of this component, reusing the previous result if the component has not changed since.
+
+        Components that do not set :py:attr:`state_caching` always build a new state dictionary. The returned
+        dictionary may be shared between calls, so it must be treated as read-only.
+
+        :return: Current state of this object and child objects.
+        :rtype: Dict
+        """
+        if not self.state_caching:
+            return self.describe_state()
+        if self._state_cache is None:
+            self._state_cache = self.describe_state()
+        return self._state_cache
+
+    def invalidate_state(self) -> None:
+        """
+        Discard the cached state of this component, so it is rebuilt the next time it is described.
+
+        This only needs to be called after mutating state in place. Setting an attribute invalidates the cache
+        automatically. The parent of this component is invalidated too, as its state contains the state of this
+        component. If the cached state has already been discarded, the parent has been invalidated since, so the
+        invalidation stops there. The change is also counted in :py:attr:`change_count`.
+        """
+        self._record_change()
+        self._discard_state_cache()
+
+    def _discard_state_cache(self) -> None:
+        """Discard the cached state of this component and, if it was not already discarded, of its parent."""
+        if self.__dict__.get("_state_cache") is None:
+            return
+        self.__dict__["_state_cache"] = None
+        parent = self.__dict__.get("_parent")
+        if parent is not None and parent.state_caching:
+            parent._discard_state_cache()
+
     # @validate_call # this slows down execution quite a bit.
     def apply_request(self, request: RequestFormat, context: Optional[Dict] = None) -> RequestResponse:
         """
@@ -1,7 +1,7 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 """User account simulation."""
 from enum import Enum
-from typing import Dict
+from typing import ClassVar, Dict
 
 from primaite import getLogger
 from primaite.simulator.core import SimComponent
@@ -42,6 +42,8 @@ class Account(SimComponent):
     account_type: AccountType
     "Account Type, currently this can be service account (used by apps) or user account."
     enabled: bool = True
+    state_caching: ClassVar[bool] = True
+    "Account state rarely changes between timesteps, so it is cached until the account is modified."
 
     def describe_state(self) -> Dict:
         """
@@ -116,7 +116,7 @@ class DomainController(SimComponent):
         :rtype: Dict
         """
         state = super().describe_state()
-        state.update({"accounts": {acct.username: acct.describe_state() for acct in self.accounts.values()}})
+        state.update({"accounts": {acct.username: acct.describe_state_cached() for acct in self.accounts.values()}})
         return state
 
     def _register_account(self, account: Account) -> None:
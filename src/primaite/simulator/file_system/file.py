@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import warnings
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional
 
 from prettytable import MARKDOWN, PrettyTable
 
@@ -35,6 +35,8 @@ class File(FileSystemItemABC):
     "The simulated file size."
     num_access: int = 0
     "Number of times the file was accessed in the current step."
+    state_caching: ClassVar[bool] = True
+    "File state rarely changes between timesteps, so it is cached until the file is modified."
 
     def __init__(self, **kwargs):
         """
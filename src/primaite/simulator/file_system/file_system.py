@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from prettytable import MARKDOWN, PrettyTable
 
@@ -31,6 +31,9 @@ class FileSystem(SimComponent):
     num_file_deletions: int = 0
     "Number of file deletions in the current step."
 
+    state_caching: ClassVar[bool] = True
+    "File system state is cached until the file system or one of its folders is modified."
+
     _default_folder_scan_duration: Optional[int] = None
     "Override default scan duration for folders"
     _default_folder_restore_duration: Optional[int] = None
@@ -260,10 +263,12 @@ class FileSystem(SimComponent):
             self.sys_log.info(f"Cannot create folder as it already exists: {folder_name}")
         else:
             folder = Folder(name=folder_name, sys_log=self.sys_log)
+            folder.parent = self
             self._folder_request_manager.add_request(
                 name=folder.name, request_type=RequestType(func=folder._request_manager)
             )
         self.folders[folder.uuid] = folder
+        self.invalidate_state()
         # set the folder scan and restore durations.
         if self._default_folder_scan_duration is not None:
             folder.scan_duration = self._default_folder_scan_duration
@@ -295,6 +300,7 @@ class FileSystem(SimComponent):
         folder.remove_all_files()
 
         self.deleted_folders[folder.uuid] = folder
+        self.invalidate_state()
         self.sys_log.warning(f"Deleted folder /{folder.name} and its contents")
         return True
 
@@ -483,7 +489,11 @@ class FileSystem(SimComponent):
         file = self.get_file(folder_name=src_folder_name, file_name=src_file_name)
         if file:
             # remove file from src
+            src_folder = file.folder
             self.delete_file(folder_name=file.folder_name, file_name=file.name)
+            # keep a record of the deleted file in src that is separate from the moved file, as a file can only
+            # invalidate the cached state of one parent folder
+            src_folder.deleted_files[file.uuid] = file.model_copy()
             dst_folder = self.get_folder(folder_name=dst_folder_name)
             if not dst_folder:
                 dst_folder = self.create_folder(dst_folder_name)
@@ -528,8 +538,10 @@ class FileSystem(SimComponent):
         :return: Current state of this object and child objects.
         """
         state = super().describe_state()
-        state["folders"] = {folder.name: folder.describe_state() for folder in self.folders.values()}
-        state["deleted_folders"] = {folder.name: folder.describe_state() for folder in self.deleted_folders.values()}
+        state["folders"] = {folder.name: folder.describe_state_cached() for folder in self.folders.values()}
+        state["deleted_folders"] = {
+            folder.name: folder.describe_state_cached() for folder in self.deleted_folders.values()
+        }
         state["num_file_creations"] = self.num_file_creations
         state["num_file_deletions"] = self.num_file_deletions
         return state
@@ -594,6 +606,7 @@ class FileSystem(SimComponent):
         self.deleted_folders.pop(folder.uuid, None)
         folder.restore()
         self.folders[folder.uuid] = folder
+        self.invalidate_state()
         return True
 
     def restore_file(self, folder_name: str, file_name: str) -> bool:
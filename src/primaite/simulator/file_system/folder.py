@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import warnings
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional
 
 from prettytable import MARKDOWN, PrettyTable
 
@@ -39,6 +39,9 @@ class Folder(FileSystemItemABC):
     restore_countdown: int = 0
     "Time steps needed until restore completion."
 
+    state_caching: ClassVar[bool] = True
+    "Folder state is cached until the folder or one of its files is modified."
+
     def __init__(self, **kwargs):
         """
         Initialise Folder class.
@@ -82,8 +85,8 @@ class Folder(FileSystemItemABC):
         :return: Current state of this object and child objects.
         """
         state = super().describe_state()
-        state["files"] = {file.name: file.describe_state() for uuid, file in self.files.items()}
-        state["deleted_files"] = {file.name: file.describe_state() for uuid, file in self.deleted_files.items()}
+        state["files"] = {file.name: file.describe_state_cached() for uuid, file in self.files.items()}
+        state["deleted_files"] = {file.name: file.describe_state_cached() for uuid, file in self.deleted_files.items()}
         state["scanned_this_step"] = self._scanned_this_step
         return state
 
@@ -250,6 +253,10 @@ class Folder(FileSystemItemABC):
         self.files[file.uuid] = file
         self._file_request_manager.add_request(file.name, RequestType(func=file._request_manager))
         file.folder = self
+        # a moved file is still parented to the folder it was moved from
+        file.parent = None
+        file.parent = self
+        self.invalidate_state()
 
     def remove_file(self, file: Optional[File]):
         """
@@ -265,6 +272,7 @@ class Folder(FileSystemItemABC):
         if self.files.get(file.uuid):
             self.files.pop(file.uuid)
             self.deleted_files[file.uuid] = file
+            self.invalidate_state()
             file.delete()
             self.sys_log.info(f"Removed file {file.name} (id: {file.uuid})")
         else:
@@ -320,6 +328,7 @@ class Folder(FileSystemItemABC):
 
         if file.deleted:
             self.deleted_files.pop(file.uuid)
+        self.invalidate_state()
         return True
 
     def quarantine(self):
@@ -318,7 +318,7 @@ class WirelessNetworkInterface(NetworkInterface, ABC):
             return
 
         self.enabled = True
-        self._connected_node.sys_log.info(f"Network Interface {self} enabled")
+        self._connected_node.sys_log.info("Network Interface %s enabled", self)
         self.pcap = PacketCapture(
             hostname=self._connected_node.config.hostname, port_num=self.port_num, port_name=self.port_name
         )
@@ -330,7 +330,7 @@ class WirelessNetworkInterface(NetworkInterface, ABC):
             return
         self.enabled = False
         if self._connected_node:
-            self._connected_node.sys_log.info(f"Network Interface {self} disabled")
+            self._connected_node.sys_log.info("Network Interface %s disabled", self)
         else:
             _LOGGER.debug(f"Interface {self} disabled")
         self.airspace.remove_wireless_interface(self)
@@ -350,13 +350,16 @@ class WirelessNetworkInterface(NetworkInterface, ABC):
             return False
         if not self.airspace.can_transmit_frame(frame, self):
             # Drop frame for now. Queuing will happen here (probably) if it's done in the future.
-            self._connected_node.sys_log.info(f"{self}: Frame dropped as Link is at capacity")
+            self._connected_node.sys_log.info("%s: Frame dropped as Link is at capacity", self)
             return False
 
         super().send_frame(frame)
         frame.set_sent_timestamp()
         self.pcap.capture_outbound(frame)
-        self.airspace.transmit(frame, self)
+        if self.frame_queue is None:
+            self.airspace.transmit(frame, self)
+        else:
+            self.frame_queue.submit(self.airspace.transmit, frame, self)
         return True
 
     def receive_frame(self, frame: Frame) -> bool:
@@ -1,6 +1,7 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from ipaddress import IPv4Address
-from typing import Any, Dict, List, Optional
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Type, Union
 
 import matplotlib.pyplot as plt
 import networkx as nx
@@ -11,12 +12,13 @@ from pydantic import Field
 from primaite import getLogger
 from primaite.simulator.core import RequestManager, RequestType, SimComponent
 from primaite.simulator.network.airspace import AirSpace
-from primaite.simulator.network.hardware.base import Link, Node, WiredNetworkInterface
+from primaite.simulator.network.hardware.base import Layer3Interface, Link, Node, WiredNetworkInterface
 from primaite.simulator.network.hardware.nodes.host.host_node import HostNode
 from primaite.simulator.network.hardware.nodes.host.server import Printer
 from primaite.simulator.network.hardware.nodes.network.network_node import NetworkNode
 from primaite.simulator.system.applications.application import Application
 from primaite.simulator.system.services.service import Service
+from primaite.utils.profiling import StepProfiler
 
 _LOGGER = getLogger(__name__)
 
@@ -38,6 +40,16 @@ class Network(SimComponent):
     airspace: AirSpace = Field(default_factory=lambda: AirSpace())
     _node_id_map: Dict[int, Node] = {}
     _link_id_map: Dict[int, Node] = {}
+    _nodes_by_hostname: Dict[str, Node] = {}
+    """Nodes in the network keyed by hostname. If several nodes share a hostname, the first added is kept."""
+    _nodes_by_class: Dict[Type[Node], Dict[str, Node]] = {}
+    """Nodes in the network grouped by class, keyed by UUID."""
+    _nodes_by_ip_address: Dict[IPv4Address, List[Node]] = {}
+    """Nodes in the network keyed by the IP addresses of their network interfaces, in the order they were indexed."""
+    _node_ip_addresses: Dict[str, List[IPv4Address]] = {}
+    """IP addresses each node is indexed under in ``_nodes_by_ip_address``, keyed by node UUID."""
+    _profiler: Optional[StepProfiler] = None
+    """Profiler which times the timestep of each type of node, set by the game which owns this network."""
 
     def __init__(self, **kwargs):
         """
@@ -87,8 +99,15 @@ class Network(SimComponent):
         """Apply a timestep evolution to this the network and its nodes and links."""
         super().apply_timestep(timestep=timestep)
         # apply timestep to nodes
-        for node_id in self.nodes:
-            self.nodes[node_id].apply_timestep(timestep=timestep)
+        profiler = self._profiler
+        if profiler is not None and profiler.enabled:
+            for node in self.nodes.values():
+                start = perf_counter()
+                node.apply_timestep(timestep=timestep)
+                profiler.record(f"advance_timestep.{node._discriminator}", perf_counter() - start)
+        else:
+            for node_id in self.nodes:
+                self.nodes[node_id].apply_timestep(timestep=timestep)
 
         # apply timestep to links
         for link_id in self.links:
@@ -106,50 +125,68 @@ class Network(SimComponent):
         for link in self.links.values():
             link.pre_timestep(timestep)
 
+    def _nodes_of_class(self, class_name: str) -> List[Node]:
+        """Get the nodes in the network whose class has the given name."""
+        return [
+            node for cls, nodes in self._nodes_by_class.items() if cls.__name__ == class_name for node in nodes.values()
+        ]
+
     @property
     def router_nodes(self) -> List[Node]:
         """The Routers in the Network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__ == "Router"]
+        return self._nodes_of_class("Router")
 
     @property
     def switch_nodes(self) -> List[Node]:
         """The Switches in the Network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__ == "Switch"]
+        return self._nodes_of_class("Switch")
 
     @property
     def computer_nodes(self) -> List[Node]:
         """The Computers in the Network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__ == "Computer"]
+        return self._nodes_of_class("Computer")
 
     @property
     def server_nodes(self) -> List[Node]:
         """The Servers in the Network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__ == "Server"]
+        return self._nodes_of_class("Server")
 
     @property
     def firewall_nodes(self) -> List[Node]:
         """The Firewalls in the Network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__ == "Firewall"]
+        return self._nodes_of_class("Firewall")
 
     @property
     def extended_hostnodes(self) -> List[Node]:
         """Extended nodes that inherited HostNode in the network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__.lower() in HostNode._registry]
+        return [
+            node
+            for cls, nodes in self._nodes_by_class.items()
+            if cls.__name__.lower() in HostNode._registry
+            for node in nodes.values()
+        ]
 
     @property
     def extended_networknodes(self) -> List[Node]:
         """Extended nodes that inherited NetworkNode in the network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__.lower() in NetworkNode._registry]
+        return [
+            node
+            for cls, nodes in self._nodes_by_class.items()
+            if cls.__name__.lower() in NetworkNode._registry
+            for node in nodes.values()
+        ]
 
     @property
     def printer_nodes(self) -> List[Node]:
         """The printers on the network."""
-        return [node for node in self.nodes.values() if isinstance(node, Printer)]
+        return [
+            node for cls, nodes in self._nodes_by_class.items() if issubclass(cls, Printer) for node in nodes.values()
+        ]
 
     @property
     def wireless_router_nodes(self) -> List[Node]:
         """The Routers in the Network."""
-        return [node for node in self.nodes.values() if node.__class__.__name__ == "WirelessRouter"]
+        return self._nodes_of_class("WirelessRouter")
 
     def show(self, nodes: bool = True, ip_addresses: bool = True, links: bool = True, markdown: bool = False):
         """
@@ -279,7 +316,10 @@ class Network(SimComponent):
             return
         self.nodes[node.uuid] = node
         self._node_id_map[len(self.nodes)] = node
+        self._nodes_by_hostname.setdefault(node.config.hostname, node)
+        self._nodes_by_class.setdefault(type(node), {})[node.uuid] = node
         node.parent = self
+        self._index_ip_addresses(node)
         self._nx_graph.add_node(node.config.hostname)
         _LOGGER.debug(f"Added node {node.uuid} to Network {self.uuid}")
         self._node_request_manager.add_request(
@@ -295,9 +335,55 @@ class Network(SimComponent):
         :param hostname: The Node hostname.
         :return: The Node if it exists in the network.
         """
-        for node in self.nodes.values():
-            if node.config.hostname == hostname:
-                return node
+        return self._nodes_by_hostname.get(hostname)
+
+    def get_node_by_ip_address(self, ip_address: Union[IPv4Address, str]) -> Optional[Node]:
+        """
+        Get a Node from the Network by the IP address of one of its network interfaces.
+
+        .. note:: If several nodes have an interface with the IP address, the node which was given it first is
+            returned. Loopback addresses, which unconfigured router ports have, are not looked up.
+
+        :param ip_address: The IP address.
+        :return: The Node if one in the network has the IP address.
+        """
+        nodes = self._nodes_by_ip_address.get(IPv4Address(ip_address))
+        return nodes[0] if nodes else None
+
+    def _index_ip_addresses(self, node: Node) -> None:
+        """
+        Update the IP address index with the current IP addresses of a node's network interfaces.
+
+        This is called when a node is added to the network, and by the node when its network interfaces are connected,
+        disconnected or have their IP address or subnet mask changed.
+
+        :param node: A node in the network.
+        """
+        ip_addresses = []
+        for network_interface in node.network_interfaces.values():
+            if isinstance(network_interface, Layer3Interface) and not network_interface.ip_address.is_loopback:
+                if network_interface.ip_address not in ip_addresses:
+                    ip_addresses.append(network_interface.ip_address)
+        old_ip_addresses = self._node_ip_addresses.get(node.uuid, [])
+        for ip_address in old_ip_addresses:
+            if ip_address not in ip_addresses:
+                self._remove_from_ip_index(ip_address, node)
+        for ip_address in ip_addresses:
+            if ip_address not in old_ip_addresses:
+                self._nodes_by_ip_address.setdefault(ip_address, []).append(node)
+        self._node_ip_addresses[node.uuid] = ip_addresses
+
+    def _unindex_ip_addresses(self, node: Node) -> None:
+        """Remove a node from the IP address index."""
+        for ip_address in self._node_ip_addresses.pop(node.uuid, ()):
+            self._remove_from_ip_index(ip_address, node)
+
+    def _remove_from_ip_index(self, ip_address: IPv4Address, node: Node) -> None:
+        nodes = [other_node for other_node in self._nodes_by_ip_address[ip_address] if other_node is not node]
+        if nodes:
+            self._nodes_by_ip_address[ip_address] = nodes
+        else:
+            del self._nodes_by_ip_address[ip_address]
 
     def remove_node(self, node: Node) -> None:
         """
@@ -311,11 +397,22 @@ class Network(SimComponent):
         if node not in self:
             _LOGGER.warning(f"Can't remove node {node.config.hostname}. It's not in the network.")
             return
+        self._unindex_ip_addresses(node)
         self.nodes.pop(node.uuid)
         for i, _node in self._node_id_map.items():
             if node == _node:
                 self._node_id_map.pop(i)
                 break
+        if self._nodes_by_hostname.get(node.config.hostname) is node:
+            del self._nodes_by_hostname[node.config.hostname]
+            for other_node in self.nodes.values():
+                if other_node.config.hostname == node.config.hostname:
+                    self._nodes_by_hostname[node.config.hostname] = other_node
+                    break
+        nodes_of_class = self._nodes_by_class[type(node)]
+        del nodes_of_class[node.uuid]
+        if not nodes_of_class:
+            del self._nodes_by_class[type(node)]
         node.parent = None
         self._node_request_manager.remove_request(name=node.config.hostname)
         _LOGGER.info(f"Removed node {node.config.hostname} from network {self.uuid}")
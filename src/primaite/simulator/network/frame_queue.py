@@ -0,0 +1,69 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Queue used to deliver frames across the network iteratively instead of by nested calls."""
+from collections import deque
+from typing import Any, Callable, Deque, Tuple
+
+from primaite import getLogger
+
+_LOGGER = getLogger(__name__)
+
+
+class FrameDeliveryQueue:
+    """
+    First in, first out queue of frame deliveries which are waiting to be carried out.
+
+    Without a queue, a frame travels through the network by nested calls: sending a frame delivers it to the receiving
+    network interface, whose node may forward it or reply by sending another frame, and so on until the exchange ends.
+    With a queue, sending a frame only adds its delivery to the queue. The first frame sent when the queue is idle
+    delivers every queued frame in turn, including the frames sent while delivering it, so the depth of the call stack
+    no longer grows with the number of hops.
+
+    Software often relies on the reply to a frame having arrived by the time its send call returns, for instance when
+    an ARP request is sent and the ARP cache is checked straight after. To keep this behaviour, the session manager
+    calls :py:meth:`flush` after sending each frame on behalf of software, which delivers everything queued so far,
+    including the reply, before returning.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Deque[Tuple[Callable[..., Any], Tuple[Any, ...]]] = deque()
+        self._draining: bool = False
+        self.frames_delivered: int = 0
+        """Total number of deliveries carried out by the queue."""
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, deliver: Callable[..., Any], *args: Any) -> None:
+        """
+        Add a frame delivery to the queue, and deliver all queued frames if the queue is not already doing so.
+
+        :param deliver: Function which delivers the frame, such as ``Link.transmit_frame``.
+        :param args: Arguments to call ``deliver`` with.
+        """
+        self._pending.append((deliver, args))
+        if not self._draining:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Deliver every queued frame, and every frame queued while doing so, until the queue is empty.
+
+        This may be called while the queue is already delivering frames, in which case the remaining frames are
+        delivered before the call returns. If a delivery raises an exception in the outermost call, the frames still
+        waiting are discarded so they are not delivered by an unrelated send later on.
+        """
+        pending = self._pending
+        was_draining = self._draining
+        self._draining = True
+        try:
+            while pending:
+                deliver, args = pending.popleft()
+                deliver(*args)
+                self.frames_delivered += 1
+        except Exception:
+            if not was_draining:
+                _LOGGER.debug(f"Discarding {len(pending)} undelivered frames after a delivery failed.")
+                pending.clear()
+            raise
+        finally:
+            self._draining = was_draining
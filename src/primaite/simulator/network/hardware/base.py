@@ -6,7 +6,7 @@ import secrets
 from abc import ABC, abstractmethod
 from ipaddress import IPv4Address, IPv4Network
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from prettytable import MARKDOWN, PrettyTable
 from pydantic import BaseModel, ConfigDict, Field, validate_call
@@ -18,6 +18,7 @@ from primaite.simulator import SIM_OUTPUT
 from primaite.simulator.core import RequestFormat, RequestManager, RequestPermissionValidator, RequestType, SimComponent
 from primaite.simulator.domain.account import Account
 from primaite.simulator.file_system.file_system import FileSystem
+from primaite.simulator.network.frame_queue import FrameDeliveryQueue
 from primaite.simulator.network.hardware.node_operating_state import NodeOperatingState
 from primaite.simulator.network.nmne import NMNEConfig
 from primaite.simulator.network.transmission.data_link_layer import Frame
@@ -104,6 +105,9 @@ class NetworkInterface(SimComponent, ABC):
     nmne_config: ClassVar[NMNEConfig] = NMNEConfig()
     "A dataclass defining malicious network events to be captured."
 
+    frame_queue: ClassVar[Optional[FrameDeliveryQueue]] = None
+    "Queue which sent frames are delivered through. If None, frames are delivered as soon as they are sent."
+
     nmne: Dict = Field(default_factory=lambda: {})
     "A dict containing details of the number of malicious events captured."
 
@@ -117,7 +121,8 @@ class NetworkInterface(SimComponent, ABC):
         self.traffic = {}
         if episode and self.pcap and SIM_OUTPUT.save_pcap_logs:
             self.pcap.current_episode = episode
-            self.pcap.setup_logger()
+            self.pcap.setup_log_file(outbound=False)
+            self.pcap.setup_log_file(outbound=True)
         self.enable()
 
     def _init_request_manager(self) -> RequestManager:
@@ -425,11 +430,11 @@ class WiredNetworkInterface(NetworkInterface, ABC):
             return False
 
         if not self._connected_link:
-            self._connected_node.sys_log.warning(f"Interface {self} cannot be enabled as there is no Link connected.")
+            self._connected_node.sys_log.warning("Interface %s cannot be enabled as there is no Link connected.", self)
             return False
 
         self.enabled = True
-        self._connected_node.sys_log.info(f"Network Interface {self} enabled")
+        self._connected_node.sys_log.info("Network Interface %s enabled", self)
         self.pcap = PacketCapture(
             hostname=self._connected_node.config.hostname, port_num=self.port_num, port_name=self.port_name
         )
@@ -443,7 +448,7 @@ class WiredNetworkInterface(NetworkInterface, ABC):
             return True
         self.enabled = False
         if self._connected_node:
-            self._connected_node.sys_log.info(f"Network Interface {self} disabled")
+            self._connected_node.sys_log.info("Network Interface %s disabled", self)
         else:
             _LOGGER.debug(f"Interface {self} disabled")
         if self._connected_link:
@@ -499,12 +504,15 @@ class WiredNetworkInterface(NetworkInterface, ABC):
             return False
         if not self._connected_link.can_transmit_frame(frame):
             # Drop frame for now. Queuing will happen here (probably) if it's done in the future.
-            self._connected_node.sys_log.info(f"{self}: Frame dropped as Link is at capacity")
+            self._connected_node.sys_log.info("%s: Frame dropped as Link is at capacity", self)
             return False
         super().send_frame(frame)
         frame.set_sent_timestamp()
         self.pcap.capture_outbound(frame)
-        self._connected_link.transmit_frame(sender_nic=self, frame=frame)
+        if self.frame_queue is None:
+            self._connected_link.transmit_frame(sender_nic=self, frame=frame)
+        else:
+            self.frame_queue.submit(self._connected_link.transmit_frame, self, frame)
         return True
 
     @abstractmethod
@@ -538,6 +546,13 @@ class Layer3Interface(BaseModel, ABC):
     subnet_mask: IPV4Address
     "The subnet mask assigned to the interface, defining the network portion and the host portion of the IP address."
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "ip_address" or name == "subnet_mask":
+            node = getattr(self, "_connected_node", None)
+            if node is not None:
+                node._network_interfaces_changed()
+
     def describe_state(self) -> Dict:
         """
         Produce a dictionary describing the current state of this object.
@@ -840,6 +855,9 @@ class UserManager(Service, discriminator="user-manager"):
 
     users: Dict[str, User] = {}
 
+    state_caching: ClassVar[bool] = False
+    """The user and admin dictionaries are modified in place, so the state of the user manager is not cached."""
+
     def __init__(self, **kwargs):
         """
         Initializes a UserManager instance.
@@ -970,11 +988,11 @@ class UserManager(Service, discriminator="user-manager"):
         if not bypass_can_perform_action and not self._can_perform_action():
             return False
         if username in self.users:
-            self.sys_log.info(f"{self.name}: Failed to create new user {username} as this user name already exists")
+            self.sys_log.info("%s: Failed to create new user %s as this user name already exists", self.name, username)
             return False
         user = User(username=username, password=password, is_admin=is_admin)
         self.users[username] = user
-        self.sys_log.info(f"{self.name}: Added new {'admin' if is_admin else 'user'}: {username}")
+        self.sys_log.info("%s: Added new %s: %s", self.name, "admin" if is_admin else "user", username)
         return True
 
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
@@ -989,9 +1007,9 @@ class UserManager(Service, discriminator="user-manager"):
             return None
         user = self.users.get(username)
         if user and not user.disabled and user.password == password:
-            self.sys_log.info(f"{self.name}: User authenticated: {username}")
+            self.sys_log.info("%s: User authenticated: %s", self.name, username)
             return user
-        self.sys_log.info(f"{self.name}: Authentication failed for: {username}")
+        self.sys_log.info("%s: Authentication failed for: %s", self.name, username)
         return None
 
     def change_user_password(self, username: str, current_password: str, new_password: str) -> bool:
@@ -1008,10 +1026,10 @@ class UserManager(Service, discriminator="user-manager"):
         user = self.users.get(username)
         if user and user.password == current_password:
             user.password = new_password
-            self.sys_log.info(f"{self.name}: Password changed for {username}")
+            self.sys_log.info("%s: Password changed for %s", self.name, username)
             self._user_session_manager._logout_user(user=user)
             return True
-        self.sys_log.info(f"{self.name}: Password change failed for {username}")
+        self.sys_log.info("%s: Password change failed for %s", self.name, username)
         return False
 
     def disable_user(self, username: str) -> bool:
@@ -1025,12 +1043,12 @@ class UserManager(Service, discriminator="user-manager"):
             return False
         if username in self.users and not self.users[username].disabled:
             if self._is_last_admin(username):
-                self.sys_log.info(f"{self.name}: Cannot disable User {username} as they are the only enabled admin")
+                self.sys_log.info("%s: Cannot disable User %s as they are the only enabled admin", self.name, username)
                 return False
             self.users[username].disabled = True
-            self.sys_log.info(f"{self.name}: User disabled: {username}")
+            self.sys_log.info("%s: User disabled: %s", self.name, username)
             return True
-        self.sys_log.info(f"{self.name}: Failed to disable user: {username}")
+        self.sys_log.info("%s: Failed to disable user: %s", self.name, username)
         return False
 
     def enable_user(self, username: str) -> bool:
@@ -1042,9 +1060,9 @@ class UserManager(Service, discriminator="user-manager"):
         """
         if username in self.users and self.users[username].disabled:
             self.users[username].disabled = False
-            self.sys_log.info(f"{self.name}: User enabled: {username}")
+            self.sys_log.info("%s: User enabled: %s", self.name, username)
             return True
-        self.sys_log.info(f"{self.name}: Failed to enable user: {username}")
+        self.sys_log.info("%s: Failed to enable user: %s", self.name, username)
         return False
 
     @property
@@ -1184,6 +1202,9 @@ class UserSessionManager(Service, discriminator="user-session-manager"):
     current_timestep: int = 0
     """The current timestep in the simulation."""
 
+    state_caching: ClassVar[bool] = False
+    """The session dictionaries are modified in place, so the state of the session manager is not cached."""
+
     def __init__(self, **kwargs):
         """
         Initializes a UserSessionManager instance.
@@ -1342,7 +1363,7 @@ class UserSessionManager(Service, discriminator="user-session-manager"):
                 dest_ip_address=session.remote_ip_address,
             )
 
-        self.sys_log.info(f"{self.name}: {session_type} {session_identity} session timeout due to inactivity")
+        self.sys_log.info("%s: %s %s session timeout due to inactivity", self.name, session_type, session_identity)
 
     @property
     def remote_session_limit_reached(self) -> bool:
@@ -1380,7 +1401,7 @@ class UserSessionManager(Service, discriminator="user-session-manager"):
         user = self._user_manager.authenticate_user(username=username, password=password)
 
         if not user:
-            self.sys_log.info(f"{self.name}: Incorrect username or password")
+            self.sys_log.info("%s: Incorrect username or password", self.name)
             return None
 
         session_id = None
@@ -1405,7 +1426,7 @@ class UserSessionManager(Service, discriminator="user-session-manager"):
                 )
                 session_id = remote_session.uuid
                 self.remote_sessions[session_id] = remote_session
-        self.sys_log.info(f"{self.name}: User {user.username} logged in")
+        self.sys_log.info("%s: User %s logged in", self.name, user.username)
         return session_id
 
     def local_login(self, username: str, password: str) -> Optional[str]:
@@ -1451,7 +1472,7 @@ class UserSessionManager(Service, discriminator="user-session-manager"):
             session = self.remote_sessions.pop(remote_session_id)
         if session:
             self.historic_sessions.append(session)
-            self.sys_log.info(f"{self.name}: User {session.user.username} logged out")
+            self.sys_log.info("%s: User %s logged out", self.name, session.user.username)
             return True
         return False
 
@@ -1495,6 +1516,102 @@ class UserSessionManager(Service, discriminator="user-session-manager"):
         return self.local_session is not None
 
 
+class _InterfaceIndex:
+    """
+    Index of the IP configuration of a node's network interfaces, for looking interfaces up by IP address.
+
+    Interfaces are indexed by their IP address, and by their subnet as an integer mask and network address, so finding
+    the interface whose subnet contains an address takes one lookup for each distinct subnet mask on the node. The
+    index is rebuilt on the next lookup after :py:meth:`invalidate` is called, which the node does whenever a network
+    interface is connected or disconnected or has its IP address or subnet mask changed. Whether an interface is
+    enabled is checked at lookup time, so enabling or disabling an interface does not invalidate the index. Lookups
+    return the first matching interface in the order the interfaces were connected, as a scan of the interfaces would.
+    """
+
+    __slots__ = ("_node", "_stale", "_by_ip_address", "_by_subnet", "_masks", "_positions")
+
+    def __init__(self, node: Node) -> None:
+        self._node: Node = node
+        self._stale: bool = True
+        self._by_ip_address: Dict[IPv4Address, List[NetworkInterface]] = {}
+        self._by_subnet: Dict[Tuple[int, int], List[NetworkInterface]] = {}
+        self._masks: List[int] = []
+        self._positions: Dict[str, int] = {}
+
+    def invalidate(self) -> None:
+        """Rebuild the index on the next lookup."""
+        self._stale = True
+
+    def _build(self) -> None:
+        by_ip_address = {}
+        by_subnet = {}
+        masks = []
+        positions = {}
+        for position, network_interface in enumerate(self._node.network_interfaces.values()):
+            if not isinstance(network_interface, Layer3Interface):
+                continue
+            positions[network_interface.uuid] = position
+            by_ip_address.setdefault(network_interface.ip_address, []).append(network_interface)
+            mask = int(network_interface.subnet_mask)
+            if mask not in masks:
+                masks.append(mask)
+            by_subnet.setdefault((mask, int(network_interface.ip_address) & mask), []).append(network_interface)
+        self._by_ip_address = by_ip_address
+        self._by_subnet = by_subnet
+        self._masks = masks
+        self._positions = positions
+        self._stale = False
+
+    @property
+    def ip_addresses(self) -> Dict[IPv4Address, List[NetworkInterface]]:
+        """The IP addresses of the node's interfaces, mapped to the interfaces with each address."""
+        if self._stale:
+            self._build()
+        return self._by_ip_address
+
+    def get_interface_by_ip_address(
+        self, ip_address: IPv4Address, enabled_only: bool = False
+    ) -> Optional[NetworkInterface]:
+        """
+        Get the first interface with the given IP address.
+
+        :param ip_address: The IP address.
+        :param enabled_only: If True, disabled interfaces are skipped.
+        :return: The interface, or None if no interface has the IP address.
+        """
+        for network_interface in self.ip_addresses.get(ip_address, ()):
+            if network_interface.enabled or not enabled_only:
+                return network_interface
+        return None
+
+    def get_interface_in_subnet(
+        self, ip_address: Optional[Union[IPv4Address, str]], enabled_only: bool = False
+    ) -> Optional[NetworkInterface]:
+        """
+        Get the first interface whose subnet contains the given IP address.
+
+        :param ip_address: The IP address.
+        :param enabled_only: If True, disabled interfaces are skipped.
+        :return: The interface, or None if the IP address is not in the subnet of any interface.
+        """
+        if ip_address is None:
+            return None
+        if self._stale:
+            self._build()
+        address = int(ip_address) if isinstance(ip_address, IPv4Address) else int(IPv4Address(ip_address))
+        match = None
+        match_position = None
+        for mask in self._masks:
+            for network_interface in self._by_subnet.get((mask, address & mask), ()):
+                if network_interface.enabled or not enabled_only:
+                    position = self._positions[network_interface.uuid]
+                    if match is None or position < match_position:
+                        match = network_interface
+                        match_position = position
+                    break
+        return match
+
+
 class Node(SimComponent, ABC):
     """
     A basic Node class that represents a node on the network.
@@ -1582,6 +1699,12 @@ class Node(SimComponent, ABC):
         default_gateway: Optional[IPV4Address] = None
         "The default gateway IP address for forwarding network traffic to other networks."
 
+        session_idle_timeout: Optional[int] = None
+        "Time steps a network session may be idle before it is expired. Sessions never expire if None."
+
+        max_sessions: Optional[int] = None
+        "Maximum number of network sessions held before the least recently used is evicted. Unbounded if None."
+
         operating_state: Any = None
 
         users: List[Dict] = []  # Temporary to appease "extra=forbid"
@@ -1630,7 +1753,11 @@ class Node(SimComponent, ABC):
         if not kwargs.get("sys_log"):
             kwargs["sys_log"] = SysLog(kwargs["config"].hostname)
         if not kwargs.get("session_manager"):
-            kwargs["session_manager"] = SessionManager(sys_log=kwargs.get("sys_log"))
+            kwargs["session_manager"] = SessionManager(
+                sys_log=kwargs.get("sys_log"),
+                idle_timeout=kwargs["config"].session_idle_timeout,
+                max_sessions=kwargs["config"].max_sessions,
+            )
         if not kwargs.get("root"):
             kwargs["root"] = SIM_OUTPUT.path / kwargs["config"].hostname
         if not kwargs.get("file_system"):
@@ -1644,6 +1771,7 @@ class Node(SimComponent, ABC):
                 dns_server=kwargs["config"].dns_server,
             )
         super().__init__(**kwargs)
+        self._interface_index: _InterfaceIndex = _InterfaceIndex(self)
         self.operating_state = (
             NodeOperatingState.ON if not (p := kwargs["config"].operating_state) else NodeOperatingState[p.upper()]
         )
@@ -1697,15 +1825,10 @@ class Node(SimComponent, ABC):
         :param enabled_only: If True, only considers enabled network interfaces.
         :return: True if the IP address is assigned to one of the nodes interfaces; False otherwise.
         """
-        for network_interface in self.network_interface.values():
-            if not hasattr(network_interface, "ip_address"):
-                continue
-            if network_interface.ip_address == ip_address:
-                if enabled_only:
-                    return network_interface.enabled
-                else:
-                    return True
-        return False
+        network_interface = self._interface_index.get_interface_by_ip_address(ip_address)
+        if network_interface is None:
+            return False
+        return network_interface.enabled or not enabled_only
 
     def setup_for_episode(self, episode: int):
         """Reset the original state of the SimComponent."""
@@ -1783,7 +1906,7 @@ class Node(SimComponent, ABC):
             """
             application_name = request[0]
             if self.software_manager.software.get(application_name):
-                self.sys_log.info(f"Can't install {application_name}. It's already installed.")
+                self.sys_log.info("Can't install %s. It's already installed.", application_name)
                 return RequestResponse(status="success", data={"reason": "already installed"})
             application_class = Application._registry[application_name]
             self.software_manager.install(application_class)
@@ -1814,7 +1937,7 @@ class Node(SimComponent, ABC):
             """
             application_name = request[0]
             if application_name not in self.software_manager.software:
-                self.sys_log.warning(f"Can't uninstall {application_name}. It's not installed.")
+                self.sys_log.warning("Can't uninstall %s. It's not installed.", application_name)
                 return RequestResponse.from_bool(False)
 
             application_instance = self.software_manager.software.get(application_name)
@@ -1909,10 +2032,10 @@ class Node(SimComponent, ABC):
                     eth_num: network_interface.describe_state()
                     for eth_num, network_interface in self.network_interface.items()
                 },
-                "file_system": self.file_system.describe_state(),
-                "applications": {app.name: app.describe_state() for app in self.applications.values()},
-                "services": {svc.name: svc.describe_state() for svc in self.services.values()},
-                "process": {proc.name: proc.describe_state() for proc in self.processes.values()},
+                "file_system": self.file_system.describe_state_cached(),
+                "applications": {app.name: app.describe_state_cached() for app in self.applications.values()},
+                "services": {svc.name: svc.describe_state_cached() for svc in self.services.values()},
+                "process": {proc.name: proc.describe_state_cached() for proc in self.processes.values()},
                 "revealed_to_red": self.config.revealed_to_red,
             }
         )
@@ -1987,6 +2110,8 @@ class Node(SimComponent, ABC):
         """
         super().apply_timestep(timestep=timestep)
 
+        self.session_manager.apply_timestep(timestep=timestep)
+
         for network_interface in self.network_interfaces.values():
             network_interface.apply_timestep(timestep=timestep)
 
@@ -1996,7 +2121,7 @@ class Node(SimComponent, ABC):
         else:
             if self.operating_state == NodeOperatingState.BOOTING:
                 self.operating_state = NodeOperatingState.ON
-                self.sys_log.info(f"{self.config.hostname}: Turned on")
+                self.sys_log.info("%s: Turned on", self.config.hostname)
                 for network_interface in self.network_interfaces.values():
                     network_interface.enable()
 
@@ -2008,7 +2133,7 @@ class Node(SimComponent, ABC):
         else:
             if self.operating_state == NodeOperatingState.SHUTTING_DOWN:
                 self.operating_state = NodeOperatingState.OFF
-                self.sys_log.info(f"{self.config.hostname}: Turned off")
+                self.sys_log.info("%s: Turned off", self.config.hostname)
                 self._shut_down_actions()
 
                 # if resetting turn back on
@@ -2178,15 +2303,22 @@ class Node(SimComponent, ABC):
             if port_name:
                 network_interface.port_name = port_name
             network_interface.parent = self
-            self.sys_log.info(f"Connected Network Interface {network_interface}")
+            self.sys_log.info("Connected Network Interface %s", network_interface)
             if self.operating_state == NodeOperatingState.ON:
                 network_interface.enable()
             self._nic_request_manager.add_request(new_nic_num, RequestType(func=network_interface._request_manager))
+            self._network_interfaces_changed()
         else:
             msg = f"Cannot connect NIC {network_interface} as it is already connected"
             self.sys_log.logger.warning(msg)
             raise NetworkError(msg)
 
+    def _network_interfaces_changed(self) -> None:
+        """Update the indexes which depend on the network interfaces of this node and their IP configuration."""
+        self._interface_index.invalidate()
+        if self._parent is not None:
+            self._parent._index_ip_addresses(self)
+
     def disconnect_nic(self, network_interface: Union[NetworkInterface, str]):
         """
         Disconnect a NIC (Network Interface Card) from the node.
@@ -2206,9 +2338,10 @@ class Node(SimComponent, ABC):
             self.network_interfaces.pop(network_interface.uuid)
             network_interface.parent = None
             network_interface.disable()
-            self.sys_log.info(f"Disconnected Network Interface {network_interface}")
+            self.sys_log.info("Disconnected Network Interface %s", network_interface)
             if network_interface_num != -1:
                 self._nic_request_manager.remove_request(network_interface_num)
+            self._network_interfaces_changed()
         else:
             msg = f"Cannot disconnect Network Interface {network_interface} as it is not connected"
             self.sys_log.logger.warning(msg)
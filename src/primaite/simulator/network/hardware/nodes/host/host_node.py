@@ -163,8 +163,9 @@ class HostARP(ARP):
         # Unmatched ARP Request
         if arp_packet.target_ip_address != from_network_interface.ip_address:
             self.sys_log.warning(
-                f"Ignoring ARP request for {arp_packet.target_ip_address}. Current IP address is "
-                f"{from_network_interface.ip_address}"
+                "Ignoring ARP request for %s. Current IP address is %s",
+                arp_packet.target_ip_address,
+                from_network_interface.ip_address,
             )
             return
 
@@ -238,7 +239,7 @@ class NIC(IPWiredNetworkInterface):
         if self.enabled:
             frame.decrement_ttl()
             if frame.ip and frame.ip.ttl < 1:
-                self._connected_node.sys_log.info(f"Frame discarded at {self} as TTL limit reached")
+                self._connected_node.sys_log.info("Frame discarded at %s as TTL limit reached", self)
                 return False
             frame.set_received_timestamp()
             self.pcap.capture_inbound(frame)
@@ -427,6 +428,6 @@ class HostNode(Node, discriminator="host-node"):
         if accept_frame:
             self.session_manager.receive_frame(frame, from_network_interface)
         else:
-            self.sys_log.info(f"Ignoring frame from {frame.ip.src_ip_address}")
+            self.sys_log.info("Ignoring frame from %s", frame.ip.src_ip_address)
             # TODO: do we need to do anything more here?
             pass
@@ -334,7 +334,7 @@ class Firewall(Router, discriminator="firewall"):
         # check if External Inbound ACL Rules permit frame
         permitted, rule = self.external_inbound_acl.is_permitted(frame)
         if not permitted:
-            self.sys_log.info(f"Frame blocked at external inbound by rule {rule}")
+            self.sys_log.info("Frame blocked at external inbound by rule %s", rule)
             return
         self.software_manager.arp.add_arp_cache_entry(
             ip_address=frame.ip.src_ip_address,
@@ -364,7 +364,7 @@ class Firewall(Router, discriminator="firewall"):
         # check if External Outbound ACL Rules permit frame
         permitted, rule = self.external_outbound_acl.is_permitted(frame=frame)
         if not permitted:
-            self.sys_log.info(f"Frame blocked at external outbound by rule {rule}")
+            self.sys_log.info("Frame blocked at external outbound by rule %s", rule)
             return
 
         self.process_frame(frame=frame, from_network_interface=from_network_interface)
@@ -384,7 +384,7 @@ class Firewall(Router, discriminator="firewall"):
         # check if Internal Inbound ACL Rules permit frame
         permitted, rule = self.internal_inbound_acl.is_permitted(frame=frame)
         if not permitted:
-            self.sys_log.info(f"Frame blocked at internal inbound by rule {rule}")
+            self.sys_log.info("Frame blocked at internal inbound by rule %s", rule)
             return
 
         self.process_frame(frame=frame, from_network_interface=from_network_interface)
@@ -402,7 +402,7 @@ class Firewall(Router, discriminator="firewall"):
         """
         permitted, rule = self.internal_outbound_acl.is_permitted(frame)
         if not permitted:
-            self.sys_log.info(f"Frame blocked at internal outbound by rule {rule}")
+            self.sys_log.info("Frame blocked at internal outbound by rule %s", rule)
             return
         self.software_manager.arp.add_arp_cache_entry(
             ip_address=frame.ip.src_ip_address,
@@ -436,7 +436,7 @@ class Firewall(Router, discriminator="firewall"):
         # check if DMZ Inbound ACL Rules permit frame
         permitted, rule = self.dmz_inbound_acl.is_permitted(frame=frame)
         if not permitted:
-            self.sys_log.info(f"Frame blocked at DMZ inbound by rule {rule}")
+            self.sys_log.info("Frame blocked at DMZ inbound by rule %s", rule)
             return
 
         self.process_frame(frame=frame, from_network_interface=from_network_interface)
@@ -456,7 +456,7 @@ class Firewall(Router, discriminator="firewall"):
         """
         permitted, rule = self.dmz_outbound_acl.is_permitted(frame)
         if not permitted:
-            self.sys_log.info(f"Frame blocked at DMZ outbound by rule {rule}")
+            self.sys_log.info("Frame blocked at DMZ outbound by rule %s", rule)
             return
         self.software_manager.arp.add_arp_cache_entry(
             ip_address=frame.ip.src_ip_address,
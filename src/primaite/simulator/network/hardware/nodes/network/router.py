@@ -7,7 +7,7 @@ from ipaddress import IPv4Address, IPv4Network
 from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple, Union
 
 from prettytable import MARKDOWN, PrettyTable
-from pydantic import Field, validate_call
+from pydantic import Field, PrivateAttr, validate_call
 
 from primaite.interface.request import RequestResponse
 from primaite.simulator.core import RequestManager, RequestType, SimComponent
@@ -64,6 +64,16 @@ def ip_matches_masked_range(ip_to_check: IPV4Address, base_ip: IPV4Address, wild
     return masked_base_ip == masked_ip_to_check
 
 
+_CompiledACLRule = Tuple["ACLRule", bool, Optional[str], int, int, int, int, Optional[int], Optional[int]]
+"""
+An ACL rule pre-converted for matching: the rule, whether it permits matching frames, the protocol, the masked source
+base address and mask, the masked destination base address and mask, the source port and the destination port.
+"""
+
+_FrameMatchKey = Tuple[str, int, int, Optional[int], Optional[int]]
+"""The fields of a frame that ACL rules match on: protocol, source IP, destination IP, source port, destination port."""
+
+
 class ACLAction(Enum):
     """Enum for defining the ACL action types."""
 
@@ -130,6 +140,13 @@ class ACLRule(SimComponent):
     dst_port: Optional[Port] = None
     match_count: int = 0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # a change to the matching criteria of a rule must be picked up by the ACL which compiled it
+        parent = self.__dict__.get("_parent")
+        if isinstance(parent, AccessControlList) and name in ACLRule.model_fields and name != "match_count":
+            parent.clear_compiled_rules()
+
     def __str__(self) -> str:
         rule_strings = []
         for key, value in self.model_dump(exclude={"uuid", "request_manager"}).items():
@@ -233,6 +250,39 @@ class ACLRule(SimComponent):
 
         return permitted, frame_matches_rule
 
+    def compile(self) -> _CompiledACLRule:
+        """
+        Pre-convert the matching criteria of this rule so that frames can be matched against it with integer operations.
+
+        Source and destination IP addresses are converted to a masked base address and a mask. A rule without an IP
+        address gets a mask of zero, which matches every address. Unset protocols and ports are normalised to None.
+
+        :return: The compiled rule, as used by :py:meth:`AccessControlList.is_permitted`.
+        """
+        src_base, src_mask = self._compile_ip(self.src_ip_address, self.src_wildcard_mask)
+        dst_base, dst_mask = self._compile_ip(self.dst_ip_address, self.dst_wildcard_mask)
+        return (
+            self,
+            self.action == ACLAction.PERMIT,
+            self.protocol or None,
+            src_base,
+            src_mask,
+            dst_base,
+            dst_mask,
+            self.src_port or None,
+            self.dst_port or None,
+        )
+
+    @staticmethod
+    def _compile_ip(ip_address: Optional[IPv4Address], wildcard_mask: Optional[IPv4Address]) -> Tuple[int, int]:
+        """Convert an IP address and optional wildcard mask into an integer base address and mask."""
+        if ip_address is None:
+            return 0, 0
+        mask = 0xFFFFFFFF
+        if wildcard_mask:
+            mask &= ~int(wildcard_mask)
+        return int(ip_address) & mask, mask
+
 
 class AccessControlList(SimComponent):
     """
@@ -289,6 +339,14 @@ class AccessControlList(SimComponent):
     _acl: List[Optional[ACLRule]] = [None] * 24
     _default_config: Dict[int, dict] = {}
     """Config dict describing how the ACL list should look at episode start"""
+    max_cached_decisions: int = 1024
+    """The maximum number of frame decisions to remember before the decision cache is cleared."""
+    _compiled_rules: Optional[List[_CompiledACLRule]] = PrivateAttr(default=None)
+    """The rules of the ACL in order, pre-converted for matching. Built on demand after the rules change."""
+    _rule_groups: Dict[Tuple[Optional[str], Optional[int]], List[_CompiledACLRule]] = PrivateAttr(default_factory=dict)
+    """Compiled rules which can match a given protocol and destination port, in order."""
+    _decisions: Dict[_FrameMatchKey, Optional[_CompiledACLRule]] = PrivateAttr(default_factory=dict)
+    """The first rule matched by recently seen frames, or None if they fell through to the implicit rule."""
 
     def __init__(self, **kwargs) -> None:
         if not kwargs.get("implicit_action"):
@@ -431,8 +489,8 @@ class AccessControlList(SimComponent):
         """
         if 0 <= position < self.max_acl_rules:
             if self._acl[position]:
-                self.sys_log.info(f"Overwriting ACL rule at position {position}")
-            self._acl[position] = ACLRule(
+                self.sys_log.info("Overwriting ACL rule at position %s", position)
+            rule = ACLRule(
                 action=action,
                 src_ip_address=src_ip_address,
                 src_wildcard_mask=src_wildcard_mask,
@@ -442,6 +500,9 @@ class AccessControlList(SimComponent):
                 src_port=src_port,
                 dst_port=dst_port,
             )
+            rule.parent = self
+            self._acl[position] = rule
+            self.clear_compiled_rules()
             return True
         else:
             raise ValueError(f"Cannot add ACL rule, position {position} is out of bounds.")
@@ -458,27 +519,84 @@ class AccessControlList(SimComponent):
             rule = self._acl[position]  # noqa
             self._acl[position] = None
             del rule
+            self.clear_compiled_rules()
             return True
         else:
             raise ValueError(f"Cannot remove ACL rule, position {position} is out of bounds.")
         return False
 
+    def clear_compiled_rules(self) -> None:
+        """
+        Discard the compiled rules and the decision cache, so they are rebuilt from the current rules.
+
+        This is called automatically when rules are added or removed, or when the matching criteria of a rule change.
+        """
+        self._compiled_rules = None
+        self._rule_groups = {}
+        self._decisions = {}
+
+    def _get_rule_group(self, protocol: str, dst_port: Optional[int]) -> List[_CompiledACLRule]:
+        """
+        Get the compiled rules which can match frames with the given protocol and destination port, in order.
+
+        :param protocol: The protocol of the frame.
+        :param dst_port: The destination port of the frame, or None if it has no transport header.
+        :return: The rules which do not rule out the frame by protocol or destination port.
+        """
+        group = self._rule_groups.get((protocol, dst_port))
+        if group is None:
+            if self._compiled_rules is None:
+                self._compiled_rules = [rule.compile() for rule in self._acl if rule]
+            group = [
+                compiled
+                for compiled in self._compiled_rules
+                if (compiled[2] is None or compiled[2] == protocol) and (compiled[8] is None or compiled[8] == dst_port)
+            ]
+            self._rule_groups[(protocol, dst_port)] = group
+        return group
+
     def is_permitted(self, frame: Frame) -> Tuple[bool, ACLRule]:
-        """Check if a packet with the given properties is permitted through the ACL."""
-        permitted = False
-        rule: ACLRule = None
+        """
+        Check if a packet with the given properties is permitted through the ACL.
 
-        for _rule in self._acl:
-            if not _rule:
-                continue
+        Rules are evaluated in order and the first matching rule decides, falling back to the implicit rule if no rule
+        matches. The matching rule for each combination of protocol, IP addresses and ports is cached until the rules
+        change.
+        """
+        src_port = None
+        dst_port = None
+        if frame.tcp:
+            src_port = frame.tcp.src_port
+            dst_port = frame.tcp.dst_port
+        elif frame.udp:
+            src_port = frame.udp.src_port
+            dst_port = frame.udp.dst_port
+        protocol = frame.ip.protocol
+        src_ip = int(frame.ip.src_ip_address)
+        dst_ip = int(frame.ip.dst_ip_address)
+        key = (protocol, src_ip, dst_ip, src_port, dst_port)
+
+        if key in self._decisions:
+            match = self._decisions[key]
+        else:
+            match = None
+            for compiled in self._get_rule_group(protocol, dst_port):
+                if (
+                    src_ip & compiled[4] == compiled[3]
+                    and dst_ip & compiled[6] == compiled[5]
+                    and (compiled[7] is None or compiled[7] == src_port)
+                ):
+                    match = compiled
+                    break
+            if len(self._decisions) >= self.max_cached_decisions:
+                self._decisions = {}
+            self._decisions[key] = match
 
-            permitted, rule_match = _rule.permit_frame_check(frame)
-            if rule_match:
-                rule = _rule
-                break
-        if not rule:
+        if match is None:
             permitted = self.implicit_action == ACLAction.PERMIT
             rule = self.implicit_rule
+        else:
+            rule, permitted = match[0], match[1]
 
         rule.match_count += 1
 
@@ -593,6 +711,18 @@ class RouteEntry(SimComponent):
     metric: float = 0.0
     "The cost metric for this route. Default is 0.0."
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # a change to a route must be picked up by the route table which indexed it
+        parent = self.__dict__.get("_parent")
+        if isinstance(parent, RouteTable) and name in RouteEntry.model_fields:
+            parent.clear_route_index()
+
+    @property
+    def prefix_len(self) -> int:
+        """The number of leading bits of the subnet mask, i.e. the prefix length of the route."""
+        return IPv4Network(f"0.0.0.0/{self.subnet_mask}").prefixlen
+
     def describe_state(self) -> Dict:
         """
         Describes the current state of the RouteEntry.
@@ -624,6 +754,20 @@ class RouteTable(SimComponent):
     routes: List[RouteEntry] = []
     default_route: Optional[RouteEntry] = None
     sys_log: SysLog
+    max_cached_routes: int = 1024
+    "The maximum number of destinations to remember the best route for before the route cache is cleared."
+    _prefix_tables: Optional[List[Tuple[int, Dict[int, RouteEntry]]]] = PrivateAttr(default=None)
+    """
+    For each prefix length in use, longest first, the network mask and a map of network address to the route with the
+    lowest metric for that network. Built on demand after the routes change.
+    """
+    _route_cache: Dict[int, Optional[RouteEntry]] = PrivateAttr(default_factory=dict)
+    "The best route for recently seen destinations, or None if only the default route applies."
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "routes":
+            self.clear_route_index()
 
     def describe_state(self) -> Dict:
         """
@@ -655,7 +799,40 @@ class RouteTable(SimComponent):
         route = RouteEntry(
             address=address, subnet_mask=subnet_mask, next_hop_ip_address=next_hop_ip_address, metric=metric
         )
+        route.parent = self
         self.routes.append(route)
+        self.clear_route_index()
+
+    def clear_route_index(self) -> None:
+        """
+        Discard the prefix tables and the route cache, so they are rebuilt from the current routes.
+
+        This is called automatically when a route is added or changed.
+        """
+        self._prefix_tables = None
+        self._route_cache = {}
+
+    def _build_prefix_tables(self) -> List[Tuple[int, Dict[int, RouteEntry]]]:
+        """
+        Index the routes by prefix length and network address.
+
+        Where several routes share a network, the route with the lowest metric is kept. Ties go to the route that was
+        added first.
+
+        :return: The network mask and routes by network address for each prefix length, longest prefix first.
+        """
+        tables: Dict[int, Dict[int, RouteEntry]] = {}
+        for route in self.routes:
+            prefix_len = route.prefix_len
+            mask = (0xFFFFFFFF << (32 - prefix_len)) & 0xFFFFFFFF
+            network = int(route.address) & mask
+            table = tables.setdefault(prefix_len, {})
+            if network not in table or route.metric < table[network].metric:
+                table[network] = route
+        return [
+            ((0xFFFFFFFF << (32 - prefix_len)) & 0xFFFFFFFF, tables[prefix_len])
+            for prefix_len in sorted(tables, reverse=True)
+        ]
 
     @validate_call()
     def set_default_route_next_hop_ip_address(self, ip_address: IPV4Address):
@@ -677,34 +854,35 @@ class RouteTable(SimComponent):
             )
         else:
             self.default_route.next_hop_ip_address = ip_address
-        self.sys_log.info(f"Default configured to use {ip_address} as the next-hop")
+        self.sys_log.info("Default configured to use %s as the next-hop", ip_address)
 
     def find_best_route(self, destination_ip: Union[str, IPv4Address]) -> Optional[RouteEntry]:
         """
         Find the best route for a given destination IP.
 
-        This method uses the Longest Prefix Match algorithm and considers metrics to find the best route.
+        This method uses the Longest Prefix Match algorithm and considers metrics to find the best route. Routes are
+        indexed by prefix length, so each lookup checks one network per prefix length in use rather than every route.
+        The best route for each destination is cached until the routes change.
 
         If no dedicated route exists but a default route does, then the default route is returned as a last resort.
 
         :param destination_ip: The destination IP to find the route for.
         :return: The best matching RouteEntry, or None if no route matches.
         """
-        if not isinstance(destination_ip, IPv4Address):
-            destination_ip = IPv4Address(destination_ip)
-        best_route = None
-        longest_prefix = -1
-        lowest_metric = float("inf")  # Initialise at infinity as any other number we compare to it will be smaller
-
-        for route in self.routes:
-            route_network = IPv4Network(f"{route.address}/{route.subnet_mask}", strict=False)
-            prefix_len = route_network.prefixlen
-
-            if destination_ip in route_network:
-                if prefix_len > longest_prefix or (prefix_len == longest_prefix and route.metric < lowest_metric):
-                    best_route = route
-                    longest_prefix = prefix_len
-                    lowest_metric = route.metric
+        destination = int(IPv4Address(destination_ip))
+        if destination in self._route_cache:
+            best_route = self._route_cache[destination]
+        else:
+            if self._prefix_tables is None:
+                self._prefix_tables = self._build_prefix_tables()
+            best_route = None
+            for mask, table in self._prefix_tables:
+                best_route = table.get(destination & mask)
+                if best_route:
+                    break
+            if len(self._route_cache) >= self.max_cached_routes:
+                self._route_cache = {}
+            self._route_cache[destination] = best_route
 
         if not best_route and self.default_route:
             best_route = self.default_route
@@ -830,9 +1008,9 @@ class RouterARP(ARP):
         if arp_entry:
             return self.software_manager.node.network_interfaces[arp_entry.network_interface_uuid]
 
-        for network_interface in self.router.network_interfaces.values():
-            if ip_address in network_interface.ip_network:
-                return network_interface
+        network_interface = self.router._interface_index.get_interface_in_subnet(ip_address)
+        if network_interface is not None:
+            return network_interface
 
         if not is_reattempt:
             if self.router.ip_is_in_router_interface_subnet(ip_address):
@@ -930,7 +1108,7 @@ class RouterICMP(ICMP):
 
         :param frame: The network frame containing the ICMP echo request.
         """
-        self.sys_log.info(f"Received echo request from {frame.ip.src_ip_address}")
+        self.sys_log.info("Received echo request from %s", frame.ip.src_ip_address)
 
         network_interface = self.software_manager.session_manager.resolve_outbound_network_interface(
             frame.ip.src_ip_address
@@ -950,7 +1128,7 @@ class RouterICMP(ICMP):
             sequence=frame.icmp.sequence + 1,
         )
         payload = secrets.token_urlsafe(int(32 / 1.3))  # Standard ICMP 32 bytes size
-        self.sys_log.info(f"Sending echo reply to {frame.ip.dst_ip_address}")
+        self.sys_log.info("Sending echo reply to %s", frame.ip.dst_ip_address)
 
         self.software_manager.session_manager.receive_payload_from_software_manager(
             payload=payload,
@@ -1141,12 +1319,15 @@ class RouterSessionManager(SessionManager):
 
         # Use session details if session_id is provided
         if session_id:
-            session = self.sessions_by_uuid[session_id]
-
-            dst_ip_address = session.with_ip_address
-            protocol = session.protocol
-            src_port = session.src_port
-            dst_port = session.dst_port
+            session = self.sessions_by_uuid.get(session_id)
+            if session:
+                dst_ip_address = session.with_ip_address
+                protocol = session.protocol
+                src_port = session.src_port
+                dst_port = session.dst_port
+            elif dst_ip_address is None:
+                # The session has expired or been evicted, leaving nowhere to send to
+                return None, None, None, src_port, dst_port, protocol, False
 
         # Determine if the payload is for broadcast or unicast
 
@@ -1156,18 +1337,16 @@ class RouterSessionManager(SessionManager):
             dst_ip_address = dst_ip_address.broadcast_address
             if dst_ip_address:
                 # Find a suitable NIC for the broadcast
-                for network_interface in self.node.network_interfaces.values():
-                    if dst_ip_address in network_interface.ip_network and network_interface.enabled:
-                        dst_mac_address = "ff:ff:ff:ff:ff:ff"
-                        outbound_network_interface = network_interface
-                        break
+                outbound_network_interface = self.node._interface_index.get_interface_in_subnet(
+                    dst_ip_address, enabled_only=True
+                )
+                if outbound_network_interface:
+                    dst_mac_address = "ff:ff:ff:ff:ff:ff"
         else:
             # Resolve MAC address for unicast transmission
             use_route_table = True
-            for network_interface in self.node.network_interfaces.values():
-                if dst_ip_address in network_interface.ip_network and network_interface.enabled:
-                    dst_mac_address = self.software_manager.arp.get_arp_cache_mac_address(dst_ip_address)
-                    break
+            if self.node._interface_index.get_interface_in_subnet(dst_ip_address, enabled_only=True):
+                dst_mac_address = self.software_manager.arp.get_arp_cache_mac_address(dst_ip_address)
 
             if dst_mac_address:
                 use_route_table = False
@@ -1238,7 +1417,11 @@ class Router(NetworkNode, discriminator="router"):
         if not kwargs.get("route_table"):
             kwargs["route_table"] = RouteTable(sys_log=kwargs["sys_log"])
         super().__init__(**kwargs)
-        self.session_manager = RouterSessionManager(sys_log=self.sys_log)
+        self.session_manager = RouterSessionManager(
+            sys_log=self.sys_log,
+            idle_timeout=self.config.session_idle_timeout,
+            max_sessions=self.config.max_sessions,
+        )
         self.session_manager.node = self
         self.software_manager.session_manager = self.session_manager
         self.session_manager.software_manager = self.software_manager
@@ -1310,13 +1493,10 @@ class Router(NetworkNode, discriminator="router"):
         :param enabled_only: If True, only considers enabled network interfaces.
         :return: True if the IP address is assigned to one of the router's interfaces; False otherwise.
         """
-        for router_interface in self.network_interface.values():
-            if router_interface.ip_address == ip_address:
-                if enabled_only:
-                    return router_interface.enabled
-                else:
-                    return True
-        return False
+        router_interface = self._interface_index.get_interface_by_ip_address(ip_address)
+        if router_interface is None:
+            return False
+        return router_interface.enabled or not enabled_only
 
     def ip_is_in_router_interface_subnet(self, ip_address: IPv4Address, enabled_only: bool = False) -> bool:
         """
@@ -1326,13 +1506,10 @@ class Router(NetworkNode, discriminator="router"):
         :param enabled_only: If True, only considers enabled network interfaces.
         :return: True if the IP address is within the subnet of any router's interface; False otherwise.
         """
-        for router_interface in self.network_interface.values():
-            if ip_address in router_interface.ip_network:
-                if enabled_only:
-                    return router_interface.enabled
-                else:
-                    return True
-        return False
+        router_interface = self._interface_index.get_interface_in_subnet(ip_address)
+        if router_interface is None:
+            return False
+        return router_interface.enabled or not enabled_only
 
     def _get_port_of_nic(self, target_nic: RouterInterface) -> Optional[int]:
         """
@@ -1413,7 +1590,7 @@ class Router(NetworkNode, discriminator="router"):
 
         if not permitted:
             at_port = self._get_port_of_nic(from_network_interface)
-            self.sys_log.info(f"Frame blocked at port {at_port} by rule {rule}")
+            self.sys_log.info("Frame blocked at port %s by rule %s", at_port, rule)
             return
 
         if frame.ip and self.software_manager.arp:
@@ -1441,11 +1618,9 @@ class Router(NetworkNode, discriminator="router"):
         """
         # check if frame is addressed to this Router but has failed to be received by a service of application at the
         # receive_frame stage
-        if frame.ip:
-            for network_interface in self.network_interfaces.values():
-                if network_interface.ip_address == frame.ip.dst_ip_address:
-                    self.sys_log.info("Dropping frame destined for this router on a port that isn't open.")
-                    return
+        if frame.ip and frame.ip.dst_ip_address in self._interface_index.ip_addresses:
+            self.sys_log.info("Dropping frame destined for this router on a port that isn't open.")
+            return
 
         network_interface: RouterInterface = self.software_manager.arp.get_arp_cache_network_interface(
             frame.ip.dst_ip_address
@@ -1453,24 +1628,24 @@ class Router(NetworkNode, discriminator="router"):
         target_mac = self.software_manager.arp.get_arp_cache_mac_address(frame.ip.dst_ip_address)
 
         if not target_mac:
-            self.sys_log.info(f"Frame dropped as ARP cannot be resolved for {frame.ip.dst_ip_address}")
+            self.sys_log.info("Frame dropped as ARP cannot be resolved for %s", frame.ip.dst_ip_address)
             # TODO: Send something back to src, is it some sort of ICMP?
             return
 
         if not network_interface:
-            self.sys_log.info(f"Destination {frame.ip.dst_ip_address} is unreachable")
+            self.sys_log.info("Destination %s is unreachable", frame.ip.dst_ip_address)
             # TODO: Send something back to src, is it some sort of ICMP?
             return
 
         if not network_interface.enabled:
-            self.sys_log.info(f"Frame dropped as NIC {network_interface} is not enabled")
+            self.sys_log.info("Frame dropped as NIC %s is not enabled", network_interface)
             # TODO: Send something back to src, is it some sort of ICMP?
             return
 
         if frame.ip.dst_ip_address in network_interface.ip_network:
             from_port = self._get_port_of_nic(from_network_interface)
             to_port = self._get_port_of_nic(network_interface)
-            self.sys_log.info(f"Forwarding frame to internally from port {from_port} to port {to_port}")
+            self.sys_log.info("Forwarding frame to internally from port %s to port %s", from_port, to_port)
             frame.decrement_ttl()
             if frame.ip and frame.ip.ttl < 1:
                 self.sys_log.info("Frame discarded as TTL limit reached")
@@ -1478,6 +1653,7 @@ class Router(NetworkNode, discriminator="router"):
                 return
             frame.ethernet.src_mac_addr = network_interface.mac_address
             frame.ethernet.dst_mac_addr = target_mac
+            frame.invalidate_size()
             network_interface.send_frame(frame)
             return
         else:
@@ -1498,18 +1674,18 @@ class Router(NetworkNode, discriminator="router"):
             network_interface = self.software_manager.arp.get_arp_cache_network_interface(route.next_hop_ip_address)
             target_mac = self.software_manager.arp.get_arp_cache_mac_address(route.next_hop_ip_address)
             if not network_interface:
-                self.sys_log.info(f"Destination {frame.ip.dst_ip_address} is unreachable")
+                self.sys_log.info("Destination %s is unreachable", frame.ip.dst_ip_address)
                 # TODO: Send something back to src, is it some sort of ICMP?
                 return
 
             if not network_interface.enabled:
-                self.sys_log.info(f"Frame dropped as NIC {network_interface} is not enabled")
+                self.sys_log.info("Frame dropped as NIC %s is not enabled", network_interface)
                 # TODO: Send something back to src, is it some sort of ICMP?
                 return
 
             from_port = self._get_port_of_nic(from_network_interface)
             to_port = self._get_port_of_nic(network_interface)
-            self.sys_log.info(f"Routing frame to internally from port {from_port} to port {to_port}")
+            self.sys_log.info("Routing frame to internally from port %s to port %s", from_port, to_port)
             frame.decrement_ttl()
             if frame.ip and frame.ip.ttl < 1:
                 self.sys_log.info("Frame discarded as TTL limit reached")
@@ -1517,9 +1693,10 @@ class Router(NetworkNode, discriminator="router"):
                 return
             frame.ethernet.src_mac_addr = network_interface.mac_address
             frame.ethernet.dst_mac_addr = target_mac
+            frame.invalidate_size()
             network_interface.send_frame(frame)
         else:
-            self.sys_log.warning(f"Frame dropped as there is no route to {frame.ip.dst_ip_address}")
+            self.sys_log.warning("Frame dropped as there is no route to %s", frame.ip.dst_ip_address)
 
     def configure_port(self, port: int, ip_address: Union[IPv4Address, str], subnet_mask: Union[IPv4Address, str]):
         """
@@ -1536,7 +1713,7 @@ class Router(NetworkNode, discriminator="router"):
         network_interface = self.network_interface[port]
         network_interface.ip_address = ip_address
         network_interface.subnet_mask = subnet_mask
-        self.sys_log.info(f"Configured Network Interface {network_interface}")
+        self.sys_log.info("Configured Network Interface %s", network_interface)
 
     def enable_port(self, port: int):
         """
@@ -63,7 +63,7 @@ class SwitchPort(WiredNetworkInterface):
             return False
         if not self._connected_link.can_transmit_frame(frame):
             # Drop frame for now. Queuing will happen here (probably) if it's done in the future.
-            self._connected_node.sys_log.info(f"{self}: Frame dropped as Link is at capacity")
+            self._connected_node.sys_log.info("%s: Frame dropped as Link is at capacity", self)
             return False
 
         self.pcap.capture_outbound(frame)
@@ -152,11 +152,11 @@ class Switch(NetworkNode, discriminator="switch"):
         mac_table_port = self.mac_address_table.get(mac_address)
         if not mac_table_port:
             self.mac_address_table[mac_address] = switch_port
-            self.sys_log.info(f"Added MAC table entry: Port {switch_port.port_num} -> {mac_address}")
+            self.sys_log.info("Added MAC table entry: Port %s -> %s", switch_port.port_num, mac_address)
         else:
             if mac_table_port != switch_port:
                 self.mac_address_table.pop(mac_address)
-                self.sys_log.info(f"Removed MAC table entry: Port {mac_table_port.port_num} -> {mac_address}")
+                self.sys_log.info("Removed MAC table entry: Port %s -> %s", mac_table_port.port_num, mac_address)
                 self._add_mac_table_entry(mac_address, switch_port)
 
     def receive_frame(self, frame: Frame, from_network_interface: SwitchPort):
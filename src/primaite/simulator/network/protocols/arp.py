@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from ipaddress import IPv4Address
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel
 
@@ -56,6 +56,8 @@ class ARPPacket(DataPacket):
     "Target MAC address."
     target_ip_address: IPv4Address
     "Target IP address."
+    estimated_header_size: ClassVar[int] = 28
+    "Size of an ARP packet for IPv4 over Ethernet."
 
     def generate_reply(self, mac_address: str) -> ARPPacket:
         """
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from ipaddress import IPv4Address
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel
 
@@ -52,6 +52,8 @@ class DNSPacket(DataPacket):
     "DNS Request packet sent by DNS Client."
     dns_reply: Optional[DNSReply] = None
     "DNS Reply packet generated by DNS Server."
+    estimated_header_size: ClassVar[int] = 64
+    "Typical size of a DNS message carrying a single question and answer."
 
     def generate_reply(self, domain_ip_address: IPv4Address) -> DNSPacket:
         """Generate a new DNSPacket to be sent as a response with a DNS Reply packet which contains the IP address.
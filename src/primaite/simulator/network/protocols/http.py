@@ -1,5 +1,6 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from enum import Enum, IntEnum
+from typing import ClassVar
 
 from primaite.simulator.network.protocols.packet import DataPacket
 
@@ -57,9 +58,15 @@ class HttpRequestPacket(DataPacket):
     request_url: str
     """URL of request."""
 
+    estimated_header_size: ClassVar[int] = 256
+    """Typical size of an HTTP request line and headers."""
+
 
 class HttpResponsePacket(DataPacket):
     """Class that reprensents an HTTP Response Packet."""
 
     status_code: HttpStatusCode = None
     """Status code of the HTTP response."""
+
+    estimated_header_size: ClassVar[int] = 256
+    """Typical size of an HTTP status line and headers."""
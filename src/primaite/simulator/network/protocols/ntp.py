@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel
 
@@ -25,6 +25,8 @@ class NTPPacket(DataPacket):
     """
 
     ntp_reply: Optional[NTPReply] = None
+    estimated_header_size: ClassVar[int] = 48
+    "Size of an NTP packet without extension fields."
 
     def generate_reply(self, ntp_server_time: datetime) -> NTPPacket:
         """Generate a NTPPacket containing the time in a NTPReply object.
@@ -1,5 +1,5 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
@@ -13,6 +13,13 @@ class DataPacket(BaseModel):
     packet_payload_size: float = 0
     """Size of the packet."""
 
+    estimated_header_size: ClassVar[int] = 64
+    """Typical size of the packet in Bytes, excluding its payload, used by the analytical frame size model."""
+
     def get_packet_size(self) -> float:
         """Returns the size of the packet header and payload."""
         return self.packet_payload_size + float(len(self.model_dump_json().encode("utf-8")))
+
+    def get_estimated_packet_size(self) -> float:
+        """Returns the size of the packet header and payload, using the typical header size of the packet type."""
+        return self.packet_payload_size + self.estimated_header_size
@@ -1,21 +1,37 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from primaite import getLogger
 from primaite.simulator.network.protocols.icmp import ICMPPacket
 from primaite.simulator.network.protocols.packet import DataPacket
-from primaite.simulator.network.transmission.network_layer import IPPacket
-from primaite.simulator.network.transmission.primaite_layer import PrimaiteHeader
-from primaite.simulator.network.transmission.transport_layer import TCPHeader, UDPHeader
+from primaite.simulator.network.transmission.network_layer import CompactIPPacket, IPPacket
+from primaite.simulator.network.transmission.primaite_layer import CompactPrimaiteHeader, PrimaiteHeader
+from primaite.simulator.network.transmission.transport_layer import (
+    CompactTCPHeader,
+    CompactUDPHeader,
+    TCPHeader,
+    UDPHeader,
+)
 from primaite.simulator.network.utils import convert_bytes_to_megabits
 from primaite.utils.validation.ip_protocol import PROTOCOL_LOOKUP
 from primaite.utils.validation.port import PORT_LOOKUP
 
 _LOGGER = getLogger(__name__)
 
+ETHERNET_HEADER_BYTES: int = 14
+"Size of an Ethernet header in Bytes, used by the analytical frame size model."
+IP_HEADER_BYTES: int = 20
+"Size of an IPv4 header without options in Bytes, used by the analytical frame size model."
+TCP_HEADER_BYTES: int = 20
+"Size of a TCP header without options in Bytes, used by the analytical frame size model."
+UDP_HEADER_BYTES: int = 8
+"Size of a UDP header in Bytes, used by the analytical frame size model."
+ICMP_HEADER_BYTES: int = 8
+"Size of an ICMP echo header in Bytes, used by the analytical frame size model."
+
 
 class EthernetHeader(BaseModel):
     """
@@ -38,78 +54,74 @@ class EthernetHeader(BaseModel):
     "Destination MAC address."
 
 
-class Frame(BaseModel):
+class CompactEthernetHeader:
     """
-    Represents a complete network frame with all layers.
-
-    :param ethernet: Ethernet layer.
-    :param ip: IP layer.
-    :param tcp: TCP layer.
-    :param payload: Payload data in the frame.
+    A lightweight equivalent of :py:class:`EthernetHeader` used by :py:class:`CompactFrame`.
 
-    :Example:
+    Attributes are not validated. Use :py:meth:`to_model` to convert it to an :py:class:`EthernetHeader`.
 
-    >>> from ipaddress import IPv4Address
-    >>> frame=Frame(
-    ...     ethernet=EthernetHeader(
-    ...         src_mac_addr='AA:BB:CC:DD:EE:FF',
-    ...         dst_mac_addr='11:22:33:44:55:66'
-    ...     ),
-    ...     ip=IPPacket(
-    ...         src_ip_address=IPv4Address('192.168.0.1'),
-    ...         dst_ip_address=IPv4Address('10.0.0.1'),
-    ...     ),
-    ...     tcp=TCPHeader(
-    ...         src_port=8080,
-    ...         dst_port=80,
-    ...     ),
-    ...     payload=b"Hello, World!"
-    ... )
+    :param src_mac_addr: Source MAC address.
+    :param dst_mac_addr: Destination MAC address.
     """
 
-    def __init__(self, **kwargs):
-        if kwargs.get("tcp") and kwargs.get("udp"):
-            msg = "Network Frame cannot have both a TCP header and a UDP header"
-            _LOGGER.error(msg)
-            raise ValueError(msg)
-        if kwargs["ip"].protocol == PROTOCOL_LOOKUP["TCP"] and not kwargs.get("tcp"):
-            msg = "Cannot build a Frame using the TCP IP Protocol without a TCPHeader"
-            _LOGGER.error(msg)
-            raise ValueError(msg)
-        if kwargs["ip"].protocol == PROTOCOL_LOOKUP["UDP"] and not kwargs.get("udp"):
-            msg = "Cannot build a Frame using the UDP IP Protocol without a UDPHeader"
-            _LOGGER.error(msg)
-            raise ValueError(msg)
-        if kwargs["ip"].protocol == PROTOCOL_LOOKUP["ICMP"] and not kwargs.get("icmp"):
-            msg = "Cannot build a Frame using the ICMP IP Protocol without a ICMPPacket"
-            _LOGGER.error(msg)
-            raise ValueError(msg)
-        kwargs["primaite"] = PrimaiteHeader()
+    __slots__ = ("src_mac_addr", "dst_mac_addr")
 
-        super().__init__(**kwargs)
+    def __init__(self, src_mac_addr: str, dst_mac_addr: str):
+        self.src_mac_addr: str = src_mac_addr
+        self.dst_mac_addr: str = dst_mac_addr
+
+    def to_model(self) -> EthernetHeader:
+        """Convert the header to an :py:class:`EthernetHeader`."""
+        return EthernetHeader(src_mac_addr=self.src_mac_addr, dst_mac_addr=self.dst_mac_addr)
 
-    ethernet: EthernetHeader
-    "Ethernet header."
-    ip: IPPacket
-    "IP packet."
-    tcp: Optional[TCPHeader] = None
-    "TCP header."
-    udp: Optional[UDPHeader] = None
-    "UDP header."
-    icmp: Optional[ICMPPacket] = None
-    "ICMP header."
-    primaite: PrimaiteHeader
-    "PrimAITE header."
-    payload: Optional[Any] = None
-    "Raw data payload."
-    sent_timestamp: Optional[datetime] = None
-    "The time the Frame was sent from the original source NIC."
-    received_timestamp: Optional[datetime] = None
-    "The time the Frame was received at the final destination NIC."
+
+def _validate_frame_headers(
+    ip: Union[IPPacket, CompactIPPacket],
+    tcp: Optional[Union[TCPHeader, CompactTCPHeader]],
+    udp: Optional[Union[UDPHeader, CompactUDPHeader]],
+    icmp: Optional[ICMPPacket],
+) -> None:
+    """
+    Check that a Frame has the transport headers required by its IP protocol.
+
+    :raises ValueError: If the Frame has both a TCP and a UDP header, or is missing the header for its IP protocol.
+    """
+    if tcp and udp:
+        msg = "Network Frame cannot have both a TCP header and a UDP header"
+        _LOGGER.error(msg)
+        raise ValueError(msg)
+    if ip.protocol == PROTOCOL_LOOKUP["TCP"] and not tcp:
+        msg = "Cannot build a Frame using the TCP IP Protocol without a TCPHeader"
+        _LOGGER.error(msg)
+        raise ValueError(msg)
+    if ip.protocol == PROTOCOL_LOOKUP["UDP"] and not udp:
+        msg = "Cannot build a Frame using the UDP IP Protocol without a UDPHeader"
+        _LOGGER.error(msg)
+        raise ValueError(msg)
+    if ip.protocol == PROTOCOL_LOOKUP["ICMP"] and not icmp:
+        msg = "Cannot build a Frame using the ICMP IP Protocol without a ICMPPacket"
+        _LOGGER.error(msg)
+        raise ValueError(msg)
+
+
+class _FrameMixin:
+    """Behaviour shared by :py:class:`Frame` and :py:class:`CompactFrame`."""
+
+    __slots__ = ()
+
+    def invalidate_size(self):
+        """
+        Discard the cached size of the Frame, so it is recalculated the next time it is read.
+
+        This must be called after mutating a header or payload of the Frame in place. Setting an attribute of the Frame
+        itself invalidates the cached size automatically.
+        """
+        self._size = None
 
     def decrement_ttl(self):
         """Decrement the IPPacket ttl by 1."""
         self.ip.ttl -= 1
+        self.invalidate_size()
 
     @property
     def can_transmit(self) -> bool:
@@ -133,7 +145,17 @@ class Frame(BaseModel):
 
     @property
     def size(self) -> float:  # noqa - Keep it as MBits as this is how they're expressed
-        """The size of the Frame in Bytes."""
+        """
+        The size of the Frame in Bytes.
+
+        The size is calculated once and cached until the Frame is modified.
+        """
+        if self._size is None:
+            self._size = self._calculate_analytical_size() if Frame.analytical_size else self._calculate_size()
+        return self._size
+
+    def _calculate_size(self) -> float:
+        """Calculate the size of the Frame in Bytes by serialising it to JSON."""
         # get the payload size if it is a data packet
         payload_size = 0.0
         if isinstance(self.payload, DataPacket):
@@ -141,6 +163,24 @@ class Frame(BaseModel):
 
         return float(len(self.model_dump_json().encode("utf-8"))) + payload_size
 
+    def _calculate_analytical_size(self) -> float:
+        """Calculate the size of the Frame in Bytes from standard header sizes, without serialising it."""
+        size = ETHERNET_HEADER_BYTES + IP_HEADER_BYTES
+        if self.tcp:
+            size += TCP_HEADER_BYTES
+        elif self.udp:
+            size += UDP_HEADER_BYTES
+        elif self.icmp:
+            size += ICMP_HEADER_BYTES
+
+        if isinstance(self.payload, DataPacket):
+            return float(size) + self.payload.get_estimated_packet_size()
+        if isinstance(self.payload, (str, bytes)):
+            size += len(self.payload)
+        elif self.payload is not None:
+            size += DataPacket.estimated_header_size
+        return float(size)
+
     @property
     def size_Mbits(self) -> float:  # noqa - Keep it as MBits as this is how they're expressed
         """The daa transfer size of the Frame in Mbits."""
@@ -179,3 +219,153 @@ class Frame(BaseModel):
         :return: True if the Frame is an ICMP packet (i.e., has an ICMP header), otherwise False.
         """
         return self.icmp is not None
+
+
+class Frame(_FrameMixin, BaseModel):
+    """
+    Represents a complete network frame with all layers.
+
+    :param ethernet: Ethernet layer.
+    :param ip: IP layer.
+    :param tcp: TCP layer.
+    :param payload: Payload data in the frame.
+
+    :Example:
+
+    >>> from ipaddress import IPv4Address
+    >>> frame=Frame(
+    ...     ethernet=EthernetHeader(
+    ...         src_mac_addr='AA:BB:CC:DD:EE:FF',
+    ...         dst_mac_addr='11:22:33:44:55:66'
+    ...     ),
+    ...     ip=IPPacket(
+    ...         src_ip_address=IPv4Address('192.168.0.1'),
+    ...         dst_ip_address=IPv4Address('10.0.0.1'),
+    ...     ),
+    ...     tcp=TCPHeader(
+    ...         src_port=8080,
+    ...         dst_port=80,
+    ...     ),
+    ...     payload=b"Hello, World!"
+    ... )
+    """
+
+    def __init__(self, **kwargs):
+        _validate_frame_headers(kwargs["ip"], kwargs.get("tcp"), kwargs.get("udp"), kwargs.get("icmp"))
+        kwargs["primaite"] = PrimaiteHeader()
+
+        super().__init__(**kwargs)
+
+    ethernet: EthernetHeader
+    "Ethernet header."
+    ip: IPPacket
+    "IP packet."
+    tcp: Optional[TCPHeader] = None
+    "TCP header."
+    udp: Optional[UDPHeader] = None
+    "UDP header."
+    icmp: Optional[ICMPPacket] = None
+    "ICMP header."
+    primaite: PrimaiteHeader
+    "PrimAITE header."
+    payload: Optional[Any] = None
+    "Raw data payload."
+    sent_timestamp: Optional[datetime] = None
+    "The time the Frame was sent from the original source NIC."
+    received_timestamp: Optional[datetime] = None
+    "The time the Frame was received at the final destination NIC."
+    analytical_size: ClassVar[bool] = False
+    """
+    Whether Frame sizes are calculated from standard header sizes rather than by serialising the Frame to JSON.
+
+    When enabled, the size of a Frame is the sum of its Ethernet, IP and transport header sizes plus the estimated size
+    of its payload. See :py:meth:`DataPacket.get_estimated_packet_size` for how :py:class:`DataPacket` payloads are
+    sized. ``str`` and ``bytes`` payloads are sized by their length, and any other payload is assumed to be the size of
+    a generic :py:class:`DataPacket`. This setting applies to :py:class:`CompactFrame` too.
+    """
+    _size: Optional[float] = PrivateAttr(default=None)
+    "The cached size of the Frame in Bytes."
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_size":
+            self._size = None
+
+
+class CompactFrame(_FrameMixin):
+    """
+    A lightweight, unvalidated equivalent of :py:class:`Frame` for the packet hot path.
+
+    A CompactFrame is built from compact headers that use ``__slots__`` instead of pydantic models, so creating one
+    skips pydantic validation. It has the same attributes, properties and methods as a :py:class:`Frame`, and is
+    converted to a :py:class:`Frame` with :py:meth:`to_frame` only when it is serialised, such as for PCAP logging or
+    when its size is calculated by serialisation.
+
+    :param ethernet: Ethernet layer.
+    :param ip: IP layer.
+    :param tcp: TCP layer. Optional.
+    :param udp: UDP layer. Optional.
+    :param icmp: ICMP layer. Optional.
+    :param payload: Payload data in the frame. Optional.
+    """
+
+    __slots__ = (
+        "ethernet",
+        "ip",
+        "tcp",
+        "udp",
+        "icmp",
+        "primaite",
+        "payload",
+        "sent_timestamp",
+        "received_timestamp",
+        "_size",
+    )
+
+    def __init__(
+        self,
+        ethernet: CompactEthernetHeader,
+        ip: CompactIPPacket,
+        tcp: Optional[CompactTCPHeader] = None,
+        udp: Optional[CompactUDPHeader] = None,
+        icmp: Optional[ICMPPacket] = None,
+        payload: Optional[Any] = None,
+    ):
+        _validate_frame_headers(ip, tcp, udp, icmp)
+        self.ethernet: CompactEthernetHeader = ethernet
+        self.ip: CompactIPPacket = ip
+        self.tcp: Optional[CompactTCPHeader] = tcp
+        self.udp: Optional[CompactUDPHeader] = udp
+        self.icmp: Optional[ICMPPacket] = icmp
+        self.primaite: CompactPrimaiteHeader = CompactPrimaiteHeader()
+        self.payload: Optional[Any] = payload
+        self.sent_timestamp: Optional[datetime] = None
+        self.received_timestamp: Optional[datetime] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_size":
+            object.__setattr__(self, "_size", None)
+
+    def to_frame(self) -> Frame:
+        """Convert the CompactFrame to a :py:class:`Frame`."""
+        frame = Frame(
+            ethernet=self.ethernet.to_model(),
+            ip=self.ip.to_model(),
+            tcp=self.tcp.to_model() if self.tcp else None,
+            udp=self.udp.to_model() if self.udp else None,
+            icmp=self.icmp,
+            payload=self.payload,
+            sent_timestamp=self.sent_timestamp,
+            received_timestamp=self.received_timestamp,
+        )
+        frame.primaite = self.primaite.to_model()
+        return frame
+
+    def model_dump(self, **kwargs) -> dict:
+        """Serialise the CompactFrame to a dict, in the same form as :py:meth:`Frame.model_dump`."""
+        return self.to_frame().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialise the CompactFrame to JSON, in the same form as :py:meth:`Frame.model_dump_json`."""
+        return self.to_frame().model_dump_json(**kwargs)
@@ -1,5 +1,7 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from enum import Enum
+from ipaddress import IPv4Address
+from typing import Union
 
 from pydantic import BaseModel
 
@@ -77,3 +79,48 @@ class IPPacket(BaseModel):
     "Time to Live (TTL) for the packet."
     precedence: Precedence = Precedence.ROUTINE
     "Precedence level for Quality of Service (default is Precedence.ROUTINE)."
+
+
+class CompactIPPacket:
+    """
+    A lightweight equivalent of :py:class:`IPPacket` used by :py:class:`CompactFrame`.
+
+    Attributes are not validated, other than converting IP addresses given as strings. Use :py:meth:`to_model` to
+    convert it to an :py:class:`IPPacket`.
+
+    :param src_ip_address: Source IP address.
+    :param dst_ip_address: Destination IP address.
+    :param protocol: The IP protocol (default is TCP).
+    :param ttl: Time to Live (TTL) for the packet.
+    :param precedence: Precedence level for Quality of Service (QoS).
+    """
+
+    __slots__ = ("src_ip_address", "dst_ip_address", "protocol", "ttl", "precedence")
+
+    def __init__(
+        self,
+        src_ip_address: Union[IPv4Address, str],
+        dst_ip_address: Union[IPv4Address, str],
+        protocol: IPProtocol = PROTOCOL_LOOKUP["TCP"],
+        ttl: int = 64,
+        precedence: Precedence = Precedence.ROUTINE,
+    ):
+        if not isinstance(src_ip_address, IPv4Address):
+            src_ip_address = IPv4Address(src_ip_address)
+        if not isinstance(dst_ip_address, IPv4Address):
+            dst_ip_address = IPv4Address(dst_ip_address)
+        self.src_ip_address: IPv4Address = src_ip_address
+        self.dst_ip_address: IPv4Address = dst_ip_address
+        self.protocol: IPProtocol = protocol
+        self.ttl: int = ttl
+        self.precedence: Precedence = precedence
+
+    def to_model(self) -> IPPacket:
+        """Convert the packet to an :py:class:`IPPacket`."""
+        return IPPacket(
+            src_ip_address=self.src_ip_address,
+            dst_ip_address=self.dst_ip_address,
+            protocol=self.protocol,
+            ttl=self.ttl,
+            precedence=self.precedence,
+        )
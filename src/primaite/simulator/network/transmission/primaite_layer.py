@@ -39,3 +39,21 @@ class PrimaiteHeader(BaseModel):
 
     agent_source: AgentSource = AgentSource.GREEN
     data_status: DataStatus = DataStatus.GOOD
+
+
+class CompactPrimaiteHeader:
+    """
+    A lightweight equivalent of :py:class:`PrimaiteHeader` used by :py:class:`CompactFrame`.
+
+    Use :py:meth:`to_model` to convert it to a :py:class:`PrimaiteHeader`.
+    """
+
+    __slots__ = ("agent_source", "data_status")
+
+    def __init__(self, agent_source: AgentSource = AgentSource.GREEN, data_status: DataStatus = DataStatus.GOOD):
+        self.agent_source: AgentSource = agent_source
+        self.data_status: DataStatus = data_status
+
+    def to_model(self) -> PrimaiteHeader:
+        """Convert the header to a :py:class:`PrimaiteHeader`."""
+        return PrimaiteHeader(agent_source=self.agent_source, data_status=self.data_status)
@@ -1,6 +1,6 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -63,3 +63,47 @@ class TCPHeader(BaseModel):
     src_port: int
     dst_port: int
     flags: List[TCPFlags] = [TCPFlags.SYN]
+
+
+class CompactUDPHeader:
+    """
+    A lightweight equivalent of :py:class:`UDPHeader` used by :py:class:`CompactFrame`.
+
+    Attributes are not validated. Use :py:meth:`to_model` to convert it to a :py:class:`UDPHeader`.
+
+    :param src_port: Source port.
+    :param dst_port: Destination port.
+    """
+
+    __slots__ = ("src_port", "dst_port")
+
+    def __init__(self, src_port: int, dst_port: int):
+        self.src_port: int = src_port
+        self.dst_port: int = dst_port
+
+    def to_model(self) -> UDPHeader:
+        """Convert the header to a :py:class:`UDPHeader`."""
+        return UDPHeader(src_port=self.src_port, dst_port=self.dst_port)
+
+
+class CompactTCPHeader:
+    """
+    A lightweight equivalent of :py:class:`TCPHeader` used by :py:class:`CompactFrame`.
+
+    Attributes are not validated. Use :py:meth:`to_model` to convert it to a :py:class:`TCPHeader`.
+
+    :param src_port: Source port.
+    :param dst_port: Destination port.
+    :param flags: TCP flags (list of TCPFlags members). Defaults to SYN.
+    """
+
+    __slots__ = ("src_port", "dst_port", "flags")
+
+    def __init__(self, src_port: int, dst_port: int, flags: Optional[List[TCPFlags]] = None):
+        self.src_port: int = src_port
+        self.dst_port: int = dst_port
+        self.flags: List[TCPFlags] = flags if flags is not None else [TCPFlags.SYN]
+
+    def to_model(self) -> TCPHeader:
+        """Convert the header to a :py:class:`TCPHeader`."""
+        return TCPHeader(src_port=self.src_port, dst_port=self.dst_port, flags=list(self.flags))
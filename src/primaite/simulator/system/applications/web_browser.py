@@ -145,6 +145,7 @@ class WebBrowser(Application, discriminator="web-browser"):
                     response_code=self.latest_response.status_code,
                 )
             )
+            self.invalidate_state()
             return self.latest_response.status_code is HttpStatusCode.OK
         else:
             self.sys_log.warning(f"{self.name}: Error sending Http Packet")
@@ -154,6 +155,7 @@ class WebBrowser(Application, discriminator="web-browser"):
                     url=url, status=self.BrowserHistoryItem._HistoryItemStatus.SERVER_UNREACHABLE
                 )
             )
+            self.invalidate_state()
             return False
 
     def send(
@@ -1,29 +1,274 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import atexit
 import json
-import logging
+import os
+import struct
+import threading
+from datetime import datetime, timedelta
+from ipaddress import IPv4Address
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from queue import Empty, SimpleQueue
+from typing import Any, BinaryIO, Dict, Final, List, Optional
 
+from pydantic import TypeAdapter
+
+from primaite import getLogger
 from primaite.simulator import SIM_OUTPUT
 
+_LOGGER = getLogger(__name__)
+
+_BUFFER_SIZE: Final[int] = 2**20
+"""Size in Bytes of the write buffer of each PCAP log file."""
+
+_FLUSH: Final[str] = "flush"
+_CLOSE: Final[str] = "close"
+
+
+class _PcapWriter:
+    """
+    Writes PCAP records to their log files from a background thread.
+
+    Capturing a frame only encodes it and puts the record on a queue. The writer thread takes every record waiting on
+    the queue at once, joins the records for each file, and writes them to files which are kept open with a large
+    buffer, so frames are captured without waiting on the file system.
+    """
+
+    def __init__(self) -> None:
+        self._queue: SimpleQueue = SimpleQueue()
+        self._files: Dict[Path, BinaryIO] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, path: Path, record: bytes) -> None:
+        """
+        Queue a record to be appended to a log file.
+
+        :param path: Path of the log file.
+        :param record: The encoded record.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._start()
+        self._queue.put((path, record))
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written, and flush the log files."""
+        self._request(_FLUSH)
+
+    def close(self) -> None:
+        """Wait until every queued record has been written, and close the log files."""
+        self._request(_CLOSE)
+
+    def reset(self) -> None:
+        """Discard the queue and open files without writing them, such as in a child process after a fork."""
+        self._queue = SimpleQueue()
+        self._files = {}
+        self._thread = None
+
+    def _request(self, request: str) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((request, done))
+        done.wait()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="pcap-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            try:
+                while True:
+                    items.append(self._queue.get_nowait())
+            except Empty:
+                pass
+
+            batches: Dict[Path, List[bytes]] = {}
+            for key, value in items:
+                if isinstance(key, Path):
+                    batches.setdefault(key, []).append(value)
+                    continue
+                self._write_batches(batches)
+                batches = {}
+                self._finish_files(close=key == _CLOSE)
+                value.set()
+            self._write_batches(batches)
+
+    def _write_batches(self, batches: Dict[Path, List[bytes]]) -> None:
+        for path, records in batches.items():
+            try:
+                file = self._files.get(path)
+                if file is None:
+                    file = self._files[path] = open(path, "ab", buffering=_BUFFER_SIZE)
+                file.write(b"".join(records))
+            except OSError as e:
+                _LOGGER.error(f"Failed to write {len(records)} PCAP records to {path}: {e}")
+
+    def _finish_files(self, close: bool) -> None:
+        for path, file in list(self._files.items()):
+            try:
+                if close:
+                    file.close()
+                else:
+                    file.flush()
+            except OSError as e:
+                _LOGGER.error(f"Failed to write PCAP log {path}: {e}")
+        if close:
+            self._files = {}
+
+
+_PCAP_WRITER: Final[_PcapWriter] = _PcapWriter()
+atexit.register(_PCAP_WRITER.close)
+
+if hasattr(os, "register_at_fork"):
+    # Empty the file buffers before forking so that the child process does not write them a second time
+    os.register_at_fork(before=_PCAP_WRITER.flush, after_in_child=_PCAP_WRITER.reset)
+
+
+_BINARY_HEADER: Final[struct.Struct] = struct.Struct("<qqIIHBBBBHHBBIIBHI")
+"""
+Fixed size part of a binary PCAP record.
+
+The fields are the sent and received timestamps, the source and destination IP addresses, the IP ttl and precedence,
+the PrimAITE agent source and data status, which transport layers are present, the TCP or UDP source and destination
+ports, the ICMP type, code, identifier and sequence, and then the number of TCP flags, the length of the MAC addresses
+and IP protocol, and the length of the payload which follow the fixed size part.
+"""
+
+_TCP: Final[int] = 1
+_UDP: Final[int] = 2
+_ICMP: Final[int] = 4
+
+_NO_TIMESTAMP: Final[int] = -(2**63)
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+_PAYLOAD_ADAPTER: Final[TypeAdapter] = TypeAdapter(Any)
 
-class _JSONFilter(logging.Filter):
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Filter logs that start and end with '{' and '}' (JSON-like messages)."""
-        return record.getMessage().startswith("{") and record.getMessage().endswith("}")
+
+def _encode_timestamp(timestamp: Optional[datetime]) -> int:
+    return _NO_TIMESTAMP if timestamp is None else (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _decode_timestamp(timestamp: int) -> Optional[str]:
+    return None if timestamp == _NO_TIMESTAMP else (_EPOCH + timestamp * _MICROSECOND).isoformat()
+
+
+def encode_binary_record(frame) -> bytes:  # noqa - Frame and CompactFrame can't be imported due to a circular import
+    """
+    Encode a Frame as a compact binary PCAP record.
+
+    Header fields are packed into fixed width binary columns rather than named, and only the payload is serialised to
+    JSON. The headers are read directly from the Frame, so a ``CompactFrame`` does not have to be converted to a
+    ``Frame`` to be captured.
+
+    :param frame: The Frame or CompactFrame to encode.
+    :return: The encoded record.
+    """
+    ip = frame.ip
+    tcp, udp, icmp = frame.tcp, frame.udp, frame.icmp
+    transport = tcp or udp
+    flags = bytes([flag.value for flag in tcp.flags]) if tcp else b""
+    addresses = f"{frame.ethernet.src_mac_addr}\x00{frame.ethernet.dst_mac_addr}\x00{ip.protocol}".encode()
+    payload = b"" if frame.payload is None else _PAYLOAD_ADAPTER.dump_json(frame.payload)
+    header = _BINARY_HEADER.pack(
+        _encode_timestamp(frame.sent_timestamp),
+        _encode_timestamp(frame.received_timestamp),
+        int(ip.src_ip_address),
+        int(ip.dst_ip_address),
+        ip.ttl,
+        ip.precedence.value,
+        frame.primaite.agent_source.value,
+        frame.primaite.data_status.value,
+        (_TCP if tcp else 0) | (_UDP if udp else 0) | (_ICMP if icmp else 0),
+        transport.src_port if transport else 0,
+        transport.dst_port if transport else 0,
+        icmp.icmp_type.value if icmp else 0,
+        icmp.icmp_code if icmp else 0,
+        icmp.identifier if icmp else 0,
+        icmp.sequence if icmp else 0,
+        len(flags),
+        len(addresses),
+        len(payload),
+    )
+    return b"".join((header, flags, addresses, payload))
+
+
+def decode_binary_records(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode binary PCAP records into dictionaries in the same form as the records of a JSON lines PCAP log.
+
+    :param data: Binary PCAP records, as written by :py:func:`encode_binary_record`.
+    :return: List of frames, represented as dictionaries.
+    """
+    frames = []
+    offset = 0
+    while offset < len(data):
+        (
+            sent_timestamp,
+            received_timestamp,
+            src_ip_address,
+            dst_ip_address,
+            ttl,
+            precedence,
+            agent_source,
+            data_status,
+            transport,
+            src_port,
+            dst_port,
+            icmp_type,
+            icmp_code,
+            identifier,
+            sequence,
+            num_flags,
+            addresses_length,
+            payload_length,
+        ) = _BINARY_HEADER.unpack_from(data, offset)
+        offset += _BINARY_HEADER.size
+        flags = list(data[offset : offset + num_flags])
+        offset += num_flags
+        src_mac_addr, dst_mac_addr, protocol = data[offset : offset + addresses_length].decode().split("\x00")
+        offset += addresses_length
+        payload = json.loads(data[offset : offset + payload_length]) if payload_length else None
+        offset += payload_length
+
+        frames.append(
+            {
+                "ethernet": {"src_mac_addr": src_mac_addr, "dst_mac_addr": dst_mac_addr},
+                "ip": {
+                    "src_ip_address": str(IPv4Address(src_ip_address)),
+                    "dst_ip_address": str(IPv4Address(dst_ip_address)),
+                    "protocol": protocol,
+                    "ttl": ttl,
+                    "precedence": precedence,
+                },
+                "tcp": {"src_port": src_port, "dst_port": dst_port, "flags": flags} if transport & _TCP else None,
+                "udp": {"src_port": src_port, "dst_port": dst_port} if transport & _UDP else None,
+                "icmp": (
+                    {"icmp_type": icmp_type, "icmp_code": icmp_code, "identifier": identifier, "sequence": sequence}
+                    if transport & _ICMP
+                    else None
+                ),
+                "primaite": {"agent_source": agent_source, "data_status": data_status},
+                "payload": payload,
+                "sent_timestamp": _decode_timestamp(sent_timestamp),
+                "received_timestamp": _decode_timestamp(received_timestamp),
+            }
+        )
+    return frames
 
 
 class PacketCapture:
     """
     Represents a PacketCapture component on a Node in the simulation environment.
 
-    PacketCapture is a service that logs Frames as json strings; It's Wireshark for PrimAITE.
+    PacketCapture is a service that logs Frames; It's Wireshark for PrimAITE. Frames are saved either as JSON lines or
+    as compact binary records, depending on ``SIM_OUTPUT.pcap_format``, and are written to file by a background thread.
 
-    The PCAPs are logged to: <simulation output directory>/<hostname>/<hostname>_<ip address>_pcap.log
+    The PCAPs are logged to: <simulation output directory>/<hostname>/<hostname>_<ip address>_pcap.log, or to a file
+    with a .bin extension rather than .log when they are saved as binary records.
     """
 
-    _logger_instances: List[logging.Logger] = []
-
     def __init__(
         self,
         hostname: str,
@@ -47,47 +292,57 @@ class PacketCapture:
         self.port_name = port_name
         "The interface name on the Node."
 
-        self.inbound_logger = None
-        self.outbound_logger = None
+        self.pcap_format: str = SIM_OUTPUT.pcap_format
+        "The format the PCAP logs are saved in, either 'json' or 'binary'."
+
+        self.inbound_path: Optional[Path] = None
+        "Path of the inbound PCAP log, set once PCAP logs are saved."
+        self.outbound_path: Optional[Path] = None
+        "Path of the outbound PCAP log, set once PCAP logs are saved."
 
         self.current_episode: int = 1
 
         if SIM_OUTPUT.save_pcap_logs:
-            self.setup_logger(outbound=False)
-            self.setup_logger(outbound=True)
-
-    def setup_logger(self, outbound: bool = False):
-        """Set up the logger configuration."""
-        log_path = self._get_log_path(outbound)
+            self.setup_log_file(outbound=False)
+            self.setup_log_file(outbound=True)
 
-        file_handler = logging.FileHandler(filename=log_path)
-        file_handler.setLevel(60)  # Custom log level > CRITICAL to prevent any unwanted standard DEBUG-CRITICAL logs
-
-        log_format = "%(message)s"
-        file_handler.setFormatter(logging.Formatter(log_format))
+    def setup_log_file(self, outbound: bool = False) -> Path:
+        """
+        Create the directory of the inbound or outbound PCAP log for the current episode, and log frames to it.
 
+        :param outbound: Whether to set up the outbound log rather than the inbound log.
+        :return: Path of the log.
+        """
+        log_path = self._get_log_path(outbound)
         if outbound:
-            self.outbound_logger = logging.getLogger(self._get_logger_name(outbound))
-            PacketCapture._logger_instances.append(self.outbound_logger)
-            logger = self.outbound_logger
+            self.outbound_path = log_path
         else:
-            self.inbound_logger = logging.getLogger(self._get_logger_name(outbound))
-            logger = self.inbound_logger
-            PacketCapture._logger_instances.append(self.inbound_logger)
+            self.inbound_path = log_path
+        return log_path
 
-        logger.setLevel(60)  # Custom log level > CRITICAL to prevent any unwanted standard DEBUG-CRITICAL logs
-        logger.addHandler(file_handler)
+    def read(self, outbound: bool = False) -> List[Dict[str, Any]]:
+        """
+        Read packet capture logs and return them as a list of dictionaries.
 
-        logger.addFilter(_JSONFilter())
+        :param outbound: Whether to read the outbound log rather than the inbound log.
+        :return: List of frames captured, represented as dictionaries.
+        """
+        _PCAP_WRITER.flush()
+        return self.read_file(self._get_log_path(outbound))
 
-    def read(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def read_file(path: Path) -> List[Dict[str, Any]]:
         """
-        Read packet capture logs and return them as a list of dictionaries.
+        Read a PCAP log file saved in either format, and return its frames as a list of dictionaries.
 
+        :param path: Path of the PCAP log. Files with a .bin extension are read as binary records.
         :return: List of frames captured, represented as dictionaries.
         """
+        if Path(path).suffix == ".bin":
+            with open(path, "rb") as file:
+                return decode_binary_records(file.read())
         frames = []
-        with open(self._get_log_path(), "r") as file:
+        with open(path, "r") as file:
             while line := file.readline():
                 frames.append(json.loads(line.rstrip()))
         return frames
@@ -106,7 +361,14 @@ class PacketCapture:
         """Get the path for the log file."""
         root = SIM_OUTPUT.path / f"episode_{self.current_episode}" / self.hostname
         root.mkdir(exist_ok=True, parents=True)
-        return root / f"{self._get_logger_name(outbound)}.log"
+        extension = "bin" if self.pcap_format == "binary" else "log"
+        return root / f"{self._get_logger_name(outbound)}.{extension}"
+
+    def _encode(self, frame) -> bytes:  # noqa - I'll have a circular import and cant use if TYPE_CHECKING ;(
+        """Encode a Frame as a record in the format of the PCAP logs."""
+        if self.pcap_format == "binary":
+            return encode_binary_record(frame)
+        return (frame.model_dump_json() + "\n").encode()
 
     def capture_inbound(self, frame):  # noqa - I'll have a circular import and cant use if TYPE_CHECKING ;(
         """
@@ -115,8 +377,7 @@ class PacketCapture:
         :param frame: The PCAP frame to capture.
         """
         if SIM_OUTPUT.save_pcap_logs:
-            msg = frame.model_dump_json()
-            self.inbound_logger.log(level=60, msg=msg)  # Log at custom log level > CRITICAL
+            _PCAP_WRITER.write(self.inbound_path or self.setup_log_file(outbound=False), self._encode(frame))
 
     def capture_outbound(self, frame):  # noqa - I'll have a circular import and cant use if TYPE_CHECKING ;(
         """
@@ -125,15 +386,9 @@ class PacketCapture:
         :param frame: The PCAP frame to capture.
         """
         if SIM_OUTPUT.save_pcap_logs:
-            msg = frame.model_dump_json()
-            self.outbound_logger.log(level=60, msg=msg)  # Log at custom log level > CRITICAL
+            _PCAP_WRITER.write(self.outbound_path or self.setup_log_file(outbound=True), self._encode(frame))
 
     @staticmethod
     def clear():
-        """Close all open PCAP file handlers."""
-        for logger in PacketCapture._logger_instances:
-            handlers = logger.handlers[:]
-            for handler in handlers:
-                logger.removeHandler(handler)
-                handler.close()
-        PacketCapture._logger_instances = []
+        """Write all captured frames to file, and close the open PCAP log files."""
+        _PCAP_WRITER.close()
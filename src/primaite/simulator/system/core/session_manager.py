@@ -1,6 +1,7 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from __future__ import annotations
 
+from collections import OrderedDict
 from ipaddress import IPv4Address, IPv4Network
 from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING, Union
 
@@ -9,9 +10,19 @@ from prettytable import MARKDOWN, PrettyTable
 from primaite.simulator.core import SimComponent
 from primaite.simulator.network.protocols.arp import ARPPacket
 from primaite.simulator.network.protocols.icmp import ICMPPacket
-from primaite.simulator.network.transmission.data_link_layer import EthernetHeader, Frame
-from primaite.simulator.network.transmission.network_layer import IPPacket
-from primaite.simulator.network.transmission.transport_layer import TCPHeader, UDPHeader
+from primaite.simulator.network.transmission.data_link_layer import (
+    CompactEthernetHeader,
+    CompactFrame,
+    EthernetHeader,
+    Frame,
+)
+from primaite.simulator.network.transmission.network_layer import CompactIPPacket, IPPacket
+from primaite.simulator.network.transmission.transport_layer import (
+    CompactTCPHeader,
+    CompactUDPHeader,
+    TCPHeader,
+    UDPHeader,
+)
 from primaite.utils.validation.ip_protocol import IPProtocol, PROTOCOL_LOOKUP
 from primaite.utils.validation.port import Port, PORT_LOOKUP
 
@@ -34,6 +45,7 @@ class Session(SimComponent):
     :param src_port: The source port number (optional).
     :param dst_port: The destination port number (optional).
     :param connected: A flag indicating whether the session is connected.
+    :param last_active_timestep: The timestep at which a frame was last sent or received on the session.
     """
 
     protocol: str
@@ -41,6 +53,7 @@ class Session(SimComponent):
     src_port: Optional[Port]
     dst_port: Optional[Port]
     connected: bool = False
+    last_active_timestep: int = 0
 
     @classmethod
     def from_session_key(cls, session_key: Tuple[IPProtocol, IPv4Address, Optional[Port], Optional[Port]]) -> Session:
@@ -74,17 +87,41 @@ class SessionManager:
     """
     Manages network sessions, including session creation, lookup, and communication with other components.
 
+    Sessions are held in least recently used order. A session that has seen no traffic for more than
+    ``idle_timeout`` timesteps is expired at the next timestep, and once ``max_sessions`` sessions are open the least
+    recently used session is evicted to make room for a new one. Both limits are disabled when set to None.
+
     :param sys_log: A reference to the system log component.
+    :param idle_timeout: Number of timesteps a session may be idle before it is expired. Optional.
+    :param max_sessions: Maximum number of sessions held before the least recently used is evicted. Optional.
+    """
+
+    compact_frames: bool = False
+    """
+    Whether to transmit :py:class:`CompactFrame` instances, which skip pydantic validation, instead of
+    :py:class:`Frame` instances. Applies to all session managers.
     """
 
-    def __init__(self, sys_log: SysLog):
-        self.sessions_by_key: Dict[
+    def __init__(self, sys_log: SysLog, idle_timeout: Optional[int] = None, max_sessions: Optional[int] = None):
+        self.sessions_by_key: OrderedDict[
             Tuple[IPProtocol, IPv4Address, IPv4Address, Optional[Port], Optional[Port]], Session
-        ] = {}
+        ] = OrderedDict()
         self.sessions_by_uuid: Dict[str, Session] = {}
         self.sys_log: SysLog = sys_log
         self.software_manager: SoftwareManager = None  # Noqa
         self.node: Node = None  # noqa
+        self.idle_timeout: Optional[int] = idle_timeout
+        self.max_sessions: Optional[int] = max_sessions
+        self.current_timestep: int = 0
+        self.sessions_expired: int = 0
+        "Number of sessions removed because they were idle for longer than ``idle_timeout``."
+        self.sessions_evicted: int = 0
+        "Number of sessions removed to keep the table within ``max_sessions``."
+
+    @property
+    def num_sessions(self) -> int:
+        """The number of sessions currently held in the session table."""
+        return len(self.sessions_by_key)
 
     def describe_state(self) -> Dict:
         """
@@ -102,6 +139,57 @@ class SessionManager:
         self.sessions_by_key.clear()
         self.sessions_by_uuid.clear()
 
+    def apply_timestep(self, timestep: int) -> None:
+        """
+        Record the current timestep and expire any sessions that have been idle for longer than ``idle_timeout``.
+
+        :param timestep: The current timestep number.
+        """
+        self.current_timestep = timestep
+        if self.idle_timeout is None:
+            return
+        # Sessions are kept in least recently used order, so only the stale head of the table needs visiting
+        while self.sessions_by_key:
+            session_key, session = next(iter(self.sessions_by_key.items()))
+            if timestep - session.last_active_timestep <= self.idle_timeout:
+                break
+            self._remove_session(session_key)
+            self.sessions_expired += 1
+
+    def _remove_session(self, session_key: Tuple[IPProtocol, IPv4Address, Optional[Port], Optional[Port]]) -> None:
+        """
+        Remove a session from the session table.
+
+        :param session_key: The key of the session to remove.
+        """
+        session = self.sessions_by_key.pop(session_key)
+        self.sessions_by_uuid.pop(session.uuid, None)
+
+    def _get_or_create_session(
+        self, session_key: Tuple[IPProtocol, IPv4Address, Optional[Port], Optional[Port]]
+    ) -> Session:
+        """
+        Get the session for a session key, creating it if it does not exist, and mark it as active.
+
+        If creating the session would exceed ``max_sessions``, the least recently used session is evicted first.
+
+        :param session_key: The key of the session.
+        :return: The active session.
+        """
+        session = self.sessions_by_key.get(session_key)
+        if session:
+            self.sessions_by_key.move_to_end(session_key)
+        else:
+            if self.max_sessions is not None:
+                while self.sessions_by_key and len(self.sessions_by_key) >= self.max_sessions:
+                    self._remove_session(next(iter(self.sessions_by_key)))
+                    self.sessions_evicted += 1
+            session = Session.from_session_key(session_key)
+            self.sessions_by_key[session_key] = session
+            self.sessions_by_uuid[session.uuid] = session
+        session.last_active_timestep = self.current_timestep
+        return session
+
     @staticmethod
     def _get_session_key(
         frame: Frame, inbound_frame: bool = True
@@ -161,9 +249,9 @@ class SessionManager:
             or the default gateway's network interface if the destination is not within any local subnet.
         :rtype: Optional["NetworkInterface"]
         """
-        for network_interface in self.node.network_interfaces.values():
-            if dst_ip_address in network_interface.ip_network and network_interface.enabled:
-                return network_interface
+        network_interface = self.node._interface_index.get_interface_in_subnet(dst_ip_address, enabled_only=True)
+        if network_interface:
+            return network_interface
         return self.software_manager.arp.get_default_gateway_network_interface()
 
     def resolve_outbound_transmission_details(
@@ -220,12 +308,15 @@ class SessionManager:
 
         # Use session details if session_id is provided
         if session_id:
-            session = self.sessions_by_uuid[session_id]
-
-            dst_ip_address = session.with_ip_address
-            protocol = session.protocol
-            src_port = session.src_port
-            dst_port = session.dst_port
+            session = self.sessions_by_uuid.get(session_id)
+            if session:
+                dst_ip_address = session.with_ip_address
+                protocol = session.protocol
+                src_port = session.src_port
+                dst_port = session.dst_port
+            elif dst_ip_address is None:
+                # The session has expired or been evicted, leaving nowhere to send to
+                return None, None, None, src_port, dst_port, protocol, False
 
         # Determine if the payload is for broadcast or unicast
 
@@ -235,18 +326,16 @@ class SessionManager:
             dst_ip_address = dst_ip_address.broadcast_address
             if dst_ip_address:
                 # Find a suitable NIC for the broadcast
-                for network_interface in self.node.network_interfaces.values():
-                    if dst_ip_address in network_interface.ip_network and network_interface.enabled:
-                        dst_mac_address = "ff:ff:ff:ff:ff:ff"
-                        outbound_network_interface = network_interface
-                        break
+                outbound_network_interface = self.node._interface_index.get_interface_in_subnet(
+                    dst_ip_address, enabled_only=True
+                )
+                if outbound_network_interface:
+                    dst_mac_address = "ff:ff:ff:ff:ff:ff"
         else:
             # Resolve MAC address for unicast transmission
             use_default_gateway = True
-            for network_interface in self.node.network_interfaces.values():
-                if dst_ip_address in network_interface.ip_network and network_interface.enabled:
-                    dst_mac_address = self.software_manager.arp.get_arp_cache_mac_address(dst_ip_address)
-                    break
+            if self.node._interface_index.get_interface_in_subnet(dst_ip_address, enabled_only=True):
+                dst_mac_address = self.software_manager.arp.get_arp_cache_mac_address(dst_ip_address)
 
             if dst_mac_address:
                 use_default_gateway = False
@@ -318,15 +407,73 @@ class SessionManager:
                 "Failed to resolve src or dst port. Have you sent the port from the service or application?"
             )
 
+        frame = self._build_frame(
+            src_mac_address=outbound_network_interface.mac_address,
+            dst_mac_address=dst_mac_address,
+            src_ip_address=outbound_network_interface.ip_address,
+            dst_ip_address=dst_ip_address,
+            ip_protocol=ip_protocol,
+            dst_port=dst_port,
+            icmp_packet=icmp_packet,
+            payload=payload,
+        )
+
+        # Manage session for unicast transmission
+        # TODO: Only create sessions for TCP
+        if not (is_broadcast and session_id):
+            self._get_or_create_session(self._get_session_key(frame, inbound_frame=False))
+
+        # Send the frame through the NIC
+        sent = outbound_network_interface.send_frame(frame)
+        # Deliver the frame and any frames sent in response before returning, as software expects replies to have
+        # arrived by the time its send returns.
+        if outbound_network_interface.frame_queue is not None:
+            outbound_network_interface.frame_queue.flush()
+        return sent
+
+    def _build_frame(
+        self,
+        src_mac_address: str,
+        dst_mac_address: str,
+        src_ip_address: IPv4Address,
+        dst_ip_address: IPv4Address,
+        ip_protocol: IPProtocol,
+        dst_port: Optional[Port],
+        icmp_packet: Optional[ICMPPacket],
+        payload: Any,
+    ) -> Union[Frame, CompactFrame]:
+        """
+        Construct a frame for transmission.
+
+        A :py:class:`CompactFrame` is built if ``compact_frames`` is enabled, otherwise a :py:class:`Frame` is built.
+
+        :return: The frame to transmit.
+        """
+        if self.compact_frames:
+            ethernet_header_cls, ip_packet_cls, tcp_header_cls, udp_header_cls, frame_cls = (
+                CompactEthernetHeader,
+                CompactIPPacket,
+                CompactTCPHeader,
+                CompactUDPHeader,
+                CompactFrame,
+            )
+        else:
+            ethernet_header_cls, ip_packet_cls, tcp_header_cls, udp_header_cls, frame_cls = (
+                EthernetHeader,
+                IPPacket,
+                TCPHeader,
+                UDPHeader,
+                Frame,
+            )
         tcp_header = None
         udp_header = None
         if ip_protocol == PROTOCOL_LOOKUP["TCP"]:
-            tcp_header = TCPHeader(
+            tcp_header = tcp_header_cls(
                 src_port=dst_port,
                 dst_port=dst_port,
             )
         elif ip_protocol == PROTOCOL_LOOKUP["UDP"]:
-            udp_header = UDPHeader(
+            udp_header = udp_header_cls(
                 src_port=dst_port,
                 dst_port=dst_port,
             )
@@ -338,11 +485,10 @@ class SessionManager:
         #         dst_ip_address=dst_ip_address,
         #         protocol=ip_protocol
         #     )
-        # Construct the frame for transmission
-        frame = Frame(
-            ethernet=EthernetHeader(src_mac_addr=outbound_network_interface.mac_address, dst_mac_addr=dst_mac_address),
-            ip=IPPacket(
-                src_ip_address=outbound_network_interface.ip_address,
+        return frame_cls(
+            ethernet=ethernet_header_cls(src_mac_addr=src_mac_address, dst_mac_addr=dst_mac_address),
+            ip=ip_packet_cls(
+                src_ip_address=src_ip_address,
                 dst_ip_address=dst_ip_address,
                 protocol=ip_protocol,
             ),
@@ -352,20 +498,6 @@ class SessionManager:
             payload=payload,
         )
 
-        # Manage session for unicast transmission
-        # TODO: Only create sessions for TCP
-        if not (is_broadcast and session_id):
-            session_key = self._get_session_key(frame, inbound_frame=False)
-            session = self.sessions_by_key.get(session_key)
-            if not session:
-                # Create a new session if it doesn't exist
-                session = Session.from_session_key(session_key)
-                self.sessions_by_key[session_key] = session
-                self.sessions_by_uuid[session.uuid] = session
-
-        # Send the frame through the NIC
-        return outbound_network_interface.send_frame(frame)
-
     def receive_frame(self, frame: Frame, from_network_interface: "NetworkInterface"):
         """
         Receive a Frame.
@@ -376,13 +508,7 @@ class SessionManager:
         :param frame: The frame being received.
         """
         # TODO: Only create sessions for TCP
-        session_key = self._get_session_key(frame, inbound_frame=True)
-        session: Session = self.sessions_by_key.get(session_key)
-        if not session:
-            # Create new session
-            session = Session.from_session_key(session_key)
-            self.sessions_by_key[session_key] = session
-            self.sessions_by_uuid[session.uuid] = session
+        session = self._get_or_create_session(self._get_session_key(frame, inbound_frame=True))
         dst_port = None
         if frame.tcp:
             dst_port = frame.tcp.dst_port
@@ -53,6 +53,10 @@ class SoftwareManager:
         self.software: Dict[str, Union[Service, Application]] = {}
         self._software_class_to_name_map: Dict[Type[IOSoftware], str] = {}
         self.port_protocol_mapping: Dict[Tuple[Port, IPProtocol], Union[Service, Application]] = {}
+        self._software_by_port_protocol: Dict[Tuple[Port, IPProtocol], List[IOSoftware]] = {}
+        """Installed software by the port and protocol it currently operates on."""
+        self._listeners_by_port: Dict[Port, List[IOSoftware]] = {}
+        """Installed software by each of the ports it listens on."""
         self.sys_log: SysLog = sys_log
         self.file_system: FileSystem = file_system
         self.dns_server: Optional[IPv4Address] = dns_server
@@ -85,9 +89,9 @@ class SoftwareManager:
         """
         Check if a specific port is open and running a service using the specified protocol.
 
-        This method iterates through all installed software on the node and checks if any of them
-        are using the specified port and protocol and are currently in a running state. It returns True if any software
-        is found running on the specified port and protocol, otherwise False.
+        This method checks whether any installed software on the node is using the specified port and protocol and is
+        currently in a running state. It returns True if any software is found running on the specified port and
+        protocol, otherwise False.
 
 
         :param port: The port to check.
@@ -97,15 +101,27 @@ class SoftwareManager:
         :return: True if the port is open and a service is running on it using the specified protocol, False otherwise.
         :rtype: bool
         """
-        for software in self.software.values():
-            if (
-                software.port == port
-                and software.protocol == protocol
-                and software.operating_state in {ApplicationOperatingState.RUNNING, ServiceOperatingState.RUNNING}
-            ):
+        for software in self._software_by_port_protocol.get((port, protocol), ()):
+            if software.operating_state in {ApplicationOperatingState.RUNNING, ServiceOperatingState.RUNNING}:
                 return True
         return False
 
+    def _index_ports(self) -> None:
+        """
+        Rebuild the indexes of installed software by port, which are used to dispatch payloads and check open ports.
+
+        This is called when software is installed or uninstalled, and by installed software when its port, protocol or
+        listening ports are changed.
+        """
+        software_by_port_protocol = {}
+        listeners_by_port = {}
+        for software in self.software.values():
+            software_by_port_protocol.setdefault((software.port, software.protocol), []).append(software)
+            for port in software.listen_on_ports:
+                listeners_by_port.setdefault(port, []).append(software)
+        self._software_by_port_protocol = software_by_port_protocol
+        self._listeners_by_port = listeners_by_port
+
     def install(self, software_class: Type[IOSoftware], software_config: Optional[IOSoftware.ConfigSchema] = None):
         """
         Install an Application or Service.
@@ -113,7 +129,7 @@ class SoftwareManager:
         :param software_class: The software class.
         """
         if software_class in self._software_class_to_name_map:
-            self.sys_log.warning(f"Cannot install {software_class} as it is already installed")
+            self.sys_log.warning("Cannot install %s as it is already installed", software_class)
             return
         if software_config is None:
             software = software_class(
@@ -145,9 +161,10 @@ class SoftwareManager:
         software.software_manager = self
         self.software[software.name] = software
         self.port_protocol_mapping[(software.port, software.protocol)] = software
+        self._index_ports()
         if isinstance(software, Application):
             software.operating_state = ApplicationOperatingState.CLOSED
-        self.node.sys_log.info(f"Installed {software.name}")
+        self.node.sys_log.info("Installed %s", software.name)
 
     def uninstall(self, software_name: str):
         """
@@ -156,7 +173,7 @@ class SoftwareManager:
         :param software_name: The software name.
         """
         if software_name not in self.software:
-            self.sys_log.error(f"Cannot uninstall {software_name} as it is not installed")
+            self.sys_log.error("Cannot uninstall %s as it is not installed", software_name)
             return
 
         self.software[software_name].uninstall()
@@ -177,8 +194,9 @@ class SoftwareManager:
             if value == software_name:
                 self._software_class_to_name_map.pop(key)
                 break
+        self._index_ports()
         del software
-        self.sys_log.info(f"Uninstalled {software_name}")
+        self.sys_log.info("Uninstalled %s", software_name)
         return
 
     def send_internal_payload(self, target_software: str, payload: Any):
@@ -193,7 +211,7 @@ class SoftwareManager:
         if receiver:
             receiver.receive_payload(payload)
         else:
-            self.sys_log.warning(f"No Service of Application found with the name {target_software}")
+            self.sys_log.warning("No Service of Application found with the name %s", target_software)
 
     def send_payload_to_session_manager(
         self,
@@ -238,7 +256,9 @@ class SoftwareManager:
         """
         Receive a payload from the SessionManager and forward it to the corresponding service or applications.
 
-        This function handles both software assigned a specific port, and software listening in on other ports.
+        This function handles both software assigned a specific port, and software listening in on other ports. The
+        payload is passed on without being copied, other than to listening software which sets
+        ``copy_listened_payloads``.
 
         :param payload: The payload being received.
         :param session: The transport session the payload originates from.
@@ -251,20 +271,18 @@ class SoftwareManager:
             main_receiver.receive(
                 payload=payload, session_id=session_id, from_network_interface=from_network_interface, frame=frame
             )
-        listening_receivers = [
-            software
-            for software in self.software.values()
-            if port in software.listen_on_ports and software != main_receiver
-        ]
+        listening_receivers = self._listeners_by_port.get(port, ())
         for receiver in listening_receivers:
+            if receiver is main_receiver:
+                continue
             receiver.receive(
-                payload=deepcopy(payload),
+                payload=deepcopy(payload) if receiver.copy_listened_payloads else payload,
                 session_id=session_id,
                 from_network_interface=from_network_interface,
                 frame=frame,
             )
         if not main_receiver and not listening_receivers:
-            self.sys_log.warning(f"No service or application found for port {port} and protocol {protocol}")
+            self.sys_log.warning("No service or application found for port %s and protocol %s", port, protocol)
 
     def show(self, markdown: bool = False):
         """
@@ -1,6 +1,7 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 import logging
 from pathlib import Path
+from typing import Any, Tuple
 
 from prettytable import MARKDOWN, PrettyTable
 
@@ -23,6 +24,10 @@ class SysLog:
     A SysLog class is a simple logger dedicated to managing and writing system logs for a Node.
 
     Each log message is written to a file located at: <simulation output directory>/<hostname>/<hostname>_sys.log
+
+    Messages can be given as a %-style format string followed by the values to format it with, in which case the
+    message is only formatted if it is output. While sys logs are neither saved nor written to the terminal, each log
+    call returns after a single comparison.
     """
 
     def __init__(self, hostname: str):
@@ -95,72 +100,71 @@ class SysLog:
         if to_terminal or SIM_OUTPUT.write_sys_log_to_terminal:
             print(f"{self.hostname}: ({level}) {msg}")
 
-    def debug(self, msg: str, to_terminal: bool = False):
+    def _log(self, level: LogLevel, msg: str, args: Tuple[Any, ...], to_terminal: bool) -> None:
+        if SIM_OUTPUT.sys_log_level > level:
+            return
+        if args:
+            msg = msg % args
+        if SIM_OUTPUT.save_sys_logs:
+            self.logger.log(level, msg)
+        self._write_to_terminal(msg, level.name, to_terminal)
+
+    def debug(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the DEBUG level.
 
-        :param msg: The message to be logged.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.sys_log_level > LogLevel.DEBUG:
+        if SIM_OUTPUT.sys_log_threshold > LogLevel.DEBUG and not to_terminal:
             return
+        self._log(LogLevel.DEBUG, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_sys_logs:
-            self.logger.debug(msg)
-        self._write_to_terminal(msg, "DEBUG", to_terminal)
-
-    def info(self, msg: str, to_terminal: bool = False):
+    def info(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the INFO level.
 
-        :param msg: The message to be logged.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.sys_log_level > LogLevel.INFO:
+        if SIM_OUTPUT.sys_log_threshold > LogLevel.INFO and not to_terminal:
             return
+        self._log(LogLevel.INFO, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_sys_logs:
-            self.logger.info(msg)
-        self._write_to_terminal(msg, "INFO", to_terminal)
-
-    def warning(self, msg: str, to_terminal: bool = False):
+    def warning(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the WARNING level.
 
-        :param msg: The message to be logged.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.sys_log_level > LogLevel.WARNING:
+        if SIM_OUTPUT.sys_log_threshold > LogLevel.WARNING and not to_terminal:
             return
+        self._log(LogLevel.WARNING, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_sys_logs:
-            self.logger.warning(msg)
-        self._write_to_terminal(msg, "WARNING", to_terminal)
-
-    def error(self, msg: str, to_terminal: bool = False):
+    def error(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the ERROR level.
 
-        :param msg: The message to be logged.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if SIM_OUTPUT.sys_log_level > LogLevel.ERROR:
+        if SIM_OUTPUT.sys_log_threshold > LogLevel.ERROR and not to_terminal:
             return
+        self._log(LogLevel.ERROR, msg, args, to_terminal)
 
-        if SIM_OUTPUT.save_sys_logs:
-            self.logger.error(msg)
-        self._write_to_terminal(msg, "ERROR", to_terminal)
-
-    def critical(self, msg: str, to_terminal: bool = False):
+    def critical(self, msg: str, *args: Any, to_terminal: bool = False):
         """
         Logs a message with the CRITICAL level.
 
-        :param msg: The message to be logged.
+        :param msg: The message to be logged. If ``args`` are given, it is a %-style format string.
+        :param args: Values to format the message with. They are only formatted if the message is output.
         :param to_terminal: If True, prints to the terminal too.
         """
-        if LogLevel.CRITICAL < SIM_OUTPUT.sys_log_level:
+        if SIM_OUTPUT.sys_log_threshold > LogLevel.CRITICAL and not to_terminal:
             return
-
-        if SIM_OUTPUT.save_sys_logs:
-            self.logger.critical(msg)
-        self._write_to_terminal(msg, "CRITICAL", to_terminal)
+        self._log(LogLevel.CRITICAL, msg, args, to_terminal)
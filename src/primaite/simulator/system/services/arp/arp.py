@@ -94,11 +94,10 @@ class ARP(Service, discriminator="arp"):
         :param network_interface: The NIC through which the NIC with the IP address is reachable.
         :param override: If True, an existing entry for the IP address will be overridden. Default is False.
         """
-        for _network_interface in self.software_manager.node.network_interfaces.values():
-            if _network_interface.ip_address == ip_address:
-                return
+        if ip_address in self.software_manager.node._interface_index.ip_addresses:
+            return
         if override or not self.arp.get(ip_address):
-            self.sys_log.info(f"Adding ARP cache entry for {mac_address}/{ip_address} via NIC {network_interface}")
+            self.sys_log.info("Adding ARP cache entry for %s/%s via NIC %s", mac_address, ip_address, network_interface)
             arp_entry = ARPEntry(mac_address=mac_address, network_interface_uuid=network_interface.uuid)
 
             self.arp[ip_address] = arp_entry
@@ -132,13 +131,7 @@ class ARP(Service, discriminator="arp"):
         if target_ip_address in self.arp:
             return
 
-        use_default_gateway = True
-        for network_interface in self.software_manager.node.network_interfaces.values():
-            if target_ip_address in network_interface.ip_network:
-                use_default_gateway = False
-                break
-
-        if use_default_gateway:
+        if self.software_manager.node._interface_index.get_interface_in_subnet(target_ip_address) is None:
             if self.software_manager.node.config.default_gateway:
                 target_ip_address = self.software_manager.node.config.default_gateway
             else:
@@ -150,13 +143,15 @@ class ARP(Service, discriminator="arp"):
         if outbound_network_interface:
             # ensure we are not attempting to find the network address or broadcast address (not useable IPs)
             if target_ip_address == outbound_network_interface.ip_network.network_address:
-                self.sys_log.info(f"Cannot send ARP request to a network address {str(target_ip_address)}")
+                self.sys_log.info("Cannot send ARP request to a network address %s", target_ip_address)
                 return
             if target_ip_address == outbound_network_interface.ip_network.broadcast_address:
-                self.sys_log.info(f"Cannot send ARP request to a broadcast address {str(target_ip_address)}")
+                self.sys_log.info("Cannot send ARP request to a broadcast address %s", target_ip_address)
                 return
 
-            self.sys_log.info(f"Sending ARP request from NIC {outbound_network_interface} for ip {target_ip_address}")
+            self.sys_log.info(
+                "Sending ARP request from NIC %s for ip %s", outbound_network_interface, target_ip_address
+            )
             arp_packet = ARPPacket(
                 sender_ip_address=outbound_network_interface.ip_address,
                 sender_mac_addr=outbound_network_interface.mac_address,
@@ -182,8 +177,11 @@ class ARP(Service, discriminator="arp"):
         )
         if outbound_network_interface:
             self.sys_log.info(
-                f"Sending ARP reply from {arp_reply.sender_mac_addr}/{arp_reply.sender_ip_address} "
-                f"to {arp_reply.target_ip_address}/{arp_reply.target_mac_addr} "
+                "Sending ARP reply from %s/%s to %s/%s ",
+                arp_reply.sender_mac_addr,
+                arp_reply.sender_ip_address,
+                arp_reply.target_ip_address,
+                arp_reply.target_mac_addr,
             )
             self.software_manager.session_manager.receive_payload_from_software_manager(
                 payload=arp_reply,
@@ -206,8 +204,10 @@ class ARP(Service, discriminator="arp"):
         :param from_network_interface: The NIC that received the ARP request.
         """
         self.sys_log.info(
-            f"Received ARP request for {arp_packet.target_ip_address} from "
-            f"{arp_packet.sender_mac_addr}/{arp_packet.sender_ip_address} "
+            "Received ARP request for %s from %s/%s ",
+            arp_packet.target_ip_address,
+            arp_packet.sender_mac_addr,
+            arp_packet.sender_ip_address,
         )
 
     def _process_arp_reply(self, arp_packet: ARPPacket, from_network_interface: NetworkInterface):
@@ -218,8 +218,10 @@ class ARP(Service, discriminator="arp"):
         :param from_network_interface: The NIC that received the ARP reply.
         """
         self.sys_log.info(
-            f"Received ARP response for {arp_packet.sender_ip_address} "
-            f"from {arp_packet.sender_mac_addr} via Network Interface {from_network_interface}"
+            "Received ARP response for %s from %s via Network Interface %s",
+            arp_packet.sender_ip_address,
+            arp_packet.sender_mac_addr,
+            from_network_interface,
         )
         self.add_arp_cache_entry(
             ip_address=arp_packet.sender_ip_address,
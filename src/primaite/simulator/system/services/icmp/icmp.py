@@ -134,7 +134,7 @@ class ICMP(Service, discriminator="icmp"):
         """
         if frame.ip.dst_ip_address != from_network_interface.ip_address:
             return
-        self.sys_log.info(f"Received echo request from {frame.ip.src_ip_address}")
+        self.sys_log.info("Received echo request from %s", frame.ip.src_ip_address)
 
         network_interface = self.software_manager.session_manager.resolve_outbound_network_interface(
             frame.ip.src_ip_address
@@ -154,7 +154,7 @@ class ICMP(Service, discriminator="icmp"):
             sequence=frame.icmp.sequence + 1,
         )
         payload = secrets.token_urlsafe(int(32 / 1.3))  # Standard ICMP 32 bytes size
-        self.sys_log.info(f"Sending echo reply to {frame.ip.dst_ip_address}")
+        self.sys_log.info("Sending echo reply to %s", frame.ip.dst_ip_address)
 
         self.software_manager.session_manager.receive_payload_from_software_manager(
             payload=payload,
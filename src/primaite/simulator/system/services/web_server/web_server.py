@@ -108,6 +108,7 @@ class WebServer(Service, discriminator="web-server"):
 
         # return true if response is OK
         self.response_codes_this_timestep.append(response.status_code)
+        self.invalidate_state()
         return response.status_code == HttpStatusCode.OK
 
     def _handle_get_request(self, payload: HttpRequestPacket) -> HttpResponsePacket:
@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from ipaddress import IPv4Address, IPv4Network
-from typing import Any, Dict, Optional, Set, TYPE_CHECKING, Union
+from typing import Any, ClassVar, Dict, Optional, Set, TYPE_CHECKING, Union
 
 from prettytable import MARKDOWN, PrettyTable
 from pydantic import BaseModel, ConfigDict, Field
@@ -111,6 +111,8 @@ class Software(SimComponent, ABC):
     "The folder on the file system the Software uses."
     _fixing_countdown: Optional[int] = None
     "Current number of ticks left to patch the software."
+    state_caching: ClassVar[bool] = True
+    "Software state rarely changes between timesteps, so it is cached until the software is modified."
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -272,16 +274,37 @@ class IOSoftware(Software, ABC):
     port: Port
     "The port to which the software is connected."
     listen_on_ports: Set[Port] = Field(default_factory=set)
-    "The set of ports to listen on."
+    """
+    The set of ports to listen on.
+
+    Assign a new set to change the ports rather than modifying the set in place, so that the software manager
+    dispatches payloads on the new ports to the software.
+    """
     protocol: IPProtocol
     "The IP Protocol the Software operates on."
     _connections: Dict[str, Dict] = {}
     "Active connections."
 
+    copy_listened_payloads: ClassVar[bool] = False
+    """
+    Whether payloads received on the ports in ``listen_on_ports`` are deep copied before being passed to the software.
+
+    Payloads are passed to the software that owns the port and to every software listening on the port without being
+    copied, so receivers must treat them as read only. Software which modifies or keeps the payloads it receives as a
+    listener must set this to True.
+    """
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.listen_on_ports = self.config.listen_on_ports
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "port" or name == "protocol" or name == "listen_on_ports":
+            software_manager = self.software_manager
+            if software_manager is not None:
+                software_manager._index_ports()
+
     @abstractmethod
     def describe_state(self) -> Dict:
         """
@@ -0,0 +1,111 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Storage of the actions every agent took at each step of an episode, written as the episode runs."""
+import atexit
+import json
+import threading
+import weakref
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Any, Dict, Final, Optional, TYPE_CHECKING, Union
+
+from primaite import getLogger
+
+if TYPE_CHECKING:
+    from primaite.game.agent.interface import AgentHistoryItem
+
+_LOGGER = getLogger(__name__)
+
+_BUFFER_SIZE: Final[int] = 2**20
+"""Size in Bytes of the write buffer of an agent action log."""
+
+_CLOSE: Final[object] = object()
+
+_OPEN_WRITERS: "weakref.WeakSet[AgentActionLogWriter]" = weakref.WeakSet()
+
+
+class AgentActionLogWriter:
+    """
+    Writes the actions of every agent at each step of an episode to a JSON lines file from a background thread.
+
+    Each line of the file is the record of one step: a dictionary with the ``"timestep"`` and ``"episode"``, and the
+    :py:class:`AgentHistoryItem` of each agent under its name. Writing a step only dumps its history items to
+    dictionaries and queues them, so that later changes to the items do not affect the log. The background thread
+    serialises the records and appends them to the file. Use :py:func:`read_agent_actions` to read the file. Any
+    existing file at the path is replaced when the first step is written.
+
+    :param path: Path of the agent action log.
+    :type path: Path
+    :param episode: Number of the episode whose actions are written.
+    :type episode: int
+    """
+
+    def __init__(self, path: Path, episode: int) -> None:
+        self.path: Path = path
+        self.episode: int = episode
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._closed: bool = False
+
+    def write(self, timestep: int, agent_actions: Dict[str, "AgentHistoryItem"]) -> None:
+        """
+        Queue the actions of the agents at a step to be written.
+
+        :param timestep: The step number.
+        :type timestep: int
+        :param agent_actions: The history item of the step of each agent, by agent name.
+        :type agent_actions: Dict[str, AgentHistoryItem]
+        """
+        if self._closed:
+            raise RuntimeError(f"Cannot write step {timestep} agent actions to {self.path} as the writer is closed.")
+        if self._thread is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _LOGGER.info(f"Saving agent action log to {self.path}")
+            self._thread = threading.Thread(target=self._run, name="agent-action-log-writer", daemon=True)
+            self._thread.start()
+            _OPEN_WRITERS.add(self)
+        record = {"timestep": timestep, "episode": self.episode}
+        record.update({name: item.model_dump() for name, item in agent_actions.items()})
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """Wait until every queued step has been written, and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_CLOSE)
+            self._thread.join()
+            _OPEN_WRITERS.discard(self)
+
+    def _run(self) -> None:
+        with open(self.path, "w", buffering=_BUFFER_SIZE) as file:
+            while (record := self._queue.get()) is not _CLOSE:
+                try:
+                    file.write(json.dumps(record) + "\n")
+                except Exception as e:
+                    _LOGGER.error(f"Failed to write step {record['timestep']} agent actions to {self.path}: {e}")
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    for writer in list(_OPEN_WRITERS):
+        writer.close()
+
+
+def read_agent_actions(path: Union[str, Path]) -> Dict[int, Dict[str, Any]]:
+    """
+    Read an agent action log written by :py:class:`AgentActionLogWriter`.
+
+    :param path: Path of the agent action log.
+    :type path: Union[str, Path]
+    :return: The record of each step, by step number. Each record has the ``"timestep"`` and ``"episode"``, and the
+        history item of each agent as a dictionary under its name.
+    :rtype: Dict[int, Dict[str, Any]]
+    """
+    actions = {}
+    with open(path, "r") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                actions[record["timestep"]] = record
+    return actions
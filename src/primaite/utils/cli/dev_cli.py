@@ -6,7 +6,7 @@ from rich.table import Table
 from typing_extensions import Annotated
 
 from primaite import _PRIMAITE_ROOT, PRIMAITE_CONFIG
-from primaite.simulator import LogLevel
+from primaite.simulator import LogLevel, SIM_OUTPUT
 from primaite.utils.cli.primaite_config_utils import is_dev_mode, update_primaite_application_config
 
 dev = typer.Typer()
@@ -58,6 +58,7 @@ def enable():
     # enable dev mode
     PRIMAITE_CONFIG["developer_mode"]["enabled"] = True
     update_primaite_application_config()
+    SIM_OUTPUT.refresh()
     print(DEVELOPER_MODE_MESSAGE)
 
 
@@ -67,6 +68,7 @@ def disable():
     # disable dev mode
     PRIMAITE_CONFIG["developer_mode"]["enabled"] = False
     update_primaite_application_config()
+    SIM_OUTPUT.refresh()
     print(PRODUCTION_MODE_MESSAGE)
 
 
@@ -150,6 +152,7 @@ def config_callback(
 
     # update application config
     update_primaite_application_config()
+    SIM_OUTPUT.refresh()
 
 
 config_typer = typer.Typer(
@@ -0,0 +1,167 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Timing instrumentation for the phases of a PrimAITE step."""
+import csv
+import json
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import ContextManager, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from primaite import getLogger
+
+_LOGGER = getLogger(__name__)
+
+_DISABLED_PHASE = nullcontext()
+"""Context manager returned for every phase while profiling is disabled, so disabled profiling costs one call."""
+
+
+class StepProfiler:
+    """
+    Records how long each phase of a step takes.
+
+    Time spent in a phase is accumulated over the course of a step, so a phase that is entered more than once in a step,
+    such as the timestep of each node of a type, is recorded as the total time spent in it during the step. Calling
+    :py:meth:`end_step` stores the accumulated timings as one sample per phase. Samples are kept for the current episode
+    until :py:meth:`end_episode` is called, and for the whole session.
+
+    While disabled, :py:meth:`phase` returns a shared no-op context manager and :py:meth:`record` returns immediately.
+
+    :param enabled: Whether timings are recorded.
+    :type enabled: bool
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self._step_timings: Dict[str, float] = {}
+        self._episode_steps: List[Dict[str, float]] = []
+        self._session_samples: Dict[str, List[float]] = {}
+
+    def phase(self, name: str) -> ContextManager:
+        """
+        Time the code run inside a ``with`` block as part of a phase.
+
+        :param name: Name of the phase.
+        :type name: str
+        :return: Context manager which times its block.
+        :rtype: ContextManager
+        """
+        if not self.enabled:
+            return _DISABLED_PHASE
+        return self._time_phase(name)
+
+    @contextmanager
+    def _time_phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Add time spent in a phase during the current step.
+
+        :param name: Name of the phase.
+        :type name: str
+        :param seconds: Time spent in the phase, in seconds.
+        :type seconds: float
+        """
+        if not self.enabled:
+            return
+        self._step_timings[name] = self._step_timings.get(name, 0.0) + seconds
+
+    def end_step(self) -> None:
+        """Store the timings accumulated during the current step and start a new step."""
+        if not self._step_timings:
+            return
+        for name, seconds in self._step_timings.items():
+            self._session_samples.setdefault(name, []).append(seconds)
+        self._episode_steps.append(self._step_timings)
+        self._step_timings = {}
+
+    def end_episode(self) -> None:
+        """Discard the samples of the current episode, keeping them in the session samples."""
+        self._step_timings = {}
+        self._episode_steps = []
+
+    def samples(self, episode_only: bool = False) -> Dict[str, List[float]]:
+        """
+        Get the recorded per-step timings of each phase, in seconds.
+
+        :param episode_only: Whether to only include samples from the current episode.
+        :type episode_only: bool
+        :return: Mapping from phase name to the time spent in that phase in each step it was entered.
+        :rtype: Dict[str, List[float]]
+        """
+        if not episode_only:
+            return self._session_samples
+        samples = {}
+        for step_timings in self._episode_steps:
+            for name, seconds in step_timings.items():
+                samples.setdefault(name, []).append(seconds)
+        return samples
+
+    def summary(self, episode_only: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Summarise the recorded per-step timings of each phase.
+
+        :param episode_only: Whether to only include samples from the current episode.
+        :type episode_only: bool
+        :return: Mapping from phase name to the number of steps, total, mean, min, median, 95th percentile and max
+            time spent in that phase per step, in seconds.
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        summary = {}
+        for name, samples in sorted(self.samples(episode_only=episode_only).items()):
+            values = np.asarray(samples)
+            summary[name] = {
+                "steps": int(values.size),
+                "total": float(values.sum()),
+                "mean": float(values.mean()),
+                "min": float(values.min()),
+                "median": float(np.median(values)),
+                "p95": float(np.percentile(values, 95)),
+                "max": float(values.max()),
+            }
+        return summary
+
+    def histogram(self, name: str, bins: int = 10, episode_only: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a histogram of the per-step timings of a phase.
+
+        :param name: Name of the phase.
+        :type name: str
+        :param bins: Number of bins.
+        :type bins: int
+        :param episode_only: Whether to only include samples from the current episode.
+        :type episode_only: bool
+        :return: The number of steps in each bin, and the bin edges in seconds, as returned by ``numpy.histogram``.
+        :rtype: Tuple[np.ndarray, np.ndarray]
+        """
+        return np.histogram(self.samples(episode_only=episode_only).get(name, []), bins=bins)
+
+    def write_episode(self, output_dir: Path) -> None:
+        """
+        Write the timings of the current episode to ``step_timings.json`` and ``step_timings.csv``.
+
+        The JSON file holds the summary of each phase and the timings of each step. The CSV file has a row for each step
+        and a column for each phase.
+
+        :param output_dir: Directory to write the files to. It is created if it does not exist.
+        :type output_dir: Path
+        """
+        if not self._episode_steps:
+            return
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "step_timings.json", "w") as file:
+            json.dump({"summary": self.summary(episode_only=True), "steps": self._episode_steps}, file)
+
+        names = sorted({name for step_timings in self._episode_steps for name in step_timings})
+        with open(output_dir / "step_timings.csv", "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=["step"] + names)
+            writer.writeheader()
+            for step, step_timings in enumerate(self._episode_steps):
+                writer.writerow({"step": step, **step_timings})
+        _LOGGER.info(f"Saved step timings to {output_dir}")
@@ -0,0 +1,243 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Storage of the metadata of every step of an episode, with random access by step."""
+import atexit
+import json
+import struct
+import threading
+import weakref
+import zlib
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple, Union
+
+from primaite import getLogger
+
+_LOGGER = getLogger(__name__)
+
+STEP_METADATA_FILENAME: Final[str] = "step_metadata.bin"
+"""Name of the step metadata file in each episode's simulation output directory."""
+
+_RECORD_HEADER: Final[struct.Struct] = struct.Struct("<IBI")
+"""Header of each record in a step metadata file: the step, whether the record is a keyframe, and the record length."""
+
+_BUFFER_SIZE: Final[int] = 2**20
+"""Size in Bytes of the write buffer of a step metadata file."""
+
+_CLOSE: Final[object] = object()
+
+_OPEN_WRITERS: "weakref.WeakSet[StepMetadataWriter]" = weakref.WeakSet()
+
+
+def diff_state(old: Dict, new: Dict) -> Optional[Dict]:
+    """
+    Find the changes which turn one state dictionary into another.
+
+    The delta is a dictionary which can have the keys ``"="``, mapping keys which were added or whose values changed
+    to their new values, ``"-"``, listing keys which were removed, and ``"~"``, mapping keys whose values are
+    dictionaries in both states to the delta between them.
+
+    :param old: The previous state.
+    :param new: The current state.
+    :return: The delta, or None if the states are equal.
+    """
+    changed = {}
+    nested = {}
+    for key, value in new.items():
+        if key not in old:
+            changed[key] = value
+            continue
+        old_value = old[key]
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            delta = diff_state(old_value, value)
+            if delta is not None:
+                nested[key] = delta
+        elif value != old_value:
+            changed[key] = value
+    removed = [key for key in old if key not in new]
+
+    delta = {}
+    if changed:
+        delta["="] = changed
+    if removed:
+        delta["-"] = removed
+    if nested:
+        delta["~"] = nested
+    return delta or None
+
+
+def apply_state_delta(old: Dict, delta: Optional[Dict]) -> Dict:
+    """
+    Apply a delta found by :py:func:`diff_state` to a state dictionary.
+
+    The old state is not modified. Dictionaries which the delta does not change are shared with the new state.
+
+    :param old: The previous state.
+    :param delta: The delta to apply.
+    :return: The current state.
+    """
+    if delta is None:
+        return old
+    new = dict(old)
+    for key in delta.get("-", ()):
+        del new[key]
+    new.update(delta.get("=", {}))
+    for key, nested in delta.get("~", {}).items():
+        new[key] = apply_state_delta(old[key], nested)
+    return new
+
+
+class StepMetadataWriter:
+    """
+    Writes the metadata of each step of an episode to a single file from a background thread.
+
+    Each step's metadata is a dictionary with a ``"state"`` key holding the simulation state. Writing a step only
+    serialises its metadata to JSON and queues it. The background thread finds the difference between the state and
+    the state of the previous step, and appends the metadata with the state replaced by a ``"state_delta"`` to the file
+    as a compressed record. The full state is stored every ``keyframe_interval`` steps instead, so that any step can be
+    read back without replaying the whole episode. Use :py:class:`StepMetadataReader` to read the file. Any existing
+    file at the path is replaced when the first step is written.
+
+    :param path: Path of the step metadata file.
+    :type path: Path
+    :param keyframe_interval: Number of steps between records which store the full state.
+    :type keyframe_interval: int
+    """
+
+    def __init__(self, path: Path, keyframe_interval: int = 32) -> None:
+        self.path: Path = path
+        self.keyframe_interval: int = keyframe_interval
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._closed: bool = False
+
+    def write(self, step: int, metadata: Dict[str, Any]) -> None:
+        """
+        Queue the metadata of a step to be written.
+
+        :param step: The step number.
+        :type step: int
+        :param metadata: The metadata of the step, which must have a ``"state"`` key.
+        :type metadata: Dict[str, Any]
+        """
+        if self._closed:
+            raise RuntimeError(f"Cannot write step {step} metadata to {self.path} as the writer is closed.")
+        if self._thread is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="step-metadata-writer", daemon=True)
+            self._thread.start()
+            _OPEN_WRITERS.add(self)
+        self._queue.put((step, json.dumps(metadata)))
+
+    def close(self) -> None:
+        """Wait until every queued step has been written, and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_CLOSE)
+            self._thread.join()
+            _OPEN_WRITERS.discard(self)
+
+    def _run(self) -> None:
+        previous_state: Optional[Dict] = None
+        records_since_keyframe = 0
+        with open(self.path, "wb", buffering=_BUFFER_SIZE) as file:
+            while (item := self._queue.get()) is not _CLOSE:
+                step, serialised = item
+                try:
+                    metadata = json.loads(serialised)
+                    state = metadata.pop("state")
+                    keyframe = previous_state is None or records_since_keyframe >= self.keyframe_interval - 1
+                    if keyframe:
+                        metadata["state"] = state
+                    else:
+                        metadata["state_delta"] = diff_state(previous_state, state)
+                    record = zlib.compress(json.dumps(metadata).encode())
+                    file.write(_RECORD_HEADER.pack(step, keyframe, len(record)) + record)
+                    # Only move on once the step is written, so that the next delta follows on from the file
+                    previous_state = state
+                    records_since_keyframe = 0 if keyframe else records_since_keyframe + 1
+                except Exception as e:
+                    _LOGGER.error(f"Failed to write step {step} metadata to {self.path}: {e}")
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    for writer in list(_OPEN_WRITERS):
+        writer.close()
+
+
+class StepMetadataReader:
+    """
+    Reads a step metadata file written by :py:class:`StepMetadataWriter`.
+
+    The metadata of a step is read with ``reader[step]``, which decodes the nearest full state at or before the step
+    and applies the deltas of the steps in between. Iterating over the reader yields the metadata of each step in
+    order, applying one delta per step. The states yielded by iteration share unchanged dictionaries with the states
+    of the steps before them, so copy a state before modifying it.
+
+    :param path: Path of the step metadata file, or of the episode directory which contains it.
+    :type path: Union[str, Path]
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        self.path: Path = path / STEP_METADATA_FILENAME if path.is_dir() else path
+        self._records: List[Tuple[int, bool, int, int]] = []
+        self._positions: Dict[int, int] = {}
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self._data: bytes = data
+        offset = 0
+        while offset < len(data):
+            step, keyframe, length = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size
+            self._positions[step] = len(self._records)
+            self._records.append((step, bool(keyframe), offset, length))
+            offset += length
+
+    @property
+    def steps(self) -> List[int]:
+        """The steps stored in the file, in the order they were written."""
+        return [record[0] for record in self._records]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, step: int) -> bool:
+        return step in self._positions
+
+    def __getitem__(self, step: int) -> Dict[str, Any]:
+        """
+        Read the metadata of a step.
+
+        :param step: The step number.
+        :return: The metadata of the step, with its full state under the ``"state"`` key.
+        :raises KeyError: If the step is not stored in the file.
+        """
+        position = self._positions[step]
+        keyframe = position
+        while not self._records[keyframe][1]:
+            keyframe -= 1
+        metadata = self._decode(keyframe)
+        state = metadata["state"]
+        for delta_position in range(keyframe + 1, position + 1):
+            metadata = self._decode(delta_position)
+            state = apply_state_delta(state, metadata.pop("state_delta"))
+        metadata["state"] = state
+        return metadata
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        state = None
+        for position in range(len(self._records)):
+            metadata = self._decode(position)
+            if "state" in metadata:
+                state = metadata["state"]
+            else:
+                state = apply_state_delta(state, metadata.pop("state_delta"))
+                metadata["state"] = state
+            yield metadata
+
+    def _decode(self, position: int) -> Dict[str, Any]:
+        _, _, offset, length = self._records[position]
+        return json.loads(zlib.decompress(self._data[offset : offset + length]))
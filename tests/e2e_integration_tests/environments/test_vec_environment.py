@@ -0,0 +1,106 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+"""Test the vectorised environment which runs several PrimAITE gym environments in worker processes."""
+import numpy as np
+import pytest
+import yaml
+
+from primaite.exceptions import PrimaiteError
+from primaite.game.agent.interface import AgentHistoryItem
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.session.vec_env import PrimaiteVecEnv
+from tests import TEST_ASSETS_ROOT
+
+CFG_PATH = TEST_ASSETS_ROOT / "configs/test_primaite_session.yaml"
+
+
+@pytest.fixture
+def cfg():
+    with open(CFG_PATH, "r") as f:
+        cfg = yaml.safe_load(f)
+    cfg["game"]["max_episode_length"] = 3
+    return cfg
+
+
+@pytest.fixture
+def vec_env(cfg):
+    env = PrimaiteVecEnv(env_config=cfg, num_envs=2)
+    yield env
+    env.close()
+
+
+def test_reset_matches_single_environment(cfg, vec_env):
+    """Each environment should start with the same observation as a single environment reset with the same seed."""
+    obs, infos = vec_env.reset(seed=5)
+
+    assert obs.shape == (2,) + vec_env.observation_space.shape
+    assert len(infos) == 2
+
+    gym = PrimaiteGymEnv(env_config=cfg)
+    gym.reset(seed=5)
+    assert np.array_equal(obs[0], gym.agent.observation_manager.flat_observation)
+    assert vec_env.action_masks().shape == (2, vec_env.action_space.n)
+
+
+def test_step_and_automatic_reset(vec_env):
+    """Finished episodes should be reset automatically, with the final observation passed in the info dict."""
+    vec_env.reset()
+    for _ in range(2):
+        obs, rewards, terminated, truncated, infos = vec_env.step([0, 0])
+        assert obs.shape == (2,) + vec_env.observation_space.shape
+        assert rewards.shape == (2,)
+        assert not truncated.any()
+        assert "terminal_observation" not in infos[0]
+
+    obs, rewards, terminated, truncated, infos = vec_env.step(np.zeros(2, dtype=int))
+    assert truncated.all()
+    assert not terminated.any()
+    for info in infos:
+        assert info["terminal_observation"].shape == vec_env.observation_space.shape
+
+    # the environments have been reset, so the next episode runs for its full length
+    _, _, _, truncated, _ = vec_env.step([0, 0])
+    assert not truncated.any()
+
+
+def test_step_info_agent_actions(cfg, vec_env):
+    """Info dicts summarise what each agent did by default, and hold full history items when asked for."""
+    vec_env.reset()
+    *_, infos = vec_env.step([0, 0])
+    assert infos[0]["agent_actions"]["defender"] == {
+        "action": "do-nothing",
+        "parameters": {},
+        "response_status": "success",
+    }
+
+    full_info_env = PrimaiteVecEnv(env_config=cfg, num_envs=1, full_info=True)
+    try:
+        full_info_env.reset()
+        *_, infos = full_info_env.step([0])
+        defender_item = infos[0]["agent_actions"]["defender"]
+        assert isinstance(defender_item, AgentHistoryItem)
+        assert defender_item.action == "do-nothing"
+        assert defender_item.observation is not None
+    finally:
+        full_info_env.close()
+
+
+def test_worker_errors_are_raised(vec_env):
+    """An error in a worker should be raised in the main process."""
+    vec_env.reset()
+    with pytest.raises(ValueError):
+        vec_env.step([0])
+    with pytest.raises(PrimaiteError):
+        vec_env.step([0, vec_env.action_space.n + 10])
+
+
+def test_prefetch_games_falls_back_in_workers(cfg):
+    """Workers cannot start prefetch processes, so games are built at reset instead of failing."""
+    cfg["game"]["prefetch_games"] = True
+    vec_env = PrimaiteVecEnv(env_config=cfg, num_envs=2)
+    try:
+        obs, _ = vec_env.reset(seed=5)
+        assert obs.shape == (2,) + vec_env.observation_space.shape
+        truncated = [vec_env.step([0, 0])[3] for _ in range(6)]
+        assert [step_truncated.all() for step_truncated in truncated] == [False, False, True] * 2
+    finally:
+        vec_env.close()
@@ -0,0 +1,166 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import io
+import pickle
+import random
+
+import numpy as np
+import pytest
+import yaml
+
+from primaite.config.load import _EXAMPLE_CFG
+from primaite.game.agent.scripted_agents.abstract_tap import AbstractTAP
+from primaite.game.agent.scripted_agents.random_agent import PeriodicAgent
+from primaite.game.game import PrimaiteGame
+from primaite.game.snapshot import _SnapshotPickler, GameSnapshot
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.session.ray_envs import PrimaiteRayMARLEnv
+from tests import TEST_ASSETS_ROOT
+
+CFG_PATH = TEST_ASSETS_ROOT / "configs/test_primaite_session.yaml"
+MULTI_AGENT_PATH = TEST_ASSETS_ROOT / "configs/multi_agent_session.yaml"
+DATA_MANIPULATION_PATH = TEST_ASSETS_ROOT / "configs/data_manipulation.yaml"
+UC7_PATH = _EXAMPLE_CFG / "uc7_config.yaml"
+
+
+def _load_cfg(path, fast_reset: bool):
+    with open(path, "r") as f:
+        cfg = yaml.safe_load(f)
+    cfg["game"]["fast_reset"] = fast_reset
+    return cfg
+
+
+def test_restored_game_is_independent_of_snapshot():
+    """Requests on a restored game must act on the restored components, not the ones that were captured."""
+    cfg = _load_cfg(CFG_PATH, fast_reset=True)
+    game, snapshot = GameSnapshot.build(cfg)
+    restored = snapshot.restore()
+
+    assert restored is not game
+    restored.simulation.apply_request(["network", "node", "client_1", "shutdown"])
+    restored_client = restored.simulation.network.get_node_by_hostname("client_1")
+    original_client = game.simulation.network.get_node_by_hostname("client_1")
+    assert restored_client is not original_client
+    assert restored_client.operating_state != original_client.operating_state
+
+
+def test_build_falls_back_to_config_when_config_changes():
+    """A new snapshot is captured when the config differs from the one the current snapshot was built from."""
+    cfg = _load_cfg(CFG_PATH, fast_reset=True)
+    _, snapshot = GameSnapshot.build(cfg)
+    _, same_snapshot = GameSnapshot.build(cfg, snapshot=snapshot)
+    assert same_snapshot is snapshot
+
+    cfg["game"]["max_episode_length"] = 10
+    game, new_snapshot = GameSnapshot.build(cfg, snapshot=snapshot)
+    assert new_snapshot is not snapshot
+    assert game.options.max_episode_length == 10
+
+
+def test_gym_env_fast_reset_matches_full_rebuild():
+    """Episodes started from a snapshot should play out identically to episodes started from a rebuilt game."""
+    envs = [PrimaiteGymEnv(env_config=_load_cfg(CFG_PATH, fast_reset=flag)) for flag in (False, True)]
+    assert envs[1]._snapshot is not None
+
+    def seeded(func, *args):
+        random.seed(1)
+        np.random.seed(1)
+        return func(*args)
+
+    for _ in range(3):
+        observations = [seeded(env.reset)[0] for env in envs]
+        assert (observations[0] == observations[1]).all()
+        for step in range(10):
+            results = [seeded(env.step, step % 5) for env in envs]
+            assert (results[0][0] == results[1][0]).all()
+            assert results[0][1] == results[1][1]
+        assert envs[0].game.step_counter == envs[1].game.step_counter == 10
+
+
+def test_gym_env_fast_reset_varies_between_episodes():
+    """Without reseeding between episodes, restored games must draw new green agent actions each episode."""
+
+    def green_actions_per_episode(fast_reset: bool):
+        np.random.seed(1)
+        random.seed(1)
+        env = PrimaiteGymEnv(env_config=_load_cfg(DATA_MANIPULATION_PATH, fast_reset=fast_reset))
+        episodes = []
+        for _ in range(3):
+            env.reset()
+            for _ in range(10):
+                env.step(0)
+            green_agent = env.game.agents["client_1_green_user"]
+            episodes.append(tuple((item.action, str(item.parameters)) for item in green_agent.history))
+        return episodes
+
+    full_rebuild_episodes = green_actions_per_episode(fast_reset=False)
+    fast_reset_episodes = green_actions_per_episode(fast_reset=True)
+    assert len(set(fast_reset_episodes)) > 1
+    assert fast_reset_episodes == full_rebuild_episodes
+
+
+def test_gym_env_fast_reset_redraws_agent_schedules():
+    """Periodic and TAP agents in restored games must draw a new schedule each episode, as rebuilt agents do."""
+
+    def schedules_per_episode(fast_reset: bool):
+        np.random.seed(3)
+        random.seed(3)
+        cfg = _load_cfg(UC7_PATH, fast_reset=fast_reset)
+        attacker_cfg = next(agent for agent in cfg["agents"] if agent["ref"] == "attacker")
+        attacker_cfg["agent_settings"]["variance"] = 2
+        env = PrimaiteGymEnv(env_config=cfg)
+        episodes = []
+        for _ in range(6):
+            env.reset()
+            episodes.append(
+                tuple(
+                    (name, agent.next_execution_timestep)
+                    for name, agent in env.game.agents.items()
+                    if isinstance(agent, (PeriodicAgent, AbstractTAP))
+                )
+            )
+        return episodes
+
+    full_rebuild_episodes = schedules_per_episode(fast_reset=False)
+    fast_reset_episodes = schedules_per_episode(fast_reset=True)
+    assert len(set(fast_reset_episodes)) > 1
+    assert len({dict(episode)["attacker"] for episode in fast_reset_episodes}) > 1
+    assert fast_reset_episodes == full_rebuild_episodes
+
+
+def test_snapshot_pickles_self_referencing_and_empty_closures():
+    """Functions whose closures refer to themselves or contain unassigned cells are restored correctly."""
+
+    def make_functions():
+        def countdown(n):
+            return n if n <= 0 else countdown(n - 1)
+
+        def uses_late_binding():
+            return late_value
+
+        restored_before_binding = uses_late_binding
+        late_value = None
+        del late_value
+        return countdown, restored_before_binding
+
+    countdown, unbound = make_functions()
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump((countdown, unbound))
+    restored_countdown, restored_unbound = pickle.loads(buffer.getvalue())
+
+    assert restored_countdown(3) == 0
+    with pytest.raises(NameError):
+        restored_unbound()
+
+
+def test_marl_env_fast_reset():
+    """The multi agent environment restores its game from the snapshot on reset."""
+    env = PrimaiteRayMARLEnv(env_config=_load_cfg(MULTI_AGENT_PATH, fast_reset=True))
+    first_game = env.game
+    for _ in range(5):
+        env.step({"defender_1": 0, "defender_2": 0})
+    env.reset()
+
+    assert env.game is not first_game
+    assert isinstance(env.game, PrimaiteGame)
+    assert env.game.step_counter == 0
+    assert all(len(agent.history) == 0 for agent in env.game.agents.values())
@@ -0,0 +1,138 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import copy
+import pickle
+import random
+
+import numpy as np
+import pytest
+import yaml
+
+from primaite.config.load import _EXAMPLE_CFG
+from primaite.game.game import PrimaiteGame
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.session.prefetch import _draw_seed, GamePrefetcher
+from primaite.session.ray_envs import PrimaiteRayMARLEnv
+from tests import TEST_ASSETS_ROOT
+
+CFG_PATH = TEST_ASSETS_ROOT / "configs/test_primaite_session.yaml"
+MULTI_AGENT_PATH = TEST_ASSETS_ROOT / "configs/multi_agent_session.yaml"
+DATA_MANIPULATION_PATH = TEST_ASSETS_ROOT / "configs/data_manipulation.yaml"
+UC7_PATH = _EXAMPLE_CFG / "uc7_config.yaml"
+
+
+def _load_cfg(path, prefetch_games: bool):
+    with open(path, "r") as f:
+        cfg = yaml.safe_load(f)
+    cfg["game"]["prefetch_games"] = prefetch_games
+    return cfg
+
+
+def test_prefetcher_returns_game_for_requested_config():
+    """The prefetcher only hands over a game built from the config that is needed, and survives failed builds."""
+    cfg = _load_cfg(CFG_PATH, prefetch_games=True)
+    prefetcher = GamePrefetcher()
+    try:
+        assert prefetcher.take(cfg) is None
+
+        prefetcher.request({"game": {"max_episode_length": "not a number"}})
+        assert prefetcher.take(cfg) is None
+
+        prefetcher.request(cfg)
+        other_cfg = _load_cfg(CFG_PATH, prefetch_games=True)
+        other_cfg["game"]["max_episode_length"] = 10
+        assert prefetcher.take(other_cfg) is None
+
+        prefetcher.request(cfg)
+        snapshot = prefetcher.take(cfg)
+        assert snapshot is not None
+        assert isinstance(snapshot.restore(), PrimaiteGame)
+    finally:
+        prefetcher.close()
+    assert prefetcher.closed
+
+
+def test_prefetcher_seeds_worker_from_global_generator():
+    """The worker builds each game from a seed drawn from the global generator, without advancing it."""
+    cfg = _load_cfg(UC7_PATH, prefetch_games=True)
+    np.random.seed(5)
+    seed = _draw_seed()
+    random.seed(seed)
+    np.random.seed(seed)
+    expected_game = PrimaiteGame.from_config(copy.deepcopy(cfg))
+
+    np.random.seed(5)
+    prefetcher = GamePrefetcher()
+    try:
+        prefetcher.request(cfg)
+        assert np.random.get_state()[1].tolist() == np.random.RandomState(5).get_state()[1].tolist()
+        prefetched_game = pickle.loads(prefetcher.take(cfg).blob)
+    finally:
+        prefetcher.close()
+
+    def schedules(game: PrimaiteGame):
+        return {name: getattr(agent, "next_execution_timestep", None) for name, agent in game.agents.items()}
+
+    assert schedules(prefetched_game) == schedules(expected_game)
+
+
+@pytest.mark.parametrize("config_path", [DATA_MANIPULATION_PATH, UC7_PATH])
+def test_gym_env_prefetch_matches_full_rebuild(config_path):
+    """Episodes played with prefetched games should play out identically to episodes with games built at reset."""
+
+    def episodes(prefetch_games: bool):
+        np.random.seed(3)
+        random.seed(3)
+        env = PrimaiteGymEnv(env_config=_load_cfg(config_path, prefetch_games=prefetch_games))
+        results = []
+        for _ in range(4):
+            observation, _ = env.reset()
+            rewards = [env.step(step % 5)[1] for step in range(10)]
+            scripted_actions = tuple(
+                (name, item.action, str(item.parameters))
+                for name, agent in env.game.agents.items()
+                if name != env._agent_name
+                for item in agent.history
+            )
+            results.append((observation.tolist(), rewards, scripted_actions))
+        env.close()
+        return results
+
+    prefetched_episodes = episodes(prefetch_games=True)
+    assert len({str(episode) for episode in prefetched_episodes}) == len(prefetched_episodes)
+    assert prefetched_episodes == episodes(prefetch_games=False)
+
+
+def test_gym_env_prefetch_respects_reset_seed():
+    """Resetting with a seed discards the prefetched game, so episodes are reproducible from the seed."""
+
+    def episode(env: PrimaiteGymEnv):
+        env.reset(seed=7)
+        for step in range(10):
+            env.step(step % 5)
+        return tuple(
+            (name, item.action, str(item.parameters))
+            for name, agent in env.game.agents.items()
+            if name != env._agent_name
+            for item in agent.history
+        )
+
+    env = PrimaiteGymEnv(env_config=_load_cfg(UC7_PATH, prefetch_games=True))
+    try:
+        assert episode(env) == episode(env)
+    finally:
+        env.close()
+
+
+def test_marl_env_prefetch():
+    """The multi agent environment swaps in the prefetched game on reset."""
+    env = PrimaiteRayMARLEnv(env_config=_load_cfg(MULTI_AGENT_PATH, prefetch_games=True))
+    first_game = env.game
+    for _ in range(5):
+        env.step({"defender_1": 0, "defender_2": 0})
+    env.reset()
+
+    assert env.game is not first_game
+    assert env.game.step_counter == 0
+    assert all(len(agent.history) == 0 for agent in env.game.agents.values())
+    env.close()
+    assert env._prefetcher.closed
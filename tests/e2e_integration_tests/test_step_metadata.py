@@ -0,0 +1,32 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import json
+
+import yaml
+
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.simulator import SIM_OUTPUT
+from primaite.utils.step_metadata import StepMetadataReader
+from tests import TEST_ASSETS_ROOT
+
+CFG_PATH = TEST_ASSETS_ROOT / "configs/test_primaite_session.yaml"
+
+
+def test_step_metadata_is_saved_each_episode():
+    """With step metadata enabled, the metadata of every step of an episode should be saved to a single file."""
+    with open(CFG_PATH, "r") as f:
+        cfg = yaml.safe_load(f)
+    cfg.setdefault("io_settings", {})["save_step_metadata"] = True
+    env = PrimaiteGymEnv(env_config=cfg)
+    env.reset()
+    states = []
+    for step in range(5):
+        env.step(step % 2)
+        states.append(json.loads(json.dumps(env.game.get_sim_state())))
+    env.reset()
+
+    reader = StepMetadataReader(SIM_OUTPUT.path / "episode_1")
+    assert reader.steps == list(range(5))
+    assert [metadata["action"] for metadata in reader] == [0, 1, 0, 1, 0]
+    assert reader[4]["state"] == states[4]
+    assert reader[2]["state"] == states[2]
+    assert not (SIM_OUTPUT.path / "episode_1" / "step_metadata").exists()
@@ -0,0 +1,49 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import json
+
+import yaml
+
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.simulator import SIM_OUTPUT
+from tests import TEST_ASSETS_ROOT
+
+CFG_PATH = TEST_ASSETS_ROOT / "configs/test_primaite_session.yaml"
+
+
+def _load_cfg(save_step_timings: bool):
+    with open(CFG_PATH, "r") as f:
+        cfg = yaml.safe_load(f)
+    cfg.setdefault("io_settings", {})["save_step_timings"] = save_step_timings
+    return cfg
+
+
+def test_step_timings_are_saved_each_episode():
+    """With step timings enabled, each episode's phase timings should be saved when the environment is reset."""
+    env = PrimaiteGymEnv(env_config=_load_cfg(save_step_timings=True))
+    env.reset()
+    for _ in range(3):
+        env.step(0)
+    env.reset()
+
+    with open(SIM_OUTPUT.path / "episode_1" / "step_timings.json") as file:
+        data = json.load(file)
+    assert len(data["steps"]) == 3
+    phases = data["summary"]
+    for phase in ["pre_timestep", "advance_timestep", "get_sim_state", "get_obs"]:
+        assert phases[phase]["steps"] == 3
+    assert any(phase.startswith("apply_agent_actions.") for phase in phases)
+    assert any(phase.startswith("update_observation.") for phase in phases)
+    assert "advance_timestep.computer" in phases
+
+    assert env.profiler.samples(episode_only=True) == {}
+    assert len(env.profiler.samples()["advance_timestep"]) == 3
+
+
+def test_step_timings_are_not_recorded_by_default():
+    """Step timings should only be recorded when enabled in the IO settings."""
+    env = PrimaiteGymEnv(env_config=_load_cfg(save_step_timings=False))
+    env.reset()
+    env.step(0)
+
+    assert env.profiler.samples() == {}
+    assert env.game.simulation.network._profiler is env.profiler
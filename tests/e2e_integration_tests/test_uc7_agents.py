@@ -91,9 +91,14 @@ def test_green_agent_negative_reward(uc7_environment):
         assert_agent_reward(env=env, agent_name=env.game.agents[agent].config.ref, positive=False)
 
 
-def test_tap001_default_behaviour(uc7_environment):
+@pytest.mark.parametrize("retention", ["full", "last-n", "none"])
+def test_tap001_default_behaviour(retention):
     """Confirms that the TAP001 expected simulation impacts works as expected in the UC7 environment."""
-    env: PrimaiteGymEnv = uc7_environment
+    with open(CONFIG_FILE, mode="r") as uc7_config:
+        cfg = yaml.safe_load(uc7_config)
+    # TAP001 looks back at the responses of its earlier scans, which must be kept whatever the history retention
+    cfg["agents"][ATTACK_AGENT_INDEX]["history"] = {"retention": retention, "length": 2}
+    env = PrimaiteGymEnv(env_config=cfg)
     env.reset()
     network = env.game.simulation.network
 
@@ -129,7 +134,8 @@ def test_tap001_default_behaviour(uc7_environment):
     assert database_file.health_status == FileSystemItemHealthStatus.CORRUPT
 
 
-def test_tap003_default_behaviour(uc7_environment):
+@pytest.mark.parametrize("retention", ["full", "none"])
+def test_tap003_default_behaviour(retention):
     """Confirms that the TAP003 expected simulation impacts works as expected in the UC7 environment."""
     from primaite.simulator.network.hardware.nodes.network.router import ACLAction, Router
     from primaite.simulator.network.transmission.network_layer import IPPacket, IPProtocol
@@ -140,6 +146,7 @@ def test_tap003_default_behaviour(uc7_environment):
             cfg = yaml.safe_load(uc7_config)
             cfg["agents"][ATTACK_AGENT_INDEX]["agent_settings"]["starting_nodes"] = ["ST_PROJ-A-PRV-PC-1"]
             cfg["agents"][ATTACK_AGENT_INDEX]["agent_settings"]["default_starting_node"] = "ST_PROJ-A-PRV-PC-1"
+            cfg["agents"][ATTACK_AGENT_INDEX]["history"] = {"retention": retention}
         env = PrimaiteGymEnv(env_config=cfg)
         return env
 
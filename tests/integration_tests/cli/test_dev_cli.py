@@ -9,6 +9,7 @@ import pytest
 import yaml
 
 from primaite import PRIMAITE_CONFIG
+from primaite.simulator import SIM_OUTPUT
 from primaite.utils.cli.primaite_config_utils import update_primaite_application_config
 from tests.integration_tests.cli import cli
 
@@ -33,6 +34,7 @@ def test_setup():
 
     PRIMAITE_CONFIG["developer_mode"] = current_config["developer_mode"]  # restore config to prevent being yelled at
     update_primaite_application_config(config=PRIMAITE_CONFIG)
+    SIM_OUTPUT.refresh()
 
 
 def test_dev_mode_enable_disable():
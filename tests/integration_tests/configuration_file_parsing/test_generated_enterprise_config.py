@@ -0,0 +1,79 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import pytest
+from pydantic import ValidationError
+
+from primaite.config.generate import EnterpriseConfigGenerator
+from primaite.config.load import load
+from primaite.game.game import PrimaiteGame
+from primaite.session.environment import PrimaiteGymEnv
+from primaite.simulator.network.creation import num_of_switches_required
+
+
+@pytest.mark.parametrize(
+    "num_subnets, hosts_per_subnet, switch_ports",
+    [(1, 5, 24), (3, 30, 24), (2, 40, 8)],
+)
+def test_generated_network(num_subnets, hosts_per_subnet, switch_ports):
+    """Check the generated network has the expected nodes and that every subnet can reach the servers."""
+    generator = EnterpriseConfigGenerator(
+        num_subnets=num_subnets, hosts_per_subnet=hosts_per_subnet, switch_ports=switch_ports
+    )
+    game = PrimaiteGame.from_config(generator.generate())
+    network = game.simulation.network
+
+    num_edge_switches = num_of_switches_required(hosts_per_subnet, switch_ports)
+    switches_per_subnet = num_edge_switches + (1 if num_edge_switches > 1 else 0)
+    assert len(network.computer_nodes) == num_subnets * hosts_per_subnet
+    assert len(network.switch_nodes) == num_subnets * switches_per_subnet + 1
+    assert len(network.router_nodes) == 1
+    assert len(network.firewall_nodes) == 1
+
+    for subnet in range(1, num_subnets + 1):
+        for host in [1, hosts_per_subnet]:
+            computer = network.get_node_by_hostname(generator.host_name(subnet, host))
+            assert computer.ping("192.168.1.14")
+            assert computer.software_manager.software["web-browser"].get_webpage()
+
+
+def test_generated_agents():
+    """Check the generated config has the requested green agents, a red agent and a blue agent."""
+    generator = EnterpriseConfigGenerator(num_subnets=3, hosts_per_subnet=4, green_agents_per_subnet=2)
+    game = PrimaiteGame.from_config(generator.generate())
+
+    assert len([agent for agent in game.agents.values() if agent.config.team == "GREEN"]) == 6
+    assert game.agents["data_manipulation_attacker"].config.agent_settings.possible_start_nodes == [
+        "pc_1_1",
+        "pc_2_1",
+        "pc_3_1",
+    ]
+    assert "defender" in game.rl_agents
+
+    generator = EnterpriseConfigGenerator(num_subnets=2, green_agents_per_subnet=0, include_red_agent=False)
+    assert list(PrimaiteGame.from_config(generator.generate()).agents) == ["defender"]
+
+
+def test_generated_config_runs(tmp_path):
+    """Check a generated config can be saved, loaded and stepped through by an environment."""
+    generator = EnterpriseConfigGenerator(num_subnets=2, hosts_per_subnet=10, max_episode_length=30)
+    config_path = generator.save(tmp_path / "enterprise.yaml")
+
+    env = PrimaiteGymEnv(env_config=load(config_path))
+    env.reset()
+    for step in range(30):
+        _, _, terminated, truncated, _ = env.step(step % env.action_space.n)
+    assert truncated and not terminated
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"hosts_per_subnet": 60},
+        {"hosts_per_subnet": 30, "switch_ports": 4},
+        {"num_subnets": 0},
+        {"unknown_option": True},
+    ],
+)
+def test_invalid_generator_options(kwargs):
+    """Check that options which cannot produce a working network are rejected."""
+    with pytest.raises(ValidationError):
+        EnterpriseConfigGenerator(**kwargs)
@@ -0,0 +1,57 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import numpy as np
+from gymnasium import spaces
+
+from primaite.game.agent.observations.observation_manager import FlatObservationEncoder
+from primaite.session.environment import PrimaiteGymEnv
+from tests import TEST_ASSETS_ROOT
+
+DATA_MANIPULATION_CONFIG = TEST_ASSETS_ROOT / "configs" / "data_manipulation.yaml"
+
+
+def test_flat_observation_matches_gymnasium_flatten():
+    """Check that the flattened observation is the same as gymnasium's flatten at every step."""
+    env = PrimaiteGymEnv(DATA_MANIPULATION_CONFIG)
+    obs, _ = env.reset()
+    observation_manager = env.agent.observation_manager
+    assert env.observation_space == spaces.flatten_space(observation_manager.space)
+
+    for step in range(20):
+        expected = spaces.flatten(observation_manager.space, observation_manager.current_observation)
+        assert obs.dtype == expected.dtype
+        assert np.array_equal(obs, expected)
+        obs, *_ = env.step(step % 5)
+
+
+def test_flat_observation_encoder_spaces():
+    """Check that the encoder flattens each kind of gymnasium space in the same way as gymnasium."""
+    space = spaces.Dict(
+        {
+            "discrete": spaces.Discrete(4, start=1),
+            "multi_discrete": spaces.MultiDiscrete([2, 3]),
+            "box": spaces.Box(low=0, high=1, shape=(2, 2)),
+            "tuple": spaces.Tuple((spaces.MultiBinary(3), spaces.Discrete(2))),
+        }
+    )
+    encoder = FlatObservationEncoder(space)
+    space.seed(0)
+    for _ in range(10):
+        obs = space.sample()
+        assert np.array_equal(encoder.encode(obs), spaces.flatten(space, obs))
+
+
+def test_flat_observation_is_not_overwritten():
+    """Check that an encoded observation is not changed by encoding the next observation."""
+    encoder = FlatObservationEncoder(spaces.Dict({"a": spaces.Discrete(3)}))
+    first = encoder.encode({"a": 0})
+    encoder.encode({"a": 2})
+    assert first.tolist() == [1, 0, 0]
+
+
+def test_flat_observation_encoded_into_array():
+    """Check that an observation can be encoded into an existing array, such as a row of a larger buffer."""
+    encoder = FlatObservationEncoder(spaces.Dict({"a": spaces.Discrete(3)}))
+    buffer = np.zeros((2, 3), dtype=encoder.flat_space.dtype)
+    result = encoder.encode({"a": 2}, out=buffer[1])
+    assert np.shares_memory(result, buffer)
+    assert buffer.tolist() == [[0, 0, 0], [0, 0, 1]]
@@ -85,7 +85,7 @@ def test_link_observation():
     assert link_2 is not None
 
     link_1_observation = LinkObservation(where=["network", "links", "switch:eth-1<->computer_1:eth-1"])
-    link_2_observation = LinkObservation(where=["network", "links", "switch:eth-2<->computer_2:eth-1"])
+    link_2_observation = LinkObservation(where=["network", "links", "computer_2:eth-1<->switch:eth-2"])
 
     state = sim.describe_state()
     link_1_obs = link_1_observation.observe(state)
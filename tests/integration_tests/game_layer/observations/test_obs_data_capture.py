@@ -1,8 +1,7 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
-import json
-
 from primaite.session.environment import PrimaiteGymEnv
 from primaite.session.io import PrimaiteIO
+from primaite.utils.agent_actions import read_agent_actions
 from tests import TEST_ASSETS_ROOT
 
 DATA_MANIPULATION_CONFIG = TEST_ASSETS_ROOT / "configs" / "data_manipulation.yaml"
@@ -22,7 +21,31 @@ def test_obs_data_in_log_file():
     env.reset()
     io = PrimaiteIO()
     path = io.generate_agent_actions_save_path(episode=1)
-    with open(path, "r") as f:
-        j = json.load(f)
+    j = read_agent_actions(path)
+
+    assert type(j[0]["defender"]["observation"]) == dict
+
+
+def test_agent_log_written_each_step():
+    """Check that the agent action log has every agent's action at each step, and matches the agents' histories."""
+    env = PrimaiteGymEnv(DATA_MANIPULATION_CONFIG)
+    env.reset()
+    for _ in range(5):
+        env.step(0)
+    histories = {name: list(agent.history) for name, agent in env.game.agents.items()}
+    env.close()
+
+    actions = read_agent_actions(env.io.generate_agent_actions_save_path(episode=1))
+    assert list(actions) == list(range(5))
+    for step, record in actions.items():
+        assert record["timestep"] == step
+        assert record["episode"] == 1
+        for name, history in histories.items():
+            assert record[name]["action"] == history[step].action
+            assert record[name]["reward"] == history[step].reward
+            assert record[name]["response"]["status"] == history[step].response.status
 
-    assert type(j["0"]["defender"]["observation"]) == dict
+    env.io.write_agent_log(agent_actions=histories, episode=2)
+    assert read_agent_actions(env.io.generate_agent_actions_save_path(episode=2)) == {
+        step: {**record, "episode": 2} for step, record in actions.items()
+    }
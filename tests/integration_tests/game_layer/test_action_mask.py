@@ -1,4 +1,6 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import numpy as np
+
 from primaite.session.environment import PrimaiteGymEnv
 from primaite.simulator.network.hardware.node_operating_state import NodeOperatingState
 from primaite.simulator.network.hardware.nodes.host.host_node import HostNode
@@ -157,3 +159,46 @@ def test_mask_contents_correct():
             mask = game.action_mask("defender")
             assert mask[action_num]
             service_obj.operating_state = ServiceOperatingState.RUNNING
+
+
+def test_mask_matches_check_valid_every_step():
+    """Check that the cached action mask matches checking every action's request against the simulation."""
+    env = PrimaiteGymEnv(CFG_PATH)
+    game = env.game
+    action_manager = env.agent.action_manager
+    rng = np.random.default_rng(0)
+
+    for _ in range(50):
+        expected = [
+            game.simulation._request_manager.check_valid(action_manager.form_request(*action), {})
+            for action in action_manager.action_map.values()
+        ]
+        assert game.action_mask("defender").tolist() == expected
+        env.step(int(rng.integers(len(action_manager.action_map))))
+
+
+def test_mask_only_rechecks_changed_components(monkeypatch):
+    """Check that validators are only called again once the components they depend on have changed."""
+    env = PrimaiteGymEnv(CFG_PATH)
+    game = env.game
+    node = game.simulation.network.get_node_by_hostname("client_1")
+    game.action_mask("defender")
+
+    calls = []
+    validator_class = type(node._request_manager.request_types["shutdown"].validator)
+    original_call = validator_class.__call__
+
+    def counting_call(validator, request, context):
+        calls.append(validator)
+        return original_call(validator, request, context)
+
+    monkeypatch.setattr(validator_class, "__call__", counting_call)
+    game.action_mask("defender")
+    assert not calls
+
+    node.operating_state = NodeOperatingState.OFF
+    mask = game.action_mask("defender")
+    assert calls
+    assert all(validator.node is node for validator in calls)
+    node.operating_state = NodeOperatingState.ON
+    assert game.action_mask("defender").sum() > mask.sum()
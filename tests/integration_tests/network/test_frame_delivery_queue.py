@@ -0,0 +1,33 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+from typing import List, Optional
+
+from primaite.simulator.network.frame_queue import FrameDeliveryQueue
+from primaite.simulator.network.hardware.base import NetworkInterface
+from primaite.simulator.network.networks import multi_lan_internet_network_example
+from primaite.simulator.system.applications.web_browser import WebBrowser
+
+
+def _get_webpage_link_loads(frame_queue: Optional[FrameDeliveryQueue]) -> List[float]:
+    """Fetch a webpage across the multi-LAN internet example network and return the load on each link."""
+    network = multi_lan_internet_network_example()
+    browser: WebBrowser = network.get_node_by_hostname("pc_1").software_manager.software["web-browser"]
+    NetworkInterface.frame_queue = frame_queue
+    try:
+        assert browser.get_webpage()
+    finally:
+        NetworkInterface.frame_queue = None
+    return sorted(round(link.current_load, 9) for link in network.links.values())
+
+
+def test_webpage_is_fetched_through_queue():
+    """Fetching a webpage involves DNS, ARP, routing and a database query, which should all complete via the queue."""
+    frame_queue = FrameDeliveryQueue()
+    _get_webpage_link_loads(frame_queue)
+
+    assert frame_queue.frames_delivered > 0
+    assert len(frame_queue) == 0
+
+
+def test_queue_carries_the_same_traffic_as_direct_delivery():
+    """Delivering frames through the queue should put the same load on each link as delivering them directly."""
+    assert _get_webpage_link_loads(FrameDeliveryQueue()) == _get_webpage_link_loads(None)
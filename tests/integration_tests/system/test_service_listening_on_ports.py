@@ -1,5 +1,5 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
-from typing import Any, Dict, List, Set
+from typing import Any, ClassVar, Dict, List, Set
 
 import yaml
 from pydantic import Field
@@ -89,3 +89,57 @@ def test_set_listen_on_ports_from_config():
     web_browser = client.software_manager.software["web-browser"]
 
     assert not web_browser.listen_on_ports.difference({PORT_LOOKUP["SMB"], PORT_LOOKUP["IPP"]})
+
+
+class _CopyingDatabaseListener(_DatabaseListener, discriminator="copying-database-listener"):
+    class ConfigSchema(_DatabaseListener.ConfigSchema):
+        """ConfigSchema for _CopyingDatabaseListener."""
+
+        type: str = "copying-database-listener"
+
+    config: "_CopyingDatabaseListener.ConfigSchema" = Field(
+        default_factory=lambda: _CopyingDatabaseListener.ConfigSchema()
+    )
+    name: str = "copying-database-listener"
+    copy_listened_payloads: ClassVar[bool] = True
+
+
+def _send_to_server(computer, server, payload, port):
+    computer.session_manager.receive_payload_from_software_manager(
+        payload=payload,
+        dst_ip_address=server.network_interface[1].ip_address,
+        dst_port=port,
+        ip_protocol=PROTOCOL_LOOKUP["TCP"],
+    )
+
+
+def test_listened_payloads_are_only_copied_when_requested(client_server):
+    """Listeners share the payload unless they ask for a copy of it."""
+    computer, server = client_server
+    server.software_manager.install(_DatabaseListener)
+    server.software_manager.install(_CopyingDatabaseListener)
+    listener = server.software_manager.software["database-listener"]
+    copying_listener = server.software_manager.software["copying-database-listener"]
+    payload = {"type": "masquerade as Database traffic"}
+
+    _send_to_server(computer, server, payload, PORT_LOOKUP["POSTGRES_SERVER"])
+
+    assert listener.payloads_received == copying_listener.payloads_received == [payload]
+    assert listener.payloads_received[0] is not copying_listener.payloads_received[0]
+
+
+def test_listen_on_ports_can_be_changed_after_install(client_server):
+    """Assigning new listening ports to installed software changes which payloads it receives."""
+    computer, server = client_server
+    server.software_manager.install(_DatabaseListener)
+    listener = server.software_manager.software["database-listener"]
+
+    listener.listen_on_ports = {PORT_LOOKUP["HTTP"]}
+    _send_to_server(computer, server, "to postgres", PORT_LOOKUP["POSTGRES_SERVER"])
+    _send_to_server(computer, server, "to http", PORT_LOOKUP["HTTP"])
+
+    assert listener.payloads_received == ["to http"]
+
+    server.software_manager.uninstall("database-listener")
+    _send_to_server(computer, server, "after uninstall", PORT_LOOKUP["HTTP"])
+    assert listener.payloads_received == ["to http"]
@@ -2,6 +2,7 @@
 from primaite.game.agent.observations.file_system_observations import FileObservation
 from primaite.game.agent.observations.observation_manager import NullObservation
 from primaite.game.agent.scripted_agents.random_agent import RandomAgent
+from primaite.interface.request import RequestResponse
 
 
 def test_creating_empty_agent():
@@ -51,3 +52,60 @@ def test_creating_agent_from_dict():
     assert len(agent.action_manager.action_map) == 2
     assert isinstance(agent.observation_manager.obs, FileObservation)
     assert len(agent.reward_function.reward_components) == 1
+
+
+def _record_steps(agent: RandomAgent, steps: int) -> None:
+    for step in range(steps):
+        agent.process_action_response(
+            timestep=step,
+            action="do-nothing" if step % 2 else "node-application-execute",
+            parameters={"step": step},
+            request=["do-nothing"],
+            response=RequestResponse(status="success" if step % 3 else "failure", data={"step": step}),
+            observation={"step": step},
+        )
+        agent.history[-1].reward = float(step)
+
+
+def test_agent_history_keeps_full_items_by_default():
+    agent = RandomAgent(config={"ref": "random_agent"})
+    _record_steps(agent, 5)
+
+    assert len(agent.history) == 5
+    assert [item.parameters for item in agent.history] == [{"step": step} for step in range(5)]
+    assert agent.history[2].observation == {"step": 2}
+    assert agent.history.rewards == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_agent_history_last_n_retention():
+    agent = RandomAgent(
+        config={"ref": "random_agent", "history": {"retention": "last-n", "length": 2, "save_observations": False}}
+    )
+    _record_steps(agent, 5)
+
+    assert len(agent.history) == 5
+    assert [item.parameters for item in agent.history] == [{}, {}, {}, {"step": 3}, {"step": 4}]
+    assert all(item.observation is None for item in agent.history)
+    # Older steps are rebuilt from the columns which are kept for every step
+    assert agent.history[1].action == "do-nothing"
+    assert agent.history[0].response.status == "failure"
+    assert agent.history[0].reward == 0.0
+    assert agent.history.timesteps == [0, 1, 2, 3, 4]
+    assert agent.history.actions == ["node-application-execute", "do-nothing"] * 2 + ["node-application-execute"]
+    assert agent.history.response_statuses == ["failure", "success", "success", "failure", "success"]
+    assert agent.history.rewards == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert [item.timestep for item in agent.history[-3:]] == [2, 3, 4]
+
+    agent.show_history()
+
+
+def test_agent_history_none_retention():
+    agent = RandomAgent(config={"ref": "random_agent", "history": {"retention": "none"}})
+    _record_steps(agent, 3)
+
+    assert len(agent.history) == 3
+    assert agent.history[-1].response.data == {"step": 2}
+    # Response data is kept for every step, as TAPs look back at the responses to earlier steps
+    assert agent.history[-2].response.data == {"step": 1}
+    assert agent.history[-2].parameters == {}
+    assert agent.history.rewards == [0.0, 1.0, 2.0]
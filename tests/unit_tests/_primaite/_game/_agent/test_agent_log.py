@@ -13,8 +13,10 @@ def override_dev_mode_temporarily():
     """Temporarily turn off dev mode for this test."""
     primaite_dev_mode = PRIMAITE_CONFIG["developer_mode"]["enabled"]
     PRIMAITE_CONFIG["developer_mode"]["enabled"] = False
+    SIM_OUTPUT.refresh()
     yield  # run tests
     PRIMAITE_CONFIG["developer_mode"]["enabled"] = primaite_dev_mode
+    SIM_OUTPUT.refresh()
 
 
 @pytest.fixture(scope="function")
@@ -135,3 +137,26 @@ def test_critical_agent_log_level(agentlog, capsys):
     assert "WARNING" not in captured
     assert "ERROR" not in captured
     assert "CRITICAL" in captured
+
+
+def test_agent_log_formats_arguments_lazily(agentlog, capsys):
+    """Test that message arguments are only formatted when the message is output."""
+    SIM_OUTPUT.agent_log_level = LogLevel.INFO
+    SIM_OUTPUT.save_agent_logs = False
+    SIM_OUTPUT.write_agent_log_to_terminal = False
+    formatted = []
+
+    class Value:
+        def __str__(self) -> str:
+            formatted.append(True)
+            return "counted"
+
+    agentlog.warning("Value is %s", Value())
+    assert not formatted
+    assert capsys.readouterr().out == ""
+
+    SIM_OUTPUT.write_agent_log_to_terminal = True
+    agentlog.info("Value is %s", Value())
+    assert len(formatted) == 1
+    assert "test_agent: (0) (INFO) Value is counted" in capsys.readouterr().out
+    SIM_OUTPUT.write_agent_log_to_terminal = False
@@ -361,3 +361,26 @@ class TestApplicationsRequiresScan:
 
         obs_not_requiring_scan = ApplicationObservation([], applications_requires_scan=False)
         assert obs_not_requiring_scan.observe(state)["health_status"] == 3  # should be actual value
+
+
+def test_observation_where_reassignment():
+    """Check that observations find their state at the location they were most recently given."""
+    state = {
+        "network": {
+            "nodes": {
+                "client_1": {"services": {"dns-client": {"operating_state": 1, "health_state_actual": 1}}},
+                "client_2": {"services": {"dns-client": {"operating_state": 2, "health_state_actual": 3}}},
+            }
+        }
+    }
+    obs = ServiceObservation(["network", "nodes", "client_1", "services", "dns-client"], services_requires_scan=False)
+    assert obs.observe(state) == {"operating_status": 1, "health_status": 1}
+
+    obs.where = ["network", "nodes", "client_2", "services", "dns-client"]
+    assert obs.observe(state) == {"operating_status": 2, "health_status": 3}
+
+    obs.where = ["network", "nodes", "client_3", "services", "dns-client"]
+    assert obs.observe(state) == obs.default_observation
+
+    obs.where = None
+    assert obs.observe(state) == obs.default_observation
@@ -49,3 +49,57 @@ def test_constant_episode_scheduler():
     result = scheduler(1)
     assert isinstance(result, dict)
     assert {"key": "value"} == result
+
+
+def test_episode_list_scheduler_parses_each_setup_once(monkeypatch):
+    """Each distinct game setup should only be parsed once, and every call should return an independent copy."""
+    parse_count = 0
+    safe_load = yaml.safe_load
+
+    def counting_safe_load(stream):
+        nonlocal parse_count
+        parse_count += 1
+        return safe_load(stream)
+
+    monkeypatch.setattr(yaml, "safe_load", counting_safe_load)
+    schedule = {0: ["episode1"], 1: ["episode2"], 2: ["episode1"]}
+    episode_data = {"episode1": "data: [1]", "episode2": "data: [2]"}
+    scheduler = EpisodeListScheduler(schedule=schedule, episode_data=episode_data, base_scenario="agents: []")
+
+    first = scheduler(0)
+    first["data"].append(3)
+    assert scheduler(2) == {"data": [1], "agents": []}
+    assert scheduler(1) == {"data": [2], "agents": []}
+    assert scheduler(3) == {"data": [1], "agents": []}
+    assert parse_count == 2
+
+
+def test_episode_list_scheduler_prefetch():
+    """A prefetched config should be parsed in the background and returned when its episode is requested."""
+    schedule = {0: ["episode1"], 1: ["episode2"]}
+    episode_data = {"episode1": "data1: 1", "episode2": "data2: 2"}
+    scheduler = EpisodeListScheduler(schedule=schedule, episode_data=episode_data, base_scenario="agents: [[a, b]]")
+
+    scheduler.prefetch(1)
+    assert len(scheduler._pending_configs) == 1
+    scheduler.prefetch(1)
+    assert len(scheduler._pending_configs) == 1
+
+    assert scheduler(1) == {"data2": 2, "agents": ["a", "b"]}
+    assert not scheduler._pending_configs
+    scheduler.prefetch(1)
+    assert not scheduler._pending_configs
+
+
+def test_constant_episode_scheduler_returns_copies():
+    """Every call should return an independent copy of the config, and a newly assigned config should be used."""
+    scheduler = ConstantEpisodeScheduler(config={"game": {"ports": ["HTTP"]}})
+
+    scheduler(0)["game"]["ports"].append("DNS")
+    assert scheduler(1) == {"game": {"ports": ["HTTP"]}}
+
+    scheduler.config = {"game": {"ports": ["ARP"]}}
+    assert scheduler(2) == {"game": {"ports": ["ARP"]}}
+
+    scheduler.config = {"game": {"parse": lambda x: x}}
+    assert scheduler(3)["game"]["parse"](1) == 1
@@ -251,3 +251,18 @@ def test_serialisation(file_system):
     assert file_system.model_dump_json() == deserialised_file_sys.model_dump_json()
 
     file_system.show(full=True)
+
+
+def test_file_system_state_is_invalidated_by_file_changes(file_system):
+    """Changing a file discards the cached state of its folder and file system."""
+    file = file_system.create_file(file_name="test_file.txt", folder_name="test_folder")
+    state = file_system.describe_state_cached()
+    assert file_system.describe_state_cached() is state
+
+    file.corrupt()
+    new_state = file_system.describe_state_cached()
+    assert new_state is not state
+    assert new_state["folders"]["test_folder"]["files"]["test_file.txt"] == file.describe_state()
+
+    file_system.delete_file(folder_name="test_folder", file_name="test_file.txt")
+    assert "test_file.txt" in file_system.describe_state_cached()["folders"]["test_folder"]["deleted_files"]
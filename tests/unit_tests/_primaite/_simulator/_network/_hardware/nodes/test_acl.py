@@ -297,3 +297,43 @@ def test_ip_traffic_from_specific_subnet():
     assert not acl.is_permitted(not_permitted_frame_2)[0]
 
     acl.show()
+
+
+def test_cached_decision_counts_matches(router_with_acl_rules):
+    """Tests that repeated frames reuse the cached decision but still increment the match count of the rule."""
+    acl = router_with_acl_rules.acl
+    frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr=generate_mac_address(), dst_mac_addr=generate_mac_address()),
+        ip=IPPacket(src_ip_address="192.168.1.1", dst_ip_address="192.168.1.2", protocol=PROTOCOL_LOOKUP["TCP"]),
+        tcp=TCPHeader(src_port=PORT_LOOKUP["HTTPS"], dst_port=PORT_LOOKUP["HTTP"]),
+    )
+    for _ in range(3):
+        is_permitted, rule = acl.is_permitted(frame)
+        assert is_permitted
+        assert rule is acl.acl[1]
+    assert acl.acl[1].match_count == 3
+
+
+def test_rule_changes_invalidate_cached_decisions(router_with_acl_rules):
+    """Tests that adding, changing and removing rules are reflected in subsequent decisions."""
+    acl = router_with_acl_rules.acl
+    frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr=generate_mac_address(), dst_mac_addr=generate_mac_address()),
+        ip=IPPacket(src_ip_address="192.168.1.1", dst_ip_address="192.168.1.2", protocol=PROTOCOL_LOOKUP["TCP"]),
+        tcp=TCPHeader(src_port=PORT_LOOKUP["HTTPS"], dst_port=PORT_LOOKUP["HTTP"]),
+    )
+    assert acl.is_permitted(frame)[0]
+
+    acl.add_rule(action=ACLAction.DENY, src_ip_address="192.168.1.0", src_wildcard_mask="0.0.0.255", position=0)
+    is_permitted, rule = acl.is_permitted(frame)
+    assert not is_permitted
+    assert rule is acl.acl[0]
+
+    acl.acl[0].action = ACLAction.PERMIT
+    assert acl.is_permitted(frame)[0]
+
+    acl.remove_rule(0)
+    acl.remove_rule(1)
+    is_permitted, rule = acl.is_permitted(frame)
+    assert not is_permitted
+    assert rule is acl.implicit_rule
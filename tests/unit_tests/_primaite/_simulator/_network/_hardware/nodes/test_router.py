@@ -1,7 +1,9 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 from ipaddress import IPv4Address
 
+from primaite.simulator.network.container import Network
 from primaite.simulator.network.hardware.nodes.network.router import ACLAction, Router
+from primaite.simulator.network.hardware.nodes.network.switch import Switch
 from primaite.utils.validation.ip_protocol import PROTOCOL_LOOKUP
 from primaite.utils.validation.port import PORT_LOOKUP
 
@@ -109,3 +111,66 @@ def test_wireless_router_from_config():
         == r20.protocol
         == None
     )
+
+
+def test_route_table_longest_prefix_match():
+    """Test that the most specific route wins, metrics break ties and route changes are reflected in lookups."""
+    router = Router.from_config(config={"type": "router", "hostname": "router_1"})
+    route_table = router.route_table
+    route_table.add_route(address="10.0.0.0", subnet_mask="255.0.0.0", next_hop_ip_address="192.168.1.1")
+    route_table.add_route(address="10.1.0.0", subnet_mask="255.255.0.0", next_hop_ip_address="192.168.1.2", metric=5)
+    route_table.add_route(address="10.1.0.0", subnet_mask="255.255.0.0", next_hop_ip_address="192.168.1.3", metric=1)
+
+    assert route_table.find_best_route("10.1.2.3").next_hop_ip_address == IPv4Address("192.168.1.3")
+    assert route_table.find_best_route("10.2.2.3").next_hop_ip_address == IPv4Address("192.168.1.1")
+    assert route_table.find_best_route("172.16.0.1") is None
+
+    route_table.set_default_route_next_hop_ip_address("192.168.1.254")
+    assert route_table.find_best_route("172.16.0.1") is route_table.default_route
+
+    route_table.routes[1].metric = 0
+    assert route_table.find_best_route("10.1.2.3").next_hop_ip_address == IPv4Address("192.168.1.2")
+
+    route_table.add_route(address="10.1.2.0", subnet_mask="255.255.255.0", next_hop_ip_address="192.168.1.4")
+    assert route_table.find_best_route("10.1.2.3").next_hop_ip_address == IPv4Address("192.168.1.4")
+
+
+def test_router_interface_lookups_follow_port_configuration():
+    """Test that lookups of the router's interfaces by IP address reflect port configuration and enabled state."""
+    router = Router.from_config(config={"type": "router", "hostname": "router_1"})
+    switch = Switch.from_config(config={"type": "switch", "hostname": "switch_1"})
+    network = Network()
+    network.connect(router.network_interface[1], switch.network_interface[1])
+    network.connect(router.network_interface[2], switch.network_interface[2])
+    router.disable_port(1)
+    router.disable_port(2)
+    router.configure_port(port=1, ip_address="192.168.1.1", subnet_mask="255.255.255.0")
+    router.configure_port(port=2, ip_address="192.168.0.1", subnet_mask="255.255.0.0")
+    session_manager = router.software_manager.session_manager
+
+    assert router.ip_is_router_interface(IPv4Address("192.168.1.1"))
+    assert not router.ip_is_router_interface(IPv4Address("192.168.1.1"), enabled_only=True)
+    assert router.ip_is_in_router_interface_subnet(IPv4Address("192.168.1.50"))
+    assert session_manager.resolve_outbound_network_interface(IPv4Address("192.168.1.50")) is None
+
+    router.enable_port(1)
+    router.enable_port(2)
+    assert router.ip_is_router_interface(IPv4Address("192.168.1.1"), enabled_only=True)
+    # Port 1 is connected first, so it is preferred over the wider overlapping subnet of port 2
+    assert (
+        session_manager.resolve_outbound_network_interface(IPv4Address("192.168.1.50")) is router.network_interface[1]
+    )
+    assert (
+        session_manager.resolve_outbound_network_interface(IPv4Address("192.168.7.50")) is router.network_interface[2]
+    )
+
+    router.disable_port(1)
+    assert (
+        session_manager.resolve_outbound_network_interface(IPv4Address("192.168.1.50")) is router.network_interface[2]
+    )
+
+    router.configure_port(port=2, ip_address="10.0.0.1", subnet_mask="255.0.0.0")
+    assert not router.ip_is_router_interface(IPv4Address("192.168.0.1"))
+    assert router.ip_is_router_interface(IPv4Address("10.0.0.1"), enabled_only=True)
+    assert not router.ip_is_in_router_interface_subnet(IPv4Address("192.168.7.50"))
+    assert session_manager.resolve_outbound_network_interface(IPv4Address("10.1.2.3")) is router.network_interface[2]
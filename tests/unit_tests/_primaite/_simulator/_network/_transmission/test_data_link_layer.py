@@ -1,11 +1,23 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 import pytest
 
+from primaite.simulator.network.protocols.http import HttpRequestMethod, HttpRequestPacket
 from primaite.simulator.network.protocols.icmp import ICMPPacket
-from primaite.simulator.network.transmission.data_link_layer import EthernetHeader, Frame
-from primaite.simulator.network.transmission.network_layer import IPPacket, Precedence
+from primaite.simulator.network.transmission.data_link_layer import (
+    CompactEthernetHeader,
+    CompactFrame,
+    EthernetHeader,
+    Frame,
+)
+from primaite.simulator.network.transmission.network_layer import CompactIPPacket, IPPacket, Precedence
 from primaite.simulator.network.transmission.primaite_layer import AgentSource, DataStatus
-from primaite.simulator.network.transmission.transport_layer import TCPFlags, TCPHeader, UDPHeader
+from primaite.simulator.network.transmission.transport_layer import (
+    CompactTCPHeader,
+    CompactUDPHeader,
+    TCPFlags,
+    TCPHeader,
+    UDPHeader,
+)
 from primaite.utils.validation.ip_protocol import PROTOCOL_LOOKUP
 from primaite.utils.validation.port import PORT_LOOKUP
 
@@ -92,3 +104,110 @@ def test_icmp_frame_creation_fails_without_icmp_header():
             ethernet=EthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
             ip=IPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20", protocol=PROTOCOL_LOOKUP["ICMP"]),
         )
+
+
+def test_frame_size_is_cached_until_modified():
+    """Tests that the Frame size is cached and recalculated once the Frame is modified."""
+    frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=IPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20"),
+        tcp=TCPHeader(src_port=8080, dst_port=80),
+    )
+    size = frame.size
+    assert frame._size == size
+
+    frame.payload = "Hello, World!"
+    assert frame._size is None
+    assert frame.size > size
+
+    frame.ip.ttl = 9
+    frame.invalidate_size()
+    assert frame.size == frame._calculate_size()
+
+
+def test_frame_analytical_size(monkeypatch):
+    """Tests that the analytical size model sums the standard header sizes and the payload size."""
+    monkeypatch.setattr(Frame, "analytical_size", True)
+    frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=IPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20", protocol=PROTOCOL_LOOKUP["UDP"]),
+        udp=UDPHeader(src_port=8080, dst_port=80),
+        payload=b"Hello, World!",
+    )
+    assert frame.size == 14 + 20 + 8 + 13
+
+    frame.payload = HttpRequestPacket(request_method=HttpRequestMethod.GET, request_url="http://example.com")
+    assert frame.size == 14 + 20 + 8 + 256
+
+    frame.payload = {"type": "sql", "sql": "SELECT"}
+    assert frame.size == 14 + 20 + 8 + 64
+
+
+def test_compact_frame_matches_frame():
+    """Tests that a CompactFrame has the same defaults, serialisation and size as the equivalent Frame."""
+    frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=IPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20"),
+        tcp=TCPHeader(src_port=8080, dst_port=80),
+        payload="Hello, World!",
+    )
+    compact_frame = CompactFrame(
+        ethernet=CompactEthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=CompactIPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20"),
+        tcp=CompactTCPHeader(src_port=8080, dst_port=80),
+        payload="Hello, World!",
+    )
+
+    assert compact_frame.ip.src_ip_address == frame.ip.src_ip_address
+    assert compact_frame.ip.ttl == 64
+    assert compact_frame.tcp.flags == [TCPFlags.SYN]
+    assert compact_frame.primaite.data_status == DataStatus.GOOD
+    assert compact_frame.model_dump_json() == frame.model_dump_json()
+    assert compact_frame.size == frame.size
+    assert compact_frame.to_frame().model_dump() == frame.model_dump()
+
+
+def test_compact_frame_size_is_cached_until_modified():
+    """Tests that the cached size of a CompactFrame is invalidated when the CompactFrame is modified."""
+    frame = CompactFrame(
+        ethernet=CompactEthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=CompactIPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20"),
+        tcp=CompactTCPHeader(src_port=8080, dst_port=80),
+    )
+    size = frame.size
+    assert frame._size == size
+
+    frame.payload = "Hello, World!"
+    assert frame._size is None
+    assert frame.size > size
+
+    frame.decrement_ttl()
+    assert frame._size is None
+    assert frame.to_frame().ip.ttl == 63
+
+
+def test_compact_frame_creation_fails_udp_without_header():
+    """Tests CompactFrame creation fails if the IPProtocol is UDP but there is no UDPHeader."""
+    with pytest.raises(ValueError):
+        CompactFrame(
+            ethernet=CompactEthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+            ip=CompactIPPacket(
+                src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20", protocol=PROTOCOL_LOOKUP["UDP"]
+            ),
+            tcp=CompactTCPHeader(src_port=8080, dst_port=80),
+        )
+
+
+def test_compact_frame_is_arp():
+    """Tests that CompactFrame exposes the same properties as Frame."""
+    frame = CompactFrame(
+        ethernet=CompactEthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="ff:ff:ff:ff:ff:ff"),
+        ip=CompactIPPacket(
+            src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20", protocol=PROTOCOL_LOOKUP["UDP"]
+        ),
+        udp=CompactUDPHeader(src_port=PORT_LOOKUP["ARP"], dst_port=PORT_LOOKUP["ARP"]),
+    )
+    assert frame.is_broadcast
+    assert frame.is_arp
+    assert not frame.is_icmp
+    assert frame.can_transmit
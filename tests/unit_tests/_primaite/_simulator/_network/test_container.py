@@ -1,5 +1,6 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
 import json
+from ipaddress import IPv4Address
 
 import pytest
 
@@ -106,3 +107,33 @@ def test_remove_link(network):
     network.remove_link(link)
     assert len(network.links) is 5
     assert network.links.get(link.uuid) is None
+
+
+def test_get_node_by_ip_address(network):
+    """Nodes should be found by the IP address of any of their interfaces, which is kept up to date."""
+    client_1 = network.get_node_by_hostname("client_1")
+    router_1 = network.get_node_by_hostname("router_1")
+    assert network.get_node_by_ip_address("192.168.10.21") is client_1
+    assert network.get_node_by_ip_address(IPv4Address("192.168.1.1")) is router_1
+    assert network.get_node_by_ip_address("192.168.10.1") is router_1
+    assert network.get_node_by_ip_address("10.0.0.1") is None
+
+    router_1.configure_port(port=1, ip_address="10.0.0.1", subnet_mask="255.255.255.0")
+    assert network.get_node_by_ip_address("10.0.0.1") is router_1
+    assert network.get_node_by_ip_address("192.168.1.1") is None
+
+    network.remove_node(client_1)
+    assert network.get_node_by_ip_address("192.168.10.21") is None
+
+
+def test_node_indexes_follow_added_and_removed_nodes(network):
+    """The hostname and node type lookups should reflect nodes being added and removed."""
+    client_1 = network.get_node_by_hostname("client_1")
+    network.remove_node(client_1)
+    assert client_1 not in network.computer_nodes
+    assert len(network.computer_nodes) == 1
+
+    network.add_node(client_1)
+    assert network.get_node_by_hostname("client_1") is client_1
+    assert network.computer_nodes[-1] is client_1
+    assert network.get_node_by_ip_address("192.168.10.21") is client_1
@@ -0,0 +1,56 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import pytest
+
+from primaite.simulator.network.frame_queue import FrameDeliveryQueue
+
+
+def test_frames_sent_during_delivery_are_queued():
+    """Frames sent while a frame is being delivered should be delivered afterwards, in the order they were sent."""
+    queue = FrameDeliveryQueue()
+    delivered = []
+
+    def deliver(name, replies=()):
+        delivered.append(name)
+        for reply in replies:
+            queue.submit(deliver, reply)
+        # frames sent during this delivery have not been delivered yet
+        assert delivered[-1] == name
+
+    queue.submit(deliver, "request", ["reply_1", "reply_2"])
+
+    assert delivered == ["request", "reply_1", "reply_2"]
+    assert queue.frames_delivered == 3
+    assert len(queue) == 0
+
+
+def test_flush_during_delivery():
+    """Flushing while a frame is being delivered should deliver the queued frames before flush returns."""
+    queue = FrameDeliveryQueue()
+    delivered = []
+
+    def deliver_request():
+        delivered.append("request")
+        queue.submit(delivered.append, "reply")
+        queue.flush()
+        delivered.append("request handled")
+
+    queue.submit(deliver_request)
+
+    assert delivered == ["request", "reply", "request handled"]
+
+
+def test_failed_delivery_discards_queued_frames():
+    """If a delivery fails, the frames still queued should not be delivered by a later send."""
+    queue = FrameDeliveryQueue()
+    delivered = []
+
+    def deliver_and_fail():
+        queue.submit(delivered.append, "reply")
+        raise ValueError("Delivery failed")
+
+    with pytest.raises(ValueError):
+        queue.submit(deliver_and_fail)
+    assert len(queue) == 0
+
+    queue.submit(delivered.append, "next")
+    assert delivered == ["next"]
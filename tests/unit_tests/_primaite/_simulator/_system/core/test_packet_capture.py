@@ -0,0 +1,147 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+from ipaddress import IPv4Address
+
+import pytest
+
+from primaite import PRIMAITE_CONFIG
+from primaite.simulator import SIM_OUTPUT
+from primaite.simulator.network.protocols.arp import ARPPacket
+from primaite.simulator.network.protocols.icmp import ICMPPacket, ICMPType
+from primaite.simulator.network.transmission.data_link_layer import (
+    CompactEthernetHeader,
+    CompactFrame,
+    EthernetHeader,
+    Frame,
+)
+from primaite.simulator.network.transmission.network_layer import CompactIPPacket, IPPacket
+from primaite.simulator.network.transmission.transport_layer import CompactTCPHeader, TCPFlags, TCPHeader, UDPHeader
+from primaite.simulator.system.core.packet_capture import PacketCapture
+from primaite.utils.validation.ip_protocol import PROTOCOL_LOOKUP
+from primaite.utils.validation.port import PORT_LOOKUP
+
+
+@pytest.fixture(autouse=True)
+def pcap_output(tmp_path):
+    """Temporarily save PCAP logs to a temporary directory, with dev mode off."""
+    primaite_dev_mode = PRIMAITE_CONFIG["developer_mode"]["enabled"]
+    PRIMAITE_CONFIG["developer_mode"]["enabled"] = False
+    original_path = SIM_OUTPUT._path
+    SIM_OUTPUT.path = tmp_path
+    SIM_OUTPUT.save_pcap_logs = True
+    yield
+    PacketCapture.clear()
+    SIM_OUTPUT.save_pcap_logs = False
+    SIM_OUTPUT.pcap_format = "json"
+    SIM_OUTPUT._path = original_path
+    PRIMAITE_CONFIG["developer_mode"]["enabled"] = primaite_dev_mode
+    SIM_OUTPUT.refresh()
+
+
+def _frames():
+    tcp_frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=IPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20"),
+        tcp=TCPHeader(src_port=8080, dst_port=80, flags=[TCPFlags.SYN, TCPFlags.ACK]),
+        payload={"request": "GET", "files": ["a.txt", "b.txt"]},
+    )
+    tcp_frame.set_sent_timestamp()
+    tcp_frame.set_received_timestamp()
+    arp_frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="ff:ff:ff:ff:ff:ff"),
+        ip=IPPacket(
+            src_ip_address="192.168.0.10", dst_ip_address="192.168.0.255", protocol=PROTOCOL_LOOKUP["UDP"], ttl=3
+        ),
+        udp=UDPHeader(src_port=PORT_LOOKUP["ARP"], dst_port=PORT_LOOKUP["ARP"]),
+        payload=ARPPacket(
+            sender_mac_addr="aa:bb:cc:dd:ee:ff",
+            sender_ip_address=IPv4Address("192.168.0.10"),
+            target_ip_address=IPv4Address("192.168.0.20"),
+        ),
+    )
+    icmp_frame = Frame(
+        ethernet=EthernetHeader(src_mac_addr="11:22:33:44:55:66", dst_mac_addr="aa:bb:cc:dd:ee:ff"),
+        ip=IPPacket(src_ip_address="192.168.0.20", dst_ip_address="192.168.0.10", protocol=PROTOCOL_LOOKUP["ICMP"]),
+        icmp=ICMPPacket(icmp_type=ICMPType.ECHO_REPLY, sequence=3),
+    )
+    return [tcp_frame, arp_frame, icmp_frame]
+
+
+@pytest.mark.parametrize("pcap_format", ["json", "binary"])
+def test_capture_and_read(pcap_format):
+    """Test that captured frames are read back as the dictionaries they serialise to as JSON, in either format."""
+    SIM_OUTPUT.pcap_format = pcap_format
+    pcap = PacketCapture(hostname="test", port_num=1)
+    frames = _frames()
+
+    for frame in frames:
+        pcap.capture_inbound(frame)
+    pcap.capture_outbound(frames[0])
+
+    assert pcap.inbound_path.suffix == (".bin" if pcap_format == "binary" else ".log")
+    assert pcap.read() == [frame.model_dump(mode="json") for frame in frames]
+    assert pcap.read(outbound=True) == [frames[0].model_dump(mode="json")]
+
+
+def test_binary_records_are_smaller_than_json():
+    """Test that binary records take less space than JSON lines."""
+    pcaps = {}
+    for pcap_format in ["json", "binary"]:
+        SIM_OUTPUT.pcap_format = pcap_format
+        pcaps[pcap_format] = PacketCapture(hostname=pcap_format)
+        for frame in _frames():
+            pcaps[pcap_format].capture_inbound(frame)
+    PacketCapture.clear()
+
+    assert pcaps["binary"].inbound_path.stat().st_size < pcaps["json"].inbound_path.stat().st_size / 2
+
+
+def test_binary_capture_of_compact_frame():
+    """Test that a CompactFrame captured as a binary record reads back the same as the equivalent Frame."""
+    SIM_OUTPUT.pcap_format = "binary"
+    pcap = PacketCapture(hostname="test")
+    frame = CompactFrame(
+        ethernet=CompactEthernetHeader(src_mac_addr="aa:bb:cc:dd:ee:ff", dst_mac_addr="11:22:33:44:55:66"),
+        ip=CompactIPPacket(src_ip_address="192.168.0.10", dst_ip_address="192.168.0.20"),
+        tcp=CompactTCPHeader(src_port=8080, dst_port=80),
+        payload="Hello, World!",
+    )
+
+    pcap.capture_inbound(frame)
+
+    assert pcap.read() == [frame.to_frame().model_dump(mode="json")]
+
+
+def test_clear_writes_and_closes_files():
+    """Test that clearing writes every captured frame to file, and that frames captured afterwards are appended."""
+    pcap = PacketCapture(hostname="test")
+    frames = _frames()
+
+    pcap.capture_inbound(frames[0])
+    PacketCapture.clear()
+    assert len(PacketCapture.read_file(pcap.inbound_path)) == 1
+
+    pcap.capture_inbound(frames[1])
+    PacketCapture.clear()
+    assert len(PacketCapture.read_file(pcap.inbound_path)) == 2
+
+
+def test_capture_when_logs_are_not_saved():
+    """Test that no PCAP log is written while PCAP logs are not saved."""
+    SIM_OUTPUT.save_pcap_logs = False
+    pcap = PacketCapture(hostname="test")
+
+    pcap.capture_inbound(_frames()[0])
+
+    assert pcap.inbound_path is None
+
+
+def test_ping_is_captured(client_server):
+    """Test that the frames of a ping are captured on the interfaces of both nodes."""
+    computer, server = client_server
+
+    assert computer.ping(server.network_interface[1].ip_address)
+
+    sent = [frame for frame in computer.network_interface[1].pcap.read(outbound=True) if frame["icmp"]]
+    received = [frame for frame in server.network_interface[1].pcap.read() if frame["icmp"]]
+    assert len(sent) == len(received) == 4
+    assert all(frame["icmp"]["icmp_type"] == ICMPType.ECHO_REQUEST.value for frame in received)
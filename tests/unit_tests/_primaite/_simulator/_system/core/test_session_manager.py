@@ -0,0 +1,106 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+from ipaddress import IPv4Address
+
+from primaite.simulator.network.hardware.nodes.host.computer import Computer
+from primaite.simulator.network.transmission.data_link_layer import CompactFrame
+from primaite.simulator.system.core.session_manager import SessionManager
+from primaite.simulator.system.core.sys_log import SysLog
+from primaite.utils.validation.ip_protocol import PROTOCOL_LOOKUP
+from primaite.utils.validation.port import PORT_LOOKUP
+
+
+def _session_key(port: int):
+    return PROTOCOL_LOOKUP["TCP"], IPv4Address("192.168.1.2"), port, PORT_LOOKUP["HTTP"]
+
+
+def test_sessions_unbounded_by_default():
+    """Test that sessions are neither expired nor evicted when no limits are configured."""
+    session_manager = SessionManager(sys_log=SysLog(hostname="test"))
+    for port in range(1000, 1100):
+        session_manager._get_or_create_session(_session_key(port))
+    session_manager.apply_timestep(1000)
+
+    assert session_manager.num_sessions == 100
+    assert session_manager.sessions_expired == 0
+    assert session_manager.sessions_evicted == 0
+
+
+def test_idle_sessions_expire():
+    """Test that only sessions idle for longer than the idle timeout are expired."""
+    session_manager = SessionManager(sys_log=SysLog(hostname="test"), idle_timeout=2)
+    stale = session_manager._get_or_create_session(_session_key(1000))
+    session_manager._get_or_create_session(_session_key(1001))
+
+    session_manager.apply_timestep(2)
+    session_manager._get_or_create_session(_session_key(1001))
+    session_manager.apply_timestep(3)
+
+    assert session_manager.num_sessions == 1
+    assert session_manager.sessions_expired == 1
+    assert stale.uuid not in session_manager.sessions_by_uuid
+    assert _session_key(1001) in session_manager.sessions_by_key
+
+
+def test_least_recently_used_session_evicted():
+    """Test that the least recently used session is evicted once the session table is full."""
+    session_manager = SessionManager(sys_log=SysLog(hostname="test"), max_sessions=2)
+    session_manager._get_or_create_session(_session_key(1000))
+    session_manager._get_or_create_session(_session_key(1001))
+    session_manager._get_or_create_session(_session_key(1000))
+    session_manager._get_or_create_session(_session_key(1002))
+
+    assert session_manager.num_sessions == 2
+    assert session_manager.sessions_evicted == 1
+    assert set(session_manager.sessions_by_key) == {_session_key(1000), _session_key(1002)}
+    assert len(session_manager.sessions_by_uuid) == 2
+
+
+def test_node_session_limits_from_config():
+    """Test that the node config sets the session manager limits."""
+    computer = Computer.from_config(
+        {
+            "type": "computer",
+            "hostname": "computer",
+            "ip_address": "192.168.1.2",
+            "subnet_mask": "255.255.255.0",
+            "session_idle_timeout": 5,
+            "max_sessions": 10,
+        }
+    )
+    assert computer.session_manager.idle_timeout == 5
+    assert computer.session_manager.max_sessions == 10
+
+
+def test_node_sessions_expire_between_pings(client_server):
+    """Test that node sessions are expired on timestep, and that expiry does not break later traffic."""
+    computer, server = client_server
+    server.session_manager.idle_timeout = 1
+    server.session_manager.max_sessions = 4
+
+    assert computer.ping(server.network_interface[1].ip_address)
+    assert server.session_manager.num_sessions > 0
+
+    server.apply_timestep(5)
+    assert server.session_manager.num_sessions == 0
+    assert server.session_manager.sessions_expired > 0
+
+    assert computer.ping(server.network_interface[1].ip_address)
+    assert server.session_manager.num_sessions <= 4
+
+
+def test_compact_frames_transmitted(client_server, monkeypatch):
+    """Test that session managers transmit CompactFrames when compact frames are enabled."""
+    monkeypatch.setattr(SessionManager, "compact_frames", True)
+    computer, server = client_server
+    received_frames = []
+    receive_frame = server.session_manager.receive_frame
+
+    def _capture_frame(frame, from_network_interface):
+        received_frames.append(frame)
+        receive_frame(frame, from_network_interface)
+
+    monkeypatch.setattr(server.session_manager, "receive_frame", _capture_frame)
+
+    assert computer.ping(server.network_interface[1].ip_address)
+    assert received_frames
+    assert all(isinstance(frame, CompactFrame) for frame in received_frames)
@@ -13,8 +13,10 @@ def override_dev_mode_temporarily():
     """Temporarily turn off dev mode for this test."""
     primaite_dev_mode = PRIMAITE_CONFIG["developer_mode"]["enabled"]
     PRIMAITE_CONFIG["developer_mode"]["enabled"] = False
+    SIM_OUTPUT.refresh()
     yield  # run tests
     PRIMAITE_CONFIG["developer_mode"]["enabled"] = primaite_dev_mode
+    SIM_OUTPUT.refresh()
 
 
 @pytest.fixture(scope="function")
@@ -135,3 +137,73 @@ def test_critical_sys_log_level(syslog, capsys):
     assert "WARNING" not in captured
     assert "ERROR" not in captured
     assert "CRITICAL" in captured
+
+
+class _CountingValue:
+    """Value which counts how many times it is formatted into a message."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "counted"
+
+
+def test_sys_log_formats_arguments_lazily(syslog, capsys):
+    """Test that message arguments are only formatted when the message is output."""
+    SIM_OUTPUT.sys_log_level = LogLevel.INFO
+    SIM_OUTPUT.save_sys_logs = False
+    SIM_OUTPUT.write_sys_log_to_terminal = False
+    value = _CountingValue()
+
+    syslog.warning("Value is %s", value)
+    assert value.formatted == 0
+    assert capsys.readouterr().out == ""
+
+    SIM_OUTPUT.write_sys_log_to_terminal = True
+    syslog.debug("Value is %s", value)
+    assert value.formatted == 0
+    syslog.info("Value is %s", value)
+    assert value.formatted == 1
+    assert "test: (INFO) Value is counted" in capsys.readouterr().out
+
+    syslog.info("Progress is 100%")
+    assert "Progress is 100%" in capsys.readouterr().out
+    SIM_OUTPUT.write_sys_log_to_terminal = False
+
+
+def test_sys_log_to_terminal_while_output_is_off(syslog, capsys):
+    """Test that a message sent to the terminal explicitly is printed even while sys logs have no output."""
+    SIM_OUTPUT.sys_log_level = LogLevel.INFO
+    SIM_OUTPUT.save_sys_logs = False
+    SIM_OUTPUT.write_sys_log_to_terminal = False
+
+    syslog.info("Value is %s", 5, to_terminal=True)
+    syslog.debug("Value is %s", 6, to_terminal=True)
+
+    captured = capsys.readouterr().out
+    assert "Value is 5" in captured
+    assert "Value is 6" not in captured
+
+
+def test_sys_log_settings_refresh_from_dev_mode(monkeypatch):
+    """Test that the cached output settings only pick up dev mode config changes once refreshed."""
+    SIM_OUTPUT.sys_log_level = LogLevel.WARNING
+    SIM_OUTPUT.write_sys_log_to_terminal = False
+    monkeypatch.setitem(PRIMAITE_CONFIG["developer_mode"], "enabled", True)
+    monkeypatch.setitem(PRIMAITE_CONFIG["developer_mode"], "sys_log_level", "DEBUG")
+    monkeypatch.setitem(PRIMAITE_CONFIG["developer_mode"], "output_to_terminal", True)
+
+    assert SIM_OUTPUT.sys_log_level == LogLevel.WARNING
+    assert not SIM_OUTPUT.write_sys_log_to_terminal
+
+    SIM_OUTPUT.refresh()
+    assert SIM_OUTPUT.sys_log_level == LogLevel.DEBUG
+    assert SIM_OUTPUT.write_sys_log_to_terminal
+    assert SIM_OUTPUT.sys_log_threshold == LogLevel.DEBUG
+
+    monkeypatch.setitem(PRIMAITE_CONFIG["developer_mode"], "enabled", False)
+    SIM_OUTPUT.refresh()
+    assert SIM_OUTPUT.sys_log_level == LogLevel.WARNING
+    assert SIM_OUTPUT.sys_log_threshold > LogLevel.CRITICAL
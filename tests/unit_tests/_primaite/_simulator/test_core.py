@@ -1,10 +1,12 @@
 # © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
-from typing import Callable, Dict, List, Literal, Tuple
+import copy
+from typing import Callable, ClassVar, Dict, List, Literal, Tuple
 
 import pytest
 from pydantic import ValidationError
 
-from primaite.simulator.core import SimComponent
+from primaite.interface.request import RequestResponse
+from primaite.simulator.core import RequestManager, RequestType, SimComponent
 
 
 class TestIsolatedSimComponent:
@@ -46,3 +48,150 @@ class TestIsolatedSimComponent:
         dump = comp.model_dump_json()
         reconstructed = TestComponent.model_validate_json(dump)
         assert dump == reconstructed.model_dump_json()
+
+    def test_state_caching_disabled_by_default(self):
+        """Components that do not opt in to state caching build a new state each time."""
+
+        class TestComponent(SimComponent):
+            name: str
+
+            def describe_state(self) -> Dict:
+                return {"name": self.name}
+
+        comp = TestComponent(name="computer")
+        assert comp.describe_state_cached() is not comp.describe_state_cached()
+
+    def test_state_caching(self):
+        """Cached state is reused until an attribute is set or the state is explicitly invalidated."""
+
+        class TestComponent(SimComponent):
+            state_caching: ClassVar[bool] = True
+            name: str
+            tags: List[str] = []
+
+            def describe_state(self) -> Dict:
+                return {"name": self.name, "tags": list(self.tags)}
+
+        comp = TestComponent(name="computer")
+        state = comp.describe_state_cached()
+        assert comp.describe_state_cached() is state
+
+        comp.name = "server"
+        new_state = comp.describe_state_cached()
+        assert new_state is not state
+        assert new_state["name"] == "server"
+
+        comp.tags.append("critical")
+        assert comp.describe_state_cached() is new_state
+        comp.invalidate_state()
+        assert comp.describe_state_cached()["tags"] == ["critical"]
+
+    def test_state_invalidation_propagates_to_parent(self):
+        """Invalidating a component also invalidates the cached state of its parent."""
+
+        class Child(SimComponent):
+            state_caching: ClassVar[bool] = True
+            value: int = 0
+
+            def describe_state(self) -> Dict:
+                return {"value": self.value}
+
+        class Parent(SimComponent):
+            state_caching: ClassVar[bool] = True
+            child: Child
+
+            def describe_state(self) -> Dict:
+                return {"child": self.child.describe_state_cached()}
+
+        parent = Parent(child=Child())
+        parent.child.parent = parent
+        state = parent.describe_state_cached()
+        assert parent.describe_state_cached() is state
+
+        parent.child.value = 1
+        assert parent.describe_state_cached()["child"]["value"] == 1
+
+    def test_change_count_propagates_to_parent(self):
+        """Changing a component counts as a change of the component and of its ancestors, but not its siblings."""
+
+        class TestComponent(SimComponent):
+            value: int = 0
+
+            def describe_state(self) -> Dict:
+                return {}
+
+        parent = TestComponent()
+        child = TestComponent()
+        sibling = TestComponent()
+        child.parent = parent
+        sibling.parent = parent
+        parent_count, child_count, sibling_count = parent.change_count, child.change_count, sibling.change_count
+
+        child.value = 1
+        assert child.change_count > child_count
+        assert parent.change_count > parent_count
+        assert sibling.change_count == sibling_count
+
+        parent_count = parent.change_count
+        child.invalidate_state()
+        assert parent.change_count > parent_count
+
+    def test_change_count_propagates_once_between_reads(self):
+        """Repeated changes between reads only walk up to the root once, but are always seen by the next read."""
+
+        class TestComponent(SimComponent):
+            value: int = 0
+
+            def describe_state(self) -> Dict:
+                return {}
+
+        root = TestComponent()
+        parent = TestComponent()
+        child = TestComponent()
+        parent.parent = root
+        child.parent = parent
+        root_count, parent_count = root.change_count, parent.change_count
+
+        child.value = 1
+        parent.value = 1
+        child.value = 2
+        assert root.change_count == root_count + 1
+        assert parent.change_count == parent_count + 1
+
+        root_count = root.change_count
+        child.value = 3
+        assert root.change_count == root_count + 1
+
+        # A copy of a component which has changed in the current epoch still counts its own changes
+        root.value = 1
+        restored_root = copy.deepcopy(root)
+        restored_count = restored_root.__dict__["_change_count"]
+        restored_root.value = 2
+        assert restored_root.change_count == restored_count + 1
+
+
+class TestRequestManager:
+    """Test resolving requests with the RequestManager."""
+
+    def test_resolve(self):
+        """Requests resolve to the leaf request type that handles them, and the options passed to it."""
+        leaf = RequestType(func=lambda request, context: RequestResponse(status="success"))
+        child_manager = RequestManager()
+        child_manager.add_request("do", leaf)
+        root_manager = RequestManager()
+        root_manager.add_request("child", RequestType(func=child_manager))
+
+        assert root_manager.resolve(["child", "do", "option"]) == (leaf, ["option"])
+        assert root_manager.resolve(["child", "missing"]) is None
+        assert root_manager.resolve(["child"]) is None
+
+    def test_structure_version(self):
+        """Adding or removing a request changes the structure version."""
+        request_manager = RequestManager()
+        version = RequestManager.structure_version
+        request_manager.add_request("do", RequestType(func=lambda request, context: RequestResponse(status="success")))
+        assert RequestManager.structure_version != version
+
+        version = RequestManager.structure_version
+        request_manager.remove_request("do")
+        assert RequestManager.structure_version != version
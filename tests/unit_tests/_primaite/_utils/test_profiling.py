@@ -0,0 +1,88 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import csv
+import json
+
+from primaite.utils.profiling import StepProfiler
+
+
+def test_disabled_profiler_records_nothing():
+    """A disabled profiler should not record any timings."""
+    profiler = StepProfiler()
+    with profiler.phase("advance_timestep"):
+        pass
+    profiler.record("advance_timestep.computer", 1.0)
+    profiler.end_step()
+
+    assert profiler.samples() == {}
+    assert profiler.summary() == {}
+
+
+def test_phase_time_is_accumulated_over_a_step():
+    """Time spent in a phase more than once during a step should be recorded as one sample."""
+    profiler = StepProfiler(enabled=True)
+    profiler.record("advance_timestep.computer", 0.5)
+    profiler.record("advance_timestep.computer", 0.25)
+    with profiler.phase("get_sim_state"):
+        pass
+    profiler.end_step()
+
+    samples = profiler.samples()
+    assert samples["advance_timestep.computer"] == [0.75]
+    assert len(samples["get_sim_state"]) == 1
+
+
+def test_summary():
+    """The summary should describe the distribution of each phase's per-step timings."""
+    profiler = StepProfiler(enabled=True)
+    for seconds in [1.0, 2.0, 3.0, 4.0]:
+        profiler.record("advance_timestep", seconds)
+        profiler.end_step()
+
+    summary = profiler.summary()["advance_timestep"]
+    assert summary["steps"] == 4
+    assert summary["total"] == 10.0
+    assert summary["mean"] == 2.5
+    assert summary["min"] == 1.0
+    assert summary["median"] == 2.5
+    assert summary["max"] == 4.0
+
+    counts, edges = profiler.histogram("advance_timestep", bins=3)
+    assert counts.sum() == 4
+    assert len(edges) == 4
+
+
+def test_episode_samples_are_kept_separately_from_session_samples():
+    """Ending an episode should discard its samples but keep them in the session samples."""
+    profiler = StepProfiler(enabled=True)
+    profiler.record("advance_timestep", 1.0)
+    profiler.end_step()
+    profiler.end_episode()
+    profiler.record("advance_timestep", 2.0)
+    profiler.end_step()
+
+    assert profiler.samples(episode_only=True) == {"advance_timestep": [2.0]}
+    assert profiler.samples() == {"advance_timestep": [1.0, 2.0]}
+
+
+def test_write_episode(tmp_path):
+    """The timings of an episode should be written to a JSON summary and a CSV with one row per step."""
+    profiler = StepProfiler(enabled=True)
+    profiler.record("advance_timestep", 1.0)
+    profiler.record("get_sim_state", 0.5)
+    profiler.end_step()
+    profiler.record("advance_timestep", 2.0)
+    profiler.end_step()
+
+    profiler.write_episode(tmp_path / "episode_0")
+
+    with open(tmp_path / "episode_0" / "step_timings.json") as file:
+        data = json.load(file)
+    assert data["summary"]["advance_timestep"]["steps"] == 2
+    assert data["steps"] == [{"advance_timestep": 1.0, "get_sim_state": 0.5}, {"advance_timestep": 2.0}]
+
+    with open(tmp_path / "episode_0" / "step_timings.csv", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert rows == [
+        {"step": "0", "advance_timestep": "1.0", "get_sim_state": "0.5"},
+        {"step": "1", "advance_timestep": "2.0", "get_sim_state": ""},
+    ]
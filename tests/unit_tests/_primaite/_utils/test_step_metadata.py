@@ -0,0 +1,91 @@
+# © Crown-owned copyright 2025, Defence Science and Technology Laboratory UK
+import copy
+import zlib
+
+import pytest
+
+from primaite.utils import step_metadata
+from primaite.utils.step_metadata import apply_state_delta, diff_state, StepMetadataReader, StepMetadataWriter
+
+
+def _state(step: int) -> dict:
+    state = {
+        "network": {
+            "nodes": {
+                "client": {"operating_state": 1, "services": {"dns-client": {"health": step % 3}}},
+                "server": {"operating_state": 1 + step // 4, "files": [step, step + 1]},
+            }
+        },
+        "time": step,
+    }
+    if step % 2:
+        state["network"]["nodes"]["client"]["users"] = {"admin": {"logged_in": True}}
+    return state
+
+
+def test_diff_and_apply_state_delta():
+    """Applying the delta between two states to the first should give the second, without modifying the first."""
+    old, new = _state(1), _state(4)
+    old_copy = copy.deepcopy(old)
+
+    delta = diff_state(old, new)
+
+    assert apply_state_delta(old, delta) == new
+    assert old == old_copy
+    assert delta["~"]["network"]["~"]["nodes"]["~"]["client"]["-"] == ["users"]
+    assert delta["="] == {"time": 4}
+    assert diff_state(new, copy.deepcopy(new)) is None
+    assert apply_state_delta(new, None) is new
+
+
+def test_write_and_read_step_metadata(tmp_path):
+    """Every step should be read back in full, both by step and by iterating over the file."""
+    writer = StepMetadataWriter(tmp_path / "episode_1" / "step_metadata.bin", keyframe_interval=3)
+    for step in range(10):
+        writer.write(step, {"step": step, "action": step % 2, "state": _state(step)})
+    writer.close()
+
+    reader = StepMetadataReader(tmp_path / "episode_1")
+
+    assert reader.steps == list(range(10))
+    assert [step for step, keyframe, _, _ in reader._records if keyframe] == [0, 3, 6, 9]
+    for step in [7, 0, 9, 4]:
+        assert reader[step] == {"step": step, "action": step % 2, "state": _state(step)}
+    assert list(reader) == [{"step": step, "action": step % 2, "state": _state(step)} for step in range(10)]
+    assert 10 not in reader
+    with pytest.raises(KeyError):
+        reader[10]
+
+
+def test_failed_step_is_skipped(tmp_path, monkeypatch):
+    """A step which fails to be written is left out, and the following steps are still read back correctly."""
+
+    class FailingZlib:
+        decompress = staticmethod(zlib.decompress)
+
+        @staticmethod
+        def compress(data: bytes) -> bytes:
+            if b'"step": 4' in data:
+                raise ValueError("Failed to compress")
+            return zlib.compress(data)
+
+    monkeypatch.setattr(step_metadata, "zlib", FailingZlib)
+    writer = StepMetadataWriter(tmp_path / "step_metadata.bin", keyframe_interval=4)
+    for step in range(8):
+        writer.write(step, {"step": step, "state": _state(step)})
+    writer.close()
+
+    reader = StepMetadataReader(tmp_path / "step_metadata.bin")
+    assert reader.steps == [0, 1, 2, 3, 5, 6, 7]
+    assert list(reader) == [{"step": step, "state": _state(step)} for step in reader.steps]
+
+
+def test_write_after_close(tmp_path):
+    """A writer should not accept any more steps once it has been closed."""
+    writer = StepMetadataWriter(tmp_path / "step_metadata.bin")
+    writer.write(0, {"state": _state(0)})
+    writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.write(1, {"state": _state(1)})
+    assert len(StepMetadataReader(tmp_path / "step_metadata.bin")) == 1